@@ -0,0 +1,24 @@
+import dataclasses
+import pathlib
+
+from typing import Any, Callable
+
+
+@dataclasses.dataclass(frozen=True)
+class Benchmark:
+    """
+    A single measured operation. Before each round, prepare is called (untimed) with a fresh, empty working directory,
+    and returns the operation to be timed for that round. This keeps per-round setup (e.g. parsing a document that the
+    operation then mutates) out of the measurement.
+    """
+    name: str
+    prepare: Callable[[pathlib.Path], Callable[[], Any]]
+    rounds: int = 5
+
+    def __post_init__(self):
+        if not isinstance(self.name, str) or not self.name:
+            raise ValueError(f"name must be a non-empty str, received {self.name!r}")
+        if not callable(self.prepare):
+            raise TypeError(f"prepare must be callable, not {type(self.prepare)}")
+        if not isinstance(self.rounds, int) or self.rounds < 1:
+            raise ValueError(f"rounds must be an int >= 1, received {self.rounds!r}")
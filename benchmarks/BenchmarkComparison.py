@@ -0,0 +1,37 @@
+import dataclasses
+
+from typing import Optional
+
+
+@dataclasses.dataclass(frozen=True)
+class BenchmarkComparison:
+    """
+    A benchmark's current median against its baseline median. Either may be missing, when a benchmark was added or
+    removed since the baseline was recorded; neither of those counts as a regression.
+    """
+    name: str
+    baseline_seconds: Optional[float]
+    current_seconds: Optional[float]
+    threshold: float
+
+    @property
+    def change_ratio(self) -> Optional[float]:
+        """
+        How much slower (positive) or faster (negative) the current run is, relative to the baseline.
+        """
+        if self.baseline_seconds is None or self.current_seconds is None or self.baseline_seconds <= 0:
+            return None
+        return self.current_seconds / self.baseline_seconds - 1
+
+    @property
+    def is_regression(self) -> bool:
+        return self.change_ratio is not None and self.change_ratio > self.threshold
+
+    def __str__(self):
+        if self.baseline_seconds is None:
+            return f"{self.name}: new, {self.current_seconds * 1000:.2f} ms"
+        if self.current_seconds is None:
+            return f"{self.name}: not run, baseline {self.baseline_seconds * 1000:.2f} ms"
+        verdict = 'REGRESSION' if self.is_regression else 'ok'
+        change = f"{self.change_ratio:+.1%}" if self.change_ratio is not None else 'n/a'
+        return f"{self.name}: {self.baseline_seconds * 1000:.2f} ms -> {self.current_seconds * 1000:.2f} ms ({change}) {verdict}"
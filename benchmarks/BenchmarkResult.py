@@ -0,0 +1,42 @@
+import dataclasses
+import statistics
+
+from typing import Tuple
+
+
+@dataclasses.dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    round_seconds: Tuple[float, ...]
+
+    def __post_init__(self):
+        if not self.round_seconds:
+            raise ValueError(f"round_seconds must not be empty, for benchmark: {self.name}")
+
+    @property
+    def min_seconds(self) -> float:
+        return min(self.round_seconds)
+
+    @property
+    def median_seconds(self) -> float:
+        return statistics.median(self.round_seconds)
+
+    @property
+    def mean_seconds(self) -> float:
+        return statistics.fmean(self.round_seconds)
+
+    def to_dict(self) -> dict:
+        return {
+            'rounds': len(self.round_seconds),
+            'min_seconds': self.min_seconds,
+            'median_seconds': self.median_seconds,
+            'mean_seconds': self.mean_seconds,
+            'round_seconds': list(self.round_seconds),
+        }
+
+    @classmethod
+    def from_dict(cls, name: str, result_dict: dict) -> 'BenchmarkResult':
+        return cls(name, tuple(result_dict['round_seconds']))
+
+    def __str__(self):
+        return f"{self.name}: median {self.median_seconds * 1000:.2f} ms, min {self.min_seconds * 1000:.2f} ms ({len(self.round_seconds)} rounds)"
@@ -0,0 +1,4 @@
+from .Benchmark import Benchmark
+from .BenchmarkResult import BenchmarkResult
+from .BenchmarkComparison import BenchmarkComparison
+from .benchmark_runner import run_benchmark, run_benchmarks, write_benchmark_results, read_benchmark_results, compare_benchmark_results
@@ -0,0 +1,55 @@
+import argparse
+import logging
+import sys
+
+from benchmarks.benchmark_runner import run_benchmarks, write_benchmark_results, read_benchmark_results, \
+    compare_benchmark_results, default_regression_threshold
+from benchmarks.hot_path_benchmarks import hot_path_benchmarks
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Time the hot paths of the export, over the sample data and generated large inputs.',
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run = subparsers.add_parser('run', help='Run the benchmarks, optionally recording the results as a baseline.')
+    run.add_argument('-o', '--output', help='Write the results to this JSON file.')
+
+    compare = subparsers.add_parser('compare', help='Run the benchmarks and compare them against a baseline.')
+    compare.add_argument('baseline', help='The JSON file written by a previous run.')
+    compare.add_argument('-t', '--threshold', type=float, default=default_regression_threshold,
+                         help=f'Relative slowdown of the median above which a benchmark fails (default: {default_regression_threshold}).')
+    compare.add_argument('-o', '--output', help='Also write the results to this JSON file.')
+
+    for subparser in (run, compare):
+        subparser.add_argument('-k', '--filter', help='Only run the benchmarks whose names match this regular expression.')
+        subparser.add_argument('-r', '--rounds', type=int, default=None, help='Override the number of timed rounds of each benchmark.')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    logging.basicConfig(level=logging.WARNING)
+    args = _parse_args(argv)
+
+    baseline = read_benchmark_results(args.baseline) if args.command == 'compare' else None
+    results = run_benchmarks(hot_path_benchmarks, name_pattern=args.filter, rounds=args.rounds)
+    if args.output:
+        write_benchmark_results(args.output, results)
+
+    if baseline is None:
+        for result in results:
+            print(result)
+        return 0
+
+    comparisons = compare_benchmark_results(baseline, results, threshold=args.threshold)
+    for comparison in comparisons:
+        print(comparison)
+    regressions = [comparison for comparison in comparisons if comparison.is_regression]
+    print(f"{len(regressions)} of {len(comparisons)} benchmarks regressed by more than {args.threshold:.0%}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+import gc
+import json
+import logging
+import os
+import pathlib
+import platform
+import re
+import sys
+import tempfile
+import time
+
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from .Benchmark import Benchmark
+from .BenchmarkComparison import BenchmarkComparison
+from .BenchmarkResult import BenchmarkResult
+
+
+benchmark_results_format_version = 1
+default_regression_threshold = 0.2
+
+logger = logging.getLogger(__name__)
+
+
+def run_benchmark(benchmark: Benchmark, rounds: Optional[int] = None, warmup_rounds: int = 1) -> BenchmarkResult:
+    """
+    Times a benchmark, preparing each round (untimed) in its own temporary directory.
+    :param benchmark: The benchmark to run.
+    :param rounds: Overrides the benchmark's own number of timed rounds.
+    :param warmup_rounds: The number of untimed rounds run first, to populate caches and imports.
+    :return: The timings of the timed rounds.
+    """
+    if not isinstance(benchmark, Benchmark):
+        raise TypeError(f"benchmark must be an instance of Benchmark, not {type(benchmark)}")
+    rounds = benchmark.rounds if rounds is None else rounds
+    if rounds < 1:
+        raise ValueError(f"rounds must be >= 1, received {rounds}")
+
+    round_seconds = ()
+    for round_index in range(warmup_rounds + rounds):
+        with tempfile.TemporaryDirectory(prefix='benchmark_') as work_dir:
+            operation = benchmark.prepare(pathlib.Path(work_dir))
+            gc.collect()
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                started_at = time.perf_counter()
+                operation()
+                elapsed_seconds = time.perf_counter() - started_at
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+        if round_index >= warmup_rounds:
+            round_seconds += (elapsed_seconds,)
+
+    result = BenchmarkResult(benchmark.name, round_seconds)
+    logger.info(f"⏱️ {result}")
+    return result
+
+
+def run_benchmarks(benchmarks: Iterable[Benchmark], name_pattern: Optional[str] = None, rounds: Optional[int] = None) -> Tuple[BenchmarkResult, ...]:
+    """
+    :param benchmarks: The benchmarks to run.
+    :param name_pattern: If given, only the benchmarks whose names match this regular expression (anywhere) are run.
+    :param rounds: Overrides each benchmark's own number of timed rounds.
+    """
+    name_regex = re.compile(name_pattern) if name_pattern else None
+    return tuple(
+        run_benchmark(benchmark, rounds=rounds)
+        for benchmark in benchmarks
+        if name_regex is None or name_regex.search(benchmark.name)
+    )
+
+
+def write_benchmark_results(path: Union[str, os.PathLike], results: Iterable[BenchmarkResult]):
+    results_json = {
+        'version': benchmark_results_format_version,
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'benchmarks': {result.name: result.to_dict() for result in results},
+    }
+    path = pathlib.Path(path)
+    temp_path = path.with_name(path.name + '.tmp')
+    temp_path.write_text(json.dumps(results_json, indent=2), encoding='utf-8')
+    os.replace(temp_path, path)
+
+
+def read_benchmark_results(path: Union[str, os.PathLike]) -> Dict[str, BenchmarkResult]:
+    results_json = json.loads(pathlib.Path(path).read_text(encoding='utf-8'))
+    if results_json.get('version') != benchmark_results_format_version:
+        raise ValueError(f"Unsupported benchmark results format version {results_json.get('version')!r} in: {path}")
+    return {name: BenchmarkResult.from_dict(name, result_dict) for name, result_dict in results_json['benchmarks'].items()}
+
+
+def compare_benchmark_results(baseline: Dict[str, BenchmarkResult],
+                              current: Iterable[BenchmarkResult],
+                              threshold: float = default_regression_threshold,
+                              ) -> Tuple[BenchmarkComparison, ...]:
+    """
+    Compares medians against a baseline.
+    :param baseline: The baseline results, by benchmark name (see read_benchmark_results).
+    :param current: The results to compare.
+    :param threshold: The relative slowdown (e.g. 0.2 for 20%) above which a benchmark counts as regressed.
+    :return: A comparison for each benchmark in either set, current results first.
+    """
+    if threshold < 0:
+        raise ValueError(f"threshold must be >= 0, received {threshold}")
+
+    current = {result.name: result for result in current}
+    comparisons = ()
+    for name in list(current) + [name for name in baseline if name not in current]:
+        baseline_result, current_result = baseline.get(name), current.get(name)
+        comparisons += (BenchmarkComparison(
+            name=name,
+            baseline_seconds=baseline_result.median_seconds if baseline_result else None,
+            current_seconds=current_result.median_seconds if current_result else None,
+            threshold=threshold,
+        ),)
+    return comparisons
@@ -0,0 +1,197 @@
+import functools
+import io
+import pathlib
+import quopri
+import random
+import re
+
+from typing import Any, Callable, Tuple
+
+import panflute
+
+from markdown_dom.MarkdownDocument import MarkdownDocument
+from markdown_re.MarkdownDocumentTextPattern import MarkdownDocumentTextPattern
+from mhtml_dom.MhtmlContainer import MhtmlContainer
+from mhtml_dom.quoted_printable import decode_quoted_printable_text
+from onenote import OneNoteApplication, OneNoteApiRecording, ReplayOneNoteAPI
+from onenote_export.OneNoteExporter import create_default_onenote_exporter
+from onenote_synthetic import SyntheticNotebookGenerator, SyntheticNotebookSettings, SyntheticPage
+from onenote_synthetic.synthetic_page_payloads import render_page_mhtml, render_page_pdf
+from path_scrubbing import PathComponentScrubber
+from pdf_inspection.PdfDocument import PdfDocument
+from .Benchmark import Benchmark
+
+
+_repo_dir = pathlib.Path(__file__).parent.parent
+sample_mhtml_paths = tuple(sorted((_repo_dir / 'test_mhtml_dom' / 'sample_data').glob('*.mht')))
+sample_pdf_paths = tuple(sorted((_repo_dir / 'test_pdf_inspection' / 'sample_data').glob('*.pdf')))
+sample_ast_json_paths = tuple(sorted((_repo_dir / 'test_markdown_dom' / 'sample_data').glob('*.md.json')))
+
+_large_page_settings = SyntheticNotebookSettings(images_per_page=40, tables_per_page=10, paragraphs_per_page=400, seed=38)
+_large_document_paragraph_count = 5000
+# The text patterns currently rebuild the document's text map per match, so they are measured against a smaller document.
+_text_pattern_document_paragraph_count = 200
+
+
+@functools.cache
+def _create_large_synthetic_page() -> SyntheticPage:
+    return SyntheticNotebookGenerator(_large_page_settings).create_page('Large page')
+
+
+@functools.cache
+def _create_large_mhtml_bytes() -> bytes:
+    return render_page_mhtml(_create_large_synthetic_page(), 'large')
+
+
+@functools.cache
+def _create_large_pdf_bytes() -> bytes:
+    return render_page_pdf(_create_large_synthetic_page())
+
+
+@functools.cache
+def _create_large_quoted_printable_text() -> str:
+    page_html = '\n'.join(f'<p style="margin:0in">{p}</p>' for p in _create_large_document_paragraph_texts())
+    return quopri.encodestring(page_html.encode('utf-8')).decode('ascii')
+
+
+@functools.cache
+def _create_large_document_paragraph_texts(paragraph_count: int = _large_document_paragraph_count) -> Tuple[str, ...]:
+    rng = random.Random(38)
+    words = ('butter', 'sugar', 'flour', 'lemon', 'zest', 'whisk', 'fold', 'bake', 'golden', 'crème', 'brûlée', '½')
+    paragraphs = []
+    for i in range(paragraph_count):
+        if i % 50 == 49:
+            paragraphs.append('Created with OneNote.')
+        else:
+            paragraphs.append(' '.join(rng.choice(words) for _ in range(rng.randint(5, 30))))
+    return tuple(paragraphs)
+
+
+@functools.cache
+def _create_large_document_ast_json(paragraph_count: int = _large_document_paragraph_count) -> str:
+    def create_block(i: int, text: str) -> panflute.Block:
+        words = text.split(' ')
+        inlines = [panflute.Str(words[0])]
+        for word in words[1:]:
+            inlines += [panflute.Space(), panflute.Str(word)]
+        if i % 25 == 0:
+            inlines += [panflute.Space(), panflute.Image(panflute.Str('image'), url=f'page_files/image{i:03d}.png')]
+        if i % 10 == 0:
+            inlines += [panflute.Space(), panflute.Link(panflute.Str('link'), url=f'https://example.com/{i}')]
+        return panflute.Para(*inlines)
+
+    panflute_doc = panflute.Doc(*(create_block(i, t) for i, t in enumerate(_create_large_document_paragraph_texts(paragraph_count))))
+    with io.StringIO() as f:
+        panflute.dump(panflute_doc, f)
+        return f.getvalue()
+
+
+@functools.cache
+def _create_path_component_names() -> Tuple[str, ...]:
+    rng = random.Random(38)
+    templates = (
+        'Meeting notes: "{word}" {month}/{day}/2023 {hour}:{minute} PM',
+        '{word} <draft> | {word}? *final*',
+        '2023_{month}_{day} {hour}:{minute}:00 – {word}/{word}',
+        '{word} — {word}: 1/2 cup & 3" pan',
+        'Plain {word} page',
+    )
+    words = ('butter', 'sugar', 'flour', 'lemon', 'zest', 'whisk', 'fold', 'bake', 'golden')
+    return tuple(
+        rng.choice(templates).format(
+            word=rng.choice(words),
+            month=f'{rng.randint(1, 12):02d}',
+            day=f'{rng.randint(1, 28):02d}',
+            hour=rng.randint(1, 12),
+            minute=f'{rng.randint(0, 59):02d}',
+        )
+        for _ in range(2000)
+    )
+
+
+def _write_inputs(work_dir: pathlib.Path, sample_paths: Tuple[pathlib.Path, ...], large_bytes: bytes, large_suffix: str) -> Tuple[pathlib.Path, ...]:
+    large_path = work_dir / f'large{large_suffix}'
+    large_path.write_bytes(large_bytes)
+    return sample_paths + (large_path,)
+
+
+def _prepare_mhtml_read_file(work_dir: pathlib.Path) -> Callable[[], Any]:
+    paths = _write_inputs(work_dir, sample_mhtml_paths, _create_large_mhtml_bytes(), '.mht')
+    return lambda: [MhtmlContainer.read_file(path) for path in paths]
+
+
+def _prepare_decode_quoted_printable_text(_: pathlib.Path) -> Callable[[], Any]:
+    texts = tuple(path.read_text(encoding='latin-1') for path in sample_mhtml_paths) + (_create_large_quoted_printable_text(),)
+    return lambda: [decode_quoted_printable_text(text) for text in texts]
+
+
+def _prepare_pdf_export_images(work_dir: pathlib.Path) -> Callable[[], Any]:
+    paths = _write_inputs(work_dir, sample_pdf_paths, _create_large_pdf_bytes(), '.pdf')
+    output_dir = work_dir / 'images'
+    output_dir.mkdir()
+
+    def export_images():
+        for path_index, path in enumerate(paths):
+            for page in PdfDocument(path).pages:
+                for image in page.images:
+                    image.export_png(output_dir / f'{path_index}_{page.page_index}_{image.page_images_index}.png')
+    return export_images
+
+
+def _create_documents(work_dir: pathlib.Path, paragraph_count: int = _large_document_paragraph_count) -> Tuple[MarkdownDocument, ...]:
+    ast_jsons = tuple(path.read_text(encoding='utf-8') for path in sample_ast_json_paths) + (_create_large_document_ast_json(paragraph_count),)
+    return tuple(MarkdownDocument(ast_json, work_dir / f'{i}.md') for i, ast_json in enumerate(ast_jsons))
+
+
+def _prepare_update_via_panflute_filters(work_dir: pathlib.Path, element_types: Tuple[type, ...] = None) -> Callable[[], Any]:
+    documents = _create_documents(work_dir)
+
+    def relink_images(element: panflute.Element, _: panflute.Doc):
+        if isinstance(element, panflute.Image):
+            element.url = element.url.replace('page_files/', 'assets/')
+        return element
+
+    return lambda: [document.update_via_panflute_filters(element_filters=(relink_images,), element_types=element_types) for document in documents]
+
+
+def _prepare_text_pattern_rm(work_dir: pathlib.Path) -> Callable[[], Any]:
+    documents = _create_documents(work_dir, _text_pattern_document_paragraph_count)
+    pattern = MarkdownDocumentTextPattern(r'\s*Created with OneNote\.\s*', flags=re.MULTILINE)
+    return lambda: [pattern.rm(document) for document in documents]
+
+
+def _prepare_text_pattern_finditer(work_dir: pathlib.Path) -> Callable[[], Any]:
+    # MarkdownDocumentTextPattern.sub is the other rewriting operation, but replacing text is not implemented yet, so
+    # this times matching against the document's text map instead.
+    documents = _create_documents(work_dir, _text_pattern_document_paragraph_count)
+    pattern = MarkdownDocumentTextPattern(r'\bbutter\b')
+    return lambda: [pattern.finditer(document, action=lambda matches: [(m.start, m.end) for m in matches]) for document in documents]
+
+
+def _prepare_cleanup_path_component(_: pathlib.Path) -> Callable[[], Any]:
+    names = _create_path_component_names()
+    # Without its cache, so that every round times the substitutions rather than cache hits.
+    scrubber = PathComponentScrubber(cache_size=0)
+    scrubber.cleanup_path_component('warm up the substitutions')
+    return lambda: [scrubber.cleanup_path_component(name) for name in names]
+
+
+def _prepare_page_export(work_dir: pathlib.Path, page_count: int = 3) -> Callable[[], Any]:
+    recording = OneNoteApiRecording(work_dir / 'recording')
+    settings = SyntheticNotebookSettings(sections_per_notebook=1, pages_per_section=page_count, images_per_page=2, tables_per_page=1, paragraphs_per_page=20)
+    SyntheticNotebookGenerator(settings).generate_into(recording)
+    exporter = create_default_onenote_exporter(work_dir / 'output', 'assets', PathComponentScrubber())
+    return lambda: exporter.execute_export(OneNoteApplication(ReplayOneNoteAPI(recording)))
+
+
+hot_path_benchmarks: Tuple[Benchmark, ...] = (
+    Benchmark('mhtml_container_read_file', _prepare_mhtml_read_file),
+    Benchmark('decode_quoted_printable_text', _prepare_decode_quoted_printable_text),
+    Benchmark('pdf_document_export_images', _prepare_pdf_export_images),
+    Benchmark('update_via_panflute_filters', _prepare_update_via_panflute_filters),
+    Benchmark('update_via_panflute_filters_typed', functools.partial(_prepare_update_via_panflute_filters, element_types=(panflute.Image,))),
+    Benchmark('markdown_text_pattern_rm', _prepare_text_pattern_rm),
+    Benchmark('markdown_text_pattern_finditer', _prepare_text_pattern_finditer),
+    Benchmark('path_component_scrubber_cleanup', _prepare_cleanup_path_component),
+    Benchmark('page_export_replayed', _prepare_page_export, rounds=3),
+)
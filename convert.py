@@ -5,21 +5,30 @@ import re
 import traceback
 import pywintypes
 
-from onenote import OneNoteApplication, OneNoteNode, OneNoteElementBasedNode
+from onenote import OneNoteApplication, OneNoteNode, OneNoteElementBasedNode, OneNoteHierarchySnapshot, HierarchySnapshotOneNoteAPI, \
+    OneNoteApiRecording, RecordingOneNoteAPI, AsyncOneNoteAPI, ComThreadOneNoteAPI
+from onenote.OneNoteAPI import OneNoteAPI
+from onenote_export.logging_helper import export_logging
 from onenote_export.OneNoteExporter import create_default_onenote_exporter
+from onenote_export.PageImageSource import PageImageSource
 from path_scrubbing import PathComponentScrubber
+from tracing import default_export_tracer
 
 
 OUTPUT_DIR = os.path.join(os.path.expanduser('~'), "Desktop", "OneNoteExport")
 ASSETS_DIR = "assets"
+ONENOTE_API_RECORDING_DIR = None  # Set to a directory to record OneNote's responses, for replay via ReplayOneNoteAPI.
+HIERARCHY_SNAPSHOT_DIR = None  # Set to a directory to keep a snapshot of the hierarchy, and fetch only the sections changed since.
 PAGES_REMOVE_ONENOTE_FOOTER = True
 USE_LEGACY_DOCX_EXPORT = False
+USE_NATIVE_XML_EXPORT = False  # Converts the page XML directly, skipping the MHTML publish and pandoc's HTML import.
+PUBLISH_WHOLE_SECTIONS = False  # Publishes each section to MHTML once and splits it into pages, rather than publishing each page.
+PAGE_IMAGE_SOURCE = PageImageSource.PDF  # BINARY_PAGE_CONTENT fetches original image bytes without publishing a PDF. Native XML export always does.
+PAGE_SUBTASK_MAX_WORKERS = 1  # Set higher to overlap each page's independent export stages, e.g. reparsing HTML while extracting images.
+PAGE_MAX_WORKERS = 1  # Set higher to export several pages at once. OneNote is then called from a single COM thread.
+PAGE_MEMORY_BUDGET_BYTES = 4 * 2 ** 30  # How much memory the pages being exported at once may use between them. Set to None for no limit.
 LOGFILE = 'onenote_to_markdown.log' # Set to None to disable logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s', datefmt='%Y-%m-%d %H:%M:%S', encoding='utf-8')
-if LOGFILE:
-    fh = logging.FileHandler(LOGFILE, mode='w', encoding='utf-8', delay=True)
-    fh.setLevel(logging.WARNING)
-    logging.root.addHandler(fh)
+TRACE_FILE = None  # Set to a .json file to record a Chrome/Perfetto trace of each page's export stages and OneNote, pandoc and PyMuPDF calls.
 # For debugging purposes, set either or both of these variables to limit which pages are exported:
 EXPORT_EXCLUSION_FILTER = r''
 EXPORT_INCLUSION_FILTER = r''
@@ -51,19 +60,43 @@ def should_handle(node: OneNoteNode) -> bool:
 
 
 if __name__ == "__main__":
-    try:
-        onenote = OneNoteApplication()
-        path_scrubber = PathComponentScrubber()
-        exporter = create_default_onenote_exporter(
-            root_output_dir=OUTPUT_DIR,
-            page_relative_assets_dir=ASSETS_DIR,
-            path_component_scrubber=path_scrubber,
-            should_export=should_handle,
-            use_legacy_docx_export=USE_LEGACY_DOCX_EXPORT,
-            pages_remove_onenote_footer=PAGES_REMOVE_ONENOTE_FOOTER,
-        )
-        exporter.execute_export(onenote)
+    with export_logging(level=logging.INFO, log_file=LOGFILE, log_file_level=logging.WARNING):
+        default_export_tracer.enabled = bool(TRACE_FILE)
+        async_onenote_api = None
+        try:
+            if PAGE_MAX_WORKERS > 1:
+                async_onenote_api = AsyncOneNoteAPI()
+                onenote_api = ComThreadOneNoteAPI(async_onenote_api)
+            else:
+                onenote_api = OneNoteAPI()
+            if ONENOTE_API_RECORDING_DIR:
+                onenote_api = RecordingOneNoteAPI(onenote_api, OneNoteApiRecording(ONENOTE_API_RECORDING_DIR))
+            if HIERARCHY_SNAPSHOT_DIR:
+                onenote_api = HierarchySnapshotOneNoteAPI(onenote_api, OneNoteHierarchySnapshot(HIERARCHY_SNAPSHOT_DIR))
+            onenote = OneNoteApplication(onenote_api)
+            path_scrubber = PathComponentScrubber()
+            exporter = create_default_onenote_exporter(
+                root_output_dir=OUTPUT_DIR,
+                page_relative_assets_dir=ASSETS_DIR,
+                path_component_scrubber=path_scrubber,
+                should_export=should_handle,
+                use_legacy_docx_export=USE_LEGACY_DOCX_EXPORT,
+                use_native_xml_export=USE_NATIVE_XML_EXPORT,
+                publish_whole_sections=PUBLISH_WHOLE_SECTIONS,
+                pages_remove_onenote_footer=PAGES_REMOVE_ONENOTE_FOOTER,
+                page_image_source=PageImageSource.BINARY_PAGE_CONTENT if USE_NATIVE_XML_EXPORT else PAGE_IMAGE_SOURCE,
+                page_subtask_max_workers=PAGE_SUBTASK_MAX_WORKERS,
+                page_max_workers=PAGE_MAX_WORKERS,
+                page_memory_budget_bytes=PAGE_MEMORY_BUDGET_BYTES if PAGE_MAX_WORKERS > 1 else None,
+            )
+            exporter.execute_export(onenote)
 
-    except pywintypes.com_error as e:
-        traceback.print_exc()
-        logging.critical("Hint: Make sure OneNote is open first.", exc_info=True)
+        except pywintypes.com_error as e:
+            traceback.print_exc()
+            logging.critical("Hint: Make sure OneNote is open first.", exc_info=True)
+        finally:
+            if async_onenote_api is not None:
+                # Lets the calls still queued finish, and the COM thread uninitialize COM.
+                async_onenote_api.close()
+            if TRACE_FILE:
+                default_export_tracer.write_chrome_trace(TRACE_FILE)
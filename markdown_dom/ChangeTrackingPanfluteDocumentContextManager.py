@@ -1,20 +1,34 @@
-import json
-import io
-from typing import ContextManager, Optional, Union, Callable
+import contextlib
+from typing import ContextManager, Iterator, Optional, Tuple, Union, Callable
 
 import panflute
 
 from markdown_dom.ChangeTrackingJsonStrContextManager import ChangeTrackingJsonStrContextManager
+from markdown_dom.PandocAstJsonCodec import PandocAstJsonCodec
+from markdown_dom.lazy_panflute_materialization import materialize_panflute_document_lazily
 
 
 class ChangeTrackingPanfluteDocumentContextManager(ContextManager[panflute.Doc]):
-    def __init__(self, document_ast_context_manager: ChangeTrackingJsonStrContextManager):
+    def __init__(self,
+                 document_ast_context_manager: ChangeTrackingJsonStrContextManager,
+                 codec: Optional[PandocAstJsonCodec] = None,
+                 ):
+        """
+        :param document_ast_context_manager: Tracks changes to the document's pandoc AST JSON.
+        :param codec: The codec used to parse and serialize the AST JSON. Defaults to the fastest one available.
+        """
         if not isinstance(document_ast_context_manager, ChangeTrackingJsonStrContextManager):
             raise TypeError("document_ast_context_manager must be ChangeTrackingJsonStrContextManager")
+        if codec is None:
+            codec = PandocAstJsonCodec.create_default()
+        if not isinstance(codec, PandocAstJsonCodec):
+            raise TypeError(f"codec must be a PandocAstJsonCodec, not {type(codec)}")
 
         self._document_ast_context_manager = document_ast_context_manager
+        self._codec = codec
         self._enters = 0
         self._panflute_document: Optional[panflute.Doc] = None
+        self._lazy_element_types: Optional[Tuple[type, ...]] = None
 
     def __enter__(self):
         self._enters += 1
@@ -22,24 +36,49 @@ class ChangeTrackingPanfluteDocumentContextManager(ContextManager[panflute.Doc])
         if self._enters == 1:
             self._panflute_document = self._load_document_from_ast_json(self._document_ast_context_manager.json_value)
 
-    @staticmethod
-    def _load_document_from_ast_json(document_ast_json: str) -> panflute.Doc:
-        return json.loads(
-            document_ast_json,
-            object_hook=panflute.elements.from_json
-        )
+    @contextlib.contextmanager
+    def entered_lazily(self, element_types: Tuple[type, ...]) -> Iterator['ChangeTrackingPanfluteDocumentContextManager']:
+        """
+        Enters the context such that only the blocks containing elements of the given types are materialized into
+        panflute elements, looking into divs, block quotes, lists, tables and figures; every other block is represented
+        by a LazyBlockPlaceholder. Only suitable for actions that don't need to see any other elements.
+        :param element_types: The panflute element types the action is interested in.
+        """
+        if self._enters != 0:
+            raise ValueError("Cannot enter lazily when already entered.")
+        element_types = tuple(element_types)
+        if not element_types:
+            raise ValueError("element_types must not be empty")
+
+        self._lazy_element_types = element_types
+        try:
+            with self:
+                yield self
+        finally:
+            self._lazy_element_types = None
+
+    def _load_document_from_ast_json(self, document_ast_json: str) -> panflute.Doc:
+        if self._lazy_element_types is not None:
+            return materialize_panflute_document_lazily(self._codec.loads(document_ast_json), self._lazy_element_types)
+        return self._codec.loads(document_ast_json, object_hook=panflute.elements.from_json)
+
+    def _dump_document_to_ast_json(self, document: panflute.Doc) -> str:
+        if not isinstance(document, panflute.Doc):
+            raise TypeError(f"document must be a panflute.Doc, not {type(document)}")
+        return self._codec.dumps(document.to_json())
 
-    @staticmethod
-    def _dump_document_to_ast_json(document: panflute.Doc) -> str:
-        with io.StringIO() as f:
-            panflute.dump(document, f)
-            return f.getvalue()
+    @property
+    def codec(self) -> PandocAstJsonCodec:
+        return self._codec
 
     @classmethod
-    def from_ast_json(cls, document_ast_json: Union[str, Callable[[], str]]) -> 'ChangeTrackingPanfluteDocumentContextManager':
+    def from_ast_json(cls,
+                      document_ast_json: Union[str, Callable[[], str]],
+                      codec: Optional[PandocAstJsonCodec] = None,
+                      ) -> 'ChangeTrackingPanfluteDocumentContextManager':
         if not isinstance(document_ast_json, (str, Callable)):
             raise TypeError("document_ast_json must be str or a callable that returns str")
-        return cls(ChangeTrackingJsonStrContextManager(document_ast_json))
+        return cls(ChangeTrackingJsonStrContextManager(document_ast_json), codec=codec)
 
     @property
     def panflute_document(self) -> panflute.Doc:
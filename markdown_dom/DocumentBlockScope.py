@@ -0,0 +1,66 @@
+from typing import Optional, Sequence, Tuple
+
+import panflute
+
+
+class DocumentBlockScope:
+    """
+    Selects a window of a document's top-level blocks, so that operations against the document's text content only need to
+    walk (and text-map) the selected blocks rather than the whole document.
+    """
+
+    def __init__(self,
+                 block_indices: Optional[Sequence[int]] = None,
+                 last_n_blocks: Optional[int] = None,
+                 ):
+        """
+        :param block_indices: Indices of the top-level blocks to select. Negative indices count from the end of the
+        document. Indices that fall outside the document are ignored.
+        :param last_n_blocks: Number of trailing top-level blocks to select.
+        """
+        if (block_indices is None) == (last_n_blocks is None):
+            raise ValueError("Exactly one of block_indices or last_n_blocks must be specified")
+        if block_indices is not None:
+            block_indices = tuple(block_indices)
+            if not all(isinstance(i, int) for i in block_indices):
+                raise TypeError(f"block_indices must be a sequence of int, not {block_indices!r}")
+        if last_n_blocks is not None:
+            if not isinstance(last_n_blocks, int):
+                raise TypeError(f"last_n_blocks must be an int, not {type(last_n_blocks)}")
+            if last_n_blocks < 0:
+                raise ValueError(f"last_n_blocks must be >= 0, received {last_n_blocks}")
+
+        self._block_indices: Optional[Tuple[int, ...]] = block_indices
+        self._last_n_blocks: Optional[int] = last_n_blocks
+
+    @classmethod
+    def last(cls, n: int) -> 'DocumentBlockScope':
+        return cls(last_n_blocks=n)
+
+    @classmethod
+    def indices(cls, *block_indices: int) -> 'DocumentBlockScope':
+        return cls(block_indices=block_indices)
+
+    def resolve_block_indices(self, block_count: int) -> Tuple[int, ...]:
+        """
+        Resolves the scope against a document having the given number of top-level blocks.
+        :param block_count: The number of top-level blocks in the document.
+        :return: The selected block indices, deduplicated and in document order.
+        """
+        if self._last_n_blocks is not None:
+            return tuple(range(max(0, block_count - self._last_n_blocks), block_count))
+
+        resolved = {i if i >= 0 else block_count + i for i in self._block_indices}
+        return tuple(sorted(i for i in resolved if 0 <= i < block_count))
+
+    def select_blocks(self, doc: panflute.Doc) -> Tuple[panflute.Block, ...]:
+        blocks = doc.content
+        return tuple(blocks[i] for i in self.resolve_block_indices(len(blocks)))
+
+    def __str__(self):
+        if self._last_n_blocks is not None:
+            return f"{self.__class__.__name__}(last_n_blocks={self._last_n_blocks})"
+        return f"{self.__class__.__name__}(block_indices={self._block_indices})"
+
+    def __repr__(self):
+        return str(self)
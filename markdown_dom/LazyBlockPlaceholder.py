@@ -0,0 +1,24 @@
+from typing import Any
+
+import panflute
+
+
+class LazyBlockPlaceholder(panflute.RawBlock):
+    """
+    Stands in for a block that has been left as raw pandoc AST JSON rather than materialized into panflute elements.
+    It serializes back to exactly that JSON, wherever it ends up in the document.
+    """
+
+    def __init__(self, block_ast: Any):
+        super().__init__(text='', format='native')
+        self._block_ast = block_ast
+
+    @property
+    def block_ast(self) -> Any:
+        return self._block_ast
+
+    def to_json(self):
+        return self._block_ast
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._block_ast.get('t')!r})"
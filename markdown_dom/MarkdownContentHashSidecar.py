@@ -0,0 +1,66 @@
+import hashlib
+import pathlib
+
+from typing import Optional
+
+from onenote_export.Pathlike import Pathlike
+
+
+class MarkdownContentHashSidecar:
+    """
+    Records a hash of the Markdown last rendered to a file in a hidden sidecar file next to it. A later render of the
+    same document can then be checked against the hash, instead of parsing the existing file back through pandoc.
+    """
+
+    def __init__(self, sidecar_name_format: str = '.{name}.sha256'):
+        """
+        :param sidecar_name_format: Format of the sidecar file's name; '{name}' is replaced by the Markdown file's name.
+        """
+        if not isinstance(sidecar_name_format, str):
+            raise TypeError(f"sidecar_name_format must be a str, not {type(sidecar_name_format)}")
+        if '{name}' not in sidecar_name_format:
+            raise ValueError(f"sidecar_name_format must contain '{{name}}', received {sidecar_name_format!r}")
+
+        self._sidecar_name_format = sidecar_name_format
+
+    @staticmethod
+    def compute_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def sidecar_path_for(self, md_path: Pathlike) -> pathlib.Path:
+        md_path = pathlib.Path(md_path)
+        return md_path.with_name(self._sidecar_name_format.format(name=md_path.name))
+
+    def read_hash(self, md_path: Pathlike) -> Optional[str]:
+        sidecar_path = self.sidecar_path_for(md_path)
+        try:
+            return sidecar_path.read_text(encoding='ascii').strip() or None
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+
+    def write_hash(self, md_path: Pathlike, content_hash: str) -> None:
+        self.sidecar_path_for(md_path).write_text(content_hash, encoding='ascii')
+
+    def is_unchanged(self, md_path: Pathlike, rendered_content: bytes) -> bool:
+        """
+        Determines whether writing the given rendered Markdown to the file would leave it unchanged.
+        The existing file is only read (to detect edits made since it was last written) when the rendered content matches
+        the recorded hash.
+        :param md_path: The Markdown file.
+        :param rendered_content: The freshly rendered Markdown.
+        :return: True if the file exists and already holds exactly the rendered content.
+        """
+        md_path = pathlib.Path(md_path)
+        recorded_hash = self.read_hash(md_path)
+        if recorded_hash is None or recorded_hash != self.compute_hash(rendered_content):
+            return False
+        try:
+            return self.compute_hash(md_path.read_bytes()) == recorded_hash
+        except FileNotFoundError:
+            return False
+
+    def __str__(self):
+        return f"{self.__class__.__name__}({self._sidecar_name_format!r})"
+
+    def __repr__(self):
+        return str(self)
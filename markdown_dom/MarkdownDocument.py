@@ -1,4 +1,5 @@
 import functools
+import os
 import pathlib
 import shutil
 
@@ -7,6 +8,9 @@ import panflute
 from typing import Iterable, Tuple, Union, Callable, Optional
 
 from markdown_dom.ChangeTrackingPanfluteDocumentContextManager import ChangeTrackingPanfluteDocumentContextManager
+from markdown_dom.DocumentBlockScope import DocumentBlockScope
+from markdown_dom.MarkdownContentHashSidecar import MarkdownContentHashSidecar
+from markdown_dom.PandocAstJsonCodec import PandocAstJsonCodec
 from markdown_dom.PandocMarkdownDocumentExportSettings import PandocMarkdownDocumentExportSettings
 from markdown_dom.PandocMarkdownDocumentImportSettings import PandocMarkdownDocumentImportSettings
 from markdown_dom.PanfluteElementAccumulator import PanfluteElementAccumulator
@@ -23,20 +27,41 @@ class MarkdownDocument:
                  initial_document_ast_json: Union[str, Callable[[], str]],
                  output_md_path: Pathlike,
                  save_settings: PandocMarkdownDocumentExportSettings = PandocMarkdownDocumentExportSettings.create_default_for_onenote_docx_to_obsidian_md(),
+                 content_hash_sidecar: Optional[MarkdownContentHashSidecar] = None,
+                 ast_json_codec: Optional[PandocAstJsonCodec] = None,
                  ):
+        """
+        :param initial_document_ast_json: The document's pandoc AST JSON, or a function that produces it.
+        :param output_md_path: The Markdown file the document is saved to.
+        :param save_settings: The settings used to render the document to Markdown.
+        :param content_hash_sidecar: If given, the initial AST is not assumed to match any existing output file. Saving
+        still skips unchanged writes, and uses the hash recorded by the previous save to avoid reading the file when the
+        rendered Markdown has changed.
+        :param ast_json_codec: The codec used to parse and serialize the document's AST JSON. Defaults to the fastest one
+        available.
+        """
         if not callable(initial_document_ast_json) and not isinstance(initial_document_ast_json, str):
             raise TypeError(f"initial_document_ast_json must be a callable or a str, not {type(initial_document_ast_json)}")
         if not isinstance(output_md_path, (str, pathlib.Path)):
             raise TypeError(f"output_md_path must be a str or a pathlib.Path, not {type(output_md_path)}")
         if not isinstance(save_settings, PandocMarkdownDocumentExportSettings):
             raise TypeError(f"save_settings must be a PandocMarkdownDocumentExportSettings, not {type(save_settings)}")
-
-        self._document_context_manager_factory = lambda: ChangeTrackingPanfluteDocumentContextManager.from_ast_json(document_ast_json=initial_document_ast_json)
+        if content_hash_sidecar is not None and not isinstance(content_hash_sidecar, MarkdownContentHashSidecar):
+            raise TypeError(f"content_hash_sidecar must be a MarkdownContentHashSidecar, not {type(content_hash_sidecar)}")
+        if ast_json_codec is not None and not isinstance(ast_json_codec, PandocAstJsonCodec):
+            raise TypeError(f"ast_json_codec must be a PandocAstJsonCodec, not {type(ast_json_codec)}")
+
+        self._document_context_manager_factory = lambda: ChangeTrackingPanfluteDocumentContextManager.from_ast_json(
+            document_ast_json=initial_document_ast_json,
+            codec=ast_json_codec,
+        )
         self._document_context_manager: Optional[ChangeTrackingPanfluteDocumentContextManager] = None
         self._mode_is_readonly: Optional[bool] = None
         self._is_dirty: bool = False
-        self._output_md_path = output_md_path
+        self._output_md_path = pathlib.Path(output_md_path)
         self._save_settings = save_settings
+        self._content_hash_sidecar = content_hash_sidecar
+        self._is_unverified_against_output = content_hash_sidecar is not None
 
     @classmethod
     def import_md_file(cls,
@@ -55,16 +80,18 @@ class MarkdownDocument:
                                    initial_document_ast_json: Union[str, Callable[[], str]],
                                    output_md_path: Pathlike,
                                    save_settings: PandocMarkdownDocumentExportSettings = PandocMarkdownDocumentExportSettings.create_default_for_onenote_docx_to_obsidian_md(),
+                                   content_hash_sidecar: Optional[MarkdownContentHashSidecar] = None,
                                    ) -> 'MarkdownDocument':
         return cls(
             initial_document_ast_json=initial_document_ast_json,
             output_md_path=output_md_path,
             save_settings=save_settings,
+            content_hash_sidecar=content_hash_sidecar,
         )
 
     @property
     def is_dirty(self) -> bool:
-        return self._is_dirty or not self._output_md_path.exists()
+        return self._is_dirty or self._is_unverified_against_output or not self._output_md_path.exists()
 
     @property
     def is_in_use(self) -> bool:
@@ -101,7 +128,11 @@ class MarkdownDocument:
                 self._document_context_manager.commit_changes()
             self._mode_is_readonly = None
 
-    def _use_panflute_document(self, action: Callable[[panflute.Doc], T], readonly: bool = True) -> T:
+    def _use_panflute_document(self,
+                               action: Callable[[panflute.Doc], T],
+                               readonly: bool = True,
+                               element_types: Optional[Tuple[type, ...]] = None,
+                               ) -> T:
         if readonly:
             if self.is_in_use:
                 raise Exception("Cannot begin read-only action while document is in use elsewhere.")
@@ -115,9 +146,14 @@ class MarkdownDocument:
                 self._document_context_manager = self._document_context_manager_factory()
             self._mode_is_readonly = False
 
+        if element_types:
+            entered_document_context_manager = self._document_context_manager.entered_lazily(element_types)
+        else:
+            entered_document_context_manager = self._document_context_manager
+
         erring = False
         try:
-            with self._document_context_manager:
+            with entered_document_context_manager:
                 return action(self._document_context_manager.panflute_document)
         except:
             erring = True
@@ -131,12 +167,15 @@ class MarkdownDocument:
                 self._document_context_manager.commit_changes()
             self._mode_is_readonly = None
 
-    def _update_panflute_document(self, projection: Callable[[panflute.Doc], panflute.Doc]):
+    def _update_panflute_document(self,
+                                  projection: Callable[[panflute.Doc], panflute.Doc],
+                                  element_types: Optional[Tuple[type, ...]] = None,
+                                  ):
         def as_document_action(doc: panflute.Doc) -> None:
             new_doc = projection(doc)
             self._document_context_manager.panflute_document = new_doc
 
-        self._use_panflute_document(as_document_action, readonly=False)
+        self._use_panflute_document(as_document_action, readonly=False, element_types=element_types)
 
     def update_via_panflute_filter(self,
                                    element_filter: PanfluteElementFilter,
@@ -161,6 +200,7 @@ class MarkdownDocument:
                                     element_filters: Iterable[PanfluteElementFilter] = (),
                                     finalize_filter: Optional[PanfluteDocumentFilter] = None,
                                     stop_if: Optional[PanfluteElementPredicate] = None,
+                                    element_types: Optional[Tuple[type, ...]] = None,
                                     ) -> None:
         """
         Executes one or more filters against the document and its elements. Filtered items are updated in-place using the
@@ -171,6 +211,8 @@ class MarkdownDocument:
         each optionally return a replacement for the element.
         :param finalize_filter: Function executed at the end, right before the document is saved.
         :param stop_if: Function executed on each element of the document. If it returns True, the filters are stopped.
+        :param element_types: If given, the filters only act on elements of these types, so only the top-level blocks
+        containing such elements need to be materialized for them; every other block is left as raw JSON.
         :return: None.
         """
 
@@ -184,7 +226,7 @@ class MarkdownDocument:
             )
             return new_doc
 
-        self._update_panflute_document(document_projection)
+        self._update_panflute_document(document_projection, element_types=element_types)
 
     def update_image_element_urls(self,
                                   change: Union[PanfluteImageElementUrlProjection, Tuple[PanfluteImageElementUrlProjection, ...]],
@@ -209,15 +251,27 @@ class MarkdownDocument:
         element_filters = tuple(functools.partial(element_filter, url_projection=projection) for projection in url_projections)
         self.update_via_panflute_filter(element_filters=element_filters)
 
-    def _run_element_accumulator(self, accumulator: PanfluteElementAccumulator[T]) -> T:
+    def _run_element_accumulator(self,
+                                 accumulator: PanfluteElementAccumulator[T],
+                                 element_types: Optional[Tuple[type, ...]] = None,
+                                 ) -> T:
         with accumulator as (element_filter, stop_if):
             def doc_action(doc: panflute.Doc):
                 panflute.run_filter(action=element_filter, stop_if=stop_if, doc=doc)
-            self._use_panflute_document(doc_action, readonly=True)
+            self._use_panflute_document(doc_action, readonly=True, element_types=element_types)
 
         return accumulator.result
 
-    def count_elements(self, predicate: PanfluteElementPredicate = None) -> int:
+    def count_elements(self,
+                       predicate: PanfluteElementPredicate = None,
+                       element_types: Optional[Tuple[type, ...]] = None,
+                       ) -> int:
+        """
+        Counts the document's elements that satisfy the predicate.
+        :param predicate: The predicate. If None, every element is counted.
+        :param element_types: If given, the predicate only holds for elements of these types, so only the top-level
+        blocks containing such elements need to be materialized.
+        """
         if predicate is None:
             predicate = lambda element, doc: True
 
@@ -228,22 +282,39 @@ class MarkdownDocument:
             return count
 
         accumulator = PanfluteElementAccumulator(accumulator_func, seed=0, stop_if=None)
-        return self._run_element_accumulator(accumulator)
+        return self._run_element_accumulator(accumulator, element_types=element_types)
 
-    def use_text_content(self, action: Callable[[Iterable[AbstractDocumentElementContentText]], T], readonly: bool = True) -> T:
+    def use_text_content(self,
+                         action: Callable[[Iterable[AbstractDocumentElementContentText]], T],
+                         readonly: bool = True,
+                         block_scope: Optional[DocumentBlockScope] = None,
+                         ) -> T:
         """
         Executes the given action against the document's text content.
         :param action: Action to execute. It is passed a generator that yields a map of the document's text content.
         :param readonly: Whether the document should be treated as read-only while action is running.
+        :param block_scope: If given, only the selected top-level blocks are walked and text-mapped.
         :return: The result of the action.
         """
 
         if not isinstance(action, Callable):
             raise TypeError(f"Expected callable, got {action!r}")
+        if block_scope is not None and not isinstance(block_scope, DocumentBlockScope):
+            raise TypeError(f"Expected DocumentBlockScope, got {block_scope!r}")
 
         def continuous_text_map_generator(doc: panflute.Doc) -> Iterable[AbstractDocumentElementContentText]:
+            if block_scope is None:
+                while True:
+                    yield CompoundDocumentElementContentTextMap.from_element_walk(doc)
+
+            # Resolved only once, so that when the previous action removes a selected block, the blocks before it
+            # aren't brought into scope in its place.
+            selected_blocks = block_scope.select_blocks(doc)
             while True:
-                yield CompoundDocumentElementContentTextMap.from_element_walk(doc)
+                remaining_block_ids = {id(block) for block in doc.content}
+                yield CompoundDocumentElementContentTextMap.from_element_walk(
+                    tuple(block for block in selected_blocks if id(block) in remaining_block_ids)
+                )
 
         def document_filter(doc: panflute.Doc) -> T:
             return action(continuous_text_map_generator(doc))
@@ -255,40 +326,77 @@ class MarkdownDocument:
               pandoc_extra_args: Tuple[str, ...] = (),
               cworkdir: Optional[Pathlike] = None,
               overwrite_existing: bool = True,
-              ) -> None:
+              ) -> bool:
         if not overwrite_existing and self._output_md_path.exists():
             raise FileExistsError(f"File {self._output_md_path} already exists.")
 
-        with temporary_file.TemporaryFilePath(suffix=".md", dir=cworkdir) as temp_md_path:
-            self._save_settings.execute_convert_pandoc_ast_json_str_to_markdown_file(
-                input_document_ast_json=document_ast_json,
-                output_md_path=temp_md_path,
-                extra_args=pandoc_extra_args,
-                cworkdir=cworkdir,
-            )
-            if self._output_md_path.exists():
-                # Sometimes 'unlink' fails when the file is open in another process.
+        rendered_content = self._save_settings.execute_convert_pandoc_ast_json_str_to_markdown_str(
+            input_document_ast_json=document_ast_json,
+            extra_args=pandoc_extra_args,
+            cworkdir=cworkdir,
+        ).encode('utf-8')
+        if self._is_output_unchanged(rendered_content):
+            return False
+
+        self._replace_output_content(rendered_content)
+        if self._content_hash_sidecar is not None:
+            self._content_hash_sidecar.write_hash(self._output_md_path, self._content_hash_sidecar.compute_hash(rendered_content))
+        return True
+
+    def _is_output_unchanged(self, rendered_content: bytes) -> bool:
+        recorded_hash = None
+        if self._content_hash_sidecar is not None:
+            recorded_hash = self._content_hash_sidecar.read_hash(self._output_md_path)
+            if recorded_hash is not None and recorded_hash != self._content_hash_sidecar.compute_hash(rendered_content):
+                # The rendering has changed since the file was last written, so there's no need to read the file.
+                return False
+
+        try:
+            existing_content = self._output_md_path.read_bytes()
+        except FileNotFoundError:
+            return False
+        if existing_content != rendered_content:
+            return False
+
+        if self._content_hash_sidecar is not None and recorded_hash is None:
+            self._content_hash_sidecar.write_hash(self._output_md_path, self._content_hash_sidecar.compute_hash(rendered_content))
+        return True
+
+    def _replace_output_content(self, content: bytes) -> None:
+        output_md_path = self._output_md_path
+        # The temporary file must be in the same directory for the replacement to be atomic.
+        with temporary_file.TemporaryFilePath(suffix='.tmp', prefix='.~', dir=output_md_path.parent) as temp_md_path:
+            with temp_md_path.open('xb') as f:
+                f.write(content)
+            if output_md_path.exists():
+                shutil.copymode(output_md_path, temp_md_path)
+            try:
+                os.replace(temp_md_path, output_md_path)
+            except PermissionError:
+                # Replacing fails when the file is open in another process (e.g. on Windows).
                 # So we try to manually overwrite the file content instead.
-                # This also preserves the file's metadata.
-                with temp_md_path.open("rb") as fs:
-                    with self._output_md_path.open("wb") as fd:
-                        shutil.copyfileobj(fs, fd)
-            else:
-                shutil.move(temp_md_path, self._output_md_path)
+                with output_md_path.open('wb') as f:
+                    f.write(content)
 
     def save(self,
              pandoc_extra_args: Tuple[str, ...] = (),
              cworkdir: Optional[Pathlike] = None,
              overwrite_existing: bool = True
-             ) -> None:
+             ) -> bool:
+        """
+        Renders the document to its output Markdown file.
+        :return: False if the write was skipped because the file already held the rendered Markdown, otherwise True.
+        """
         saver = functools.partial(
             self._save,
             pandoc_extra_args=pandoc_extra_args,
             cworkdir=cworkdir,
             overwrite_existing=overwrite_existing,
         )
-        self._use_pandoc_ast_json(saver)
+        written = self._use_pandoc_ast_json(saver)
         self._is_dirty = False
+        self._is_unverified_against_output = False
+        return written
 
     def __str__(self):
         members = ()
@@ -0,0 +1,38 @@
+from typing import Any, Callable, Optional
+
+import orjson
+
+from markdown_dom.PandocAstJsonCodec import PandocAstJsonCodec
+
+
+def _apply_object_hook(value: Any, object_hook: Callable[[dict], Any]) -> Any:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (dict, list)):
+                value[key] = _apply_object_hook(item, object_hook)
+        return object_hook(value)
+    if isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, (dict, list)):
+                value[index] = _apply_object_hook(item, object_hook)
+    return value
+
+
+class OrjsonPandocAstJsonCodec(PandocAstJsonCodec):
+    """
+    Parses and serializes pandoc AST JSON using orjson, which is considerably faster than the standard library.
+    """
+
+    @property
+    def name(self) -> str:
+        return 'orjson'
+
+    def loads(self, document_ast_json: str, object_hook: Optional[Callable[[dict], Any]] = None) -> Any:
+        value = orjson.loads(document_ast_json)
+        if object_hook is not None:
+            # orjson has no object hook, so emulate json's: innermost objects first.
+            value = _apply_object_hook(value, object_hook)
+        return value
+
+    def dumps(self, value: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        return orjson.dumps(value, default=default).decode('utf-8')
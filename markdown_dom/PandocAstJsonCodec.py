@@ -0,0 +1,52 @@
+import json
+
+from typing import Any, Callable, Optional
+
+
+class PandocAstJsonCodec:
+    """
+    Parses and serializes pandoc AST JSON, using the standard library's json module.
+    """
+
+    @property
+    def name(self) -> str:
+        return 'json'
+
+    def loads(self, document_ast_json: str, object_hook: Optional[Callable[[dict], Any]] = None) -> Any:
+        """
+        :param document_ast_json: The JSON to parse.
+        :param object_hook: If given, called with every decoded JSON object, innermost first, and its result used in
+        place of the object.
+        """
+        return json.loads(document_ast_json, object_hook=object_hook)
+
+    def dumps(self, value: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        """
+        :param value: The value to serialize.
+        :param default: If given, called with every value that can't otherwise be serialized, and should return a
+        serializable replacement for it.
+        """
+        return json.dumps(
+            value,
+            default=default,
+            check_circular=False,
+            separators=(',', ':'),  # Compact separators, like pandoc.
+            ensure_ascii=False,  # For pandoc compatibility.
+        )
+
+    @staticmethod
+    def create_default() -> 'PandocAstJsonCodec':
+        """
+        Creates the fastest codec available in the current environment.
+        """
+        try:
+            from markdown_dom.OrjsonPandocAstJsonCodec import OrjsonPandocAstJsonCodec
+            return OrjsonPandocAstJsonCodec()
+        except ImportError:
+            return PandocAstJsonCodec()
+
+    def __str__(self):
+        return f"{self.__class__.__name__}()"
+
+    def __repr__(self):
+        return str(self)
@@ -8,6 +8,7 @@ from markdown_dom.PandocExtensionActivationMap import PandocExtensionActivationM
 from markdown_dom.PandocFormat import PandocFormat
 from markdown_dom.PandocFormatAndExtensions import PandocFormatAndExtensions
 from onenote_export.Pathlike import Pathlike
+from tracing import ExportTracer
 
 
 default_extra_args_for_onenote_docx_to_obsidian_md = (
@@ -151,17 +152,48 @@ class PandocMarkdownDocumentExportSettings:
         if cworkdir is pathlib.Path:
             cworkdir = str(cworkdir)
 
-        result = pypandoc.convert_text(
-            source=input_document_ast_json,
-            format=str(PandocFormat.json),
-            outputfile=output_md_path,
-            to=str(self._output_format_and_extensions),
-            extra_args=extra_args_to_use,
-            verify_format=False,
-            cworkdir=cworkdir
-        )
+        with ExportTracer.current().span('execute_convert_pandoc_ast_json_str_to_markdown_file', 'pandoc', output=str(output_md_path)):
+            result = pypandoc.convert_text(
+                source=input_document_ast_json,
+                format=str(PandocFormat.json),
+                outputfile=output_md_path,
+                to=str(self._output_format_and_extensions),
+                extra_args=extra_args_to_use,
+                verify_format=False,
+                cworkdir=cworkdir
+            )
         assert result is None or isinstance(result, str) and len(result) == 0, f"Unexpected result from pypandoc.convert_text: {result}"
 
+    def execute_convert_pandoc_ast_json_str_to_markdown_str(self, input_document_ast_json: str, extra_args: Optional[Tuple[str, ...]] = None, cworkdir: Optional[Pathlike] = None) -> str:
+        """
+        Renders the document to Markdown, capturing pandoc's output in memory rather than having it write a file.
+        :return: The rendered Markdown, exactly as pandoc emitted it (including its line endings).
+        """
+        if not isinstance(input_document_ast_json, str):
+            raise TypeError(f"input_document_ast_json must be a str, not {type(input_document_ast_json)}")
+        if extra_args is not None and not isinstance(extra_args, tuple):
+            raise TypeError(f"extra_args must be a tuple, not {type(extra_args)}")
+        if cworkdir is not None and not isinstance(cworkdir, str) and not isinstance(cworkdir, pathlib.Path):
+            raise TypeError(f"cworkdir must be a str or a pathlib.Path, not {type(cworkdir)}")
+
+        extra_args_to_use = self.extra_args
+        if extra_args is not None:
+            extra_args_to_use = extra_args_to_use + extra_args
+        if isinstance(cworkdir, pathlib.Path):
+            cworkdir = str(cworkdir)
+
+        with ExportTracer.current().span('execute_convert_pandoc_ast_json_str_to_markdown_str', 'pandoc'):
+            result = pypandoc.convert_text(
+                source=input_document_ast_json,
+                format=str(PandocFormat.json),
+                to=str(self._output_format_and_extensions),
+                extra_args=extra_args_to_use,
+                verify_format=False,
+                cworkdir=cworkdir
+            )
+        assert isinstance(result, str), f"Unexpected result from pypandoc.convert_text: {result!r}"
+        return result
+
     @staticmethod
     def create_default_for_onenote_docx_to_obsidian_md() -> 'PandocMarkdownDocumentExportSettings':
         return PandocMarkdownDocumentExportSettings(
@@ -8,6 +8,7 @@ from markdown_dom.PandocFormatAndExtensions import PandocFormatAndExtensions
 from markdown_dom.PandocMarkdownDocumentExportSettings import default_extra_args_for_onenote_docx_to_obsidian_md, \
     default_output_format_and_extensions_for_onenote_docx_to_obsidian_md
 from onenote_export.Pathlike import Pathlike
+from tracing import ExportTracer
 
 
 default_input_format_and_extensions_for_onenote_docx_to_ast_json = PandocFormatAndExtensions(
@@ -82,14 +83,15 @@ class PandocMarkdownDocumentImportSettings:
         if cworkdir is pathlib.Path:
             cworkdir = str(cworkdir)
 
-        result = pypandoc.convert_file(
-            source_file=input_docx_path,
-            format=str(self._input_format_and_extensions),
-            to=str(PandocFormat.json),
-            extra_args=extra_args_to_use,
-            encoding='utf-8',
-            cworkdir=cworkdir,
-        )
+        with ExportTracer.current().span('execute_convert_docx_file_to_pandoc_ast_json_str', 'pandoc', source=str(input_docx_path)):
+            result = pypandoc.convert_file(
+                source_file=input_docx_path,
+                format=str(self._input_format_and_extensions),
+                to=str(PandocFormat.json),
+                extra_args=extra_args_to_use,
+                encoding='utf-8',
+                cworkdir=cworkdir,
+            )
         assert isinstance(result, str) and len(result) > 0, f"Unexpected result from pypandoc.convert_file: {result}"
         return result
 
@@ -107,14 +109,15 @@ class PandocMarkdownDocumentImportSettings:
         if cworkdir is pathlib.Path:
             cworkdir = str(cworkdir)
 
-        result = pypandoc.convert_file(
-            source_file=input_md_path,
-            format=str(self._input_format_and_extensions),
-            to=str(PandocFormat.json),
-            extra_args=extra_args_to_use,
-            encoding='utf-8',
-            cworkdir=cworkdir,
-        )
+        with ExportTracer.current().span('execute_convert_markdown_file_to_pandoc_ast_json_str', 'pandoc', source=str(input_md_path)):
+            result = pypandoc.convert_file(
+                source_file=input_md_path,
+                format=str(self._input_format_and_extensions),
+                to=str(PandocFormat.json),
+                extra_args=extra_args_to_use,
+                encoding='utf-8',
+                cworkdir=cworkdir,
+            )
         assert isinstance(result, str) and len(result) > 0, f"Unexpected result from pypandoc.convert_file: {result}"
         return result
 
@@ -132,14 +135,15 @@ class PandocMarkdownDocumentImportSettings:
         if cworkdir is pathlib.Path:
             cworkdir = str(cworkdir)
 
-        result = pypandoc.convert_file(
-            source_file=input_html_path,
-            format=str(self._input_format_and_extensions),
-            to=str(PandocFormat.json),
-            extra_args=extra_args_to_use,
-            encoding='utf-8',
-            cworkdir=cworkdir,
-        )
+        with ExportTracer.current().span('execute_convert_html_file_to_pandoc_ast_json_str', 'pandoc', source=str(input_html_path)):
+            result = pypandoc.convert_file(
+                source_file=input_html_path,
+                format=str(self._input_format_and_extensions),
+                to=str(PandocFormat.json),
+                extra_args=extra_args_to_use,
+                encoding='utf-8',
+                cworkdir=cworkdir,
+            )
         assert isinstance(result, str) and len(result) > 0, f"Unexpected result from pypandoc.convert_file: {result}"
         return result
 
@@ -299,7 +299,6 @@ def _yield_document_order_element_content_text_references(
             iteration_stack = tuple(e.content) + iteration_stack
             if synthetic_text_linkage_break_text:
                 iteration_stack = (create_synthetic_text_linkage_break(),) + iteration_stack
-            assert not e.content
         elif isinstance(element, panflute.TableHead):
             e: panflute.TableHead = element
             if synthetic_text_linkage_break_text:
@@ -307,7 +306,6 @@ def _yield_document_order_element_content_text_references(
             iteration_stack = tuple(e.content) + iteration_stack
             if synthetic_text_linkage_break_text:
                 iteration_stack = (create_synthetic_text_linkage_break(),) + iteration_stack
-            assert not e.content
         elif isinstance(element, panflute.TableRow):
             e: panflute.TableRow = element
             if synthetic_text_linkage_break_text:
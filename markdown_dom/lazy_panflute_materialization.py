@@ -0,0 +1,155 @@
+import dataclasses
+
+from typing import Any, FrozenSet, Set, Tuple
+
+import panflute
+
+from markdown_dom.LazyBlockPlaceholder import LazyBlockPlaceholder
+
+
+def _get_element_type_tags(element_types: Tuple[type, ...]) -> FrozenSet[str]:
+    """
+    Gets the pandoc AST tags of the given panflute element types and all of their subclasses, so that abstract types
+    (e.g. panflute.Inline) stand for every concrete type derived from them.
+    """
+    tags = set()
+    pending = list(element_types)
+    while pending:
+        element_type = pending.pop()
+        if element_type.__name__ not in tags:
+            tags.add(element_type.__name__)
+            pending.extend(element_type.__subclasses__())
+    return frozenset(tags)
+
+
+def _find_ast_elements_containing_tags(ast_value: Any, tags: FrozenSet[str]) -> Set[int]:
+    """
+    Finds, in a single bottom-up pass, the AST elements which have one of the given tags or contain an element that has.
+    :return: The ids of those elements' dicts.
+    """
+    result = set()
+
+    def visit(value: Any) -> bool:
+        children = value.values() if isinstance(value, dict) else value
+        contains_tag = False
+        for child in children:
+            if isinstance(child, (dict, list)) and visit(child):
+                contains_tag = True
+        if isinstance(value, dict) and (contains_tag or value.get('t') in tags):
+            result.add(id(value))
+            return True
+        return contains_tag
+
+    visit(ast_value)
+    return result
+
+
+@dataclasses.dataclass(frozen=True)
+class _WantedAstElements:
+    """
+    The wanted element tags, and the ids of the AST elements which have or contain one of them.
+    """
+    tags: FrozenSet[str]
+    containing_element_ids: Set[int]
+
+
+def materialize_panflute_element(ast_value: Any) -> Any:
+    """
+    Materializes parsed pandoc AST JSON into panflute elements, the same way json.loads would with panflute's object hook.
+    """
+    if isinstance(ast_value, dict):
+        return panflute.elements.from_json({
+            k: materialize_panflute_element(v) if isinstance(v, (dict, list)) else v
+            for k, v in ast_value.items()
+        })
+    if isinstance(ast_value, list):
+        return [materialize_panflute_element(v) if isinstance(v, (dict, list)) else v for v in ast_value]
+    return ast_value
+
+
+def _materialize_blocks_lazily(blocks_ast: list, wanted: _WantedAstElements) -> list:
+    return [_materialize_block_lazily(block_ast, wanted) for block_ast in blocks_ast]
+
+
+def _materialize_table_rows_lazily(rows_ast: list, wanted: _WantedAstElements) -> list:
+    return [
+        [row_attr, [[*cell_ast[:4], _materialize_blocks_lazily(cell_ast[4], wanted)] for cell_ast in cells_ast]]
+        for row_attr, cells_ast in rows_ast
+    ]
+
+
+def _materialize_container_content_lazily(tag: str, content_ast: Any, wanted: _WantedAstElements) -> Any:
+    """
+    :return: The content of a block that contains other blocks, with those blocks materialized lazily, or None if the
+    block doesn't contain other blocks.
+    """
+    if tag == 'BlockQuote':
+        return _materialize_blocks_lazily(content_ast, wanted)
+    if tag == 'Div':
+        attr, blocks_ast = content_ast
+        return [attr, _materialize_blocks_lazily(blocks_ast, wanted)]
+    if tag == 'BulletList':
+        return [_materialize_blocks_lazily(item_ast, wanted) for item_ast in content_ast]
+    if tag == 'OrderedList':
+        list_attributes, items_ast = content_ast
+        return [list_attributes, [_materialize_blocks_lazily(item_ast, wanted) for item_ast in items_ast]]
+    if tag == 'DefinitionList':
+        return [
+            [term_ast, [_materialize_blocks_lazily(definition_ast, wanted) for definition_ast in definitions_ast]]
+            for term_ast, definitions_ast in content_ast
+        ]
+    if tag == 'Figure':
+        attr, (short_caption, caption_blocks_ast), blocks_ast = content_ast
+        return [attr, [short_caption, _materialize_blocks_lazily(caption_blocks_ast, wanted)], _materialize_blocks_lazily(blocks_ast, wanted)]
+    if tag == 'Table':
+        attr, (short_caption, caption_blocks_ast), col_specs, (head_attr, head_rows_ast), bodies_ast, (foot_attr, foot_rows_ast) = content_ast
+        return [
+            attr,
+            [short_caption, _materialize_blocks_lazily(caption_blocks_ast, wanted)],
+            col_specs,
+            [head_attr, _materialize_table_rows_lazily(head_rows_ast, wanted)],
+            [
+                [body_attr, row_head_columns, _materialize_table_rows_lazily(head_rows, wanted), _materialize_table_rows_lazily(body_rows, wanted)]
+                for body_attr, row_head_columns, head_rows, body_rows in bodies_ast
+            ],
+            [foot_attr, _materialize_table_rows_lazily(foot_rows_ast, wanted)],
+        ]
+    return None
+
+
+def _materialize_block_lazily(block_ast: Any, wanted: _WantedAstElements) -> panflute.Block:
+    if id(block_ast) not in wanted.containing_element_ids:
+        return LazyBlockPlaceholder(block_ast)
+
+    tag = block_ast['t']
+    # A wanted block is handed over whole, as whatever wants it may look at everything inside it.
+    content_ast = _materialize_container_content_lazily(tag, block_ast['c'], wanted) if tag not in wanted.tags else None
+    if content_ast is None:
+        return materialize_panflute_element(block_ast)
+    # The blocks already materialized (or left as placeholders) within the content are passed through as they are.
+    return materialize_panflute_element({**block_ast, 'c': content_ast})
+
+
+def materialize_panflute_document_lazily(document_ast: dict, element_types: Tuple[type, ...]) -> panflute.Doc:
+    """
+    Builds a panflute document from parsed pandoc AST JSON, only materializing the blocks which contain an element of
+    one of the given types. Blocks that contain other blocks (divs, block quotes, lists, tables and figures) are
+    materialized around their contents, so that only the blocks within them that contain such an element are too. Every
+    other block is left as raw JSON inside a LazyBlockPlaceholder.
+    :param document_ast: The parsed pandoc AST JSON of the whole document.
+    :param element_types: The panflute element types the caller is interested in; abstract types (e.g. panflute.Inline)
+        stand for all of their concrete subclasses.
+    :return: The document.
+    """
+    if not isinstance(document_ast, dict) or 'blocks' not in document_ast:
+        raise TypeError(f"document_ast must be a parsed pandoc AST document, not {type(document_ast)}")
+    if not element_types or not all(isinstance(t, type) and issubclass(t, panflute.Element) for t in element_types):
+        raise TypeError(f"element_types must be a non-empty tuple of panflute element types, not {element_types!r}")
+
+    wanted_tags = _get_element_type_tags(element_types)
+    wanted = _WantedAstElements(wanted_tags, _find_ast_elements_containing_tags(document_ast['blocks'], wanted_tags))
+    return panflute.Doc(
+        *_materialize_blocks_lazily(document_ast['blocks'], wanted),
+        api_version=document_ast['pandoc-api-version'],
+        metadata=materialize_panflute_element(document_ast['meta']),
+    )
@@ -1,3 +1,4 @@
+import itertools
 from typing import TypeVar, Callable, Optional, Sequence, Iterable, Union
 
 import panflute
@@ -25,9 +26,9 @@ def normalize_elementlike(elementlike: PanfluteElementLike) -> Sequence[panflute
     elif isinstance(elementlike, panflute.Element):
         return (elementlike,)
     elif isinstance(elementlike, Sequence):
-        return tuple(normalize_elementlike(e) for e in elementlike)
+        return tuple(itertools.chain.from_iterable(normalize_elementlike(e) for e in elementlike))
     elif isinstance(elementlike, Iterable):
-        return tuple(normalize_elementlike(e) for e in elementlike)
+        return tuple(itertools.chain.from_iterable(normalize_elementlike(e) for e in elementlike))
     elif elementlike is None:
         return tuple()
     else:
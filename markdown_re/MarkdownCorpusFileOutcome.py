@@ -0,0 +1,25 @@
+import dataclasses
+import pathlib
+
+
+@dataclasses.dataclass(frozen=True)
+class MarkdownCorpusFileOutcome:
+    """
+    The outcome of running a MarkdownDocumentTextPattern against one Markdown file of a corpus.
+    """
+
+    md_path: pathlib.Path
+    prefiltered_out: bool = False
+    matched: bool = False
+    rewritten: bool = False
+
+    def __str__(self):
+        if self.prefiltered_out:
+            status = 'prefiltered out'
+        elif self.rewritten:
+            status = 'rewritten'
+        elif self.matched:
+            status = 'matched'
+        else:
+            status = 'not matched'
+        return f'{self.md_path}: {status}'
@@ -2,6 +2,7 @@ import re
 
 from typing import Iterable, Callable, Optional, List, Any, Union
 
+from markdown_dom.DocumentBlockScope import DocumentBlockScope
 from markdown_dom.MarkdownDocument import MarkdownDocument
 from markdown_dom.AbstractDocumentElementContentText import AbstractDocumentElementContentText
 from markdown_dom.CompoundDocumentElementContentTextMap import CompoundDocumentElementContentTextMap
@@ -27,11 +28,19 @@ class MarkdownDocumentTextPattern:
             if flags is not None:
                 raise ValueError("Cannot specify flags when pattern is already a MarkdownDocumentTextPattern")
             self._pattern = pattern._pattern
-        if isinstance(pattern, re.Pattern):
+        elif isinstance(pattern, re.Pattern):
             if flags is not None:
                 raise ValueError("Cannot specify flags when pattern is already a MarkdownDocumentTextPattern")
             self._pattern = pattern
-        self._pattern = re.compile(pattern, flags=flags)
+        else:
+            self._pattern = re.compile(pattern, flags=flags or 0)
+
+    @property
+    def regex(self) -> re.Pattern:
+        """
+        The underlying compiled regular expression.
+        """
+        return self._pattern
 
     def match(self,
               doc: MarkdownDocument,
@@ -39,6 +48,7 @@ class MarkdownDocumentTextPattern:
               pos: Optional[int] = None,
               endpos: Optional[int] = None,
               action_is_readonly: bool = True,
+              block_scope: Optional[DocumentBlockScope] = None,
               ) -> T:
         """
         Try to apply the pattern at the start of the MarkdownDocument's plaintext, returning a match object, or None if no
@@ -48,6 +58,7 @@ class MarkdownDocumentTextPattern:
         :param pos: The position in the string where the search is to start.
         :param endpos: The position in the string where the search is to end.
         :param action_is_readonly: Whether the document should be treated as read-only while action is running.
+        :param block_scope: If given, only the selected top-level blocks of the document are searched.
         :return: A value of type T, as determined by the action function.
         """
 
@@ -62,7 +73,7 @@ class MarkdownDocumentTextPattern:
             mapped_match = DocumentElementContentTextMatch(text_map, underlying_match) if underlying_match else None
             return action(mapped_match)
 
-        return doc.use_text_content(action_wrapper, readonly=action_is_readonly)
+        return doc.use_text_content(action_wrapper, readonly=action_is_readonly, block_scope=block_scope)
 
     def search(self,
                doc: MarkdownDocument,
@@ -70,6 +81,7 @@ class MarkdownDocumentTextPattern:
                pos: Optional[int] = None,
                endpos: Optional[int] = None,
                action_is_readonly: bool = True,
+               block_scope: Optional[DocumentBlockScope] = None,
                ) -> T:
         """
         Scan through the MarkdownDocument's plaintext looking for a match, and return a match object, or None if no match
@@ -79,6 +91,7 @@ class MarkdownDocumentTextPattern:
         :param pos: The position in the string where the search is to start.
         :param endpos: The position in the string where the search is to end.
         :param action_is_readonly: Whether the document should be treated as read-only while action is running.
+        :param block_scope: If given, only the selected top-level blocks of the document are searched.
         :return: A value of type T, as determined by the action function.
         """
 
@@ -93,7 +106,7 @@ class MarkdownDocumentTextPattern:
             mapped_match = DocumentElementContentTextMatch(text_map, underlying_match) if underlying_match else None
             return action(mapped_match)
 
-        return doc.use_text_content(action_wrapper, readonly=action_is_readonly)
+        return doc.use_text_content(action_wrapper, readonly=action_is_readonly, block_scope=block_scope)
 
     def fullmatch(self,
                   doc: MarkdownDocument,
@@ -101,6 +114,7 @@ class MarkdownDocumentTextPattern:
                   pos: Optional[int] = None,
                   endpos: Optional[int] = None,
                   action_is_readonly: bool = True,
+                  block_scope: Optional[DocumentBlockScope] = None,
                   ) -> T:
         """
         Try to apply the pattern to the entirety of the MarkdownDocument's plaintext, returning a match object,
@@ -110,6 +124,7 @@ class MarkdownDocumentTextPattern:
         :param pos: The position in the string where the search is to start.
         :param endpos: The position in the string where the search is to end.
         :param action_is_readonly: Whether the document should be treated as read-only while action is running.
+        :param block_scope: If given, only the selected top-level blocks of the document are searched.
         :return: A value of type T, as determined by the action function.
         """
 
@@ -124,13 +139,14 @@ class MarkdownDocumentTextPattern:
             mapped_match = DocumentElementContentTextMatch(text_map, underlying_match) if underlying_match else None
             return action(mapped_match)
 
-        return doc.use_text_content(action_wrapper, readonly=action_is_readonly)
+        return doc.use_text_content(action_wrapper, readonly=action_is_readonly, block_scope=block_scope)
 
     def findall(self,
                 doc: MarkdownDocument,
                 action: Callable[[List[Any]], T] = lambda m: m,
                 pos: Optional[int] = None,
                 endpos: Optional[int] = None,
+                block_scope: Optional[DocumentBlockScope] = None,
                 ) -> T:
         """
         Return a list of all non-overlapping matches in the MarkdownDocument's plaintext.
@@ -138,6 +154,7 @@ class MarkdownDocumentTextPattern:
         :param action: The action to take on the match.
         :param pos: The position in the string where the search is to start.
         :param endpos: The position in the string where the search is to end.
+        :param block_scope: If given, only the selected top-level blocks of the document are searched.
         :return: A value of type T, as determined by the action function.
         """
 
@@ -151,7 +168,7 @@ class MarkdownDocumentTextPattern:
             found_texts: List[Any] = self._pattern.findall(text_map.text, **inner_findall_kwargs)
             return action(found_texts)
 
-        return doc.use_text_content(action_wrapper, readonly=True)
+        return doc.use_text_content(action_wrapper, readonly=True, block_scope=block_scope)
 
     def finditer(self,
                  doc: MarkdownDocument,
@@ -159,6 +176,7 @@ class MarkdownDocumentTextPattern:
                  pos: Optional[int] = None,
                  endpos: Optional[int] = None,
                  action_is_readonly: bool = True,
+                 block_scope: Optional[DocumentBlockScope] = None,
                  ) -> T:
         """
         Return an iterator over all non-overlapping matches in the MarkdownDocument's plaintext.
@@ -167,6 +185,7 @@ class MarkdownDocumentTextPattern:
         :param pos: The position in the string where the search is to start.
         :param endpos: The position in the string where the search is to end.
         :param action_is_readonly: Whether the document should be treated as read-only while action is running.
+        :param block_scope: If given, only the selected top-level blocks of the document are searched.
         :return: A value of type T, as determined by the action function.
         """
 
@@ -181,13 +200,14 @@ class MarkdownDocumentTextPattern:
             mapped_matches = (DocumentElementContentTextMatch(text_map, m) for m in underlying_matches)
             return action(mapped_matches)
 
-        return doc.use_text_content(action_wrapper, readonly=action_is_readonly)
+        return doc.use_text_content(action_wrapper, readonly=action_is_readonly, block_scope=block_scope)
 
     def sub(self,
             doc: MarkdownDocument,
             repl: Union[PanfluteElementLike, Callable[[DocumentElementContentTextMatch], PanfluteElementLike]],
             pos: Optional[int] = None,
             endpos: Optional[int] = None,
+            block_scope: Optional[DocumentBlockScope] = None,
             ) -> None:
         """
         Update the MarkdownDocument's plaintext to reflect the string obtained by replacing the leftmost non-overlapping
@@ -196,11 +216,12 @@ class MarkdownDocumentTextPattern:
         :param repl: The replacement string.
         :param pos: The position in the string where the search is to start.
         :param endpos: The position in the string where the search is to end.
+        :param block_scope: If given, only the selected top-level blocks of the document are searched.
         :return: A value of type T, as determined by the action function.
         """
 
         if repl == '':
-            return self.rm(doc, pos=pos, endpos=endpos)
+            return self.rm(doc, pos=pos, endpos=endpos, block_scope=block_scope)
 
         if repl is None:
             raise ValueError("repl cannot be None")
@@ -227,12 +248,13 @@ class MarkdownDocumentTextPattern:
                 inner_finditer_kwargs['pos'] = mapped_match.start + replacement_text_len
                 next_underlying_match = next(self._pattern.finditer(text_map.text, **inner_finditer_kwargs), None)
 
-        doc.use_text_content(action_wrapper, readonly=False)
+        doc.use_text_content(action_wrapper, readonly=False, block_scope=block_scope)
 
     def rm(self,
            doc: MarkdownDocument,
            pos: Optional[int] = None,
            endpos: Optional[int] = None,
+           block_scope: Optional[DocumentBlockScope] = None,
            ) -> None:
         """
         Update the MarkdownDocument's plaintext to reflect the string obtained by removing the leftmost non-overlapping
@@ -240,6 +262,7 @@ class MarkdownDocumentTextPattern:
         :param doc: The MarkdownDocument to match against.
         :param pos: The position in the string where the search is to start.
         :param endpos: The position in the string where the search is to end.
+        :param block_scope: If given, only the selected top-level blocks of the document are searched.
         """
 
         def action_wrapper(text_map_generator: Iterable[AbstractDocumentElementContentText]) -> None:
@@ -261,4 +284,4 @@ class MarkdownDocumentTextPattern:
                 inner_finditer_kwargs['pos'] = mapped_match.start
                 next_underlying_match = next(self._pattern.finditer(text_map.text, **inner_finditer_kwargs), None)
 
-        doc.use_text_content(action_wrapper, readonly=False)
+        doc.use_text_content(action_wrapper, readonly=False, block_scope=block_scope)
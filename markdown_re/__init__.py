@@ -2,3 +2,6 @@ from markdown_re.DocumentElementContentTextMatch import DocumentElementContentTe
 from markdown_re.MarkdownDocumentTextPattern import MarkdownDocumentTextPattern
 from markdown_re.re_md import compile, match, search, fullmatch, findall, finditer, sub, rm
 from markdown_re.type_variables import PanfluteElementLike
+from markdown_dom.DocumentBlockScope import DocumentBlockScope
+from markdown_re.MarkdownCorpusFileOutcome import MarkdownCorpusFileOutcome
+from markdown_re.re_md_corpus import search_corpus, sub_corpus, rm_corpus
@@ -0,0 +1,62 @@
+import argparse
+import re
+import sys
+
+from markdown_dom.DocumentBlockScope import DocumentBlockScope
+from markdown_re.re_md_corpus import search_corpus, sub_corpus, rm_corpus
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='python -m markdown_re',
+        description='Search for (and optionally rewrite) a regular expression in the plaintext of every Markdown file below a directory.',
+    )
+    parser.add_argument('pattern', help='The regular expression to run against each document\'s plaintext.')
+    parser.add_argument('corpus_dir', help='The directory (e.g. an exported vault) to search recursively for .md files.')
+    rewrite = parser.add_mutually_exclusive_group()
+    rewrite.add_argument('--repl', help='Replace matches with this text.')
+    rewrite.add_argument('--rm', action='store_true', help='Remove matches.')
+    parser.add_argument('-i', '--ignore-case', action='store_true', help='Match case-insensitively.')
+    parser.add_argument('-m', '--multiline', action='store_true', help='Let ^ and $ match at line boundaries.')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Number of worker processes (default: number of CPUs).')
+    parser.add_argument('--last-blocks', type=int, default=None, help='Only search the last N top-level blocks of each document.')
+    parser.add_argument('--no-prefilter', action='store_true', help='Do not skip files based on a raw-text literal prefilter.')
+    parser.add_argument('-n', '--dry-run', action='store_true', help='Report the files that would be rewritten without writing them.')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+
+    flags = re.RegexFlag(0)
+    if args.ignore_case:
+        flags |= re.IGNORECASE
+    if args.multiline:
+        flags |= re.MULTILINE
+    common_kwargs = dict(
+        block_scope=DocumentBlockScope.last(args.last_blocks) if args.last_blocks is not None else None,
+        flags=flags,
+        max_workers=args.jobs,
+        use_prefilter=not args.no_prefilter,
+    )
+
+    if args.rm:
+        outcomes = rm_corpus(args.pattern, args.corpus_dir, dry_run=args.dry_run, **common_kwargs)
+    elif args.repl is not None:
+        outcomes = sub_corpus(args.pattern, args.corpus_dir, args.repl, dry_run=args.dry_run, **common_kwargs)
+    else:
+        outcomes = search_corpus(args.pattern, args.corpus_dir, **common_kwargs)
+
+    for outcome in outcomes:
+        if outcome.matched:
+            print(outcome)
+    print(f"{len(outcomes)} files, "
+          f"{sum(o.prefiltered_out for o in outcomes)} prefiltered out, "
+          f"{sum(o.matched for o in outcomes)} matched, "
+          f"{sum(o.rewritten for o in outcomes)} rewritten",
+          file=sys.stderr)
+    return 0 if any(o.matched for o in outcomes) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
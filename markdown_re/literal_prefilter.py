@@ -0,0 +1,77 @@
+import re
+
+from typing import Iterable, List, Tuple
+
+try:
+    from re import _parser as _regex_parser
+except ImportError:  # Python < 3.11
+    import sre_parse as _regex_parser
+
+
+_prefilter_token_pattern = re.compile(r'[A-Za-z0-9]{3,}')
+
+
+def _yield_required_literal_runs(parsed_pattern: Iterable) -> Iterable[str]:
+    current_run: List[str] = []
+
+    def flush() -> Iterable[str]:
+        if current_run:
+            yield ''.join(current_run)
+            current_run.clear()
+
+    for op, value in parsed_pattern:
+        op_name = str(op)
+        if op_name == 'LITERAL':
+            current_run.append(chr(value))
+        elif op_name == 'SUBPATTERN':
+            yield from flush()
+            yield from _yield_required_literal_runs(value[-1])
+        elif op_name in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT'):
+            yield from flush()
+            repeat_min, _, repeated_pattern = value
+            if repeat_min >= 1:
+                yield from _yield_required_literal_runs(repeated_pattern)
+        else:
+            # Anything else (alternations, character classes, anchors, lookarounds, …) may or may not consume the text
+            # around it, so it ends the current run.
+            yield from flush()
+
+    yield from flush()
+
+
+def extract_required_literal_tokens(pattern: re.Pattern) -> Tuple[str, ...]:
+    """
+    Extracts lower-cased ASCII alphanumeric tokens which must appear in any text the pattern matches.
+    Only ASCII alphanumerics are kept because Markdown may escape, entity-encode or percent-encode anything else, so the
+    tokens can be looked for in a Markdown file's raw text even though the pattern itself is run against the plaintext of
+    the parsed document.
+    :param pattern: The compiled regular expression.
+    :return: The tokens, or an empty tuple if nothing useful could be extracted.
+    """
+    if not isinstance(pattern, re.Pattern):
+        raise TypeError(f'pattern must be a re.Pattern, not {type(pattern)}')
+    if not isinstance(pattern.pattern, str):
+        return ()
+
+    parsed_pattern = _regex_parser.parse(pattern.pattern, pattern.flags)
+    tokens = ()
+    for run in _yield_required_literal_runs(parsed_pattern):
+        for token in _prefilter_token_pattern.findall(run):
+            token = token.lower()
+            if token not in tokens:
+                tokens += (token,)
+    return tokens
+
+
+def raw_text_could_match(required_literal_tokens: Tuple[str, ...], raw_text: str) -> bool:
+    """
+    Cheaply determines whether a pattern having the given required tokens could possibly match the given raw text.
+    Note that intra-word Markdown formatting (e.g. 'One**Note**') splits tokens in the raw text and defeats the check.
+    :param required_literal_tokens: Tokens, as returned by extract_required_literal_tokens.
+    :param raw_text: The raw Markdown text.
+    :return: False if the pattern cannot match, True if it might.
+    """
+    if not required_literal_tokens:
+        return True
+    raw_text = raw_text.lower()
+    return all(token in raw_text for token in required_literal_tokens)
@@ -2,6 +2,7 @@ import re
 
 from typing import Iterable, Optional, List, Any, Union, Callable
 
+from markdown_dom.DocumentBlockScope import DocumentBlockScope
 from markdown_dom.MarkdownDocument import MarkdownDocument
 from markdown_re.DocumentElementContentTextMatch import DocumentElementContentTextMatch
 from markdown_re.MarkdownDocumentTextPattern import MarkdownDocumentTextPattern
@@ -33,6 +34,7 @@ def match(pattern: MarkdownPatternLike,
           pos: Optional[int] = None,
           endpos: Optional[int] = None,
           action_is_readonly: bool = True,
+          block_scope: Optional[DocumentBlockScope] = None,
           flags: Optional[re.RegexFlag] = None,
           ) -> T:
     """
@@ -43,11 +45,12 @@ def match(pattern: MarkdownPatternLike,
     :param pos: The position at which to start matching; defaults to the beginning of the string.
     :param endpos: The position at which to end matching; defaults to the end of the string.
     :param action_is_readonly: Whether the document should be treated as read-only while action is running.
+    :param block_scope: If given, only the selected top-level blocks of the document are searched.
     :param flags: A bitwise OR of the flags.
     """
 
     pattern = compile(pattern, flags=flags)
-    return pattern.match(doc, action=action, pos=pos, endpos=endpos, action_is_readonly=action_is_readonly)
+    return pattern.match(doc, action=action, pos=pos, endpos=endpos, action_is_readonly=action_is_readonly, block_scope=block_scope)
 
 
 def search(pattern: MarkdownPatternLike,
@@ -56,6 +59,7 @@ def search(pattern: MarkdownPatternLike,
            pos: Optional[int] = None,
            endpos: Optional[int] = None,
            action_is_readonly: bool = True,
+           block_scope: Optional[DocumentBlockScope] = None,
            flags: Optional[re.RegexFlag] = None,
            ) -> T:
     """
@@ -66,11 +70,12 @@ def search(pattern: MarkdownPatternLike,
     :param pos: The position at which to start matching; defaults to the beginning of the string.
     :param endpos: The position at which to end matching; defaults to the end of the string.
     :param action_is_readonly: Whether the document should be treated as read-only while action is running.
+    :param block_scope: If given, only the selected top-level blocks of the document are searched.
     :param flags: A bitwise OR of the flags.
     """
 
     pattern = compile(pattern, flags=flags)
-    return pattern.search(doc, action=action, pos=pos, endpos=endpos, action_is_readonly=action_is_readonly)
+    return pattern.search(doc, action=action, pos=pos, endpos=endpos, action_is_readonly=action_is_readonly, block_scope=block_scope)
 
 
 def fullmatch(pattern: MarkdownPatternLike,
@@ -79,6 +84,7 @@ def fullmatch(pattern: MarkdownPatternLike,
               pos: Optional[int] = None,
               endpos: Optional[int] = None,
               action_is_readonly: bool = True,
+              block_scope: Optional[DocumentBlockScope] = None,
               flags: Optional[re.RegexFlag] = None,
               ) -> T:
     """
@@ -89,11 +95,12 @@ def fullmatch(pattern: MarkdownPatternLike,
     :param pos: The position at which to start matching; defaults to the beginning of the string.
     :param endpos: The position at which to end matching; defaults to the end of the string.
     :param action_is_readonly: Whether the document should be treated as read-only while action is running.
+    :param block_scope: If given, only the selected top-level blocks of the document are searched.
     :param flags: A bitwise OR of the flags.
     """
 
     pattern = compile(pattern, flags=flags)
-    return pattern.fullmatch(doc, action=action, pos=pos, endpos=endpos, action_is_readonly=action_is_readonly)
+    return pattern.fullmatch(doc, action=action, pos=pos, endpos=endpos, action_is_readonly=action_is_readonly, block_scope=block_scope)
 
 
 def findall(pattern: MarkdownPatternLike,
@@ -101,6 +108,7 @@ def findall(pattern: MarkdownPatternLike,
             action: Callable[[List[Any]], T] = lambda m: m,
             pos: Optional[int] = None,
             endpos: Optional[int] = None,
+            block_scope: Optional[DocumentBlockScope] = None,
             flags: Optional[re.RegexFlag] = None,
             ) -> T:
     """
@@ -110,12 +118,13 @@ def findall(pattern: MarkdownPatternLike,
     :param action: A function to apply to the match object, if one is found. The function should take a single argument, which will be the match object, and return a value of type T.
     :param pos: The position at which to start matching; defaults to the beginning of the string.
     :param endpos: The position at which to end matching; defaults to the end of the string.
+    :param block_scope: If given, only the selected top-level blocks of the document are searched.
     :param flags: A bitwise OR of the flags.
     :return: A value of type T, as determined by the action function.
     """
 
     pattern = compile(pattern, flags=flags)
-    return pattern.findall(doc, action=action, pos=pos, endpos=endpos)
+    return pattern.findall(doc, action=action, pos=pos, endpos=endpos, block_scope=block_scope)
 
 
 def finditer(pattern: MarkdownPatternLike,
@@ -124,6 +133,7 @@ def finditer(pattern: MarkdownPatternLike,
              pos: Optional[int] = None,
              endpos: Optional[int] = None,
              action_is_readonly: bool = True,
+             block_scope: Optional[DocumentBlockScope] = None,
              flags: Optional[re.RegexFlag] = None,
              ) -> T:
     """
@@ -134,12 +144,13 @@ def finditer(pattern: MarkdownPatternLike,
     :param pos: The position at which to start matching; defaults to the beginning of the string.
     :param endpos: The position at which to end matching; defaults to the end of the string.
     :param action_is_readonly: Whether the document should be treated as read-only while action is running.
+    :param block_scope: If given, only the selected top-level blocks of the document are searched.
     :param flags: A bitwise OR of the flags.
     :return: A value of type T, as determined by the action function.
     """
 
     pattern = compile(pattern, flags=flags)
-    return pattern.finditer(doc, action=action, pos=pos, endpos=endpos, action_is_readonly=action_is_readonly)
+    return pattern.finditer(doc, action=action, pos=pos, endpos=endpos, action_is_readonly=action_is_readonly, block_scope=block_scope)
 
 
 def sub(pattern: MarkdownPatternLike,
@@ -147,6 +158,7 @@ def sub(pattern: MarkdownPatternLike,
         repl: Union[PanfluteElementLike, Callable[[DocumentElementContentTextMatch], PanfluteElementLike]],
         pos: Optional[int] = None,
         endpos: Optional[int] = None,
+        block_scope: Optional[DocumentBlockScope] = None,
         flags: Optional[re.RegexFlag] = None,
         ) -> None:
     """
@@ -157,17 +169,19 @@ def sub(pattern: MarkdownPatternLike,
     :param repl: The replacement string.
     :param pos: The position at which to start matching; defaults to the beginning of the string.
     :param endpos: The position at which to end matching; defaults to the end of the string.
+    :param block_scope: If given, only the selected top-level blocks of the document are searched.
     :param flags: A bitwise OR of the flags.
     """
 
     pattern = compile(pattern, flags=flags)
-    return pattern.sub(doc, repl, pos=pos, endpos=endpos)[0]
+    return pattern.sub(doc, repl, pos=pos, endpos=endpos, block_scope=block_scope)
 
 
 def rm(pattern: MarkdownPatternLike,
        doc: MarkdownDocument,
        pos: Optional[int] = None,
        endpos: Optional[int] = None,
+       block_scope: Optional[DocumentBlockScope] = None,
        flags: Optional[re.RegexFlag] = None,
        ) -> None:
     """
@@ -177,8 +191,9 @@ def rm(pattern: MarkdownPatternLike,
     :param doc: The MarkdownDocument to match against.
     :param pos: The position at which to start matching; defaults to the beginning of the string.
     :param endpos: The position at which to end matching; defaults to the end of the string.
+    :param block_scope: If given, only the selected top-level blocks of the document are searched.
     :param flags: A bitwise OR of the flags.
     """
 
     pattern = compile(pattern, flags=flags)
-    return pattern.rm(doc, pos=pos, endpos=endpos)
+    return pattern.rm(doc, pos=pos, endpos=endpos, block_scope=block_scope)
@@ -0,0 +1,184 @@
+import concurrent.futures
+import enum
+import functools
+import os
+import pathlib
+import re
+
+from typing import Callable, Iterable, Optional, Tuple, Union
+
+from markdown_dom.DocumentBlockScope import DocumentBlockScope
+from markdown_dom.MarkdownDocument import MarkdownDocument
+from markdown_re.DocumentElementContentTextMatch import DocumentElementContentTextMatch
+from markdown_re.MarkdownCorpusFileOutcome import MarkdownCorpusFileOutcome
+from markdown_re.MarkdownDocumentTextPattern import MarkdownDocumentTextPattern
+from markdown_re.literal_prefilter import extract_required_literal_tokens, raw_text_could_match
+from markdown_re.re_md import MarkdownPatternLike, compile
+from markdown_re.type_variables import PanfluteElementLike
+from onenote_export.Pathlike import Pathlike
+
+
+CorpusReplacement = Union[PanfluteElementLike, Callable[[DocumentElementContentTextMatch], PanfluteElementLike]]
+
+
+@enum.unique
+class _CorpusOperation(enum.Enum):
+    SEARCH = 'search'
+    SUB = 'sub'
+    RM = 'rm'
+
+
+def iter_corpus_md_files(corpus_dir: Pathlike) -> Iterable[pathlib.Path]:
+    """
+    Yields every Markdown file below the given directory, in a stable order.
+    :param corpus_dir: The root directory of the corpus (e.g. an exported vault).
+    """
+    if isinstance(corpus_dir, str):
+        corpus_dir = pathlib.Path(corpus_dir)
+    if not isinstance(corpus_dir, pathlib.Path):
+        raise TypeError(f"corpus_dir must be a str or pathlib.Path, not {type(corpus_dir)}")
+    if not corpus_dir.is_dir():
+        raise NotADirectoryError(f"corpus_dir must be an existing directory: {corpus_dir}")
+
+    return iter(sorted(p for p in corpus_dir.rglob('*.md') if p.is_file()))
+
+
+def _process_corpus_file(md_path: pathlib.Path,
+                         pattern: MarkdownDocumentTextPattern,
+                         operation: _CorpusOperation,
+                         required_literal_tokens: Tuple[str, ...],
+                         repl: Optional[CorpusReplacement],
+                         block_scope: Optional[DocumentBlockScope],
+                         dry_run: bool,
+                         ) -> MarkdownCorpusFileOutcome:
+    raw_text = md_path.read_text(encoding='utf-8', errors='surrogateescape')
+    if not raw_text_could_match(required_literal_tokens, raw_text):
+        return MarkdownCorpusFileOutcome(md_path, prefiltered_out=True)
+
+    doc = MarkdownDocument.import_md_file(md_path)
+    matched = pattern.search(doc, action=lambda m: m is not None, block_scope=block_scope)
+    if not matched or operation == _CorpusOperation.SEARCH or dry_run:
+        return MarkdownCorpusFileOutcome(md_path, matched=matched)
+
+    if operation == _CorpusOperation.RM:
+        pattern.rm(doc, block_scope=block_scope)
+    else:
+        pattern.sub(doc, repl, block_scope=block_scope)
+    doc.save()
+    return MarkdownCorpusFileOutcome(md_path, matched=True, rewritten=True)
+
+
+def _run_corpus_operation(pattern: MarkdownPatternLike,
+                          corpus_dir: Pathlike,
+                          operation: _CorpusOperation,
+                          repl: Optional[CorpusReplacement],
+                          block_scope: Optional[DocumentBlockScope],
+                          flags: Optional[re.RegexFlag],
+                          max_workers: Optional[int],
+                          use_prefilter: bool,
+                          dry_run: bool,
+                          ) -> Tuple[MarkdownCorpusFileOutcome, ...]:
+    pattern = compile(pattern, flags=flags)
+    md_paths = tuple(iter_corpus_md_files(corpus_dir))
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, received {max_workers}")
+
+    process_file = functools.partial(
+        _process_corpus_file,
+        pattern=pattern,
+        operation=operation,
+        required_literal_tokens=extract_required_literal_tokens(pattern.regex) if use_prefilter else (),
+        repl=repl,
+        block_scope=block_scope,
+        dry_run=dry_run,
+    )
+
+    worker_count = min(max_workers or os.cpu_count() or 1, len(md_paths))
+    if worker_count <= 1:
+        return tuple(map(process_file, md_paths))
+
+    # Small chunks keep the workers balanced, since files needing a pandoc round-trip take far longer than those that
+    # are prefiltered out.
+    chunksize = max(1, min(32, len(md_paths) // (worker_count * 8)))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=worker_count) as executor:
+        return tuple(executor.map(process_file, md_paths, chunksize=chunksize))
+
+
+def search_corpus(pattern: MarkdownPatternLike,
+                  corpus_dir: Pathlike,
+                  *,
+                  block_scope: Optional[DocumentBlockScope] = None,
+                  flags: Optional[re.RegexFlag] = None,
+                  max_workers: Optional[int] = None,
+                  use_prefilter: bool = True,
+                  ) -> Tuple[MarkdownCorpusFileOutcome, ...]:
+    """
+    Scan through the plaintext of every Markdown file in a corpus looking for a match.
+    :param pattern: The regular expression pattern to use. If this is a MarkdownDocumentTextPattern, it will be used as-is. Otherwise, it will be compiled into a MarkdownDocumentTextPattern.
+    :param corpus_dir: The root directory of the corpus; it is searched recursively for '.md' files.
+    :param block_scope: If given, only the selected top-level blocks of each document are searched.
+    :param flags: A bitwise OR of the flags.
+    :param max_workers: The maximum number of worker processes; defaults to the number of CPUs.
+    :param use_prefilter: Whether to skip files whose raw text lacks the pattern's required literal text.
+    :return: The outcome for each file, in path order.
+    """
+
+    return _run_corpus_operation(pattern, corpus_dir, _CorpusOperation.SEARCH, None, block_scope, flags, max_workers,
+                                 use_prefilter, dry_run=True)
+
+
+def sub_corpus(pattern: MarkdownPatternLike,
+               corpus_dir: Pathlike,
+               repl: CorpusReplacement,
+               *,
+               block_scope: Optional[DocumentBlockScope] = None,
+               flags: Optional[re.RegexFlag] = None,
+               max_workers: Optional[int] = None,
+               use_prefilter: bool = True,
+               dry_run: bool = False,
+               ) -> Tuple[MarkdownCorpusFileOutcome, ...]:
+    """
+    Replace the leftmost non-overlapping occurrences of pattern in the plaintext of every Markdown file in a corpus, and
+    write back the files that matched.
+    :param pattern: The regular expression pattern to use. If this is a MarkdownDocumentTextPattern, it will be used as-is. Otherwise, it will be compiled into a MarkdownDocumentTextPattern.
+    :param corpus_dir: The root directory of the corpus; it is searched recursively for '.md' files.
+    :param repl: The replacement. If callable, it must be picklable (e.g. a module-level function) to reach the workers.
+    :param block_scope: If given, only the selected top-level blocks of each document are searched.
+    :param flags: A bitwise OR of the flags.
+    :param max_workers: The maximum number of worker processes; defaults to the number of CPUs.
+    :param use_prefilter: Whether to skip files whose raw text lacks the pattern's required literal text.
+    :param dry_run: If True, report which files would be rewritten without writing anything.
+    :return: The outcome for each file, in path order.
+    """
+
+    if repl is None:
+        raise ValueError("repl cannot be None")
+    operation = _CorpusOperation.RM if repl == '' else _CorpusOperation.SUB
+    return _run_corpus_operation(pattern, corpus_dir, operation, repl, block_scope, flags, max_workers, use_prefilter,
+                                 dry_run)
+
+
+def rm_corpus(pattern: MarkdownPatternLike,
+              corpus_dir: Pathlike,
+              *,
+              block_scope: Optional[DocumentBlockScope] = None,
+              flags: Optional[re.RegexFlag] = None,
+              max_workers: Optional[int] = None,
+              use_prefilter: bool = True,
+              dry_run: bool = False,
+              ) -> Tuple[MarkdownCorpusFileOutcome, ...]:
+    """
+    Remove the leftmost non-overlapping occurrences of pattern in the plaintext of every Markdown file in a corpus, and
+    write back the files that matched.
+    :param pattern: The regular expression pattern to use. If this is a MarkdownDocumentTextPattern, it will be used as-is. Otherwise, it will be compiled into a MarkdownDocumentTextPattern.
+    :param corpus_dir: The root directory of the corpus; it is searched recursively for '.md' files.
+    :param block_scope: If given, only the selected top-level blocks of each document are searched.
+    :param flags: A bitwise OR of the flags.
+    :param max_workers: The maximum number of worker processes; defaults to the number of CPUs.
+    :param use_prefilter: Whether to skip files whose raw text lacks the pattern's required literal text.
+    :param dry_run: If True, report which files would be rewritten without writing anything.
+    :return: The outcome for each file, in path order.
+    """
+
+    return _run_corpus_operation(pattern, corpus_dir, _CorpusOperation.RM, None, block_scope, flags, max_workers,
+                                 use_prefilter, dry_run)
@@ -0,0 +1,172 @@
+import html
+import posixpath
+import re
+import urllib.parse
+
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+from .MhtmlContainer import MhtmlContainer
+from .MhtmlContainerHeaders import MhtmlContainerHeaders
+from .MhtmlContentItem import MhtmlContentItem
+
+
+_html_reference_pattern = re.compile(
+    r'''(?P<attribute>\b(?:src|href)\s*=\s*)(?:"(?P<double_quoted>[^"]*)"|'(?P<single_quoted>[^']*)'|(?P<unquoted>[^\s>"']+))''',
+    re.IGNORECASE,
+)
+_main_file_link_pattern = re.compile(r'''<link\b[^>]*\brel\s*=\s*["']?Main-File\b[^>]*>''', re.IGNORECASE)
+_asset_file_name_pattern = re.compile(r'^(?P<stem>.*?)\d*(?P<suffix>\.[^.]*)?$')
+_title_pattern = re.compile(r'<title\b[^>]*>(?P<text>.*?)</title\s*>', re.IGNORECASE | re.DOTALL)
+_anchor_pattern = re.compile(r'(?P<start_tag><a\b[^>]*>)(?P<text>.*?)</a\s*>', re.IGNORECASE | re.DOTALL)
+_tag_pattern = re.compile(r'<[^>]*>')
+_non_asset_content_types = ('text/html', 'text/xml')
+
+
+def _is_content_type(item: MhtmlContentItem, content_types: Sequence[str]) -> bool:
+    return item.content_type is not None and item.content_type.value.lower().startswith(content_types)
+
+
+def _iter_referenced_locations(document_item: MhtmlContentItem, text: Optional[str] = None) -> Iterator[Tuple[re.Match, str]]:
+    for match in _html_reference_pattern.finditer(document_item.body if text is None else text):
+        reference = next(group for group in match.group('double_quoted', 'single_quoted', 'unquoted') if group is not None)
+        yield match, urllib.parse.urldefrag(urllib.parse.urljoin(document_item.content_location, html.unescape(reference))).url
+
+
+def _get_html_text(html_fragment: str) -> str:
+    return ' '.join(html.unescape(_tag_pattern.sub('', html_fragment)).split())
+
+
+def _get_main_and_document_items(container: MhtmlContainer, document_count: int) -> Tuple[Tuple[MhtmlContentItem, ...], Tuple[MhtmlContentItem, ...]]:
+    html_items = tuple(item for item in container.content_items if _is_content_type(item, ('text/html',)))
+    for item in html_items:
+        if not item.content_location:
+            raise ValueError(f'HTML document has no Content-Location: {item!r}')
+        if not isinstance(item.body, str):
+            raise ValueError(f'HTML document body was not decoded to text: {item.content_location!r}')
+
+    # Each document names the main document (a table of contents, where there are several) in its "Main-File" link.
+    main_file_locations = {
+        location
+        for item in html_items
+        for main_file_link in _main_file_link_pattern.finditer(item.body)
+        for _, location in _iter_referenced_locations(item, main_file_link.group(0))
+        if location != item.content_location
+    }
+    main_items = tuple(item for item in html_items if item.content_location in main_file_locations)
+    document_items = tuple(item for item in html_items if item.content_location not in main_file_locations)
+    if len(document_items) != document_count:
+        raise ValueError(f'Expected {document_count} HTML documents (besides any main document), found {len(document_items)}')
+    return main_items, document_items
+
+
+def _get_document_items(container: MhtmlContainer, document_count: int) -> Tuple[MhtmlContentItem, ...]:
+    _, document_items = _get_main_and_document_items(container, document_count)
+    return document_items
+
+
+def _create_asset_file_name(content_location: str, ordinal: int) -> str:
+    file_name = posixpath.basename(urllib.parse.urlsplit(content_location).path)
+    match = _asset_file_name_pattern.match(file_name)
+    stem = match.group('stem') or 'file'
+    suffix = match.group('suffix') or ''
+    return f'{stem}{ordinal:03d}{suffix}'
+
+
+def _split_document(container_headers: MhtmlContainerHeaders,
+                    document_item: MhtmlContentItem,
+                    items_by_content_location: Dict[str, MhtmlContentItem],
+                    file_base_name: str,
+                    ) -> MhtmlContainer:
+    document_location = document_item.content_location
+    document_dir_location = urllib.parse.urljoin(document_location, '.')
+    files_dir = f'{file_base_name}_files'
+    asset_file_names: Dict[MhtmlContentItem, str] = {}
+
+    def rewrite_reference(match: re.Match, referenced_location: str) -> str:
+        referenced_item: Optional[MhtmlContentItem] = items_by_content_location.get(referenced_location)
+        if referenced_item is None or _is_content_type(referenced_item, _non_asset_content_types):
+            return match.group(0)
+        if referenced_item not in asset_file_names:
+            asset_file_names[referenced_item] = _create_asset_file_name(referenced_location, len(asset_file_names) + 1)
+        quote = '"' if match.group('double_quoted') is not None else "'" if match.group('single_quoted') is not None else ''
+        return f'{match.group("attribute")}{quote}{files_dir}/{asset_file_names[referenced_item]}{quote}'
+
+    document_body_parts = []
+    document_body_position = 0
+    for match, referenced_location in _iter_referenced_locations(document_item):
+        document_body_parts += [document_item.body[document_body_position:match.start()], rewrite_reference(match, referenced_location)]
+        document_body_position = match.end()
+    document_body = ''.join(document_body_parts) + document_item.body[document_body_position:]
+    content_items = (
+        MhtmlContentItem({**document_item._headers, 'Content-Location': f'{document_dir_location}{file_base_name}.htm'}, document_body),
+        *(
+            MhtmlContentItem({**item._headers, 'Content-Location': f'{document_dir_location}{files_dir}/{asset_file_name}'}, item.body)
+            for item, asset_file_name in asset_file_names.items()
+        ),
+    )
+    return MhtmlContainer(container_headers, content_items)
+
+
+def get_mhtml_document_titles(container: MhtmlContainer, document_count: int) -> Tuple[Optional[str], ...]:
+    """
+    Gets the title of each HTML document in an MHTML container holding several (e.g. a whole OneNote section): the text
+    of its own '<title>', or else of the main document's link to it (OneNote titles only the main document, whose links
+    to the pages are named after them).
+    :param container: The container holding the documents.
+    :param document_count: How many documents the container is expected to hold, not counting the main document.
+    :return: Each document's title (or None where it has none), in the order they appear in the container.
+    :raises ValueError: If the container doesn't hold the expected number of documents.
+    """
+    if not isinstance(container, MhtmlContainer):
+        raise TypeError(f"container must be an instance of MhtmlContainer, not {type(container)}")
+
+    main_items, document_items = _get_main_and_document_items(container, document_count)
+    linked_titles: Dict[str, str] = {}
+    for main_item in main_items:
+        for anchor in _anchor_pattern.finditer(main_item.body):
+            for _, location in _iter_referenced_locations(main_item, anchor.group('start_tag')):
+                linked_titles.setdefault(location, _get_html_text(anchor.group('text')))
+
+    titles = []
+    for document_item in document_items:
+        title = _title_pattern.search(document_item.body)
+        titles.append(_get_html_text(title.group('text')) if title else linked_titles.get(document_item.content_location))
+    return tuple(titles)
+
+
+def split_mhtml_documents(container: MhtmlContainer,
+                          document_count: int,
+                          file_base_name: str = 'page',
+                          document_indices: Optional[Sequence[int]] = None,
+                          ) -> Tuple[MhtmlContainer, ...]:
+    """
+    Splits an MHTML container holding several HTML documents (e.g. a whole OneNote section, one document per page) into
+    a container per document, laid out the way a single document is published: '<file_base_name>.htm', with the
+    assets it references under '<file_base_name>_files/'. Each document's references to its assets are rewritten to
+    match; an asset referenced by several documents is copied into each of them.
+    :param container: The container to split.
+    :param document_count: How many documents the container is expected to hold, not counting the main document the
+        others name as their "Main-File".
+    :param file_base_name: The base name to give each document.
+    :param document_indices: Which of the documents to split out, by their index in the container. All of them if None.
+    :return: A container per document split out, in the order they appear in the container (or in document_indices).
+    :raises ValueError: If the container doesn't hold the expected number of documents, e.g. because it wasn't laid out
+        as expected.
+    """
+    if not isinstance(container, MhtmlContainer):
+        raise TypeError(f"container must be an instance of MhtmlContainer, not {type(container)}")
+    if not isinstance(document_count, int):
+        raise TypeError(f"document_count must be an int, not {type(document_count)}")
+    if document_count < 1:
+        raise ValueError(f"document_count must be >= 1, received {document_count}")
+
+    document_items = _get_document_items(container, document_count)
+    if document_indices is not None:
+        if not all(isinstance(i, int) and 0 <= i < document_count for i in document_indices):
+            raise ValueError(f"document_indices must be indices of the container's {document_count} documents, received {document_indices!r}")
+        document_items = tuple(document_items[i] for i in document_indices)
+    items_by_content_location = {item.content_location: item for item in container.content_items if item.content_location}
+    return tuple(
+        _split_document(container, document_item, items_by_content_location, file_base_name)
+        for document_item in document_items
+    )
@@ -0,0 +1,139 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import queue
+import threading
+
+from logging import getLogger
+from typing import Callable, ContextManager, Optional, TypeVar
+from xml.etree import ElementTree
+
+from onenote_export.Pathlike import Pathlike
+from .HierarchyScope import HierarchyScope
+from .OneNoteAPI import OneNoteAPI
+from .PageInfo import PageInfo
+from .PublishFormat import PublishFormat
+from .XMLSchema import XMLSchema
+
+
+T = TypeVar('T')
+_ComCall = Callable[[OneNoteAPI], T]
+
+
+class AsyncOneNoteAPI(ContextManager['AsyncOneNoteAPI']):
+    """
+    An asyncio facade over OneNoteAPI. Every call is queued to a single thread that owns the OneNoteAPI (and so its COM
+    dispatch), and is made there, in the order the calls were queued; the caller gets an awaitable for its result.
+    While a call waits on OneNote, the event loop is free to run other work, such as subprocesses and file I/O.
+    The thread initializes COM as a single-threaded apartment (where pythoncom is available) and creates the OneNoteAPI
+    itself, because an apartment-threaded COM object must only be used from the thread that created it.
+    """
+
+    def __init__(self, create_onenote_api: Callable[[], OneNoteAPI] = OneNoteAPI, thread_name: str = 'OneNoteCOM'):
+        """
+        :param create_onenote_api: Creates the OneNoteAPI, on the COM thread.
+        :param thread_name: The name of the COM thread.
+        """
+        if not callable(create_onenote_api):
+            raise TypeError(f"create_onenote_api must be callable, not {type(create_onenote_api)}")
+
+        self._create_onenote_api = create_onenote_api
+        self._calls: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._is_closed = False
+        self._logger = getLogger(__name__)
+        self._thread = threading.Thread(target=self._run_com_thread, name=thread_name, daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def _initialize_com_apartment() -> Optional[Callable[[], None]]:
+        # Imported here so that everything but the live backend works without the Windows-only COM modules.
+        try:
+            import pythoncom
+        except ImportError:
+            return None
+        pythoncom.CoInitialize()
+        return pythoncom.CoUninitialize
+
+    def _run_com_thread(self):
+        uninitialize_com_apartment = self._initialize_com_apartment()
+        try:
+            onenote_api: Optional[OneNoteAPI] = None
+            onenote_api_error: Optional[BaseException] = None
+            try:
+                onenote_api = self._create_onenote_api()
+            except BaseException as e:
+                self._logger.error('Failed to create the OneNoteAPI on the COM thread.', exc_info=True)
+                onenote_api_error = e
+
+            while True:
+                queued = self._calls.get()
+                if queued is None:
+                    break
+                context, com_call, future = queued
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if onenote_api_error is not None:
+                    future.set_exception(onenote_api_error)
+                    continue
+                try:
+                    future.set_result(context.run(com_call, onenote_api))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            if uninitialize_com_apartment is not None:
+                uninitialize_com_apartment()
+
+    def submit(self, com_call: _ComCall) -> concurrent.futures.Future:
+        """
+        Queues a call to be made with the OneNoteAPI, on the COM thread, in a copy of the calling context (so that it
+        is traced into the caller's current tracer).
+        :param com_call: Makes the call, given the OneNoteAPI.
+        :return: A future for the call's result.
+        """
+        if not callable(com_call):
+            raise TypeError(f"com_call must be callable, not {type(com_call)}")
+        future = concurrent.futures.Future()
+        with self._lock:
+            if self._is_closed:
+                raise RuntimeError('AsyncOneNoteAPI is closed')
+            self._calls.put((contextvars.copy_context(), com_call, future))
+        return future
+
+    async def call(self, com_call: _ComCall) -> T:
+        """
+        Makes a call with the OneNoteAPI on the COM thread, without blocking the event loop while it runs.
+        :param com_call: Makes the call, given the OneNoteAPI.
+        :return: The call's result.
+        """
+        return await asyncio.wrap_future(self.submit(com_call))
+
+    async def get_hierarchy(self, node_id: str, hierarchy_scope: HierarchyScope, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        return await self.call(lambda onenote_api: onenote_api.get_hierarchy(node_id, hierarchy_scope, schema))
+
+    async def publish(self, page_id: str, target_file_path: Pathlike, publish_format: PublishFormat, clsid_of_exporter: str = ""):
+        return await self.call(lambda onenote_api: onenote_api.publish(page_id, target_file_path, publish_format, clsid_of_exporter))
+
+    async def get_page_content(self, page_id: str, page_info: PageInfo, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        return await self.call(lambda onenote_api: onenote_api.get_page_content(page_id, page_info, schema))
+
+    async def get_binary_page_content(self, page_id: str, callback_id: str) -> bytes:
+        return await self.call(lambda onenote_api: onenote_api.get_binary_page_content(page_id, callback_id))
+
+    def close(self):
+        """
+        Stops taking calls, waits for those already queued to finish, and then stops the COM thread.
+        """
+        with self._lock:
+            if self._is_closed:
+                return
+            self._is_closed = True
+            self._calls.put(None)
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> 'AsyncOneNoteAPI':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
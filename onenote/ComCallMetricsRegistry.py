@@ -0,0 +1,127 @@
+import bisect
+import math
+import threading
+
+from typing import Dict, List
+
+from .ComMethodCallMetrics import ComMethodCallMetrics
+
+
+# Attempt latencies are counted into fixed, log-spaced buckets rather than kept, so that a long export's metrics take
+# the same memory as a short one's. With 20 buckets per decade, a reported percentile is at most ~12% above the latency
+# it stands for. Latencies beyond the last bucket are counted in it.
+_LATENCY_BUCKETS_PER_DECADE = 20
+_LATENCY_BUCKET_UPPER_BOUNDS_SECONDS = tuple(
+    1e-4 * 10 ** (i / _LATENCY_BUCKETS_PER_DECADE)
+    for i in range(7 * _LATENCY_BUCKETS_PER_DECADE + 1)
+)
+
+
+class _ComMethodCallRecorder:
+    def __init__(self):
+        self.call_count = 0
+        self.failure_count = 0
+        self.retry_count = 0
+        self.total_backoff_seconds = 0.0
+        self.attempt_count = 0
+        self.total_latency_seconds = 0.0
+        self.max_latency_seconds = 0.0
+        self.attempt_counts_by_latency_bucket: List[int] = [0] * len(_LATENCY_BUCKET_UPPER_BOUNDS_SECONDS)
+
+    def record_attempt(self, latency_seconds: float):
+        bucket = min(bisect.bisect_left(_LATENCY_BUCKET_UPPER_BOUNDS_SECONDS, latency_seconds), len(_LATENCY_BUCKET_UPPER_BOUNDS_SECONDS) - 1)
+        self.attempt_counts_by_latency_bucket[bucket] += 1
+        self.attempt_count += 1
+        self.total_latency_seconds += latency_seconds
+        self.max_latency_seconds = max(self.max_latency_seconds, latency_seconds)
+
+    def percentile(self, p: float) -> float:
+        if not self.attempt_count:
+            return 0.0
+        rank = max(1, math.ceil(p / 100 * self.attempt_count))
+        cumulative_count = 0
+        for upper_bound_seconds, count in zip(_LATENCY_BUCKET_UPPER_BOUNDS_SECONDS, self.attempt_counts_by_latency_bucket):
+            cumulative_count += count
+            if cumulative_count >= rank:
+                return min(upper_bound_seconds, self.max_latency_seconds)
+        return self.max_latency_seconds
+
+
+class ComCallMetricsRegistry:
+    """
+    Accumulates, per OneNote COM method, how many calls were made, how long attempts took and how much time was spent
+    backing off before retries. Latency percentiles are approximate, as attempts are counted into log-spaced buckets.
+    Safe to record into from multiple threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._recorders: Dict[str, _ComMethodCallRecorder] = {}
+
+    def _get_recorder(self, method_name: str) -> _ComMethodCallRecorder:
+        recorder = self._recorders.get(method_name)
+        if recorder is None:
+            recorder = self._recorders[method_name] = _ComMethodCallRecorder()
+        return recorder
+
+    def record_attempt(self, method_name: str, latency_seconds: float):
+        """
+        Records a single attempt at invoking a COM method, whether it succeeded or not.
+        :param method_name: The name of the method invoked.
+        :param latency_seconds: How long the attempt took.
+        """
+        with self._lock:
+            self._get_recorder(method_name).record_attempt(latency_seconds)
+
+    def record_backoff(self, method_name: str, backoff_seconds: float):
+        """
+        Records that a failed attempt at invoking a COM method is going to be retried after backing off.
+        :param method_name: The name of the method invoked.
+        :param backoff_seconds: How long is being waited before the retry.
+        """
+        with self._lock:
+            recorder = self._get_recorder(method_name)
+            recorder.retry_count += 1
+            recorder.total_backoff_seconds += backoff_seconds
+
+    def record_call(self, method_name: str, succeeded: bool):
+        """
+        Records the outcome of a call to a COM method, once it is done with any retries.
+        :param method_name: The name of the method invoked.
+        :param succeeded: Whether the call ultimately returned a result.
+        """
+        with self._lock:
+            recorder = self._get_recorder(method_name)
+            recorder.call_count += 1
+            if not succeeded:
+                recorder.failure_count += 1
+
+    def snapshot(self) -> Dict[str, ComMethodCallMetrics]:
+        """
+        Summarizes what has been recorded so far.
+        :return: The metrics of each method invoked, by method name, in order of first invocation.
+        """
+        with self._lock:
+            return {
+                method_name: ComMethodCallMetrics(
+                    method_name=method_name,
+                    call_count=recorder.call_count,
+                    failure_count=recorder.failure_count,
+                    attempt_count=recorder.attempt_count,
+                    retry_count=recorder.retry_count,
+                    total_backoff_seconds=recorder.total_backoff_seconds,
+                    total_latency_seconds=recorder.total_latency_seconds,
+                    p50_latency_seconds=recorder.percentile(50),
+                    p95_latency_seconds=recorder.percentile(95),
+                    p99_latency_seconds=recorder.percentile(99),
+                    max_latency_seconds=recorder.max_latency_seconds,
+                )
+                for method_name, recorder in self._recorders.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._recorders.clear()
+
+
+default_com_call_metrics_registry = ComCallMetricsRegistry()
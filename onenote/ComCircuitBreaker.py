@@ -0,0 +1,64 @@
+import threading
+
+from logging import getLogger
+from typing import Optional
+
+from .MonotonicClock import MonotonicClock
+
+
+class ComCircuitBreaker:
+    """
+    Trips after too many consecutive retryable COM failures, across all calls sharing it. While tripped, every caller
+    waits out a single shared pause before its next attempt, rather than each call backing off on its own.
+    """
+
+    def __init__(self, failure_threshold: int = 5, open_seconds: float = 15.0):
+        """
+        :param failure_threshold: The number of consecutive retryable failures that trips the breaker.
+        :param open_seconds: How long calls are paused once the breaker trips.
+        """
+        if not isinstance(failure_threshold, int):
+            raise TypeError(f"failure_threshold must be an int, not {type(failure_threshold)}")
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be >= 1, received {failure_threshold}")
+        if open_seconds < 0:
+            raise ValueError(f"open_seconds must be >= 0, received {open_seconds}")
+
+        self._failure_threshold = failure_threshold
+        self._open_seconds = open_seconds
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._open_until: Optional[float] = None
+        self._logger = getLogger(__name__)
+
+    def is_open(self, clock: MonotonicClock) -> bool:
+        with self._lock:
+            return self._open_until is not None and self._open_until > clock.monotonic()
+
+    def record_failure(self, clock: MonotonicClock):
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._consecutive_failures < self._failure_threshold:
+                return
+            self._consecutive_failures = 0
+            self._open_until = clock.monotonic() + self._open_seconds
+        self._logger.warning(f"OneNote is failing repeatedly; pausing all COM calls for {self._open_seconds} seconds…")
+
+    def record_success(self):
+        with self._lock:
+            self._consecutive_failures = 0
+
+    def wait_until_closed(self, clock: MonotonicClock):
+        """
+        Blocks until the breaker is no longer tripped.
+        :param clock: The clock to check and sleep against.
+        """
+        while True:
+            with self._lock:
+                if self._open_until is None:
+                    return
+                remaining_seconds = self._open_until - clock.monotonic()
+                if remaining_seconds <= 0:
+                    self._open_until = None
+                    return
+            clock.sleep(remaining_seconds)
@@ -0,0 +1,27 @@
+import dataclasses
+
+
+@dataclasses.dataclass(frozen=True)
+class ComMethodCallMetrics:
+    """
+    A point-in-time summary of the calls made to one OneNote COM method.
+    """
+    method_name: str
+    call_count: int
+    failure_count: int
+    attempt_count: int
+    retry_count: int
+    total_backoff_seconds: float
+    total_latency_seconds: float
+    p50_latency_seconds: float
+    p95_latency_seconds: float
+    p99_latency_seconds: float
+    max_latency_seconds: float
+
+    def __str__(self):
+        return \
+            f"{self.method_name}: {self.call_count} calls ({self.failure_count} failed), " \
+            f"{self.retry_count} retries ({self.total_backoff_seconds:.1f}s backing off), " \
+            f"latency p50={self.p50_latency_seconds * 1000:.0f}ms p95={self.p95_latency_seconds * 1000:.0f}ms " \
+            f"p99={self.p99_latency_seconds * 1000:.0f}ms max={self.max_latency_seconds * 1000:.0f}ms " \
+            f"total={self.total_latency_seconds:.1f}s"
@@ -0,0 +1,155 @@
+import random
+
+from logging import getLogger
+from typing import Callable, Optional, Tuple, TypeVar
+
+from .ComCallMetricsRegistry import ComCallMetricsRegistry, default_com_call_metrics_registry
+from .ComCircuitBreaker import ComCircuitBreaker
+from .MonotonicClock import MonotonicClock
+from .com_error_types import get_com_error_types
+
+
+T = TypeVar('T')
+
+
+default_retryable_hresults = (
+    -2147023170,  # 0x800706BE "The remote procedure call failed."
+    -2147023174,  # 0x800706BA "The RPC server is unavailable."
+    -2147023175,  # 0x800706B9 "The RPC server is too busy to complete this operation."
+)
+
+
+class ComRetryPolicy:
+    """
+    Decides whether, and after how long, a failed OneNote COM call is retried. Backoff grows exponentially from a few
+    milliseconds, with jitter, until either the attempts or the time budget of the call run out.
+    """
+
+    def __init__(self,
+                 *,
+                 max_attempts: int = 8,
+                 initial_backoff_seconds: float = 0.05,
+                 backoff_multiplier: float = 2.0,
+                 max_backoff_seconds: float = 5.0,
+                 jitter_ratio: float = 0.5,
+                 max_total_seconds: float = 60.0,
+                 retryable_hresults: Tuple[int, ...] = default_retryable_hresults,
+                 com_error_types: Optional[Tuple[type[BaseException], ...]] = None,
+                 circuit_breaker: Optional[ComCircuitBreaker] = None,
+                 clock: Optional[MonotonicClock] = None,
+                 rng: Optional[random.Random] = None,
+                 metrics: ComCallMetricsRegistry = default_com_call_metrics_registry,
+                 ):
+        """
+        :param max_attempts: The most attempts made per call, including the first.
+        :param initial_backoff_seconds: The backoff before the first retry, before jitter.
+        :param backoff_multiplier: The factor by which the backoff grows with each retry.
+        :param max_backoff_seconds: The longest backoff before any one retry, before jitter.
+        :param jitter_ratio: The fraction (0 to 1) of each backoff that is randomly shaved off, so that retries of calls
+        which failed together don't land together.
+        :param max_total_seconds: The time budget per call. A retry that would start after it is not made.
+        :param retryable_hresults: The COM HRESULTs worth retrying. Other errors are raised immediately.
+        :param com_error_types: The exception types that carry an HRESULT. Defaults to pywintypes.com_error.
+        :param circuit_breaker: If given, pauses all calls sharing it while OneNote is failing repeatedly.
+        :param clock: The clock to back off against. Defaults to the system's monotonic clock.
+        :param rng: The source of jitter. Defaults to a new random.Random.
+        :param metrics: The registry to record attempts, backoffs and call outcomes into.
+        """
+        if not isinstance(max_attempts, int):
+            raise TypeError(f"max_attempts must be an int, not {type(max_attempts)}")
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, received {max_attempts}")
+        if initial_backoff_seconds < 0 or max_backoff_seconds < 0 or max_total_seconds < 0:
+            raise ValueError("Backoff durations and budgets must be >= 0")
+        if backoff_multiplier < 1:
+            raise ValueError(f"backoff_multiplier must be >= 1, received {backoff_multiplier}")
+        if not 0 <= jitter_ratio <= 1:
+            raise ValueError(f"jitter_ratio must be between 0 and 1, received {jitter_ratio}")
+        if circuit_breaker is not None and not isinstance(circuit_breaker, ComCircuitBreaker):
+            raise TypeError(f"circuit_breaker must be an instance of ComCircuitBreaker, not {type(circuit_breaker)}")
+
+        self._max_attempts = max_attempts
+        self._initial_backoff_seconds = initial_backoff_seconds
+        self._backoff_multiplier = backoff_multiplier
+        self._max_backoff_seconds = max_backoff_seconds
+        self._jitter_ratio = jitter_ratio
+        self._max_total_seconds = max_total_seconds
+        self._retryable_hresults = tuple(retryable_hresults)
+        self._com_error_types = tuple(com_error_types) if com_error_types is not None else None
+        self._circuit_breaker = circuit_breaker
+        self._clock = clock or MonotonicClock()
+        self._rng = rng or random.Random()
+        self._metrics = metrics
+
+    @property
+    def clock(self) -> MonotonicClock:
+        return self._clock
+
+    @property
+    def circuit_breaker(self) -> Optional[ComCircuitBreaker]:
+        return self._circuit_breaker
+
+    def is_retryable(self, error: BaseException) -> bool:
+        return getattr(error, 'hresult', None) in self._retryable_hresults
+
+    def calculate_backoff(self, attempt: int) -> float:
+        """
+        Calculates how long to back off after the given failed attempt.
+        :param attempt: The number of the attempt that failed, starting at 1.
+        :return: The backoff, in seconds.
+        """
+        backoff = min(self._max_backoff_seconds, self._initial_backoff_seconds * (self._backoff_multiplier ** (attempt - 1)))
+        return backoff * (1 - self._jitter_ratio * self._rng.random())
+
+    def execute(self, method_name: str, invoke: Callable[[], T]) -> T:
+        """
+        Invokes a COM call, retrying it as the policy allows.
+        :param method_name: The name of the COM method, for logging and metrics.
+        :param invoke: Makes the call.
+        :return: The call's result.
+        """
+        logger = getLogger(__name__).getChild(method_name)
+        com_error_types = self._com_error_types if self._com_error_types is not None else get_com_error_types()
+        errors: list[BaseException] = []
+        started_at = self._clock.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.wait_until_closed(self._clock)
+
+            attempt_started_at = self._clock.monotonic()
+            try:
+                result = invoke()
+            except com_error_types as error:
+                self._metrics.record_attempt(method_name, self._clock.monotonic() - attempt_started_at)
+                if not self.is_retryable(error):
+                    self._metrics.record_call(method_name, succeeded=False)
+                    raise
+                if self._circuit_breaker is not None:
+                    self._circuit_breaker.record_failure(self._clock)
+
+                errors.insert(0, error)
+                backoff = self.calculate_backoff(attempt)
+                elapsed = self._clock.monotonic() - started_at
+                if attempt >= self._max_attempts or elapsed + backoff > self._max_total_seconds:
+                    self._metrics.record_call(method_name, succeeded=False)
+                    raise RuntimeError(
+                        f"Failed to invoke {method_name} after {attempt} attempts in {elapsed:.1f} seconds: {errors}",
+                        error
+                    ) from error
+
+                logger.warning(f"Invocation of {method_name} failed: {error}", exc_info=error)
+                logger.info(f"Backing off {backoff:.3f} seconds before retrying (attempt {attempt})…")
+                self._metrics.record_backoff(method_name, backoff)
+                self._clock.sleep(backoff)
+                continue
+
+            self._metrics.record_attempt(method_name, self._clock.monotonic() - attempt_started_at)
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.record_success()
+            self._metrics.record_call(method_name, succeeded=True)
+            return result
+
+
+default_com_retry_policy = ComRetryPolicy(circuit_breaker=ComCircuitBreaker())
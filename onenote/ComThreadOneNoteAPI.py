@@ -0,0 +1,39 @@
+from typing import Any
+from xml.etree import ElementTree
+
+from onenote_export.Pathlike import Pathlike
+from .AsyncOneNoteAPI import AsyncOneNoteAPI
+from .HierarchyScope import HierarchyScope
+from .OneNoteAPI import OneNoteAPI
+from .PageInfo import PageInfo
+from .PublishFormat import PublishFormat
+from .XMLSchema import XMLSchema
+
+
+class ComThreadOneNoteAPI(OneNoteAPI):
+    """
+    A OneNoteAPI that can be called from any thread, e.g. by pages being exported concurrently. Every call is made on
+    the COM thread of an AsyncOneNoteAPI (with that thread's OneNoteAPI retrying it), while the calling thread waits.
+    """
+
+    def __init__(self, async_onenote_api: AsyncOneNoteAPI):
+        if not isinstance(async_onenote_api, AsyncOneNoteAPI):
+            raise TypeError(f"async_onenote_api must be an instance of AsyncOneNoteAPI, not {type(async_onenote_api)}")
+        super().__init__()
+        self._async_onenote_api = async_onenote_api
+
+    @staticmethod
+    def _create_onenote_com_object() -> Any:
+        return None
+
+    def get_hierarchy(self, node_id: str, hierarchy_scope: HierarchyScope, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        return self._async_onenote_api.submit(lambda onenote_api: onenote_api.get_hierarchy(node_id, hierarchy_scope, schema)).result()
+
+    def publish(self, page_id: str, target_file_path: Pathlike, publish_format: PublishFormat, clsid_of_exporter: str = ""):
+        return self._async_onenote_api.submit(lambda onenote_api: onenote_api.publish(page_id, target_file_path, publish_format, clsid_of_exporter)).result()
+
+    def get_page_content(self, page_id: str, page_info: PageInfo, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        return self._async_onenote_api.submit(lambda onenote_api: onenote_api.get_page_content(page_id, page_info, schema)).result()
+
+    def get_binary_page_content(self, page_id: str, callback_id: str) -> bytes:
+        return self._async_onenote_api.submit(lambda onenote_api: onenote_api.get_binary_page_content(page_id, callback_id)).result()
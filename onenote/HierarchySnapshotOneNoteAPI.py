@@ -0,0 +1,142 @@
+import copy
+
+from logging import getLogger
+from typing import Any, Dict, Iterable
+from xml.etree import ElementTree
+
+from onenote_export.Pathlike import Pathlike
+from .HierarchyScope import HierarchyScope
+from .OneNoteAPI import OneNoteAPI
+from .OneNoteHierarchySnapshot import OneNoteHierarchySnapshot
+from .PageInfo import PageInfo
+from .PublishFormat import PublishFormat
+from .XMLSchema import XMLSchema
+from .onenote_xml import local_name
+
+
+_hierarchy_node_names = ('Notebook', 'SectionGroup', 'Section', 'Page')
+
+
+def _iter_bylocal_name(element: ElementTree, name: str) -> Iterable[ElementTree]:
+    return (e for e in element.iter() if local_name(e) == name)
+
+
+def _copy_with_immediate_children(element: ElementTree) -> ElementTree:
+    """
+    Copies an element the way GetHierarchy returns it for HierarchyScope.Children: with its child nodes, but without
+    their own descendant nodes.
+    """
+    def copy_without_descendant_nodes(source: ElementTree) -> ElementTree:
+        result = ElementTree.Element(source.tag, source.attrib)
+        result.extend(copy.deepcopy(child) for child in source if local_name(child) not in _hierarchy_node_names)
+        return result
+
+    result = ElementTree.Element(element.tag, element.attrib)
+    result.extend(copy_without_descendant_nodes(child) for child in element)
+    return result
+
+
+class HierarchySnapshotOneNoteAPI(OneNoteAPI):
+    """
+    A OneNoteAPI that answers the node hierarchy's HierarchyScope.Children requests from a persisted snapshot.
+    Only the list of notebooks is always fetched live. A notebook whose lastModifiedTime is unchanged is served entirely
+    from the snapshot; otherwise its sections are fetched, and only the sections whose lastModifiedTime changed have their
+    pages fetched again.
+    """
+
+    def __init__(self, onenote_api: OneNoteAPI, snapshot: OneNoteHierarchySnapshot):
+        """
+        :param onenote_api: The OneNoteAPI to fetch live XML from, and to delegate all other calls to.
+        :param snapshot: The snapshot to serve from and to keep up to date.
+        """
+        if not isinstance(onenote_api, OneNoteAPI):
+            raise TypeError(f"onenote_api must be an instance of OneNoteAPI, not {type(onenote_api)}")
+        if not isinstance(snapshot, OneNoteHierarchySnapshot):
+            raise TypeError(f"snapshot must be an instance of OneNoteHierarchySnapshot, not {type(snapshot)}")
+        super().__init__(retry_policy=onenote_api.retry_policy)
+        self._onenote_api = onenote_api
+        self._snapshot = snapshot
+        self._logger = getLogger(__name__)
+        self._live_notebook_elements: Dict[str, ElementTree] = {}
+        self._resolved_elements: Dict[str, ElementTree] = {}
+
+    @staticmethod
+    def _create_onenote_com_object() -> Any:
+        # Every call is delegated to the wrapped OneNoteAPI, which owns the COM dispatch (if any).
+        return None
+
+    def get_hierarchy(self, node_id: str, hierarchy_scope: HierarchyScope, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        if hierarchy_scope != HierarchyScope.Children or schema != XMLSchema.xs2013:
+            return self._onenote_api.get_hierarchy(node_id, hierarchy_scope, schema)
+
+        if node_id == "":
+            result = self._onenote_api.get_hierarchy(node_id, hierarchy_scope, schema)
+            for notebook_element in result:
+                if local_name(notebook_element) == 'Notebook':
+                    self._live_notebook_elements[notebook_element.attrib['ID']] = notebook_element
+            return result
+
+        if node_id in self._live_notebook_elements and node_id not in self._resolved_elements:
+            self._resolve_notebook(self._live_notebook_elements[node_id])
+
+        element = self._resolved_elements.get(node_id)
+        if element is None:
+            return self._onenote_api.get_hierarchy(node_id, hierarchy_scope, schema)
+        return _copy_with_immediate_children(element)
+
+    def _resolve_notebook(self, live_notebook_element: ElementTree):
+        notebook_id = live_notebook_element.attrib['ID']
+        notebook_name = live_notebook_element.attrib.get('name', notebook_id)
+        last_modified_time = live_notebook_element.attrib.get('lastModifiedTime')
+
+        notebook_element = None
+        if last_modified_time is not None and self._snapshot.get_notebook_last_modified_time(notebook_id) == last_modified_time:
+            notebook_element = self._snapshot.load_notebook(notebook_id)
+            if notebook_element is not None:
+                self._logger.info(f"📸 Reusing hierarchy snapshot of unchanged notebook: '{notebook_name}'")
+
+        if notebook_element is None:
+            notebook_element = self._refresh_notebook(notebook_id, notebook_name)
+            if last_modified_time is not None:
+                self._snapshot.save_notebook(notebook_element, last_modified_time)
+
+        for element in notebook_element.iter():
+            if local_name(element) in _hierarchy_node_names and 'ID' in element.attrib:
+                self._resolved_elements[element.attrib['ID']] = element
+
+    def _refresh_notebook(self, notebook_id: str, notebook_name: str) -> ElementTree:
+        previous_notebook_element = self._snapshot.load_notebook(notebook_id)
+        previous_section_elements = {
+            e.attrib['ID']: e for e in _iter_bylocal_name(previous_notebook_element, 'Section')
+        } if previous_notebook_element is not None else {}
+
+        notebook_element = self._onenote_api.get_hierarchy(notebook_id, HierarchyScope.Sections)
+        section_elements = tuple(_iter_bylocal_name(notebook_element, 'Section'))
+        refreshed_section_count = 0
+        for section_element in section_elements:
+            # Locked sections can't be enumerated, so they're never taken from (nor contribute pages to) the snapshot.
+            if section_element.attrib.get('locked') == 'true':
+                continue
+            previous_section_element = previous_section_elements.get(section_element.attrib['ID'])
+            last_modified_time = section_element.attrib.get('lastModifiedTime')
+            if previous_section_element is not None \
+                    and last_modified_time is not None \
+                    and previous_section_element.attrib.get('lastModifiedTime') == last_modified_time \
+                    and previous_section_element.attrib.get('locked') != 'true':
+                pages_source_element = previous_section_element
+            else:
+                pages_source_element = self._onenote_api.get_hierarchy(section_element.attrib['ID'], HierarchyScope.Pages)
+                refreshed_section_count += 1
+            section_element.extend([e for e in pages_source_element if local_name(e) == 'Page'])
+
+        self._logger.info(f"📸 Refreshed {refreshed_section_count} of {len(section_elements)} sections in hierarchy snapshot of notebook: '{notebook_name}'")
+        return notebook_element
+
+    def publish(self, page_id: str, target_file_path: Pathlike, publish_format: PublishFormat, clsid_of_exporter: str = ""):
+        return self._onenote_api.publish(page_id, target_file_path, publish_format, clsid_of_exporter)
+
+    def get_page_content(self, page_id: str, page_info: PageInfo, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        return self._onenote_api.get_page_content(page_id, page_info, schema)
+
+    def get_binary_page_content(self, page_id: str, callback_id: str) -> bytes:
+        return self._onenote_api.get_binary_page_content(page_id, callback_id)
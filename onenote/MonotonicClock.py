@@ -0,0 +1,14 @@
+import time
+
+
+class MonotonicClock:
+    """
+    The time source retries back off against. Substitutable, so that retry timing can be tested without waiting.
+    """
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
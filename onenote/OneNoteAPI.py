@@ -1,22 +1,36 @@
 import base64
+from typing import Any
 from xml.etree import ElementTree
 
-from win32com import client as win32
 
 from onenote.HierarchyScope import HierarchyScope
 from onenote.PageInfo import PageInfo
 from onenote.PublishFormat import PublishFormat
 from onenote.XMLSchema import XMLSchema
+from onenote.ComRetryPolicy import ComRetryPolicy, default_com_retry_policy
 from onenote.retry_com import retry_com
 from onenote_export.Pathlike import Pathlike
 
 
 class OneNoteAPI:
-    def __init__(self, app: win32.CDispatch = None):
+    """
+    The session with OneNote: owns a single COM dispatch, which every node built from it shares.
+    """
+
+    def __init__(self, app: Any = None, retry_policy: ComRetryPolicy = default_com_retry_policy):
+        if not isinstance(retry_policy, ComRetryPolicy):
+            raise TypeError(f"retry_policy must be an instance of ComRetryPolicy, not {type(retry_policy)}")
         self._app = app if app is not None else self._create_onenote_com_object()
+        self._retry_policy = retry_policy
+
+    @property
+    def retry_policy(self) -> ComRetryPolicy:
+        return self._retry_policy
 
     @staticmethod
-    def _create_onenote_com_object() -> win32.CDispatch:
+    def _create_onenote_com_object() -> Any:
+        # Imported here so that everything but the live backend works without the Windows-only COM modules.
+        from win32com import client as win32
         return win32.gencache.EnsureDispatch("OneNote.Application.12")
 
     @retry_com
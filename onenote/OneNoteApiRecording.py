@@ -0,0 +1,88 @@
+import hashlib
+import json
+import os
+import pathlib
+import threading
+
+from typing import Dict, Optional, Union
+
+
+class OneNoteApiRecording:
+    """
+    A directory of recorded OneNoteAPI responses, keyed by the request that produced them.
+    Responses are stored one per file, and the index of which request produced which file is append-only, so that
+    recording a large session stays linear.
+    """
+
+    index_file_name = 'index.jsonl'
+    responses_dir_name = 'responses'
+
+    def __init__(self, recording_dir: Union[str, os.PathLike]):
+        """
+        :param recording_dir: The directory holding the recording. Created on the first write.
+        """
+        if isinstance(recording_dir, str):
+            recording_dir = pathlib.Path(recording_dir)
+        if not isinstance(recording_dir, pathlib.Path):
+            raise TypeError(f"recording_dir must be an instance of pathlib.Path or str, not {type(recording_dir)}")
+
+        self._recording_dir = recording_dir
+        self._index: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def recording_dir(self) -> pathlib.Path:
+        return self._recording_dir
+
+    @staticmethod
+    def create_request_key(method_name: str, *args: str) -> str:
+        return '|'.join((method_name,) + args)
+
+    def _get_index(self) -> Dict[str, str]:
+        if self._index is None:
+            index = {}
+            index_path = self._recording_dir / self.index_file_name
+            if index_path.exists():
+                with index_path.open('r', encoding='utf-8') as index_file:
+                    for line in index_file:
+                        if line.strip():
+                            entry = json.loads(line)
+                            index[entry['key']] = entry['file']
+            self._index = index
+        return self._index
+
+    def __contains__(self, request_key: str) -> bool:
+        with self._lock:
+            return request_key in self._get_index()
+
+    def read(self, request_key: str) -> bytes:
+        """
+        Reads a recorded response.
+        :param request_key: The request's key, as created by create_request_key.
+        :return: The response's bytes.
+        """
+        with self._lock:
+            file_name = self._get_index().get(request_key)
+        if file_name is None:
+            raise KeyError(f"No response was recorded for request: {request_key}")
+        return (self._recording_dir / self.responses_dir_name / file_name).read_bytes()
+
+    def write(self, request_key: str, response: bytes, suffix: str = '.bin'):
+        """
+        Records a response, replacing any response previously recorded for the same request.
+        :param request_key: The request's key, as created by create_request_key.
+        :param response: The response's bytes.
+        :param suffix: The suffix to give the response's file, to ease inspecting the recording.
+        """
+        file_name = hashlib.sha256(request_key.encode('utf-8')).hexdigest()[:32] + suffix
+        responses_dir = self._recording_dir / self.responses_dir_name
+        responses_dir.mkdir(parents=True, exist_ok=True)
+        (responses_dir / file_name).write_bytes(response)
+
+        with self._lock:
+            index = self._get_index()
+            if index.get(request_key) == file_name:
+                return
+            with (self._recording_dir / self.index_file_name).open('a', encoding='utf-8') as index_file:
+                index_file.write(json.dumps({'key': request_key, 'file': file_name}) + '\n')
+            index[request_key] = file_name
@@ -2,6 +2,8 @@ from .OneNoteNode import OneNoteNode
 
 
 class OneNoteApplication(OneNoteNode):
+    __slots__ = ()
+
     @property
     def node_id(self) -> str:
         return ""
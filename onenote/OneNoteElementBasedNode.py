@@ -1,5 +1,5 @@
-from functools import cache
-from win32com import client as win32
+from datetime import datetime
+from typing import Optional
 from xml.etree import ElementTree
 
 from .OneNoteAPI import OneNoteAPI
@@ -7,28 +7,37 @@ from .OneNoteNode import OneNoteNode
 
 
 class OneNoteElementBasedNode(OneNoteNode):
-    def __init__(self, element: ElementTree, parent: OneNoteNode, index: int, onenote_api: OneNoteAPI = None):
+    """
+    A node read from an element of the OneNote hierarchy XML. Each node copies the attributes it needs out of its
+    element, rather than keeping the element (and so the rest of the XML it came from) alive.
+    """
+    __slots__ = ('_node_id', '_name', '_parent', '_index')
+
+    def __init__(self, element: ElementTree, parent: OneNoteNode, index: int, onenote_api: OneNoteAPI):
         super().__init__(onenote_api)
-        self._element = element
+        self._node_id: str = element.attrib['ID']
+        self._name: str = element.attrib['name']
         self._parent = parent
         self._index = index
 
+    @staticmethod
+    def _read_datetime_attribute(element: ElementTree, attribute_name: str) -> Optional[datetime]:
+        value = element.attrib.get(attribute_name)
+        return datetime.fromisoformat(value) if value is not None else None
+
     @property
-    @cache
     def node_id(self) -> str:
-        return self._element.attrib['ID']
+        return self._node_id
 
     @property
     def parent(self) -> OneNoteNode:
         return self._parent
 
     @property
-    @cache
     def name(self) -> str:
-        return self._element.attrib['name']
+        return self._name
 
     @property
-    @cache
     def route(self) -> tuple[str, ...]:
         parent = self.parent
         self_route_part = (self.name,)
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+import pathlib
+
+from typing import Optional, Union
+from xml.etree import ElementTree
+
+
+class OneNoteHierarchySnapshot:
+    """
+    Persists each notebook's hierarchy XML, down to the page level, between runs. An index of each notebook's
+    lastModifiedTime is kept alongside, so that whether a notebook changed can be determined without parsing its XML.
+    """
+
+    index_file_name = 'index.json'
+
+    def __init__(self, snapshot_dir: Union[str, os.PathLike]):
+        """
+        :param snapshot_dir: The directory to persist the snapshot to. Created on the first save.
+        """
+        if isinstance(snapshot_dir, str):
+            snapshot_dir = pathlib.Path(snapshot_dir)
+        if not isinstance(snapshot_dir, pathlib.Path):
+            raise TypeError(f"snapshot_dir must be an instance of pathlib.Path or str, not {type(snapshot_dir)}")
+
+        self._snapshot_dir = snapshot_dir
+        self._index: Optional[dict[str, dict[str, str]]] = None
+
+    @property
+    def snapshot_dir(self) -> pathlib.Path:
+        return self._snapshot_dir
+
+    def _get_index(self) -> dict[str, dict[str, str]]:
+        if self._index is None:
+            index_path = self._snapshot_dir / self.index_file_name
+            try:
+                self._index = json.loads(index_path.read_text(encoding='utf-8'))
+            except (FileNotFoundError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _write_atomically(self, path: pathlib.Path, content: str):
+        temp_path = path.with_name(f'.~{path.name}')
+        temp_path.write_text(content, encoding='utf-8')
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _notebook_file_name(notebook_id: str) -> str:
+        return hashlib.sha256(notebook_id.encode('utf-8')).hexdigest()[:32] + '.xml'
+
+    def get_notebook_last_modified_time(self, notebook_id: str) -> Optional[str]:
+        """
+        Gets the lastModifiedTime the notebook had when its snapshot was saved.
+        :param notebook_id: The notebook's OneNote ID.
+        :return: The lastModifiedTime attribute value, or None if there is no snapshot of the notebook.
+        """
+        entry = self._get_index().get(notebook_id)
+        return entry['lastModifiedTime'] if entry else None
+
+    def load_notebook(self, notebook_id: str) -> Optional[ElementTree]:
+        """
+        Loads the notebook's hierarchy XML, as it was saved.
+        :param notebook_id: The notebook's OneNote ID.
+        :return: The notebook element, or None if there is no (readable) snapshot of the notebook.
+        """
+        entry = self._get_index().get(notebook_id)
+        if not entry:
+            return None
+        try:
+            return ElementTree.fromstring((self._snapshot_dir / entry['file']).read_text(encoding='utf-8'))
+        except (FileNotFoundError, ElementTree.ParseError):
+            return None
+
+    def save_notebook(self, notebook_element: ElementTree, last_modified_time: str):
+        """
+        Saves the notebook's hierarchy XML, replacing any previous snapshot of it.
+        :param notebook_element: The notebook element, including its descendants down to the page level.
+        :param last_modified_time: The notebook's lastModifiedTime, as reported alongside the other notebooks.
+        """
+        if not isinstance(last_modified_time, str):
+            raise TypeError(f"last_modified_time must be a str, not {type(last_modified_time)}")
+        notebook_id = notebook_element.attrib['ID']
+        file_name = self._notebook_file_name(notebook_id)
+
+        self._snapshot_dir.mkdir(parents=True, exist_ok=True)
+        self._write_atomically(self._snapshot_dir / file_name, ElementTree.tostring(notebook_element, encoding='unicode'))
+
+        index = self._get_index()
+        index[notebook_id] = {'lastModifiedTime': last_modified_time, 'file': file_name}
+        self._write_atomically(self._snapshot_dir / self.index_file_name, json.dumps(index, indent=2))
@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
-from functools import cache
-from typing import Iterable
+from typing import Iterable, Optional
 from xml.etree import ElementTree
 
 from .HierarchyScope import HierarchyScope
@@ -8,8 +7,16 @@ from .OneNoteAPI import OneNoteAPI
 
 
 class OneNoteNode(ABC):
-    def __init__(self, onenote_api: OneNoteAPI = None):
-        self._onenote_api = onenote_api or OneNoteAPI()
+    # Nodes keep only what they need, rather than a dict per node, so that hierarchies of many pages stay small.
+    __slots__ = ('_onenote_api', '_children', '__weakref__')
+
+    def __init__(self, onenote_api: OneNoteAPI):
+        # Every node shares the one OneNoteAPI it was given, rather than binding to OneNote over COM again, which is
+        # slow and can make OneNote reject calls as busy.
+        if not isinstance(onenote_api, OneNoteAPI):
+            raise TypeError(f"onenote_api must be an instance of OneNoteAPI, not {type(onenote_api)}")
+        self._onenote_api = onenote_api
+        self._children: Optional[tuple['OneNoteNode', ...]] = None
 
     @property
     @abstractmethod
@@ -41,7 +48,7 @@ class OneNoteNode(ABC):
             yield child
 
     @property
-    @cache
     def children(self) -> tuple['OneNoteNode', ...]:
-        result_children = self._get_children()
-        return tuple(result_children)
+        if self._children is None:
+            self._children = tuple(self._get_children())
+        return self._children
@@ -1,6 +1,5 @@
 from datetime import datetime
-from functools import cache
-from win32com import client as win32
+from typing import Optional
 from xml.etree import ElementTree
 
 from .OneNoteAPI import OneNoteAPI
@@ -9,28 +8,30 @@ from .OneNoteElementBasedNode import OneNoteElementBasedNode
 
 
 class OneNoteNotebook(OneNoteElementBasedNode):
-    def __init__(self, element: ElementTree, parent: OneNoteNode, index: int, onenote_api: OneNoteAPI = None):
+    __slots__ = ('_nickname', '_path', '_modified_at', '_color')
+
+    def __init__(self, element: ElementTree, parent: OneNoteNode, index: int, onenote_api: OneNoteAPI):
         super().__init__(element, parent, index, onenote_api)
+        self._nickname: Optional[str] = element.attrib.get('nickname')
+        self._path: Optional[str] = element.attrib.get('path')
+        self._modified_at = self._read_datetime_attribute(element, 'lastModifiedTime')
+        self._color: Optional[str] = element.attrib.get('color')
 
     @property
-    @cache
-    def nickname(self) -> str:
-        return self._element.attrib['nickname']
+    def nickname(self) -> Optional[str]:
+        return self._nickname
 
     @property
-    @cache
-    def path(self) -> str:
-        return self._element.attrib['path']
+    def path(self) -> Optional[str]:
+        return self._path
 
     @property
-    @cache
-    def modified_at(self) -> datetime:
-        return datetime.fromisoformat(self._element.attrib['lastModifiedTime'])
+    def modified_at(self) -> Optional[datetime]:
+        return self._modified_at
 
     @property
-    @cache
-    def color(self) -> str:
-        return self._element.attrib['color']
+    def color(self) -> Optional[str]:
+        return self._color
 
 
 OneNoteElementBasedNode.register(OneNoteNotebook)
@@ -1,27 +1,33 @@
 import pathlib
 from datetime import datetime
-from functools import cache
 from itertools import takewhile
-from typing import Iterable
+from typing import Iterable, Optional
 from xml.etree import ElementTree
 
 from onenote_export.Pathlike import Pathlike
 from .OneNoteAPI import OneNoteAPI
 from .OneNoteElementBasedNode import OneNoteElementBasedNode
+from .PageInfo import PageInfo
 from .PublishFormat import PublishFormat
+from .XMLSchema import XMLSchema
 from .retry_com import retry_com
 
 
 class OneNotePage(OneNoteElementBasedNode):
-    def __init__(self, element: ElementTree, parent: OneNoteElementBasedNode, index: int, onenote_api: OneNoteAPI = None):
+    __slots__ = ('_is_subpage', '_path', '_created_at', '_modified_at')
+
+    def __init__(self, element: ElementTree, parent: OneNoteElementBasedNode, index: int, onenote_api: OneNoteAPI):
         if not isinstance(parent, OneNoteElementBasedNode):
             raise ValueError(f'Unexpected parent type: {type(parent)}')
         super().__init__(element, parent, index, onenote_api)
+        self._is_subpage = element.attrib.get('isSubPage') == 'true'
+        self._path: Optional[str] = element.attrib.get('path')
+        self._created_at = self._read_datetime_attribute(element, 'dateTime')
+        self._modified_at = self._read_datetime_attribute(element, 'lastModifiedTime')
 
     @property
-    @cache
     def is_subpage(self) -> bool:
-        return 'isSubPage' in self._element.attrib and self._element.attrib['isSubPage'] == 'true'
+        return self._is_subpage
 
     def __export(self, path: Pathlike, publish_format: PublishFormat):
         self._onenote_api.publish(self.node_id, path, publish_format)
@@ -46,6 +52,12 @@ class OneNotePage(OneNoteElementBasedNode):
             raise ValueError(f"Expected path suffix '.mhtml' or '.mht', got: {path.suffix}")
         self.__export(path, PublishFormat.pfMHTML)
 
+    def get_content(self, page_info: PageInfo = PageInfo.piBasic, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        return self._onenote_api.get_page_content(self.node_id, page_info, schema)
+
+    def get_binary_content(self, callback_id: str) -> bytes:
+        return self._onenote_api.get_binary_page_content(self.node_id, callback_id)
+
     def _get_subpages(self) -> Iterable['OneNotePage']:
         if self.is_subpage:
             return
@@ -63,25 +75,16 @@ class OneNotePage(OneNoteElementBasedNode):
         return self._get_subpages()
 
     @property
-    @cache
-    def children(self) -> tuple['OneNotePage', ...]:
-        result_children = self._get_children()
-        return tuple(result_children)
-
-    @property
-    @cache
-    def path(self) -> str:
-        return self._element.attrib['path']
+    def path(self) -> Optional[str]:
+        return self._path
 
     @property
-    @cache
-    def created_at(self) -> datetime:
-        return datetime.fromisoformat(self._element.attrib['dateTime'])
+    def created_at(self) -> Optional[datetime]:
+        return self._created_at
 
     @property
-    @cache
-    def modified_at(self) -> datetime:
-        return datetime.fromisoformat(self._element.attrib['lastModifiedTime'])
+    def modified_at(self) -> Optional[datetime]:
+        return self._modified_at
 
 
 OneNoteElementBasedNode.register(OneNotePage)
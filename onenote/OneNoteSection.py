@@ -1,61 +1,70 @@
+import pathlib
 from datetime import datetime
-from functools import cache
-from typing import Iterable
-from win32com import client as win32
+from typing import Iterable, Optional
 from xml.etree import ElementTree
 
 from .OneNoteAPI import OneNoteAPI
 from .OneNoteElementBasedNode import OneNoteElementBasedNode
 from .OneNoteNode import OneNoteNode
 from .OneNotePage import OneNotePage
+from .PublishFormat import PublishFormat
 
 
 class OneNoteSection(OneNoteElementBasedNode):
-    def __init__(self, element: ElementTree, parent: OneNoteNode, index: int, onenote_api: OneNoteAPI = None):
+    __slots__ = ('_path', '_modified_at', '_is_readonly', '_is_encrypted', '_is_locked', '_all_pages')
+
+    def __init__(self, element: ElementTree, parent: OneNoteNode, index: int, onenote_api: OneNoteAPI):
         super().__init__(element, parent, index, onenote_api)
+        self._path: Optional[str] = element.attrib.get('path')
+        self._modified_at = self._read_datetime_attribute(element, 'lastModifiedTime')
+        self._is_readonly = element.attrib.get('readOnly') == 'true'
+        self._is_encrypted = element.attrib.get('encrypted') == 'true'
+        self._is_locked = element.attrib.get('locked') == 'true'
+        self._all_pages: Optional[tuple[OneNotePage, ...]] = None
 
     def _get_non_subpage_pages(self) -> Iterable[OneNotePage]:
-        for child in super()._get_children():
-            if isinstance(child, OneNotePage) and not child.is_subpage:
-                yield child
-            elif child.is_subpage:
-                continue
-            else:
-                raise ValueError(f'Unexpected child type: {type(child)}')
+        return (page for page in self.all_pages if not page.is_subpage)
 
     def _get_children(self) -> Iterable[OneNotePage]:
         return self._get_non_subpage_pages()
 
     @property
-    @cache
-    def children(self) -> tuple[OneNotePage, ...]:
-        result_children = self._get_children()
-        return tuple(result_children)
+    def all_pages(self) -> tuple[OneNotePage, ...]:
+        """
+        The section's pages, subpages included, in the order OneNote lists (and publishes) them.
+        """
+        if self._all_pages is None:
+            children = tuple(super()._get_children())
+            for child in children:
+                if not isinstance(child, OneNotePage):
+                    raise ValueError(f'Unexpected child type: {type(child)}')
+            self._all_pages = children
+        return self._all_pages
+
+    def _export_mhtml(self, path: pathlib.Path):
+        if path.suffix not in ('.mhtml', '.mht'):
+            raise ValueError(f"Expected path suffix '.mhtml' or '.mht', got: {path.suffix}")
+        self._onenote_api.publish(self.node_id, path, PublishFormat.pfMHTML)
 
     @property
-    @cache
-    def path(self) -> str:
-        return self._element.attrib['path']
+    def path(self) -> Optional[str]:
+        return self._path
 
     @property
-    @cache
-    def modified_at(self) -> datetime:
-        return datetime.fromisoformat(self._element.attrib['lastModifiedTime'])
+    def modified_at(self) -> Optional[datetime]:
+        return self._modified_at
 
     @property
-    @cache
     def is_readonly(self) -> bool:
-        return self._element.attrib['readOnly'] == 'true'
+        return self._is_readonly
 
     @property
-    @cache
     def is_encrypted(self) -> bool:
-        return 'encrypted' in self._element.attrib and self._element.attrib['encrypted'] == 'true'
+        return self._is_encrypted
 
     @property
-    @cache
     def is_locked(self) -> bool:
-        return 'locked' in self._element.attrib and self._element.attrib['locked'] == 'true'
+        return self._is_locked
 
 
 OneNoteElementBasedNode.register(OneNoteSection)
@@ -1,6 +1,5 @@
 from datetime import datetime
-from functools import cache
-from win32com import client as win32
+from typing import Optional
 from xml.etree import ElementTree
 
 from .OneNoteAPI import OneNoteAPI
@@ -9,18 +8,20 @@ from .OneNoteNode import OneNoteNode
 
 
 class OneNoteSectionGroup(OneNoteElementBasedNode):
-    def __init__(self, element: ElementTree, parent: OneNoteNode, index: int, onenote_api: OneNoteAPI = None):
+    __slots__ = ('_path', '_modified_at')
+
+    def __init__(self, element: ElementTree, parent: OneNoteNode, index: int, onenote_api: OneNoteAPI):
         super().__init__(element, parent, index, onenote_api)
+        self._path: Optional[str] = element.attrib.get('path')
+        self._modified_at = self._read_datetime_attribute(element, 'lastModifiedTime')
 
     @property
-    @cache
-    def path(self) -> str:
-        return self._element.attrib['path']
+    def path(self) -> Optional[str]:
+        return self._path
 
     @property
-    @cache
-    def modified_at(self) -> datetime:
-        return datetime.fromisoformat(self._element.attrib['lastModifiedTime'])
+    def modified_at(self) -> Optional[datetime]:
+        return self._modified_at
 
 
 OneNoteElementBasedNode.register(OneNoteSectionGroup)
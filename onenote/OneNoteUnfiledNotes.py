@@ -1,5 +1,3 @@
-from functools import cache
-from win32com import client as win32
 from xml.etree import ElementTree
 
 from .OneNoteAPI import OneNoteAPI
@@ -8,16 +6,17 @@ from .OneNoteNode import OneNoteNode
 
 
 class OneNoteUnfiledNotes(OneNoteNode):
-    def __init__(self, element: ElementTree, parent: OneNoteNode, index: int, onenote_api: OneNoteAPI = None):
+    __slots__ = ('_node_id', '_parent', '_index')
+
+    def __init__(self, element: ElementTree, parent: OneNoteNode, index: int, onenote_api: OneNoteAPI):
         super().__init__(onenote_api)
-        self._element = element
+        self._node_id: str = element.attrib['ID']
         self._parent = parent
         self._index = index
 
     @property
-    @cache
     def node_id(self) -> str:
-        return self._element.attrib['ID']
+        return self._node_id
 
     @property
     def parent(self) -> OneNoteNode:
@@ -0,0 +1,75 @@
+import pathlib
+from typing import Any
+from xml.etree import ElementTree
+
+from onenote_export.Pathlike import Pathlike
+from .HierarchyScope import HierarchyScope
+from .OneNoteAPI import OneNoteAPI
+from .OneNoteApiRecording import OneNoteApiRecording
+from .PageInfo import PageInfo
+from .PublishFormat import PublishFormat
+from .ReplayOneNoteAPI import \
+    create_get_hierarchy_request_key, \
+    create_publish_request_key, \
+    create_get_page_content_request_key, \
+    create_get_binary_page_content_request_key
+from .XMLSchema import XMLSchema
+
+
+_publish_format_suffixes = {
+    PublishFormat.pfOneNote: '.one',
+    PublishFormat.pfOneNotePackage: '.onepkg',
+    PublishFormat.pfMHTML: '.mht',
+    PublishFormat.pfPDF: '.pdf',
+    PublishFormat.pfXPS: '.xps',
+    PublishFormat.pfWord: '.docx',
+    PublishFormat.pfEMF: '.emf',
+    PublishFormat.pfHTML: '.html',
+    PublishFormat.pfOneNote2007: '.one',
+}
+
+
+class RecordingOneNoteAPI(OneNoteAPI):
+    """
+    A OneNoteAPI that passes every request through to another OneNoteAPI (usually the live one), recording each response
+    so that the session can be replayed later by ReplayOneNoteAPI.
+    """
+
+    def __init__(self, onenote_api: OneNoteAPI, recording: OneNoteApiRecording):
+        if not isinstance(onenote_api, OneNoteAPI):
+            raise TypeError(f"onenote_api must be an instance of OneNoteAPI, not {type(onenote_api)}")
+        if not isinstance(recording, OneNoteApiRecording):
+            raise TypeError(f"recording must be an instance of OneNoteApiRecording, not {type(recording)}")
+        super().__init__(retry_policy=onenote_api.retry_policy)
+        self._onenote_api = onenote_api
+        self._recording = recording
+
+    @staticmethod
+    def _create_onenote_com_object() -> Any:
+        # Every call is delegated to the wrapped OneNoteAPI, which owns the COM dispatch (if any).
+        return None
+
+    @staticmethod
+    def _serialize(element: ElementTree) -> bytes:
+        return ElementTree.tostring(element, encoding='utf-8')
+
+    def get_hierarchy(self, node_id: str, hierarchy_scope: HierarchyScope, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        result = self._onenote_api.get_hierarchy(node_id, hierarchy_scope, schema)
+        self._recording.write(create_get_hierarchy_request_key(node_id, hierarchy_scope, schema), self._serialize(result), '.xml')
+        return result
+
+    def publish(self, page_id: str, target_file_path: Pathlike, publish_format: PublishFormat, clsid_of_exporter: str = ""):
+        result = self._onenote_api.publish(page_id, target_file_path, publish_format, clsid_of_exporter)
+        published_bytes = pathlib.Path(target_file_path).read_bytes()
+        self._recording.write(create_publish_request_key(page_id, publish_format), published_bytes, _publish_format_suffixes.get(publish_format, '.bin'))
+        return result
+
+    def get_page_content(self, page_id: str, page_info: PageInfo, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        result = self._onenote_api.get_page_content(page_id, page_info, schema)
+        self._recording.write(create_get_page_content_request_key(page_id, page_info, schema), self._serialize(result), '.xml')
+        return result
+
+    def get_binary_page_content(self, page_id: str, callback_id: str) -> bytes:
+        result = self._onenote_api.get_binary_page_content(page_id, callback_id)
+        self._recording.write(create_get_binary_page_content_request_key(page_id, callback_id), result)
+        return result
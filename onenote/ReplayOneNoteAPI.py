@@ -0,0 +1,59 @@
+import pathlib
+from typing import Any
+from xml.etree import ElementTree
+
+from onenote_export.Pathlike import Pathlike
+from .HierarchyScope import HierarchyScope
+from .OneNoteAPI import OneNoteAPI
+from .OneNoteApiRecording import OneNoteApiRecording
+from .PageInfo import PageInfo
+from .PublishFormat import PublishFormat
+from .XMLSchema import XMLSchema
+
+
+def create_get_hierarchy_request_key(node_id: str, hierarchy_scope: HierarchyScope, schema: XMLSchema) -> str:
+    return OneNoteApiRecording.create_request_key('get_hierarchy', node_id, hierarchy_scope.name, schema.name)
+
+
+def create_publish_request_key(page_id: str, publish_format: PublishFormat) -> str:
+    return OneNoteApiRecording.create_request_key('publish', page_id, publish_format.name)
+
+
+def create_get_page_content_request_key(page_id: str, page_info: PageInfo, schema: XMLSchema) -> str:
+    return OneNoteApiRecording.create_request_key('get_page_content', page_id, page_info.name, schema.name)
+
+
+def create_get_binary_page_content_request_key(page_id: str, callback_id: str) -> str:
+    return OneNoteApiRecording.create_request_key('get_binary_page_content', page_id, callback_id)
+
+
+class ReplayOneNoteAPI(OneNoteAPI):
+    """
+    A OneNoteAPI that serves every request from a recording (see RecordingOneNoteAPI), without OneNote, COM or Windows.
+    Requests that weren't recorded raise KeyError.
+    """
+
+    def __init__(self, recording: OneNoteApiRecording):
+        if not isinstance(recording, OneNoteApiRecording):
+            raise TypeError(f"recording must be an instance of OneNoteApiRecording, not {type(recording)}")
+        super().__init__()
+        self._recording = recording
+
+    @staticmethod
+    def _create_onenote_com_object() -> Any:
+        return None
+
+    def get_hierarchy(self, node_id: str, hierarchy_scope: HierarchyScope, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        return ElementTree.fromstring(self._recording.read(create_get_hierarchy_request_key(node_id, hierarchy_scope, schema)))
+
+    def publish(self, page_id: str, target_file_path: Pathlike, publish_format: PublishFormat, clsid_of_exporter: str = ""):
+        target_file_path = pathlib.Path(target_file_path)
+        if target_file_path.exists():
+            raise FileExistsError(f"Publish target must not already exist: {target_file_path}")
+        target_file_path.write_bytes(self._recording.read(create_publish_request_key(page_id, publish_format)))
+
+    def get_page_content(self, page_id: str, page_info: PageInfo, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        return ElementTree.fromstring(self._recording.read(create_get_page_content_request_key(page_id, page_info, schema)))
+
+    def get_binary_page_content(self, page_id: str, callback_id: str) -> bytes:
+        return self._recording.read(create_get_binary_page_content_request_key(page_id, callback_id))
@@ -7,3 +7,10 @@ from .OneNoteSection import OneNoteSection
 from .OneNoteSectionGroup import OneNoteSectionGroup
 from .OneNoteUnfiledNotes import OneNoteUnfiledNotes
 from .OneNoteOpenSections import OneNoteOpenSections
+from .OneNoteHierarchySnapshot import OneNoteHierarchySnapshot
+from .HierarchySnapshotOneNoteAPI import HierarchySnapshotOneNoteAPI
+from .OneNoteApiRecording import OneNoteApiRecording
+from .RecordingOneNoteAPI import RecordingOneNoteAPI
+from .ReplayOneNoteAPI import ReplayOneNoteAPI
+from .AsyncOneNoteAPI import AsyncOneNoteAPI
+from .ComThreadOneNoteAPI import ComThreadOneNoteAPI
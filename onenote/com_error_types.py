@@ -0,0 +1,17 @@
+import functools
+
+from typing import Tuple
+
+
+@functools.cache
+def get_com_error_types() -> Tuple[type[BaseException], ...]:
+    """
+    Gets the exception types raised by failing COM calls, importing the Windows-only modules defining them on first use.
+    :return: The types, or an empty tuple where COM isn't available (in which case `except get_com_error_types()` catches
+    nothing).
+    """
+    try:
+        import pywintypes
+    except ImportError:
+        return ()
+    return (pywintypes.com_error,)
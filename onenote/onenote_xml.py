@@ -0,0 +1,8 @@
+from xml.etree import ElementTree
+
+
+def local_name(element: ElementTree) -> str:
+    """
+    Gets an element's tag without its namespace, so that OneNote XML of any schema version can be handled alike.
+    """
+    return element.tag.rsplit('}', 1)[-1]
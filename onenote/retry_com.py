@@ -1,10 +1,8 @@
-import time
-from functools import wraps
+import functools
 from typing import Callable, TypeVar
-from logging import getLogger
 
-import pywintypes
-from _ctypes import COMError
+from tracing import ExportTracer
+from .ComRetryPolicy import ComRetryPolicy, default_com_retry_policy
 
 
 T = TypeVar('T')
@@ -12,44 +10,18 @@ decoratee = Callable[[...], T]
 
 
 def retry_com(func_being_decorated: decoratee, *decorator_args, **decorator_kwargs) -> decoratee:
-    logger = getLogger(__name__).getChild(func_being_decorated.__name__)
-
-    def _calculate_backoff(attempt: int) -> float:
-        return (1.9 * (2 ** attempt)) + 10
-
-    def _log_backing_off(attempt: int, backoff: float, error: COMError):
-        logger.warning(f"Invocation of {func_being_decorated.__name__} failed: {error}", exc_info=error)
-        logger.info(f"Backing off {backoff} seconds before retrying (attempt {attempt})…")
-
-    retryable_errors = (
-        -2147023170,  # 0x800706BE "The remote procedure call failed."
-        -2147023174,  # 0x800706BA "The RPC server is unavailable."
-        -2147023175,  # 0x800706B9 "The RPC server is too busy to complete this operation."
-    )
-
-    @wraps(func_being_decorated)
-    def wrapper_retry_com(*args, **kwargs) -> T:
-        errors: list[COMError] = []
-        max_attempts = 3
-        for attempt in range(1, max_attempts + 1):
-            try:
-                return func_being_decorated(*args, **kwargs)
-            except pywintypes.com_error as error:
-                if error.hresult not in retryable_errors:
-                    raise
-
-                errors.insert(0, error)
-                if attempt >= max_attempts:
-                    raise RuntimeError(
-                        f"Failed to invoke {func_being_decorated.__name__} after {max_attempts} attempts: {errors}",
-                        error
-                    ) from error
-
-                backoff = _calculate_backoff(attempt)
-                _log_backing_off(attempt, backoff, error)
-                time.sleep(backoff)
-                continue
-
-        raise NotImplementedError("This should be unreachable")
+    """
+    Retries a COM-invoking method according to the retry policy of the object it's invoked on (its `retry_policy`
+    attribute), or the default policy if it has none. Each call (retries included) is traced as a single span, with the
+    ID of the node it was made for.
+    """
+    method_name = func_being_decorated.__name__
+
+    @functools.wraps(func_being_decorated)
+    def wrapper_retry_com(self, *args, **kwargs) -> T:
+        retry_policy: ComRetryPolicy = getattr(self, 'retry_policy', None) or default_com_retry_policy
+        node_id = args[0] if args and isinstance(args[0], str) else None
+        with ExportTracer.current().span(method_name, 'com', node_id=node_id):
+            return retry_policy.execute(method_name, functools.partial(func_being_decorated, self, *args, **kwargs))
 
     return wrapper_retry_com
@@ -0,0 +1,228 @@
+import concurrent.futures
+import contextvars
+import time
+
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from tracing import ExportTracer, default_export_tracer
+from .ExportTaskGraphRun import ExportTaskGraphRun
+
+
+ExportTask = Callable[[], None]
+
+
+class ExportTaskGraph:
+    """
+    Export tasks, and which of them must finish before which others start. Executing the graph runs every task once,
+    in a topological order; given more than one worker, the tasks whose prerequisites have all finished run in
+    parallel. Tasks that call OneNote are run on the calling thread, as its COM objects must only be used from there.
+    """
+
+    def __init__(self):
+        self._prerequisites: Dict[ExportTask, Tuple[ExportTask, ...]] = {}
+        self._on_calling_thread: Dict[ExportTask, bool] = {}
+
+    @staticmethod
+    def from_tasks(tasks: Iterable[ExportTask]) -> 'ExportTaskGraph':
+        """
+        Creates a graph of the given tasks and, transitively, the prerequisites they were created with.
+        :param tasks: The tasks, e.g. OneNoteExportTaskBase instances.
+        """
+        graph = ExportTaskGraph()
+
+        def add_with_prerequisites(task: ExportTask):
+            if task in graph._prerequisites:
+                return
+            prerequisites = tuple(getattr(task, 'prerequisites', ()))
+            for prerequisite in prerequisites:
+                add_with_prerequisites(prerequisite)
+            graph.add(task, prerequisites)
+
+        for task in tasks:
+            add_with_prerequisites(task)
+        return graph
+
+    @property
+    def tasks(self) -> Tuple[ExportTask, ...]:
+        return tuple(self._prerequisites)
+
+    def prerequisites_of(self, task: ExportTask) -> Tuple[ExportTask, ...]:
+        return self._prerequisites[task]
+
+    def add(self, task: ExportTask, prerequisites: Iterable[ExportTask] = (), *, on_calling_thread: bool = False) -> ExportTask:
+        """
+        Adds a task, after the given prerequisites (which are added too, where they aren't already in the graph).
+        :param task: The task.
+        :param prerequisites: The tasks that must finish before this one starts.
+        :param on_calling_thread: Whether the task must run on the thread that executes the graph, e.g. because it
+            calls OneNote.
+        :return: The task.
+        """
+        if not callable(task):
+            raise TypeError(f"task must be callable, not {type(task)}")
+        self._prerequisites.setdefault(task, ())
+        self._on_calling_thread[task] = self._on_calling_thread.get(task, False) or on_calling_thread
+        for prerequisite in prerequisites:
+            self.add_edge(prerequisite, task)
+        return task
+
+    def add_edge(self, prerequisite: ExportTask, dependent: ExportTask):
+        """
+        Requires one task to finish before another starts, adding either that isn't already in the graph.
+        """
+        if prerequisite is dependent:
+            raise ValueError(f"A task cannot be its own prerequisite: {dependent}")
+        self.add(prerequisite)
+        self.add(dependent)
+        if prerequisite not in self._prerequisites[dependent]:
+            self._prerequisites[dependent] += (prerequisite,)
+
+    def find_cycle(self) -> Optional[Tuple[ExportTask, ...]]:
+        """
+        :return: The tasks of a cycle of prerequisites, starting and ending with the same task, or None if there is none.
+        """
+        unvisited, visiting, visited = 0, 1, 2
+        states = {task: unvisited for task in self._prerequisites}
+        for root in self._prerequisites:
+            if states[root] != unvisited:
+                continue
+            path = [root]
+            states[root] = visiting
+            stack = [iter(self._prerequisites[root])]
+            while stack:
+                prerequisite = next(stack[-1], None)
+                if prerequisite is None:
+                    states[path.pop()] = visited
+                    stack.pop()
+                elif states[prerequisite] == visiting:
+                    cycle = path[path.index(prerequisite):] + [prerequisite]
+                    return tuple(reversed(cycle))
+                elif states[prerequisite] == unvisited:
+                    states[prerequisite] = visiting
+                    path.append(prerequisite)
+                    stack.append(iter(self._prerequisites[prerequisite]))
+        return None
+
+    def topological_order(self) -> Tuple[ExportTask, ...]:
+        """
+        :return: Every task, each after its prerequisites, otherwise in the order they were added.
+        :raises ValueError: If the tasks' prerequisites form a cycle.
+        """
+        cycle = self.find_cycle()
+        if cycle is not None:
+            raise ValueError(f"Export tasks' prerequisites form a cycle: {_describe_tasks(cycle)}")
+
+        ordered: Dict[ExportTask, None] = {}
+
+        def visit(task: ExportTask):
+            if task in ordered:
+                return
+            for prerequisite in self._prerequisites[task]:
+                visit(prerequisite)
+            ordered[task] = None
+
+        for task in self._prerequisites:
+            visit(task)
+        return tuple(ordered)
+
+    def execute(self,
+                max_workers: int = 1,
+                *,
+                tracer: ExportTracer = default_export_tracer,
+                trace_args: Optional[Dict[str, Optional[str]]] = None,
+                ) -> ExportTaskGraphRun:
+        """
+        Runs every task, each once its prerequisites have finished. Once a task fails, no more are started; those
+        already running are waited for, and then the failure is raised.
+        :param max_workers: How many tasks may run at once. With 1, every task runs on the calling thread.
+        :param tracer: Where to record a cycle, or the critical path of the run.
+        :param trace_args: Identifies what the tasks are being run for, e.g. the page's node_id.
+        :return: How long each task took, and the critical path through them.
+        :raises ValueError: If the tasks' prerequisites form a cycle.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, received {max_workers}")
+        trace_args = trace_args or {}
+        try:
+            order = self.topological_order()
+        except ValueError:
+            tracer.mark('task_graph_cycle', 'export', tasks=_describe_tasks(self.find_cycle()), **trace_args)
+            raise
+
+        started = time.perf_counter()
+        if max_workers == 1 or len(order) < 2:
+            durations = {task: _timed(task) for task in order}
+        else:
+            durations = self._execute_in_parallel(order, max_workers)
+        run = ExportTaskGraphRun.create(
+            durations,
+            {task: self._prerequisites[task] for task in order},
+            time.perf_counter() - started,
+        )
+        tracer.mark(
+            'critical_path', 'export',
+            tasks=_describe_tasks(run.critical_path),
+            critical_path_ms=f'{run.critical_path_seconds * 1000:.0f}',
+            wall_ms=f'{run.wall_seconds * 1000:.0f}',
+            **trace_args,
+        )
+        return run
+
+    def _execute_in_parallel(self, order: Sequence[ExportTask], max_workers: int) -> Dict[ExportTask, float]:
+        durations: Dict[ExportTask, float] = {}
+        waiting = list(order)
+        running: Dict[concurrent.futures.Future, ExportTask] = {}
+        failure: Optional[BaseException] = None
+
+        def is_ready(task: ExportTask) -> bool:
+            return all(prerequisite in durations for prerequisite in self._prerequisites[task])
+
+        def record(future: concurrent.futures.Future):
+            nonlocal failure
+            task = running.pop(future)
+            try:
+                durations[task] = future.result()
+            except BaseException as e:
+                failure = failure or e
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ExportTask') as pool:
+            while (waiting or running) and not (failure and not running):
+                ready = [task for task in waiting if is_ready(task)] if failure is None else []
+                on_calling_thread = next((task for task in ready if self._on_calling_thread[task]), None)
+                capacity = max_workers - (1 if on_calling_thread is not None else 0)
+                for task in ready:
+                    if len(running) >= capacity:
+                        break
+                    if not self._on_calling_thread[task]:
+                        waiting.remove(task)
+                        # Run in a copy of the calling context, so the task sees the same current tracer.
+                        running[pool.submit(contextvars.copy_context().run, _timed, task)] = task
+
+                if on_calling_thread is not None:
+                    waiting.remove(on_calling_thread)
+                    try:
+                        durations[on_calling_thread] = _timed(on_calling_thread)
+                    except BaseException as e:
+                        failure = failure or e
+                    for future in [future for future in running if future.done()]:
+                        record(future)
+                elif running:
+                    done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        record(future)
+                elif failure is None:
+                    raise RuntimeError(f"No export task is ready to run: {_describe_tasks(waiting)}")
+
+        if failure is not None:
+            raise failure
+        return durations
+
+
+def _timed(task: ExportTask) -> float:
+    started = time.perf_counter()
+    task()
+    return time.perf_counter() - started
+
+
+def _describe_tasks(tasks: Iterable[ExportTask]) -> str:
+    return ' → '.join(str(task) for task in tasks)
@@ -0,0 +1,51 @@
+import dataclasses
+
+from typing import Callable, Dict, Tuple
+
+
+@dataclasses.dataclass(frozen=True)
+class ExportTaskGraphRun:
+    """
+    How long each task of an ExportTaskGraph took when it was executed, and the critical path through them: the chain
+    of tasks, each a prerequisite of the next, that took longest in total, and so bounded how soon the run could finish.
+    """
+    task_durations_seconds: Dict[Callable[[], None], float]
+    critical_path: Tuple[Callable[[], None], ...]
+    critical_path_seconds: float
+    wall_seconds: float
+
+    @staticmethod
+    def create(task_durations_seconds: Dict[Callable[[], None], float],
+               prerequisites: Dict[Callable[[], None], Tuple[Callable[[], None], ...]],
+               wall_seconds: float,
+               ) -> 'ExportTaskGraphRun':
+        """
+        :param task_durations_seconds: How long each task took.
+        :param prerequisites: Each task's prerequisites, with every task after its own prerequisites.
+        :param wall_seconds: How long the run took.
+        """
+        path_seconds: Dict[Callable[[], None], float] = {}
+        path_predecessor: Dict[Callable[[], None], Callable[[], None]] = {}
+        for task, task_prerequisites in prerequisites.items():
+            slowest_prerequisite = max(task_prerequisites, key=path_seconds.__getitem__, default=None)
+            preceding_seconds = path_seconds[slowest_prerequisite] if slowest_prerequisite is not None else 0.0
+            path_seconds[task] = preceding_seconds + task_durations_seconds[task]
+            if slowest_prerequisite is not None:
+                path_predecessor[task] = slowest_prerequisite
+
+        critical_path = ()
+        last = max(path_seconds, key=path_seconds.__getitem__, default=None)
+        while last is not None:
+            critical_path = (last,) + critical_path
+            last = path_predecessor.get(last)
+
+        return ExportTaskGraphRun(
+            task_durations_seconds=task_durations_seconds,
+            critical_path=critical_path,
+            critical_path_seconds=path_seconds[critical_path[-1]] if critical_path else 0.0,
+            wall_seconds=wall_seconds,
+        )
+
+    def __str__(self):
+        critical_path = ' → '.join(f'{task} ({self.task_durations_seconds[task] * 1000:.0f}ms)' for task in self.critical_path)
+        return f"critical path {self.critical_path_seconds:.2f}s of {self.wall_seconds:.2f}s: {critical_path}"
@@ -1,11 +1,14 @@
 import abc
-from typing import Callable, Iterable
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from tracing import ExportTracer, default_export_tracer
 
 
 class OneNoteExportTaskBase(Callable[[], None], abc.ABC):
-    def __init__(self, prerequisites: Iterable['OneNoteExportTask']):
-        self._prerequisites = prerequisites
+    def __init__(self, prerequisites: Iterable['OneNoteExportTask'], tracer: Optional[ExportTracer] = None):
+        self._prerequisites = tuple(prerequisites)
         self._is_complete = False
+        self._tracer = tracer or default_export_tracer
 
     def _satisfy_prerequisites(self):
         for prerequisite in self._prerequisites:
@@ -14,13 +17,26 @@ class OneNoteExportTaskBase(Callable[[], None], abc.ABC):
     def __call__(self):
         if not self.is_complete:
             self._satisfy_prerequisites()
-            self._execute()
+            with self._tracer.activated(), self._tracer.span(self._trace_name, 'export', **self._trace_args):
+                self._execute()
         self._is_complete = True
 
+    @property
+    def prerequisites(self) -> Tuple['OneNoteExportTaskBase', ...]:
+        return self._prerequisites
+
     @property
     def is_complete(self) -> bool:
         return self._is_complete
 
+    @property
+    def _trace_name(self) -> str:
+        return str(self)
+
+    @property
+    def _trace_args(self) -> Dict[str, Optional[str]]:
+        return {}
+
     @abc.abstractmethod
     def _execute(self):
         pass
@@ -31,7 +31,7 @@ class OneNoteExportTaskContext(Generic[TNode]):
     @property
     def safe_filename_base(self) -> Optional[pathlib.Path]: return self._safe_filename_base
 
-    def get_logger(self, module_name: str) -> logging.Logger:
+    def get_logger(self, module_name: str) -> logging.LoggerAdapter:
         return get_logger(module_name=module_name, onenote_node=self.node)
 
     def __str__(self):
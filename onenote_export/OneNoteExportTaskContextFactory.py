@@ -1,18 +1,23 @@
+import logging
 import pathlib
-from typing import Callable
+from typing import Dict, Iterable, Optional
 
 from onenote import OneNoteNode, OneNotePage, OneNoteApplication
+from path_scrubbing import PathComponentScrubber
 from .OneNoteExportTaskContext import OneNoteExportTaskContext
 from .OneNotePageExportTaskContext import OneNotePageExportTaskContext
 from .Pathlike import Pathlike
+from .SectionMhtmlPublisher import SectionMhtmlPublisher
 
 
 class OneNoteExportTaskContextFactory:
     def __init__(self,
                  root_output_dir: Pathlike,
                  page_relative_assets_dir: Pathlike,
-                 path_component_scrubber: Callable[[str], pathlib.Path],
+                 path_component_scrubber: PathComponentScrubber,
                  use_legacy_docx_export: bool,
+                 use_native_xml_export: bool = False,
+                 publish_whole_sections: bool = False,
                  ):
         self._root_output_dir =\
             pathlib.Path(root_output_dir) if isinstance(root_output_dir, str) else root_output_dir
@@ -20,13 +25,49 @@ class OneNoteExportTaskContextFactory:
             pathlib.Path(page_relative_assets_dir) if isinstance(page_relative_assets_dir, str) else page_relative_assets_dir
         self._path_component_scrubber = path_component_scrubber
         self._use_legacy_docx_export = use_legacy_docx_export
+        self._use_native_xml_export = use_native_xml_export
+        self._section_mhtml_publisher: Optional[SectionMhtmlPublisher] = SectionMhtmlPublisher() if publish_whole_sections else None
+        self._safe_filename_bases: Dict[OneNoteNode, pathlib.Path] = {}
+        self._logger = logging.getLogger(__name__)
 
     @staticmethod
     def _is_output_dir_step_down(current_context: OneNoteExportTaskContext[OneNoteNode], child: OneNoteNode) -> bool:
         return not isinstance(child, OneNotePage) and not isinstance(current_context.node, OneNotePage)
 
+    @staticmethod
+    def _yield_output_dir_siblings(node: OneNoteNode) -> Iterable[OneNoteNode]:
+        # Pages don't get an output dir of their own, so a section's pages and their subpages all share the section's.
+        output_dir_owner = node.parent
+        while isinstance(output_dir_owner, OneNotePage):
+            output_dir_owner = output_dir_owner.parent
+        if output_dir_owner is None:
+            return ()
+
+        def yield_output_dir_entries(container: OneNoteNode) -> Iterable[OneNoteNode]:
+            for entry in container.children:
+                yield entry
+                if isinstance(entry, OneNotePage):
+                    yield from yield_output_dir_entries(entry)
+
+        return yield_output_dir_entries(output_dir_owner)
+
+    def _scrub_output_dir_siblings(self, node: OneNoteNode):
+        siblings = tuple(self._yield_output_dir_siblings(node))
+        safe_filename_bases = self._path_component_scrubber.cleanup_path_components(sibling.name for sibling in siblings)
+        for sibling, safe_filename_base in zip(siblings, safe_filename_bases):
+            if safe_filename_base != self._path_component_scrubber(sibling.name):
+                self._logger.warning(f'⚠️ "{sibling.name}" would have the same output name as another in its directory, so is named "{safe_filename_base}".')
+            self._safe_filename_bases[sibling] = safe_filename_base
+
+    def _get_safe_filename_base(self, node: OneNoteNode) -> pathlib.Path:
+        if node not in self._safe_filename_bases:
+            self._scrub_output_dir_siblings(node)
+        if node not in self._safe_filename_bases:
+            return self._path_component_scrubber(node.name)
+        return self._safe_filename_bases[node]
+
     def create_context_for_traversal_transition_to_child(self, parent_context: OneNoteExportTaskContext[OneNoteNode], child: OneNoteNode) -> OneNoteExportTaskContext[OneNoteNode]:
-        child_safe_filename_base = self._path_component_scrubber(child.name)
+        child_safe_filename_base = self._get_safe_filename_base(child)
         if not parent_context.output_dir or len(parent_context.output_dir.parts) == 0:
             new_output_dir = self._root_output_dir
         elif OneNoteExportTaskContextFactory._is_output_dir_step_down(parent_context, child):
@@ -42,7 +83,14 @@ class OneNoteExportTaskContextFactory:
         )
 
         if isinstance(child, OneNotePage):
-            child_context = OneNotePageExportTaskContext.begin_export(child_context, use_legacy_docx_export=self._use_legacy_docx_export)
+            if self._section_mhtml_publisher is not None:
+                self._section_mhtml_publisher.expect_page(child)
+            child_context = OneNotePageExportTaskContext.begin_export(
+                child_context,
+                use_legacy_docx_export=self._use_legacy_docx_export,
+                use_native_xml_export=self._use_native_xml_export,
+                section_mhtml_publisher=self._section_mhtml_publisher,
+            )
 
         return child_context
 
@@ -4,20 +4,38 @@ from logging import Logger
 from typing import Dict, Iterable, Callable, Optional, Union
 
 from onenote import OneNoteNode, OneNoteApplication, OneNotePage
+from tracing import ExportTracer, default_export_tracer
 from .OneNoteExportTaskContext import OneNoteExportTaskContext
 from .OneNoteExportTaskContextFactory import OneNoteExportTaskContextFactory
 from .OneNoteExportTaskBase import OneNoteExportTaskBase
 from .OneNoteExportTaskLiteral import OneNoteExportTaskLiteral
 from .OneNotePageExportTaskContext import OneNotePageExportTaskContext
 from .OneNotePageExporterSettings import OneNotePageExporterSettings
+from .PageMemoryAdmissionController import PageMemoryAdmissionController
 from .simple_injector import prepare_action_params, InjectableParameter
 
 
+def _should_try_injection(param: inspect.Parameter) -> bool:
+    # Module-level, rather than a lambda per call, so that the injection plan for each task spec is compiled only once.
+    return param.name != 'prerequisites'
+
+
+@functools.cache
+def _get_init_parameter_names(task_class: type) -> frozenset:
+    return frozenset(inspect.signature(task_class.__init__).parameters)
+
+
+def create_node_trace_args(node: OneNoteNode) -> Dict[str, Optional[str]]:
+    return {'node_id': node.node_id, 'node_name': getattr(node, 'name', None)}
+
+
 class OneNoteExportTaskFactory:
     def __init__(self,
                  context_factory: OneNoteExportTaskContextFactory,
                  page_exporter_settings: OneNotePageExporterSettings,
                  should_export: Callable[[OneNoteNode], bool] = lambda node: True,
+                 tracer: ExportTracer = default_export_tracer,
+                 admission_controller: Optional[PageMemoryAdmissionController] = None,
                  ):
         if not isinstance(context_factory, OneNoteExportTaskContextFactory):
             raise ValueError(f'export_context_factory must be an instance of OneNoteExportMiddlewareContextFactory, not {type(context_factory)}')
@@ -25,6 +43,8 @@ class OneNoteExportTaskFactory:
         self._context_factory = context_factory
         self._should_export = should_export
         self._page_exporter_settings = page_exporter_settings
+        self._tracer = tracer
+        self._admission_controller = admission_controller
 
     def _get_or_create_context(self, node: OneNoteNode) -> OneNoteExportTaskContext[OneNoteNode]:
         if node not in self._contexts:
@@ -62,17 +82,27 @@ class OneNoteExportTaskFactory:
                 InjectableParameter(('subtask_factory', 'task_factory', 'tf'), (OneNoteExportTaskFactory,), lambda: self),
                 InjectableParameter(('settings',), (OneNotePageExporterSettings,), lambda: self._page_exporter_settings),
             ),
-            should_try_injection=lambda param: param.name != 'prerequisites'
+            should_try_injection=_should_try_injection,
         )
 
-        if spec_is_task_class and 'prerequisites' in inspect.signature(task_spec.__init__).parameters:
+        if spec_is_task_class and 'prerequisites' in _get_init_parameter_names(task_spec):
             task_ctor_kwargs['prerequisites'] = prerequisites
+        if spec_is_task_class and 'tracer' in _get_init_parameter_names(task_spec):
+            task_ctor_kwargs['tracer'] = self._tracer
+        if spec_is_task_class and 'admission_controller' in _get_init_parameter_names(task_spec):
+            task_ctor_kwargs['admission_controller'] = self._admission_controller
 
         partialized = functools.partial(task_spec, *task_ctor_args, **task_ctor_kwargs)
 
         if spec_is_task_class:
             return partialized()
         if isinstance(task_spec, Callable):
-            return OneNoteExportTaskLiteral(partialized, description=task_spec.__name__, prerequisites=prerequisites)
+            return OneNoteExportTaskLiteral(
+                partialized,
+                description=task_spec.__name__,
+                prerequisites=prerequisites,
+                trace_args=create_node_trace_args(node),
+                tracer=self._tracer,
+            )
         raise ValueError(f'Unexpected task_spec type: {type(task_spec)}')
 
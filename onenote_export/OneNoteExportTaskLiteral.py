@@ -1,12 +1,20 @@
-from typing import Callable, Iterable
+from typing import Callable, Dict, Iterable, Optional
 
 from onenote_export.OneNoteExportTaskBase import OneNoteExportTaskBase
+from tracing import ExportTracer
 
 
 class OneNoteExportTaskLiteral(OneNoteExportTaskBase):
-    def __init__(self, execute: Callable[[], None], description: str = None, prerequisites: Iterable[OneNoteExportTaskBase] = ()):
-        super().__init__(prerequisites)
+    def __init__(self,
+                 execute: Callable[[], None],
+                 description: str = None,
+                 prerequisites: Iterable[OneNoteExportTaskBase] = (),
+                 trace_args: Optional[Dict[str, Optional[str]]] = None,
+                 tracer: Optional[ExportTracer] = None,
+                 ):
+        super().__init__(prerequisites, tracer)
         self._execute_impl = execute
+        self._trace_args_value = trace_args or {}
 
         if description is None:
             description = execute.__name__
@@ -25,5 +33,9 @@ class OneNoteExportTaskLiteral(OneNoteExportTaskBase):
     def description(self) -> str:
         return self._description
 
+    @property
+    def _trace_args(self) -> Dict[str, Optional[str]]:
+        return self._trace_args_value
+
 
 OneNoteExportTaskBase.register(OneNoteExportTaskLiteral)
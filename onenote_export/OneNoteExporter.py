@@ -1,6 +1,5 @@
 from typing import Callable, Dict, Optional, Tuple
 import logging
-import pathlib
 
 from onenote import \
     OneNoteApplication,\
@@ -11,10 +10,16 @@ from onenote import \
     OneNotePage,\
     OneNoteSectionGroup,\
     OneNoteSection
+from onenote.ComCallMetricsRegistry import ComCallMetricsRegistry, default_com_call_metrics_registry
+from path_scrubbing import PathComponentScrubber
+from tracing import ExportTracer, default_export_tracer
+from .ExportTaskGraph import ExportTaskGraph
 from .OneNoteExportTaskContextFactory import OneNoteExportTaskContextFactory
 from .OneNoteExportTaskBase import OneNoteExportTaskBase
 from .OneNoteExportTaskFactory import OneNoteExportTaskFactory
 from .OneNotePageExporterSettings import OneNotePageExporterSettings
+from .PageImageSource import PageImageSource
+from .PageMemoryAdmissionController import PageMemoryAdmissionController
 from .Pathlike import Pathlike
 
 
@@ -23,9 +28,23 @@ class OneNoteExporter:
                  task_factory: OneNoteExportTaskFactory,
                  *,
                  logger: logging.Logger = logging.getLogger(__name__),
+                 com_call_metrics: ComCallMetricsRegistry = default_com_call_metrics_registry,
+                 tracer: ExportTracer = default_export_tracer,
+                 page_max_workers: int = 1,
+                 admission_controller: Optional[PageMemoryAdmissionController] = None,
                  ):
+        if page_max_workers < 1:
+            raise ValueError(f"page_max_workers must be >= 1, received {page_max_workers}")
         self._task_factory = task_factory
         self._logger = logger
+        self._com_call_metrics = com_call_metrics
+        self._tracer = tracer
+        self._page_max_workers = page_max_workers
+        self._admission_controller = admission_controller
+
+    @property
+    def admission_controller(self) -> Optional[PageMemoryAdmissionController]:
+        return self._admission_controller
 
     def _scan_and_create_export_tasks(self, application: OneNoteApplication) -> Tuple[OneNoteExportTaskBase, ...]:
         export_tasks: Dict[OneNoteNode, OneNoteExportTaskBase] = {}
@@ -81,37 +100,85 @@ class OneNoteExporter:
         return export_tasks_values
 
     def execute_export(self, application: OneNoteApplication) -> None:
-        export_tasks = self._scan_and_create_export_tasks(application)
+        # The OneNote, pandoc and PyMuPDF calls made during the export are traced into this exporter's tracer.
+        with self._tracer.activated():
+            self._execute_export(application)
+
+    def _execute_export(self, application: OneNoteApplication) -> None:
+        with self._tracer.span('scan', 'export'):
+            export_tasks = self._scan_and_create_export_tasks(application)
 
         self._logger.info('🚀 Starting export…')
-        for export_task in export_tasks:
-            export_task()
-        self._logger.info('🏁 Export complete.')
+        try:
+            with self._tracer.span('export', 'export'):
+                run = ExportTaskGraph.from_tasks(export_tasks).execute(self._page_max_workers, tracer=self._tracer)
+            self._logger.info('🏁 Export complete.')
+            self._logger.info(f'⏱️ Export tasks: {run}')
+        finally:
+            # Even when the export fails partway, e.g. on a COM error, the calls made until then help diagnose it.
+            self._log_com_call_metrics()
+            self._log_admission_metrics()
+
+    def _log_com_call_metrics(self):
+        com_call_metrics = self._com_call_metrics.snapshot()
+        if not com_call_metrics:
+            return
+        self._logger.info('⏱️ OneNote COM calls:')
+        for method_metrics in com_call_metrics.values():
+            self._logger.info(f'⏱️   {method_metrics}')
+
+    def _log_admission_metrics(self):
+        if self._admission_controller is None:
+            return
+        self._logger.info(f'🧮 Page memory admission: {self._admission_controller.snapshot()}')
 
 
 def create_default_onenote_exporter(
     root_output_dir: Pathlike,
     page_relative_assets_dir: Pathlike,
-    path_component_scrubber: Callable[[str], pathlib.Path],
+    path_component_scrubber: PathComponentScrubber,
     should_export: Callable[[OneNoteNode], bool] = lambda node: True,
     use_legacy_docx_export: bool = False,
+    use_native_xml_export: bool = False,
+    publish_whole_sections: bool = False,
     pages_remove_onenote_footer: bool = True,
+    page_image_source: PageImageSource = PageImageSource.PDF,
+    page_subtask_max_workers: int = 1,
+    page_max_workers: int = 1,
+    page_memory_budget_bytes: Optional[int] = None,
+    tracer: ExportTracer = default_export_tracer,
 ) -> 'OneNoteExporter':
+    if use_native_xml_export and page_image_source != PageImageSource.BINARY_PAGE_CONTENT:
+        logging.getLogger(__name__).warning(
+            f"⚠️ Native XML export takes each page's images from its content, so page_image_source {page_image_source.name} is ignored."
+        )
+
     context_factory = OneNoteExportTaskContextFactory(
         root_output_dir=root_output_dir,
         page_relative_assets_dir=page_relative_assets_dir,
         path_component_scrubber=path_component_scrubber,
         use_legacy_docx_export=use_legacy_docx_export,
+        use_native_xml_export=use_native_xml_export,
+        publish_whole_sections=publish_whole_sections,
     )
 
     page_exporter_settings = OneNotePageExporterSettings(
         pages_remove_onenote_footer=pages_remove_onenote_footer,
+        page_image_source=page_image_source,
+        page_subtask_max_workers=page_subtask_max_workers,
     )
 
+    admission_controller = PageMemoryAdmissionController(page_memory_budget_bytes) if page_memory_budget_bytes is not None else None
+
     return OneNoteExporter(
         task_factory=OneNoteExportTaskFactory(
             context_factory=context_factory,
             page_exporter_settings=page_exporter_settings,
             should_export=should_export,
+            tracer=tracer,
+            admission_controller=admission_controller,
         ),
+        tracer=tracer,
+        page_max_workers=page_max_workers,
+        admission_controller=admission_controller,
     )
@@ -1,18 +1,20 @@
 import functools
 import pathlib
-from functools import cache
 from typing import ContextManager, Callable, Union, Optional, Sequence
 
 import pypandoc
 
+from markdown_dom.MarkdownContentHashSidecar import MarkdownContentHashSidecar
 from markdown_dom.MarkdownDocument import MarkdownDocument
 from onenote import OneNotePage
 from onenote_export.OneNoteExportTaskContext import OneNoteExportTaskContext
 from onenote_export.PageExportAssetExtraction import PageExportAssetExtraction
 from onenote_export.Pathlike import Pathlike
+from onenote_export.SectionMhtmlPublisher import SectionMhtmlPublisher
 from onenote_export.TemporaryOneNotePageDocxExport import TemporaryOneNotePageDocxExport
 from onenote_export.TemporaryOneNotePageMhtmlExport import TemporaryOneNotePageMhtmlExport
 from onenote_export.TemporaryOneNotePagePdfExport import TemporaryOneNotePagePdfExport
+from onenote_export.TemporaryOneNotePageXmlExport import TemporaryOneNotePageXmlExport
 from onenote_export.TemporaryPageExportPandocAstJsonContext import TemporaryPageExportPandocAstJsonContext
 from pdf_inspection.PdfDocument import PdfDocument
 
@@ -20,6 +22,7 @@ from pdf_inspection.PdfDocument import PdfDocument
 default_create_temporary_pdf_export_handler = TemporaryOneNotePagePdfExport
 default_create_temporary_docx_export_handler = TemporaryOneNotePageDocxExport
 default_create_temporary_mhtml_export_handler = TemporaryOneNotePageMhtmlExport
+default_create_temporary_xml_export_handler = TemporaryOneNotePageXmlExport
 
 
 def default_create_output_md_document(context: 'OneNotePageExportTaskContext') -> MarkdownDocument:
@@ -28,34 +31,40 @@ def default_create_output_md_document(context: 'OneNotePageExportTaskContext') -
         export_in_vivo = context._temp_docx_export
     elif issubclass(context._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageMhtmlExport):
         export_in_vivo = context._temp_mhtml_export
+    elif issubclass(context._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageXmlExport):
+        export_in_vivo = context._temp_xml_export
     else:
         raise RuntimeError(f"Unsupported temporary_page_pandoc_ast_json_handler_class: {context._temporary_page_pandoc_ast_json_handler_class}")
     if not export_in_vivo:
         raise RuntimeError("OneNotePageExportTaskContext must be entered before calling accessing the output markdown document")
 
-    if md_path.exists():
-        def get_replacement_ast():
-            with export_in_vivo:
-                return context.page_as_pandoc_ast_json
-        doc = MarkdownDocument.import_md_file(md_path)
-        doc._replace_pandoc_ast_json(get_replacement_ast())
-    else:
-        def get_initial_ast():
-            with export_in_vivo:
-                return context.page_as_pandoc_ast_json
-        doc = MarkdownDocument.open_document_ast_json_str(
-            initial_document_ast_json=get_initial_ast,
-            output_md_path=md_path,
-        )
+    def get_page_ast():
+        with export_in_vivo:
+            return context.page_as_pandoc_ast_json
+
+    # Rather than parsing any existing output file back through pandoc just to compare it, the rendered Markdown is
+    # compared against the hash recorded when the file was last written.
+    doc = MarkdownDocument.open_document_ast_json_str(
+        initial_document_ast_json=get_page_ast,
+        output_md_path=md_path,
+        content_hash_sidecar=MarkdownContentHashSidecar(),
+    )
     return doc
 
 
+def _measure_published_bytes(path: pathlib.Path) -> int:
+    if path.is_dir():
+        return sum(file.stat().st_size for file in path.rglob('*') if file.is_file())
+    return path.stat().st_size if path.exists() else 0
+
+
 class OneNotePageExportTaskContext(OneNoteExportTaskContext[OneNotePage], PageExportAssetExtraction, ContextManager):
     def __init__(self,
                  context: OneNoteExportTaskContext[OneNotePage],
                  *,
                  create_temporary_docx_export_handler: Callable[[OneNotePage], TemporaryOneNotePageDocxExport] = default_create_temporary_docx_export_handler,
                  create_temporary_mhtml_export_handler: Callable[[OneNotePage], TemporaryOneNotePageMhtmlExport] = default_create_temporary_mhtml_export_handler,
+                 create_temporary_xml_export_handler: Callable[[OneNotePage], TemporaryOneNotePageXmlExport] = default_create_temporary_xml_export_handler,
                  temporary_page_pandoc_ast_json_handler_class: type[Union[TemporaryPageExportPandocAstJsonContext, PageExportAssetExtraction]] = TemporaryOneNotePageMhtmlExport,
                  create_temporary_pdf_export_handler: Callable[[OneNotePage], TemporaryOneNotePagePdfExport] = TemporaryOneNotePagePdfExport,
                  create_output_md_document: Callable[['OneNotePageExportTaskContext'], MarkdownDocument] = default_create_output_md_document,
@@ -71,27 +80,49 @@ class OneNotePageExportTaskContext(OneNoteExportTaskContext[OneNotePage], PageEx
         self._create_temporary_pdf_export_handler = functools.partial(create_temporary_pdf_export_handler, page)
         self._create_temporary_docx_export_handler = functools.partial(create_temporary_docx_export_handler, page)
         self._create_temporary_mhtml_export_handler = functools.partial(create_temporary_mhtml_export_handler, page)
+        self._create_temporary_xml_export_handler = functools.partial(create_temporary_xml_export_handler, page)
         self._create_output_md_document = functools.partial(create_output_md_document, self)
         self._temp_pdf_export: TemporaryOneNotePagePdfExport = None
+        self._temp_pdf_export_is_entered = False
         self._temp_docx_export: TemporaryOneNotePageDocxExport = None
         self._temp_docx_export_pandoc_ast_json: str = None
         self._temp_mhtml_export: TemporaryOneNotePageMhtmlExport = None
         self._temp_mhtml_export_pandoc_ast_json: str = None
+        self._temp_xml_export: TemporaryOneNotePageXmlExport = None
+        self._temp_xml_export_pandoc_ast_json: str = None
         self._temporary_page_pandoc_ast_json_handler_class = temporary_page_pandoc_ast_json_handler_class
         self._output_md_document: MarkdownDocument = None
+        self._extracted_asset_paths: Optional[Sequence[pathlib.Path]] = None
+        self._extracted_image_paths: Optional[Sequence[pathlib.Path]] = None
 
         if \
                 not issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageDocxExport) and \
-                not issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageMhtmlExport):
-            raise TypeError(f"temporary_page_pandoc_ast_json_handler_class must be either TemporaryOneNotePageDocxExport or TemporaryOneNotePageMhtmlExport, not {self._temporary_page_pandoc_ast_json_handler_class}")
+                not issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageMhtmlExport) and \
+                not issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageXmlExport):
+            raise TypeError(f"temporary_page_pandoc_ast_json_handler_class must be one of TemporaryOneNotePageDocxExport, TemporaryOneNotePageMhtmlExport or TemporaryOneNotePageXmlExport, not {self._temporary_page_pandoc_ast_json_handler_class}")
 
     @staticmethod
-    def begin_export(context: OneNoteExportTaskContext[OneNotePage], *, use_legacy_docx_export: bool = False) -> 'OneNotePageExportTaskContext':
+    def begin_export(context: OneNoteExportTaskContext[OneNotePage],
+                     *,
+                     use_legacy_docx_export: bool = False,
+                     use_native_xml_export: bool = False,
+                     section_mhtml_publisher: Optional[SectionMhtmlPublisher] = None,
+                     ) -> 'OneNotePageExportTaskContext':
         if isinstance(context, OneNotePageExportTaskContext):
             raise TypeError(f"Context must not be an instance of OneNotePageExportMiddlewareContext, not {type(context)}")
+        if use_legacy_docx_export and use_native_xml_export:
+            raise ValueError("use_legacy_docx_export and use_native_xml_export cannot both be set")
 
+        if use_native_xml_export:
+            return OneNotePageExportTaskContext(context, temporary_page_pandoc_ast_json_handler_class=TemporaryOneNotePageXmlExport)
         if use_legacy_docx_export:
             return OneNotePageExportTaskContext(context, temporary_page_pandoc_ast_json_handler_class=TemporaryOneNotePageDocxExport)
+        if section_mhtml_publisher is not None:
+            return OneNotePageExportTaskContext(
+                context,
+                temporary_page_pandoc_ast_json_handler_class=TemporaryOneNotePageMhtmlExport,
+                create_temporary_mhtml_export_handler=functools.partial(TemporaryOneNotePageMhtmlExport, mhtml_source=section_mhtml_publisher.pop_page_mhtml_container),
+            )
         return OneNotePageExportTaskContext(context, temporary_page_pandoc_ast_json_handler_class=TemporaryOneNotePageMhtmlExport)
 
     @property
@@ -99,17 +130,14 @@ class OneNotePageExportTaskContext(OneNoteExportTaskContext[OneNotePage], PageEx
         return self._node
 
     @property
-    @cache
     def page_node_id(self) -> str:
         return self._page.node_id
 
     @property
-    @cache
     def page_name(self) -> str:
         return self._page.name
 
     @property
-    @cache
     def page_route(self) -> tuple[str, ...]:
         return self._page.route
 
@@ -131,26 +159,37 @@ class OneNotePageExportTaskContext(OneNoteExportTaskContext[OneNotePage], PageEx
             self._temp_docx_export = self._create_temporary_docx_export_handler()
         elif issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageMhtmlExport):
             self._temp_mhtml_export = self._create_temporary_mhtml_export_handler()
+        elif issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageXmlExport):
+            self._temp_xml_export = self._create_temporary_xml_export_handler()
         else:
             raise RuntimeError(f"Unsupported temporary_page_pandoc_ast_json_handler_class: {self._temporary_page_pandoc_ast_json_handler_class}")
         self._output_md_document = self._create_output_md_document()
 
-        self._temp_pdf_export.__enter__()
-
         if issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageDocxExport):
             self._temp_docx_export.__enter__()
         elif issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageMhtmlExport):
             self._temp_mhtml_export.__enter__()
+        elif issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageXmlExport):
+            self._temp_xml_export.__enter__()
         else:
             raise RuntimeError(f"Unsupported temporary_page_pandoc_ast_json_handler_class: {self._temporary_page_pandoc_ast_json_handler_class}")
 
         return self
 
+    def ensure_pdf_published(self):
+        """
+        Publishes the page to PDF, if it hasn't been yet, so that it counts towards published_bytes.
+        """
+        if self._temp_pdf_export is None:
+            raise RuntimeError("OneNotePageExportTaskContext must be entered before publishing the page to PDF")
+        # The page is only published to PDF once something needs it.
+        if not self._temp_pdf_export_is_entered:
+            self._temp_pdf_export.__enter__()
+            self._temp_pdf_export_is_entered = True
+
     @property
-    @cache
     def page_as_pdf_document(self) -> PdfDocument:
-        if self._temp_pdf_export is None:
-            raise RuntimeError("OneNotePageExportTaskContext must be entered before accessing page_as_pdf_document")
+        self.ensure_pdf_published()
         return self._temp_pdf_export.pdf_document
 
     @property
@@ -169,12 +208,22 @@ class OneNotePageExportTaskContext(OneNoteExportTaskContext[OneNotePage], PageEx
             self._temp_mhtml_export_pandoc_ast_json = self._temp_mhtml_export.create_pandoc_ast_json()
         return self._temp_mhtml_export_pandoc_ast_json
 
+    @property
+    def _page_as_xml_pandoc_ast_json(self) -> str:
+        if self._temp_xml_export is None:
+            raise RuntimeError("OneNotePageExportTaskContext must be entered before accessing page_as_xml_pandoc_ast_json")
+        if self._temp_xml_export_pandoc_ast_json is None:
+            self._temp_xml_export_pandoc_ast_json = self._temp_xml_export.create_pandoc_ast_json()
+        return self._temp_xml_export_pandoc_ast_json
+
     @property
     def page_as_pandoc_ast_json(self) -> str:
         if issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageDocxExport):
             return self._page_as_docx_pandoc_ast_json
         if issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageMhtmlExport):
             return self._page_as_mhtml_pandoc_ast_json
+        if issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageXmlExport):
+            return self._page_as_xml_pandoc_ast_json
         raise RuntimeError(f"Unsupported temporary_page_pandoc_ast_json_handler_class: {self._temporary_page_pandoc_ast_json_handler_class}")
 
     def extract_assets_to(self,
@@ -196,21 +245,76 @@ class OneNotePageExportTaskContext(OneNoteExportTaskContext[OneNotePage], PageEx
             return self._temp_docx_export.extract_assets_to(target_dir, map_extraction_path)
         if issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageMhtmlExport):
             return self._temp_mhtml_export.extract_assets_to(target_dir, map_extraction_path)
+        if issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageXmlExport):
+            return self._temp_xml_export.extract_assets_to(target_dir, map_extraction_path)
         raise RuntimeError(f"Unsupported temporary_page_pandoc_ast_json_handler_class: {self._temporary_page_pandoc_ast_json_handler_class}")
 
+    @property
+    def reads_onenote_during_subtasks(self) -> bool:
+        """
+        Whether the page's content is read from OneNote as the subtasks need it, rather than when the context is entered.
+        """
+        return issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageXmlExport)
+
+    @property
+    def extracts_images_with_ordinated_assets(self) -> bool:
+        """
+        Whether the page's images are among its ordinated assets, already linked from its markdown document, rather
+        than needing to be extracted from elsewhere and patched in.
+        """
+        return issubclass(self._temporary_page_pandoc_ast_json_handler_class, TemporaryOneNotePageXmlExport)
+
     @property
     def output_md_document(self) -> MarkdownDocument:
         if self._output_md_document is None:
             raise RuntimeError("OneNotePageExportTaskContext must be entered before accessing output_md_document")
         return self._output_md_document
 
+    @property
+    def published_bytes(self) -> int:
+        """
+        The size of what has been published for the page so far: its MHTML or DOCX, and its PDF.
+        """
+        published_exports = [self._temp_docx_export, self._temp_mhtml_export]
+        if self._temp_pdf_export_is_entered:
+            published_exports.append(self._temp_pdf_export)
+        return sum(
+            _measure_published_bytes(export.tempfile_path)
+            for export in published_exports
+            if export is not None and export.tempfile_path is not None
+        )
+
+    @property
+    def extracted_asset_paths(self) -> Optional[Sequence[pathlib.Path]]:
+        """
+        The page's ordinated assets, relative to the output directory, once they have been extracted.
+        """
+        return self._extracted_asset_paths
+
+    @extracted_asset_paths.setter
+    def extracted_asset_paths(self, value: Sequence[pathlib.Path]):
+        self._extracted_asset_paths = value
+
+    @property
+    def extracted_image_paths(self) -> Optional[Sequence[pathlib.Path]]:
+        """
+        The page's images, relative to the output directory, once they have been extracted.
+        """
+        return self._extracted_image_paths
+
+    @extracted_image_paths.setter
+    def extracted_image_paths(self, value: Sequence[pathlib.Path]):
+        self._extracted_image_paths = value
+
     @property
     def pandoc_path(self) -> pathlib.Path:
         return pathlib.Path(pypandoc.get_pandoc_path())
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self._temp_pdf_export:
-            self._temp_pdf_export.__exit__(exc_type, exc_val, exc_tb)
+            if self._temp_pdf_export_is_entered:
+                self._temp_pdf_export.__exit__(exc_type, exc_val, exc_tb)
+                self._temp_pdf_export_is_entered = False
             self._temp_pdf_export = None
         if self._temp_docx_export:
             self._temp_docx_export.__exit__(exc_type, exc_val, exc_tb)
@@ -218,4 +322,8 @@ class OneNotePageExportTaskContext(OneNoteExportTaskContext[OneNotePage], PageEx
         if self._temp_mhtml_export:
             self._temp_mhtml_export.__exit__(exc_type, exc_val, exc_tb)
             self._temp_mhtml_export = None
+        if self._temp_xml_export:
+            self._temp_xml_export.__exit__(exc_type, exc_val, exc_tb)
+            self._temp_xml_export = None
         self._temp_docx_export_pandoc_ast_json = None
+        self._temp_xml_export_pandoc_ast_json = None
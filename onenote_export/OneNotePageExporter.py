@@ -1,13 +1,18 @@
+import contextlib
 import functools
 import logging
 
-import pywintypes
-from typing import Iterable, Tuple, Callable
+from typing import Dict, Iterable, Optional, Callable
 
+from onenote.com_error_types import get_com_error_types
+from tracing import ExportTracer
+from .ExportTaskGraph import ExportTaskGraph
 from .OneNoteExportTaskBase import OneNoteExportTaskBase
-from .OneNoteExportTaskFactory import OneNoteExportTaskFactory
+from .OneNoteExportTaskFactory import OneNoteExportTaskFactory, create_node_trace_args
 from .OneNotePageExportTaskContext import OneNotePageExportTaskContext
 from .OneNotePageExporterSettings import OneNotePageExporterSettings
+from .PageImageSource import PageImageSource
+from .PageMemoryAdmissionController import PageMemoryAdmissionController
 from .page_export_tasks import *
 from .page_export_tasks.page_remove_onenote_footer import page_remove_onenote_footer
 
@@ -20,69 +25,119 @@ class OneNotePageExporter(OneNoteExportTaskBase):
                  settings: OneNotePageExporterSettings,
                  *,
                  logger: logging.Logger = logging.getLogger(__name__ + '.' + __qualname__),
+                 tracer: Optional[ExportTracer] = None,
+                 admission_controller: Optional[PageMemoryAdmissionController] = None,
                  ):
-        super().__init__(prerequisites)
+        super().__init__(prerequisites, tracer)
         if not isinstance(context, OneNotePageExportTaskContext):
             raise TypeError(f"Context must be an instance of OneNotePageExportMiddlewareContext, not {type(context)}")
         self._context = context
         self._settings = settings
         self._logger = logger
-        self._subtasks = tuple(self._yield_subtasks(context, tuple(), subtask_factory))
+        self._admission_controller = admission_controller
+        self._subtask_graph = self._create_subtask_graph(context, subtask_factory)
 
-    def _yield_subtasks(
+    def _create_subtask_graph(
         self,
         context: OneNotePageExportTaskContext,
-        prerequisites: Tuple[OneNoteExportTaskBase],
         subtask_factory: OneNoteExportTaskFactory
-    ) -> Iterable['OneNoteExportTask']:
-        create_subtask = functools.partial(subtask_factory.create_from_spec, node=context.node)
+    ) -> ExportTaskGraph:
+        create_subtask = functools.partial(subtask_factory.create_from_spec, node=context.node, prerequisites=())
+        graph = ExportTaskGraph()
 
-        task_ensure_output_dir_exists = create_subtask(
-            task_spec=page_ensure_output_dir_exists,
-            prerequisites=prerequisites
-        )
-        yield task_ensure_output_dir_exists
+        task_ensure_output_dir_exists = graph.add(create_subtask(task_spec=page_ensure_output_dir_exists))
 
-        task_ensure_assets_dir_exists = create_subtask(
-            task_spec=page_ensure_assets_dir_exists,
-            prerequisites=prerequisites + (task_ensure_output_dir_exists,)
+        task_ensure_assets_dir_exists = graph.add(
+            create_subtask(task_spec=page_ensure_assets_dir_exists),
+            prerequisites=(task_ensure_output_dir_exists,)
         )
-        yield task_ensure_assets_dir_exists
 
-        task_page_reparse_embedded_html = create_subtask(
-            task_spec=page_reparse_embedded_html,
-            prerequisites=prerequisites
+        # Building the page's markdown document, or extracting its files, may call OneNote, which has to happen on the
+        # calling thread.
+        reads_onenote = context.reads_onenote_during_subtasks
+
+        # Reparsing the raw HTML only needs the page's markdown document, so it can overlap extracting the page's files.
+        task_page_reparse_embedded_html = graph.add(
+            create_subtask(task_spec=page_reparse_embedded_html),
+            on_calling_thread=reads_onenote,
         )
-        yield task_page_reparse_embedded_html
 
-        task_page_extract_ordinated_assets_and_relink = create_subtask(
-            task_spec=page_extract_ordinated_assets_and_relink,
-            prerequisites=(task_ensure_assets_dir_exists, task_page_reparse_embedded_html,)
+        task_page_extract_ordinated_assets = graph.add(
+            create_subtask(task_spec=page_extract_ordinated_assets),
+            prerequisites=(task_ensure_assets_dir_exists,),
+            on_calling_thread=reads_onenote,
         )
-        yield task_page_extract_ordinated_assets_and_relink
 
-        task_pdf_patch_images_into_md = create_subtask(
-            task_spec=page_pdf_patch_images_into_md,
-            prerequisites=(task_page_extract_ordinated_assets_and_relink,)
+        # From here on, each task edits the markdown document, so each waits for the last.
+        task_page_relink_ordinated_assets = graph.add(
+            create_subtask(task_spec=page_relink_ordinated_assets),
+            prerequisites=(task_page_reparse_embedded_html, task_page_extract_ordinated_assets,)
         )
-        yield task_pdf_patch_images_into_md
 
-        final_save_task_prereqs = (task_pdf_patch_images_into_md,)
+        final_save_task_prereqs = (task_page_relink_ordinated_assets,)
+
+        if self._extracts_images_separately:
+            # The images can share file names with the ordinated assets, and are the ones that should be kept.
+            task_page_extract_images = graph.add(
+                create_subtask(task_spec=page_extract_images),
+                prerequisites=(task_page_extract_ordinated_assets,),
+                on_calling_thread=True,
+            )
+
+            task_page_patch_images_into_md = graph.add(
+                create_subtask(task_spec=page_patch_images_into_md),
+                prerequisites=(task_page_relink_ordinated_assets, task_page_extract_images,)
+            )
+            final_save_task_prereqs = (task_page_patch_images_into_md,)
 
         if self._settings.pages_remove_onenote_footer:
-            task_page_remove_onenote_footer = create_subtask(
-                task_spec=page_remove_onenote_footer,
-                prerequisites=(task_page_reparse_embedded_html,)
+            task_page_remove_onenote_footer = graph.add(
+                create_subtask(task_spec=page_remove_onenote_footer),
+                prerequisites=final_save_task_prereqs
             )
-            final_save_task_prereqs += (task_page_remove_onenote_footer,)
-            yield task_page_remove_onenote_footer
+            final_save_task_prereqs = (task_page_remove_onenote_footer,)
 
-        task_export_pandoc_ast_to_markdown_file = create_subtask(
-            task_spec=page_export_pandoc_ast_to_markdown_file,
+        graph.add(
+            create_subtask(task_spec=page_export_pandoc_ast_to_markdown_file),
             prerequisites=final_save_task_prereqs
         )
-        yield task_export_pandoc_ast_to_markdown_file
 
+        return graph
+
+    @property
+    def _extracts_images_separately(self) -> bool:
+        # The page's native XML links its images, which are extracted along with its other ordinated assets.
+        return not self._context.extracts_images_with_ordinated_assets
+
+    @property
+    def subtask_graph(self) -> ExportTaskGraph:
+        return self._subtask_graph
+
+    def __str__(self):
+        return f"page_export '{self._context.output_md_path}'"
+
+    @contextlib.contextmanager
+    def _admitted(self):
+        if self._admission_controller is None:
+            yield
+            return
+
+        if self._extracts_images_separately and self._settings.page_image_source == PageImageSource.PDF:
+            # Published before the page is admitted, rather than once its images are extracted, so that it counts.
+            self._context.ensure_pdf_published()
+        footprint_bytes = self._admission_controller.estimate_footprint_bytes(self._context.published_bytes)
+        with contextlib.ExitStack() as admission:
+            with self._tracer.span('page_admission', 'export', footprint_bytes=str(footprint_bytes), **self._trace_args):
+                admission.enter_context(self._admission_controller.admit(footprint_bytes))
+            yield
+
+    @property
+    def _trace_name(self) -> str:
+        return 'page_export'
+
+    @property
+    def _trace_args(self) -> Dict[str, Optional[str]]:
+        return create_node_trace_args(self._context.node)
 
     def _execute(self):
         had_com_failure = None
@@ -98,22 +153,26 @@ class OneNotePageExporter(OneNoteExportTaskBase):
                         return True
                 return False
 
-            is_com_failure = exception_is_or_has_cause(e, lambda e: isinstance(e, pywintypes.com_error))
+            is_com_failure = exception_is_or_has_cause(e, lambda e: isinstance(e, get_com_error_types()))
             if is_com_failure:
                 self._logger.error(f"Unrecoverable COM error while {activity_description}.", exc_info=e)
             return is_com_failure
 
         try:
-            with self._context:
-                for subtask in self._subtasks:
-                    try:
-                        subtask()
-                    except Exception as e:
-                        had_com_failure = handle_com_failure(e, f"executing subtask {subtask}")
-                        if had_com_failure:
-                            break
-                        else:
-                            raise
+            with self._context, self._admitted():
+                try:
+                    run = self._subtask_graph.execute(
+                        self._settings.page_subtask_max_workers,
+                        tracer=self._tracer,
+                        trace_args=self._trace_args,
+                    )
+                except Exception as e:
+                    had_com_failure = handle_com_failure(e, "executing subtasks")
+                    if had_com_failure:
+                        return
+                    else:
+                        raise
+            self._logger.info(f"⏱️ Exported with {run}: '{self._context.output_md_path}'")
         except Exception as e:
             had_com_failure = had_com_failure or handle_com_failure(e, f"preparing to execute subtasks")
             if had_com_failure:
@@ -1,6 +1,10 @@
 import dataclasses
 
+from .PageImageSource import PageImageSource
+
 
 @dataclasses.dataclass
 class OneNotePageExporterSettings:
     pages_remove_onenote_footer: bool = True
+    page_image_source: PageImageSource = PageImageSource.PDF
+    page_subtask_max_workers: int = 1  # How many of each page's export subtasks may run at once.
@@ -0,0 +1,10 @@
+from enum import Enum, unique
+
+
+@unique
+class PageImageSource(str, Enum):
+    PDF = 'pdf'
+    """Publish the page to PDF, and re-encode the images found in it as PNG."""
+
+    BINARY_PAGE_CONTENT = 'binary_page_content'
+    """Fetch each image's original bytes via GetBinaryPageContent, and write them unchanged."""
@@ -0,0 +1,114 @@
+import collections
+import contextlib
+import threading
+import time
+
+from typing import ContextManager, Deque
+
+from .PageMemoryAdmissionMetrics import PageMemoryAdmissionMetrics
+
+
+class PageMemoryAdmissionController:
+    """
+    Limits how many pages are exported at once by how much memory they are expected to need, rather than by a count.
+    A page's footprint is estimated from the size of what was published for it (its MHTML and PDF): converting a page
+    holds those contents, the pandoc JSON made from them and the panflute tree parsed from that, all at once.
+    Pages are admitted in the order they ask, each once the footprints of the pages already admitted and its own fit
+    the budget. A page whose footprint doesn't fit the budget by itself is admitted once no other page is, and runs alone.
+    Safe to use from multiple threads.
+    """
+
+    def __init__(self,
+                 budget_bytes: int,
+                 bytes_per_published_byte: float = 16.0,
+                 baseline_bytes: int = 64 * 2 ** 20,
+                 ):
+        """
+        :param budget_bytes: How much memory the pages being exported may use between them.
+        :param bytes_per_published_byte: How much memory converting a page needs per byte published for it.
+        :param baseline_bytes: How much memory converting a page needs however little was published for it.
+        """
+        if budget_bytes <= 0:
+            raise ValueError(f"budget_bytes must be > 0, received {budget_bytes}")
+        if bytes_per_published_byte < 0:
+            raise ValueError(f"bytes_per_published_byte must be >= 0, received {bytes_per_published_byte}")
+        if baseline_bytes < 0:
+            raise ValueError(f"baseline_bytes must be >= 0, received {baseline_bytes}")
+        self._budget_bytes = budget_bytes
+        self._bytes_per_published_byte = bytes_per_published_byte
+        self._baseline_bytes = baseline_bytes
+        self._condition = threading.Condition()
+        self._waiting: Deque[object] = collections.deque()
+        self._admitted_bytes = 0
+        self._admitted_count = 0
+        self._total_admitted_count = 0
+        self._run_alone_count = 0
+        self._peak_admitted_bytes = 0
+        self._peak_admitted_count = 0
+        self._total_wait_seconds = 0.0
+
+    @property
+    def budget_bytes(self) -> int:
+        return self._budget_bytes
+
+    def estimate_footprint_bytes(self, published_bytes: int) -> int:
+        """
+        :param published_bytes: The size of what was published for the page.
+        :return: How much memory exporting the page is expected to need.
+        """
+        return self._baseline_bytes + int(published_bytes * self._bytes_per_published_byte)
+
+    def admit(self, footprint_bytes: int) -> ContextManager[None]:
+        """
+        Waits for the page to be admitted, which it stays until the returned context manager is exited.
+        :param footprint_bytes: How much memory exporting the page is expected to need.
+        """
+        if footprint_bytes < 0:
+            raise ValueError(f"footprint_bytes must be >= 0, received {footprint_bytes}")
+        return self._admitted(footprint_bytes)
+
+    @contextlib.contextmanager
+    def _admitted(self, footprint_bytes: int):
+        ticket = object()
+        started = time.monotonic()
+        with self._condition:
+            self._waiting.append(ticket)
+            try:
+                self._condition.wait_for(lambda: self._waiting[0] is ticket and self._fits(footprint_bytes))
+            except BaseException:
+                self._waiting.remove(ticket)
+                self._condition.notify_all()
+                raise
+            self._waiting.popleft()
+            runs_alone = footprint_bytes > self._budget_bytes
+            self._admitted_bytes += footprint_bytes
+            self._admitted_count += 1
+            self._total_admitted_count += 1
+            self._run_alone_count += 1 if runs_alone else 0
+            self._peak_admitted_bytes = max(self._peak_admitted_bytes, self._admitted_bytes)
+            self._peak_admitted_count = max(self._peak_admitted_count, self._admitted_count)
+            self._total_wait_seconds += time.monotonic() - started
+            # The next page in line may fit alongside this one.
+            self._condition.notify_all()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._admitted_bytes -= footprint_bytes
+                self._admitted_count -= 1
+                self._condition.notify_all()
+
+    def _fits(self, footprint_bytes: int) -> bool:
+        return self._admitted_count == 0 or self._admitted_bytes + footprint_bytes <= self._budget_bytes
+
+    def snapshot(self) -> PageMemoryAdmissionMetrics:
+        with self._condition:
+            return PageMemoryAdmissionMetrics(
+                budget_bytes=self._budget_bytes,
+                admitted_count=self._total_admitted_count,
+                waiting_count=len(self._waiting),
+                run_alone_count=self._run_alone_count,
+                peak_admitted_bytes=self._peak_admitted_bytes,
+                peak_admitted_count=self._peak_admitted_count,
+                total_wait_seconds=self._total_wait_seconds,
+            )
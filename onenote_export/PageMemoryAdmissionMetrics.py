@@ -0,0 +1,21 @@
+import dataclasses
+
+
+@dataclasses.dataclass(frozen=True)
+class PageMemoryAdmissionMetrics:
+    """
+    A point-in-time summary of the pages admitted by a PageMemoryAdmissionController.
+    """
+    budget_bytes: int
+    admitted_count: int
+    waiting_count: int
+    run_alone_count: int
+    peak_admitted_bytes: int
+    peak_admitted_count: int
+    total_wait_seconds: float
+
+    def __str__(self):
+        return \
+            f"{self.admitted_count} pages admitted ({self.run_alone_count} too big to share), " \
+            f"peak {self.peak_admitted_count} at once using ~{self.peak_admitted_bytes / 2 ** 20:.0f} MiB " \
+            f"of {self.budget_bytes / 2 ** 20:.0f} MiB, {self.total_wait_seconds:.1f}s waiting"
@@ -0,0 +1,119 @@
+import logging
+import threading
+from typing import Dict, Optional, Set
+
+from mhtml_dom.MhtmlContainer import MhtmlContainer
+from mhtml_dom.split_mhtml_documents import get_mhtml_document_titles, split_mhtml_documents
+from onenote import OneNoteNode, OneNotePage, OneNoteSection
+from .temporary_file import TemporaryFilePath
+
+
+class SectionMhtmlPublisher:
+    """
+    Publishes each section to MHTML once, rather than each of its pages, and splits the section's MHTML into a
+    container per page, laid out as if the page had been published by itself. A section of hundreds of pages then
+    takes one OneNote call instead of hundreds.
+    Only the pages expected to be exported (see `expect_page`) are split out, and each page's container is handed out
+    once, and then dropped. Where a section's MHTML can't be split into its pages, or its documents aren't titled after
+    its pages in the same order, its pages get no container, and are left to be published one at a time. Different sections can be published at the same time.
+    """
+
+    def __init__(self, logger: logging.Logger = logging.getLogger(__name__)):
+        self._logger = logger
+        self._lock = threading.Lock()
+        self._section_locks: Dict[str, threading.Lock] = {}
+        self._published_section_ids: Set[str] = set()
+        self._expected_page_ids_by_section_id: Dict[str, Set[str]] = {}
+        self._page_mhtml_containers: Dict[str, MhtmlContainer] = {}
+
+    @staticmethod
+    def _get_section(page: OneNotePage) -> Optional[OneNoteSection]:
+        node: Optional[OneNoteNode] = page
+        while isinstance(node, OneNotePage):
+            node = node.parent
+        return node if isinstance(node, OneNoteSection) else None
+
+    @property
+    def pending_page_count(self) -> int:
+        """
+        How many pages' containers have been split out of their sections' MHTML, but not yet handed out.
+        """
+        with self._lock:
+            return len(self._page_mhtml_containers)
+
+    def expect_page(self, page: OneNotePage):
+        """
+        Records that the page is going to be exported, so its container is to be split out when its section is published.
+        :param page: The page.
+        """
+        if not isinstance(page, OneNotePage):
+            raise TypeError(f"page must be an instance of OneNotePage, not {type(page)}")
+
+        section = self._get_section(page)
+        if section is None:
+            return
+
+        with self._lock:
+            self._expected_page_ids_by_section_id.setdefault(section.node_id, set()).add(page.node_id)
+
+    def _publish_section(self, section: OneNoteSection, wanted_page_ids: Set[str]) -> Dict[str, MhtmlContainer]:
+        pages = section.all_pages
+        page_ids = tuple(page.node_id for page in pages)
+        wanted_page_indices = tuple(i for i, page_id in enumerate(page_ids) if page_id in wanted_page_ids)
+        if not wanted_page_indices:
+            return {}
+
+        with TemporaryFilePath(suffix='.mht') as mhtml_file:
+            section._export_mhtml(mhtml_file)
+            section_mhtml_container = MhtmlContainer.read_file(mhtml_file)
+
+        try:
+            # The documents are matched to the pages by position, so they must be in the same order.
+            document_titles = get_mhtml_document_titles(section_mhtml_container, len(page_ids))
+            mismatched_page_names = [
+                pages[i].name for i in wanted_page_indices
+                if document_titles[i] != ' '.join(pages[i].name.split())
+            ]
+            if mismatched_page_names:
+                raise ValueError(f'Documents are not titled after their pages, e.g. "{mismatched_page_names[0]}"')
+            page_mhtml_containers = split_mhtml_documents(section_mhtml_container, len(page_ids), document_indices=wanted_page_indices)
+        except ValueError as e:
+            self._logger.warning(f'⚠️ Could not split section "{section.name}" into its pages, so they will be published one at a time: {e}')
+            return {}
+        return dict(zip((page_ids[i] for i in wanted_page_indices), page_mhtml_containers))
+
+    def pop_page_mhtml_container(self, page: OneNotePage) -> Optional[MhtmlContainer]:
+        """
+        Gets the page's MHTML, split out of its section's, publishing the section first if it hasn't been yet.
+        :param page: The page.
+        :return: The page's MHTML, or None if it couldn't be split out of its section's (or was already handed out).
+        """
+        if not isinstance(page, OneNotePage):
+            raise TypeError(f"page must be an instance of OneNotePage, not {type(page)}")
+
+        section = self._get_section(page)
+        if section is None:
+            return None
+
+        with self._lock:
+            section_lock = self._section_locks.setdefault(section.node_id, threading.Lock())
+        # Only the pages of the same section wait for it to be published.
+        with section_lock:
+            with self._lock:
+                is_published = section.node_id in self._published_section_ids
+                self._published_section_ids.add(section.node_id)
+                wanted_page_ids = self._expected_page_ids_by_section_id.get(section.node_id, set()) | {page.node_id}
+            if not is_published:
+                page_mhtml_containers = self._publish_section(section, wanted_page_ids)
+                with self._lock:
+                    self._page_mhtml_containers.update(page_mhtml_containers)
+
+        with self._lock:
+            expected_page_ids = self._expected_page_ids_by_section_id.get(section.node_id)
+            if expected_page_ids is not None:
+                expected_page_ids.discard(page.node_id)
+                if not expected_page_ids:
+                    # Every page expected of the section has had its container, so nothing more is kept for it.
+                    del self._expected_page_ids_by_section_id[section.node_id]
+                    self._section_locks.pop(section.node_id, None)
+            return self._page_mhtml_containers.pop(page.node_id, None)
@@ -1,6 +1,6 @@
 import pathlib
 
-from typing import ContextManager
+from typing import ContextManager, Optional
 
 from mhtml_dom.MhtmlContainer import MhtmlContainer
 from onenote import OneNotePage
@@ -21,6 +21,13 @@ class TemporaryOneNotePageExportFile(temporary_file.TemporaryFilePath, ContextMa
         self._page = page
         self._kind = kind
 
+    def _get_prepublished_mhtml_container(self) -> Optional[MhtmlContainer]:
+        """
+        :return: The page's MHTML, if it was already published some other way (e.g. along with its section), or None
+            to publish the page by itself.
+        """
+        return None
+
     def __enter__(self):
         self._enters += 1
         if self._enters > 1:
@@ -39,6 +46,10 @@ class TemporaryOneNotePageExportFile(temporary_file.TemporaryFilePath, ContextMa
         if self._kind == TemporaryOneNotePageExportKind.MHTML:
             mhtml_extraction_dir = super().__enter__()
             self._tempfile_path = mhtml_extraction_dir
+            prepublished_mhtml_container = self._get_prepublished_mhtml_container()
+            if prepublished_mhtml_container is not None:
+                prepublished_mhtml_container.extractall(mhtml_extraction_dir)
+                return self._tempfile_path
             with TemporaryFilePath(suffix='.mht') as mhtml_file:
                 self._page._export_mhtml(mhtml_file)
                 mhtml_container = MhtmlContainer.read_file(mhtml_file)
@@ -4,6 +4,7 @@ import shutil
 from typing import Optional, Callable, Sequence
 
 from markdown_dom.PandocMarkdownDocumentImportSettings import PandocMarkdownDocumentImportSettings
+from mhtml_dom.MhtmlContainer import MhtmlContainer
 from onenote import OneNotePage
 from onenote_export.PageExportAssetExtraction import PageExportAssetExtraction
 from onenote_export.Pathlike import Pathlike
@@ -13,8 +14,25 @@ from onenote_export.TemporaryPageExportPandocAstJsonContext import TemporaryPage
 
 
 class TemporaryOneNotePageMhtmlExport(TemporaryPageExportPandocAstJsonContext, PageExportAssetExtraction, TemporaryOneNotePageExportFile):
-    def __init__(self, page: OneNotePage, dir: Pathlike = None):
+    def __init__(self,
+                 page: OneNotePage,
+                 dir: Pathlike = None,
+                 *,
+                 mhtml_source: Optional[Callable[[OneNotePage], Optional[MhtmlContainer]]] = None,
+                 ):
+        """
+        :param page: The page to export.
+        :param dir: Where to extract the page's MHTML. Defaults to the system's temporary directory.
+        :param mhtml_source: Supplies the page's MHTML where it was already published, e.g. along with its section.
+            Where it supplies None (or isn't given), the page is published by itself.
+        """
         super().__init__(page, TemporaryOneNotePageExportKind.MHTML, dir)
+        self._mhtml_source = mhtml_source
+
+    def _get_prepublished_mhtml_container(self) -> Optional[MhtmlContainer]:
+        if self._mhtml_source is None:
+            return None
+        return self._mhtml_source(self._page)
 
     def _get_html_file_path(self) -> pathlib.Path:
         mhtml_extraction_dir = self._tempfile_path
@@ -0,0 +1,140 @@
+import base64
+import json
+import pathlib
+import threading
+import urllib.parse
+
+from typing import Optional, Callable, Sequence, ContextManager, Dict, Tuple
+from xml.etree import ElementTree
+
+from markdown_dom.PandocMarkdownDocumentImportSettings import PandocMarkdownDocumentImportSettings
+from onenote import OneNotePage
+from onenote.PageInfo import PageInfo
+from onenote_export.PageExportAssetExtraction import PageExportAssetExtraction
+from onenote_export.Pathlike import Pathlike
+from onenote_export.TemporaryPageExportPandocAstJsonContext import TemporaryPageExportPandocAstJsonContext
+from onenote_export.onenote_page_xml import local_name, read_image_reference, determine_image_file_suffix
+from onenote_export.onenote_page_xml_to_pandoc_ast import convert_onenote_page_xml_to_pandoc_ast
+
+
+class TemporaryOneNotePageXmlExport(TemporaryPageExportPandocAstJsonContext, PageExportAssetExtraction, ContextManager):
+    """
+    Converts a page's native content XML straight to a pandoc AST, skipping both the publish to MHTML (or DOCX) and the
+    pandoc import of the result. Images are fetched individually, and only once their bytes are needed.
+    """
+
+    page_files_dir = pathlib.Path('page_files')
+
+    def __init__(self, page: OneNotePage):
+        if not isinstance(page, OneNotePage):
+            raise TypeError(f"Page must be an instance of OneNotePage, not {type(page)}")
+        self._page = page
+        self._enters = 0
+        self._page_content: Optional[ElementTree] = None
+        self._image_elements: Tuple[ElementTree, ...] = ()
+        self._image_ordinals_by_element_id: Dict[int, int] = {}
+        self._image_bytes_by_ordinal: Dict[int, bytes] = {}
+        self._image_bytes_lock = threading.Lock()
+
+    def __enter__(self) -> 'TemporaryOneNotePageXmlExport':
+        self._enters += 1
+        if self._enters > 1:
+            return self
+
+        self._page_content = self._page.get_content(PageInfo.piFileType)
+        self._image_elements = tuple(
+            element for element in self._page_content.iter()
+            if local_name(element) == 'Image' and read_image_reference(element) is not None
+        )
+        self._image_ordinals_by_element_id = {id(element): i for i, element in enumerate(self._image_elements, start=1)}
+        return self
+
+    @staticmethod
+    def create_default_import_settings(self) -> PandocMarkdownDocumentImportSettings:
+        return PandocMarkdownDocumentImportSettings.create_default_for_onenote_html()
+
+    def _ensure_entered(self):
+        if self._page_content is None:
+            raise Exception("Cannot read the page content when TemporaryOneNotePageXmlExport is not active.")
+
+    def _read_image_bytes(self, ordinal: int) -> bytes:
+        # Converting the page and extracting its assets can both read the images, and may do so at the same time.
+        with self._image_bytes_lock:
+            if ordinal not in self._image_bytes_by_ordinal:
+                callback_id, inline_data, _ = read_image_reference(self._image_elements[ordinal - 1])
+                if inline_data is not None:
+                    image_bytes = base64.b64decode(inline_data)
+                else:
+                    image_bytes = self._page.get_binary_content(callback_id)
+                self._image_bytes_by_ordinal[ordinal] = image_bytes
+            return self._image_bytes_by_ordinal[ordinal]
+
+    def _get_image_relative_path(self, ordinal: int) -> pathlib.Path:
+        image_format = self._image_elements[ordinal - 1].attrib.get('format')
+        # Without a reported format, the suffix can only come from sniffing the image's bytes.
+        image_bytes = self._read_image_bytes(ordinal) if not image_format else b''
+        suffix = determine_image_file_suffix(image_format, image_bytes)
+        return self.page_files_dir / f'image{ordinal:03d}{suffix}'
+
+    def _resolve_image_url(self, image_element: ElementTree) -> Optional[str]:
+        ordinal = self._image_ordinals_by_element_id.get(id(image_element))
+        if ordinal is None:
+            return None
+        return urllib.parse.quote(self._get_image_relative_path(ordinal).as_posix())
+
+    def create_pandoc_ast_json(self,
+                               open_settings: Optional[PandocMarkdownDocumentImportSettings] = None,
+                               cworkdir: Optional[Pathlike] = None,
+                               ) -> str:
+        """
+        Converts the page content XML to pandoc AST JSON.
+        :param open_settings: Unused, as pandoc isn't used to import anything.
+        :param cworkdir: Unused, as pandoc isn't used to import anything.
+        :return: The pandoc AST JSON.
+        """
+        self._ensure_entered()
+        pandoc_ast = convert_onenote_page_xml_to_pandoc_ast(self._page_content, resolve_image_url=self._resolve_image_url)
+        return json.dumps(pandoc_ast, ensure_ascii=False)
+
+    def extract_assets_to(self,
+                          target_dir: Pathlike,
+                          map_extraction_path: Optional[Callable[[pathlib.Path], Optional[pathlib.Path]]] = None,
+                          ) -> Sequence[pathlib.Path]:
+        """
+        Extracts assets from the page export to the target directory.
+        :param target_dir: The directory to extract assets to.
+        :param map_extraction_path: A function that takes a path to an asset and returns the path to which the asset should be extracted. If None, the asset will not be extracted.
+        :return: The paths to the extracted assets.
+        """
+        self._ensure_entered()
+        if isinstance(target_dir, str):
+            target_dir = pathlib.Path(target_dir)
+        if not isinstance(target_dir, pathlib.Path):
+            raise TypeError(f"target_dir must be an instance of pathlib.Path or str, not {type(target_dir)}")
+
+        extracted_files = ()
+
+        for ordinal in range(1, len(self._image_elements) + 1):
+            asset_file_relative_path = self._get_image_relative_path(ordinal)
+            if map_extraction_path is not None:
+                asset_file_relative_path = map_extraction_path(asset_file_relative_path)
+
+            if asset_file_relative_path:
+                asset_file_target_path = target_dir / asset_file_relative_path
+                asset_file_target_path.parent.mkdir(parents=True, exist_ok=True)
+                asset_file_target_path.write_bytes(self._read_image_bytes(ordinal))
+
+                asset_file_target_path = asset_file_target_path.relative_to(target_dir)
+                extracted_files += (asset_file_target_path,)
+
+        return extracted_files
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._enters -= 1
+        if self._enters > 0:
+            return
+
+        self._page_content = None
+        self._image_elements = ()
+        self._image_ordinals_by_element_id = {}
+        self._image_bytes_by_ordinal = {}
@@ -1,11 +1,23 @@
+import contextlib
 import logging
-from functools import lru_cache
-from typing import Optional
+import logging.handlers
+import queue
+from typing import Iterator, Optional, TextIO
 
 from onenote import OneNoteNode, OneNoteApplication, OneNoteNotebook, OneNoteSectionGroup, OneNotePage, OneNoteSection, \
     OneNoteUnfiledNotes, OneNoteOpenSections
 
 
+onenote_node_record_attribute = 'onenote_node'
+_level_symbols = {
+    logging.DEBUG: '📜',
+    logging.INFO: 'ℹ️',
+    logging.WARNING: '⚠️',
+    logging.ERROR: '❗',
+    logging.CRITICAL: '🛑',
+}
+
+
 def _get_logger_name_part(onenote_node: OneNoteNode) -> Optional[str]:
     if onenote_node is None:
         return None
@@ -33,49 +45,82 @@ def _get_logger_name_part(onenote_node: OneNoteNode) -> Optional[str]:
     raise TypeError(f'Unexpected type: {type(onenote_node)}')
 
 
-def _get_onenote_node_logger(onenote_node: OneNoteNode) -> logging.Logger:
-    if hasattr(onenote_node, 'parent') and onenote_node.parent is not None:
-        parent_logger = _get_onenote_node_logger(onenote_node.parent)
-    else:
-        parent_logger = logging.root
-
-    child_logger_name_part = _get_logger_name_part(onenote_node)
-
-    if child_logger_name_part is None:
-        return parent_logger
-
-    return parent_logger.getChild(child_logger_name_part)
-
-
-def _create_console_logger_handler_for_exact_level(level: int, symbol: str) -> logging.Handler:
-    # Customize format for each log level
-    formatter = logging.Formatter(
-        fmt=f'%(asctime)s {symbol}%(levelname)-8s %(name)s %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    # Create console handler
-    console_handler = logging.StreamHandler()
+def get_onenote_node_log_context(onenote_node: OneNoteNode) -> str:
+    """
+    :return: Where the node is in the OneNote hierarchy, e.g. 'OneNote.Notebook[0].Section[2].Page[5]'.
+    """
+    name_parts = []
+    while onenote_node is not None:
+        name_part = _get_logger_name_part(onenote_node)
+        if name_part is not None:
+            name_parts.append(name_part)
+        onenote_node = getattr(onenote_node, 'parent', None)
+    return '.'.join(reversed(name_parts))
+
+
+def get_logger(*, module_name: str, onenote_node: OneNoteNode) -> logging.LoggerAdapter:
+    """
+    Gets a logger that attaches the node's place in the OneNote hierarchy to each of its records (as the
+    'onenote_node' attribute), rather than creating a logger per node. Adds no handlers; records propagate to the
+    root logger's handlers, e.g. those configured by export_logging.
+    """
+    module_logger = logging.root if module_name is None else logging.getLogger(module_name)
+    return logging.LoggerAdapter(module_logger, {onenote_node_record_attribute: get_onenote_node_log_context(onenote_node)})
+
+
+class _ExportLogFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__(
+            fmt='%(asctime)s %(level_symbol)s%(levelname)-8s %(name)s %(onenote_node_context)s%(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S',
+        )
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        record.level_symbol = _level_symbols.get(record.levelno, '')
+        onenote_node = getattr(record, onenote_node_record_attribute, None)
+        record.onenote_node_context = f'{onenote_node} ' if onenote_node else ''
+        return super().formatMessage(record)
+
+
+@contextlib.contextmanager
+def export_logging(level: int = logging.INFO,
+                   log_file: Optional[str] = None,
+                   log_file_level: int = logging.WARNING,
+                   console_stream: Optional[TextIO] = None,
+                   ) -> Iterator[logging.handlers.QueueListener]:
+    """
+    Configures the root logger for an export: the calling threads only enqueue records, while a background thread
+    formats them and writes them to the console (and the log file, if any). Restores the root logger on exit, after
+    writing out any records still queued.
+    :param level: The least severe level to log.
+    :param log_file: The file to also write records to, if any. It is overwritten.
+    :param log_file_level: The least severe level to write to the log file.
+    :param console_stream: Where to write console output. Defaults to stderr.
+    """
+    formatter = _ExportLogFormatter()
+    console_handler = logging.StreamHandler(console_stream)
     console_handler.setFormatter(formatter)
-    console_handler.setLevel(level)
-    console_handler.addFilter(lambda record: record.levelno == level)
-    return console_handler
-
-
-@lru_cache(maxsize=128)
-def get_logger(*, module_name: str, onenote_node: OneNoteNode) -> logging.Logger:
-    parent_logger = _get_onenote_node_logger(onenote_node)
-
-    if module_name is None:
-        result_logger = parent_logger
-    else:
-        result_logger = parent_logger.getChild(module_name)
-
-    if not result_logger.handlers:
-        result_logger.addHandler(_create_console_logger_handler_for_exact_level(logging.DEBUG, '📜'))
-        result_logger.addHandler(_create_console_logger_handler_for_exact_level(logging.INFO, 'ℹ️'))
-        result_logger.addHandler(_create_console_logger_handler_for_exact_level(logging.WARNING, '⚠️'))
-        result_logger.addHandler(_create_console_logger_handler_for_exact_level(logging.ERROR, '❗'))
-        result_logger.addHandler(_create_console_logger_handler_for_exact_level(logging.CRITICAL, '🛑'))
-        result_logger.propagate = False
-
-    return result_logger
+    handlers = [console_handler]
+    if log_file:
+        file_handler = logging.FileHandler(log_file, mode='w', encoding='utf-8', delay=True)
+        file_handler.setFormatter(formatter)
+        file_handler.setLevel(log_file_level)
+        handlers.append(file_handler)
+
+    record_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(record_queue)
+    listener = logging.handlers.QueueListener(record_queue, *handlers, respect_handler_level=True)
+
+    root_logger = logging.root
+    previous_handlers, previous_level = root_logger.handlers[:], root_logger.level
+    root_logger.handlers[:] = [queue_handler]
+    root_logger.setLevel(level)
+    listener.start()
+    try:
+        yield listener
+    finally:
+        listener.stop()
+        root_logger.handlers[:] = previous_handlers
+        root_logger.setLevel(previous_level)
+        for handler in handlers:
+            handler.close()
@@ -0,0 +1,56 @@
+from typing import Iterable, Optional, Tuple
+from xml.etree import ElementTree
+
+from onenote.onenote_xml import local_name
+
+
+_image_file_signatures = (
+    (b'\x89PNG\r\n\x1a\n', '.png'),
+    (b'\xff\xd8\xff', '.jpg'),
+    (b'GIF87a', '.gif'),
+    (b'GIF89a', '.gif'),
+    (b'BM', '.bmp'),
+    (b'II*\x00', '.tif'),
+    (b'MM\x00*', '.tif'),
+)
+
+
+def find_child(element: ElementTree, name: str) -> Optional[ElementTree]:
+    return next(find_children(element, name), None)
+
+
+def find_children(element: ElementTree, name: str) -> Iterable[ElementTree]:
+    return (child for child in element if local_name(child) == name)
+
+
+def read_image_reference(image_element: ElementTree) -> Optional[Tuple[Optional[str], Optional[str], Optional[str]]]:
+    """
+    Reads where an Image element's binary data can be found.
+    :param image_element: An Image element from the page content XML.
+    :return: A tuple of the image's callbackID (if its binary data must be fetched separately), its inline base-64 encoded
+    data (if the page content was requested with binary data), and its format (if the page content was requested with
+    file types); or None if the element has no binary data at all.
+    """
+    callback_id_element = find_child(image_element, 'CallbackID')
+    data_element = find_child(image_element, 'Data')
+    callback_id = callback_id_element.attrib.get('callbackID') if callback_id_element is not None else None
+    inline_data = data_element.text if data_element is not None else None
+    if callback_id is None and inline_data is None:
+        return None
+    return callback_id, inline_data, image_element.attrib.get('format')
+
+
+def determine_image_file_suffix(image_format: Optional[str], image_bytes: bytes) -> str:
+    """
+    Determines the file suffix for an image, preferring the format OneNote reports for it over sniffing its bytes.
+    :param image_format: The image's 'format' attribute from the page content XML, if any.
+    :param image_bytes: The image's bytes.
+    :return: A file suffix, including the leading dot.
+    """
+    if image_format:
+        image_format = image_format.lower()
+        return '.jpg' if image_format == 'jpeg' else f'.{image_format}'
+    for signature, suffix in _image_file_signatures:
+        if image_bytes.startswith(signature):
+            return suffix
+    return '.bin'
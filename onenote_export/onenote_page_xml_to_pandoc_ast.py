@@ -0,0 +1,334 @@
+import functools
+import html.parser
+import json
+import re
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from xml.etree import ElementTree
+
+import pypandoc
+
+from onenote_export.onenote_page_xml import local_name, find_child, find_children
+
+
+PandocAstNode = Dict[str, Any]
+ImageUrlResolver = Callable[[ElementTree], Optional[str]]
+
+
+_empty_attr = ['', [], []]
+_whitespace_or_word_pattern = re.compile(r'(\s+)|(\S+)')
+_style_declaration_pattern = re.compile(r'\s*([\w-]+)\s*:\s*([^;]+)')
+_heading_quick_style_name_pattern = re.compile(r'^h([1-6])$')
+_number_pattern = re.compile(r'(\d+)')
+_points_to_pixels = 96 / 72
+
+_tag_wrappers = {
+    'b': 'Strong',
+    'strong': 'Strong',
+    'i': 'Emph',
+    'em': 'Emph',
+    'u': 'Underline',
+    's': 'Strikeout',
+    'strike': 'Strikeout',
+    'del': 'Strikeout',
+    'sup': 'Superscript',
+    'sub': 'Subscript',
+}
+_style_wrappers = (
+    ('font-weight', 'bold', 'Strong'),
+    ('font-style', 'italic', 'Emph'),
+    ('text-decoration', 'underline', 'Underline'),
+    ('text-decoration', 'line-through', 'Strikeout'),
+    ('vertical-align', 'super', 'Superscript'),
+    ('vertical-align', 'sub', 'Subscript'),
+)
+_wrapper_types = frozenset(_tag_wrappers.values())
+
+
+@functools.cache
+def get_pandoc_api_version() -> Tuple[int, ...]:
+    """
+    Gets the pandoc API version of the pandoc in use, which refuses AST JSON of any other version.
+    """
+    empty_document = json.loads(pypandoc.convert_text('', to='json', format='markdown'))
+    return tuple(empty_document['pandoc-api-version'])
+
+
+def _text_to_inlines(text: str) -> List[PandocAstNode]:
+    inlines = []
+    for whitespace, word in _whitespace_or_word_pattern.findall(text):
+        if whitespace:
+            inlines.append({'t': 'Space'})
+        else:
+            inlines.append({'t': 'Str', 'c': word})
+    return inlines
+
+
+def _normalize_spaces(inlines: List[PandocAstNode]) -> List[PandocAstNode]:
+    result = []
+    for inline in inlines:
+        if inline['t'] == 'Space' and (not result or result[-1]['t'] in ('Space', 'LineBreak')):
+            continue
+        if inline['t'] == 'LineBreak' and result and result[-1]['t'] == 'Space':
+            result.pop()
+        result.append(inline)
+    while result and result[-1]['t'] == 'Space':
+        result.pop()
+    return result
+
+
+def _merge_adjacent_wrappers(inlines: List[PandocAstNode]) -> List[PandocAstNode]:
+    # Text formatted alike across runs (e.g. split by a selection) would otherwise render as e.g. **lem****ons**.
+    result = []
+    for inline in inlines:
+        if result and inline['t'] in _wrapper_types and result[-1]['t'] == inline['t']:
+            result[-1] = {'t': inline['t'], 'c': _merge_adjacent_wrappers(result[-1]['c'] + inline['c'])}
+        else:
+            result.append(inline)
+    return result
+
+
+def _wrap_inlines(inlines: List[PandocAstNode], wrappers: Tuple[str, ...], href: Optional[str]) -> List[PandocAstNode]:
+    # Spaces at the edges are moved outside of the wrappers, since Markdown emphasis can't start or end with one.
+    leading = [inlines[0]] if inlines and inlines[0]['t'] == 'Space' else []
+    trailing = [inlines[-1]] if len(inlines) > len(leading) and inlines[-1]['t'] == 'Space' else []
+    core = inlines[len(leading):len(inlines) - len(trailing)]
+    if not core:
+        return leading + trailing
+
+    for wrapper in reversed(wrappers):
+        core = [{'t': wrapper, 'c': core}]
+    if href:
+        core = [{'t': 'Link', 'c': [_empty_attr, core, [href, '']]}]
+    return leading + core + trailing
+
+
+class _OneNoteTextHtmlParser(html.parser.HTMLParser):
+    """
+    Converts the HTML fragment within a OneNote XML 'T' element to pandoc inlines.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._frames: List[Tuple[Optional[str], Tuple[str, ...], Optional[str], List[PandocAstNode]]] = [(None, (), None, [])]
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        if tag == 'br':
+            self._frames[-1][3].append({'t': 'LineBreak'})
+            return
+
+        attrs = dict(attrs)
+        wrappers = ()
+        if tag in _tag_wrappers:
+            wrappers += (_tag_wrappers[tag],)
+        declarations = dict((k.lower(), v.strip().lower()) for k, v in _style_declaration_pattern.findall(attrs.get('style') or ''))
+        for property_name, value, wrapper in _style_wrappers:
+            if value in declarations.get(property_name, '').split() and wrapper not in wrappers:
+                wrappers += (wrapper,)
+        href = attrs.get('href') if tag == 'a' else None
+        self._frames.append((tag, wrappers, href, []))
+
+    def handle_endtag(self, tag: str):
+        if not any(frame[0] == tag for frame in self._frames[1:]):
+            return
+        while True:
+            frame = self._frames.pop()
+            self._close_frame(frame)
+            if frame[0] == tag:
+                break
+
+    def handle_data(self, data: str):
+        self._frames[-1][3].extend(_text_to_inlines(data))
+
+    def _close_frame(self, frame):
+        _, wrappers, href, inlines = frame
+        self._frames[-1][3].extend(_wrap_inlines(inlines, wrappers, href))
+
+    def result(self) -> List[PandocAstNode]:
+        self.close()
+        while len(self._frames) > 1:
+            self._close_frame(self._frames.pop())
+        return self._frames[0][3]
+
+
+def _parse_text_html(text_html: str) -> List[PandocAstNode]:
+    parser = _OneNoteTextHtmlParser()
+    parser.feed(text_html)
+    return parser.result()
+
+
+def convert_onenote_text_html_to_inlines(text_html: str) -> List[PandocAstNode]:
+    return _normalize_spaces(_parse_text_html(text_html))
+
+
+class _OneNotePageXmlToPandocAstConversion:
+    def __init__(self, page_content: ElementTree, resolve_image_url: ImageUrlResolver):
+        self._page_content = page_content
+        self._resolve_image_url = resolve_image_url
+        self._heading_levels: Dict[str, int] = {}
+        for quick_style_def in find_children(page_content, 'QuickStyleDef'):
+            heading_match = _heading_quick_style_name_pattern.match(quick_style_def.attrib.get('name', ''))
+            if heading_match:
+                self._heading_levels[quick_style_def.attrib.get('index')] = int(heading_match.group(1))
+
+    def convert_page(self) -> List[PandocAstNode]:
+        blocks = []
+        for child in self._page_content:
+            name = local_name(child)
+            if name == 'Title':
+                for oe in find_children(child, 'OE'):
+                    blocks.extend(self._convert_oe(oe))
+            elif name == 'Outline':
+                oe_children = find_child(child, 'OEChildren')
+                if oe_children is not None:
+                    blocks.extend(self._convert_oe_children(oe_children))
+            elif name == 'Image':
+                image = self._convert_image(child)
+                if image is not None:
+                    blocks.append({'t': 'Para', 'c': [image]})
+        return blocks
+
+    def _convert_oe_children(self, oe_children: ElementTree) -> List[PandocAstNode]:
+        blocks = []
+        list_kind, list_start, list_items = None, 1, []
+
+        def flush_list():
+            if list_kind == 'bullet':
+                blocks.append({'t': 'BulletList', 'c': list_items})
+            elif list_kind == 'number':
+                list_attributes = [list_start, {'t': 'Decimal'}, {'t': 'Period'}]
+                blocks.append({'t': 'OrderedList', 'c': [list_attributes, list_items]})
+
+        for oe in find_children(oe_children, 'OE'):
+            oe_list_kind, oe_list_number = self._read_list_kind(oe)
+            if oe_list_kind != list_kind:
+                flush_list()
+                list_kind, list_start, list_items = oe_list_kind, oe_list_number, []
+
+            oe_blocks = self._convert_oe(oe)
+            if oe_list_kind is None:
+                blocks.extend(oe_blocks)
+            else:
+                # Tight list items hold Plain rather than Para.
+                if oe_blocks and oe_blocks[0]['t'] == 'Para':
+                    oe_blocks[0] = {'t': 'Plain', 'c': oe_blocks[0]['c']}
+                list_items.append(oe_blocks)
+        flush_list()
+        return blocks
+
+    @staticmethod
+    def _read_list_kind(oe: ElementTree) -> Tuple[Optional[str], int]:
+        list_element = find_child(oe, 'List')
+        if list_element is None:
+            return None, 1
+        number_element = find_child(list_element, 'Number')
+        if number_element is None:
+            return 'bullet', 1
+        number_match = _number_pattern.search(number_element.attrib.get('text', ''))
+        return 'number', int(number_match.group(1)) if number_match else 1
+
+    def _convert_oe(self, oe: ElementTree) -> List[PandocAstNode]:
+        blocks = []
+        inlines = []
+        for tag in find_children(oe, 'Tag'):
+            if 'completed' in tag.attrib:
+                inlines += [{'t': 'Str', 'c': '☒' if tag.attrib['completed'] == 'true' else '☐'}, {'t': 'Space'}]
+                break
+
+        def flush_inlines():
+            normalized_inlines = _normalize_spaces(_merge_adjacent_wrappers(inlines))
+            if any(inline['t'] not in ('Space', 'LineBreak') for inline in normalized_inlines):
+                heading_level = self._heading_levels.get(oe.attrib.get('quickStyleIndex'))
+                if heading_level:
+                    blocks.append({'t': 'Header', 'c': [heading_level, _empty_attr, normalized_inlines]})
+                else:
+                    blocks.append({'t': 'Para', 'c': normalized_inlines})
+            inlines.clear()
+
+        for child in oe:
+            name = local_name(child)
+            if name == 'T':
+                # OneNote splits a line's text into several runs at selection boundaries, so the runs are joined as is.
+                inlines.extend(_parse_text_html(child.text or ''))
+            elif name == 'Image':
+                image = self._convert_image(child)
+                if image is not None:
+                    flush_inlines()
+                    blocks.append({'t': 'Para', 'c': [image]})
+            elif name == 'Table':
+                flush_inlines()
+                blocks.append(self._convert_table(child))
+            elif name == 'OEChildren':
+                flush_inlines()
+                blocks.extend(self._convert_oe_children(child))
+        flush_inlines()
+        return blocks
+
+    def _convert_image(self, image: ElementTree) -> Optional[PandocAstNode]:
+        url = self._resolve_image_url(image)
+        if url is None:
+            return None
+
+        attributes = []
+        size = find_child(image, 'Size')
+        if size is not None:
+            for dimension in ('width', 'height'):
+                if dimension in size.attrib:
+                    attributes.append([dimension, str(round(float(size.attrib[dimension]) * _points_to_pixels))])
+        alt_inlines = _text_to_inlines(image.attrib.get('alt', ''))
+        return {'t': 'Image', 'c': [['', [], attributes], _normalize_spaces(alt_inlines), [url, '']]}
+
+    def _convert_table(self, table: ElementTree) -> PandocAstNode:
+        rows = []
+        for row in find_children(table, 'Row'):
+            cells = []
+            for cell in find_children(row, 'Cell'):
+                oe_children = find_child(cell, 'OEChildren')
+                cell_blocks = self._convert_oe_children(oe_children) if oe_children is not None else []
+                cell_blocks = [{'t': 'Plain', 'c': b['c']} if b['t'] == 'Para' else b for b in cell_blocks]
+                cells.append([_empty_attr, {'t': 'AlignDefault'}, 1, 1, cell_blocks])
+            rows.append([_empty_attr, cells])
+
+        column_count = max((len(cells) for _, cells in rows), default=0)
+        for _, cells in rows:
+            cells.extend([_empty_attr, {'t': 'AlignDefault'}, 1, 1, []] for _ in range(column_count - len(cells)))
+        column_specs = [[{'t': 'AlignDefault'}, {'t': 'ColWidthDefault'}] for _ in range(column_count)]
+
+        if table.attrib.get('hasHeaderRow') == 'true' and rows:
+            head_rows, body_rows = rows[:1], rows[1:]
+        else:
+            head_rows, body_rows = [], rows
+        return {'t': 'Table', 'c': [
+            _empty_attr,
+            [None, []],
+            column_specs,
+            [_empty_attr, head_rows],
+            [[_empty_attr, 0, [], body_rows]],
+            [_empty_attr, []],
+        ]}
+
+
+def convert_onenote_page_xml_to_pandoc_ast(page_content: ElementTree,
+                                           resolve_image_url: Optional[ImageUrlResolver] = None,
+                                           api_version: Optional[Tuple[int, ...]] = None,
+                                           ) -> PandocAstNode:
+    """
+    Converts a page's content XML (as returned by GetPageContent) directly to a pandoc AST, without publishing the page
+    or running pandoc. Titles, outlines (OE, T, List and Table elements, including nested OEChildren), to-do tags and
+    images are converted; ink, attached files and other content are dropped.
+    :param page_content: The page content XML.
+    :param resolve_image_url: Returns the URL to link for an Image element, or None to drop the image. If not given, all
+    images are dropped.
+    :param api_version: The pandoc API version to declare. Defaults to that of the pandoc in use.
+    :return: The pandoc AST, ready to be serialized to JSON.
+    """
+    if resolve_image_url is None:
+        resolve_image_url = lambda _: None
+    if api_version is None:
+        api_version = get_pandoc_api_version()
+
+    return {
+        'pandoc-api-version': list(api_version),
+        'meta': {},
+        'blocks': _OneNotePageXmlToPandocAstConversion(page_content, resolve_image_url).convert_page(),
+    }
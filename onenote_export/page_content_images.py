@@ -0,0 +1,41 @@
+import base64
+
+from typing import Iterable, Optional, Tuple
+from xml.etree import ElementTree
+
+from onenote import OneNotePage
+from onenote.PageInfo import PageInfo
+from onenote_export.onenote_page_xml import local_name, read_image_reference, determine_image_file_suffix
+
+
+def yield_page_content_image_references(page_content: ElementTree) -> Iterable[Tuple[Optional[str], Optional[str], Optional[str]]]:
+    """
+    Yields a reference to each image in a page's content XML, in document order: the order of the XML, which includes
+    any images in the page's title and those positioned on the page outside of an outline, where they appear among the
+    outlines. This is the order OneNote numbers a page's images in when publishing it (image001, image002, ...), which
+    page_patch_images_into_md relies on to match each image to its reference.
+    :param page_content: The page content XML, as returned by GetPageContent.
+    :return: Tuples, as returned by read_image_reference.
+    """
+    for element in page_content.iter():
+        if local_name(element) != 'Image':
+            continue
+        image_reference = read_image_reference(element)
+        if image_reference is not None:
+            yield image_reference
+
+
+def read_page_content_images(page: OneNotePage) -> Iterable[Tuple[bytes, str]]:
+    """
+    Reads the original bytes of each image on a page, in document order (see yield_page_content_image_references),
+    without publishing the page.
+    :param page: The page.
+    :return: Tuples of each image's bytes and its file suffix.
+    """
+    page_content = page.get_content(PageInfo.piFileType)
+    for callback_id, inline_data, image_format in yield_page_content_image_references(page_content):
+        if inline_data is not None:
+            image_bytes = base64.b64decode(inline_data)
+        else:
+            image_bytes = page.get_binary_content(callback_id)
+        yield image_bytes, determine_image_file_suffix(image_format, image_bytes)
@@ -1,6 +1,6 @@
 from .page_ensure_assets_dir_exists import page_ensure_assets_dir_exists
 from .page_ensure_output_dir_exists import page_ensure_output_dir_exists
 from .page_export_pandoc_ast_to_markdown_file import page_export_pandoc_ast_to_markdown_file
-from .page_extract_ordinated_assets_and_relink import page_extract_ordinated_assets_and_relink
-from .page_pdf_patch_images_into_md import page_pdf_patch_images_into_md
+from .page_extract_ordinated_assets_and_relink import page_extract_ordinated_assets_and_relink, page_extract_ordinated_assets, page_relink_ordinated_assets
+from .page_pdf_patch_images_into_md import page_pdf_patch_images_into_md, page_extract_images, page_patch_images_into_md
 from .page_reparse_embedded_html import page_reparse_embedded_html
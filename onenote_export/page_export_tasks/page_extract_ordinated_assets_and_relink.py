@@ -75,7 +75,7 @@ def _update_element_relative_url_to_local_asset(
     return element
 
 
-def page_extract_ordinated_assets_and_relink(context: OneNotePageExportTaskContext, logger: logging.Logger):
+def page_extract_ordinated_assets(context: OneNotePageExportTaskContext, logger: logging.Logger):
     assets_filename_stem_prefix = context.safe_filename_base.stem + '_'
     map_asset_extraction_path = functools.partial(
         _map_ordinated_asset_extraction_path,
@@ -84,11 +84,17 @@ def page_extract_ordinated_assets_and_relink(context: OneNotePageExportTaskConte
     )
 
     logger.info(f"✂️️ Extracting ordinated assets: '{context.output_md_path}'")
-    extracted_assets = context.extract_assets_to(
+    context.extracted_asset_paths = context.extract_assets_to(
         target_dir=context.output_dir,
         map_extraction_path=map_asset_extraction_path,
     )
 
+
+def page_relink_ordinated_assets(context: OneNotePageExportTaskContext, logger: logging.Logger):
+    extracted_assets = context.extracted_asset_paths
+    if extracted_assets is None:
+        raise RuntimeError("page_extract_ordinated_assets must run before page_relink_ordinated_assets")
+
     logger.info(f"️🗺️ Preparing to update ordinated asset references in markdown: '{context.output_md_path}'")
     doc = context.output_md_document
     element_filters: Tuple[PanfluteElementFilter, ...] = ()
@@ -107,5 +113,10 @@ def page_extract_ordinated_assets_and_relink(context: OneNotePageExportTaskConte
             element_filters += (element_filter,)
 
     logger.info(f"📝️️ Updating ordinated asset references in markdown: '{context.output_md_path}'")
-    doc.update_via_panflute_filters(element_filters=element_filters)
+    doc.update_via_panflute_filters(element_filters=element_filters, element_types=(panflute.Image, panflute.Link))
     logger.info(f"☑️ Updated ordinated asset references in markdown: '{context.output_md_path}'")
+
+
+def page_extract_ordinated_assets_and_relink(context: OneNotePageExportTaskContext, logger: logging.Logger):
+    page_extract_ordinated_assets(context, logger)
+    page_relink_ordinated_assets(context, logger)
@@ -9,10 +9,15 @@ import panflute
 
 from markdown_dom.MarkdownDocument import PanfluteElementFilter, MarkdownDocument
 from onenote_export.OneNotePageExportTaskContext import OneNotePageExportTaskContext
+from onenote_export.OneNotePageExporterSettings import OneNotePageExporterSettings
+from onenote_export.PageImageSource import PageImageSource
+from onenote_export.page_content_images import read_page_content_images
 from pdf_inspection.PdfDocumentPage import PdfDocumentPage
 
 
-def page_pdf_patch_images_into_md(context: OneNotePageExportTaskContext, logger: logging.Logger):
+def page_extract_images(context: OneNotePageExportTaskContext, logger: logging.Logger, settings: OneNotePageExporterSettings = None):
+    page_image_source = settings.page_image_source if settings is not None else PageImageSource.PDF
+
     def _count_non_ignorable_drawings(pdf_page: PdfDocumentPage) -> int:
         return len([drawing for drawing in pdf_page.drawings if not drawing.is_effectively_empty])
 
@@ -39,6 +44,34 @@ def page_pdf_patch_images_into_md(context: OneNotePageExportTaskContext, logger:
                     f"⚠️ Page {pdf_page.page_index + 1} of the PDF for '{context.output_md_path}' has {count_of_non_ignorable_drawings} non-empty drawings that are not exported.")
         return result_image_names
 
+    def _extract_binary_page_content_pictures() -> list[pathlib.Path]:
+        result_image_names = []
+        for image_index, (image_bytes, image_suffix) in enumerate(read_page_content_images(context.node)):
+            img_num_suffix = str(image_index + 1).zfill(3)
+            image_name = "%s_%s%s" % (context.safe_filename_base, img_num_suffix, image_suffix)
+            page_relative_image_path = context.assets_dir / pathlib.Path(image_name)
+            image_output_path = context.output_dir / page_relative_image_path
+            logger.debug("🖼️ Writing image: %s" % str(image_output_path))
+            image_output_path.write_bytes(image_bytes)
+            result_image_names.append(page_relative_image_path)
+        return result_image_names
+
+    # Output picture assets to folder.
+    if page_image_source == PageImageSource.BINARY_PAGE_CONTENT:
+        logger.info(f"✂️️ Fetching page content pictures: '{context.output_md_path}'")
+        context.extracted_image_paths = _extract_binary_page_content_pictures()
+    elif page_image_source == PageImageSource.PDF:
+        logger.info(f"✂️️ Extracting PDF pictures: '{context.output_md_path}'")
+        context.extracted_image_paths = _extract_pdf_pictures()
+    else:
+        raise ValueError(f"Unsupported page_image_source: {page_image_source}")
+
+
+def page_patch_images_into_md(context: OneNotePageExportTaskContext, logger: logging.Logger):
+    extracted_image_names = context.extracted_image_paths
+    if extracted_image_names is None:
+        raise RuntimeError("page_extract_images must run before page_patch_images_into_md")
+
     broken_image_path_pattern = re.compile(r"image(\d+)\.jpg")
 
     def get_jpg_image_ordinal(element: panflute.Element) -> Optional[int]:
@@ -53,7 +86,7 @@ def page_pdf_patch_images_into_md(context: OneNotePageExportTaskContext, logger:
         return image_number
 
     def _count_broken_images(doc: MarkdownDocument) -> int:
-        return doc.count_elements(lambda element, _: get_jpg_image_ordinal(element) is not None)
+        return doc.count_elements(lambda element, _: get_jpg_image_ordinal(element) is not None, element_types=(panflute.Image,))
 
     def _fix_image_names(image_names_to_fix: list[pathlib.Path]):
         doc = context.output_md_document
@@ -69,16 +102,17 @@ def page_pdf_patch_images_into_md(context: OneNotePageExportTaskContext, logger:
             path_str = urllib.parse.quote(str(path).encode('utf8'), safe='\\').replace('\\', '/')
             element_filters += (functools.partial(update_image_url, new_image_url=path_str, image_index=i),)
 
-        doc.update_via_panflute_filters(element_filters=element_filters)
+        doc.update_via_panflute_filters(element_filters=element_filters, element_types=(panflute.Image,))
         remaining_broken_image_count = _count_broken_images(doc)
 
         if remaining_broken_image_count > 0:
             logger.warning(f"⚠️ Still has broken images: '{context.output_md_path}'")
 
-    # Output picture assets to folder.
-    logger.info(f"✂️️ Extracting PDF pictures: '{context.output_md_path}'")
-    image_names_extracted_from_pdf = _extract_pdf_pictures()
-
     # Replace image names in markdown file.
     logger.info(f"📝️️ Updating image references in markdown: '{context.output_md_path}'")
-    _fix_image_names(image_names_extracted_from_pdf)
+    _fix_image_names(extracted_image_names)
+
+
+def page_pdf_patch_images_into_md(context: OneNotePageExportTaskContext, logger: logging.Logger, settings: OneNotePageExporterSettings = None):
+    page_extract_images(context, logger, settings)
+    page_patch_images_into_md(context, logger)
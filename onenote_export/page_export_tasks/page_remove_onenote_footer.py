@@ -1,6 +1,7 @@
 import logging
 import re
 
+from markdown_dom.DocumentBlockScope import DocumentBlockScope
 from markdown_dom.MarkdownDocument import MarkdownDocument
 from markdown_re.MarkdownDocumentTextPattern import MarkdownDocumentTextPattern
 from onenote_export.OneNotePageExportTaskContext import OneNotePageExportTaskContext
@@ -8,9 +9,13 @@ from onenote_export.OneNotePageExportTaskContext import OneNotePageExportTaskCon
 
 footer_text_pattern = MarkdownDocumentTextPattern(r'\s*Created with OneNote\.\s*', flags=re.MULTILINE)
 
+# The footer is always emitted as its own block at the very end of the page, so there's no need to walk the rest of the
+# document, which is usually one more block holding the whole page body.
+footer_block_scope = DocumentBlockScope.last(1)
+
 
 def _eliminate_footer_text(doc: MarkdownDocument):
-    footer_text_pattern.rm(doc)
+    footer_text_pattern.rm(doc, block_scope=footer_block_scope)
     return
 
 
@@ -1,7 +1,7 @@
 import dataclasses
 import inspect
 import itertools
-from functools import cache, lru_cache
+from functools import cache
 from typing import Dict, Tuple, Optional, Any, Callable
 
 
@@ -85,79 +85,101 @@ def default_resolution_fallback(signature_param: inspect.Parameter) -> Optional[
 def default_should_try_injection(signature_param: inspect.Parameter) -> bool:
     return True
 
-@lru_cache(maxsize=128)
-def prepare_action_params(action: callable, injectables: Tuple[InjectableParameter, ...], should_try_injection: Callable[[inspect.Parameter], bool] = default_should_try_injection, resolution_fallback: Callable[[inspect.Parameter], Optional[Any]] = default_resolution_fallback) -> tuple[tuple, dict]:
-    """Returns a tuple of the parameters of the provided action."""
 
+def _unbound_value_factory():
+    raise AssertionError('Injection plans are compiled against slots, whose values are only bound later.')
+
+
+InjectableSlotKey = Tuple[Tuple[str, ...], Tuple[type, ...]]
+
+
+@dataclasses.dataclass(frozen=True)
+class InjectionPlan:
+    """
+    Which injectable fills which of an action's parameters. Compiling a plan does the signature introspection and
+    matching; binding it to injectables only calls their value factories.
+    """
+    positional_slot_indices: Tuple[int, ...]
+    keyword_slot_indices: Tuple[Tuple[str, int], ...]
+    keyword_constants: Tuple[Tuple[str, Any], ...]
+
+    def bind(self, injectables: Tuple[InjectableParameter, ...]) -> tuple[tuple, dict]:
+        result_args_values = tuple(injectables[i].value_factory() for i in self.positional_slot_indices)
+        result_kwargs_values = {name: injectables[i].value_factory() for name, i in self.keyword_slot_indices}
+        result_kwargs_values.update(self.keyword_constants)
+        return result_args_values, result_kwargs_values
+
+
+@cache
+def compile_injection_plan(action: callable, slots: Tuple[InjectableSlotKey, ...], should_try_injection: Callable[[inspect.Parameter], bool] = default_should_try_injection, resolution_fallback: Callable[[inspect.Parameter], Optional[Any]] = default_resolution_fallback) -> InjectionPlan:
+    """
+    Works out which slot fills which of the action's parameters. Cached per action and slots, so the arguments should be
+    long-lived (e.g. module-level functions rather than lambdas created per call).
+    :param action: The callable whose parameters are to be injected.
+    :param slots: The (possible_names, possible_types) of each injectable, in order of preference.
+    """
     signature_params = list(inspect.signature(action).parameters.values())
-    remaining_injectables = injectables
+    slot_params = tuple(InjectableParameter(names, types, _unbound_value_factory) for names, types in slots)
+    remaining_slot_indices = tuple(range(len(slot_params)))
 
     if len(signature_params) == 0:
-        return (), {}
+        return InjectionPlan((), (), ())
 
     if signature_params[0].name == 'self':
         signature_params = signature_params[1:]
         if len(signature_params) == 0:
-            return (), {}
+            return InjectionPlan((), (), ())
 
     positional_signature_params = tuple(itertools.takewhile(
         lambda p: p.kind in (inspect.Parameter.POSITIONAL_ONLY,),
         signature_params))
     keyword_signature_params = tuple(itertools.dropwhile(lambda p: p in positional_signature_params, signature_params))
 
-    result_args: Dict[int, callable] = {}
+    def find_slot_index(signature_param: inspect.Parameter, is_match: Callable[['InjectableParameterSignatureComparison'], bool]) -> Optional[int]:
+        nonlocal remaining_slot_indices
+        for slot_index in remaining_slot_indices:
+            if is_match(slot_params[slot_index].compare_to(signature_param)):
+                remaining_slot_indices = tuple(i for i in remaining_slot_indices if i != slot_index)
+                return slot_index
+        return None
+
+    result_args: Dict[int, int] = {}
+    result_kwargs: Dict[str, int] = {}
+    result_constants: Dict[str, Any] = {}
+    is_strong_match = lambda comparison: comparison.is_strong_match
+    is_weak_match = lambda comparison: comparison.is_weak_match
 
     # Look for strong matches for positional parameters first
-    for signature_param_index in range(len(positional_signature_params)):
-        signature_param = positional_signature_params[signature_param_index]
+    for signature_param_index, signature_param in enumerate(positional_signature_params):
         if not should_try_injection(signature_param):
             continue
-
-        for injectable_param_index in range(len(remaining_injectables)):
-            injectable_param = remaining_injectables[injectable_param_index]
-            comparison = injectable_param.compare_to(signature_param)
-
-            if comparison.is_strong_match:
-                result_args[signature_param_index] = injectable_param.value_factory
-                remaining_injectables = tuple(i for i in remaining_injectables if i != injectable_param)
-                break
+        slot_index = find_slot_index(signature_param, is_strong_match)
+        if slot_index is not None:
+            result_args[signature_param_index] = slot_index
 
     # Then look for strong matches for keyword parameters
-    result_kwargs: Dict[str, callable] = {}
     for signature_param in keyword_signature_params:
         if not should_try_injection(signature_param):
             continue
-        for injectable_param_index in range(len(remaining_injectables)):
-            injectable_param = remaining_injectables[injectable_param_index]
-            comparison = injectable_param.compare_to(signature_param)
-
-            if comparison.is_strong_match:
-                result_kwargs[signature_param.name] = injectable_param.value_factory
-                remaining_injectables = tuple(i for i in remaining_injectables if i != injectable_param)
-                break
+        slot_index = find_slot_index(signature_param, is_strong_match)
+        if slot_index is not None:
+            result_kwargs[signature_param.name] = slot_index
 
     # Then look for weak matches for positional parameters
-    for signature_param_index in range(len(positional_signature_params)):
-        signature_param = positional_signature_params[signature_param_index]
+    for signature_param_index, signature_param in enumerate(positional_signature_params):
         if signature_param_index in result_args:
             continue
         if not should_try_injection(signature_param):
             continue
-
-        for injectable_param_index in range(len(remaining_injectables)):
-            injectable_param = remaining_injectables[injectable_param_index]
-            comparison = injectable_param.compare_to(signature_param)
-
-            if comparison.is_weak_match:
-                result_args[signature_param_index] = injectable_param.value_factory
-                remaining_injectables = tuple(i for i in remaining_injectables if i != injectable_param)
-                break
+        slot_index = find_slot_index(signature_param, is_weak_match)
+        if slot_index is not None:
+            result_args[signature_param_index] = slot_index
 
         has_default_value = signature_param.default != inspect.Parameter.empty
         if not has_default_value:
             resolution_fallback_result = resolution_fallback(signature_param)
             if resolution_fallback_result is not None:
-                result_kwargs[signature_param.name] = lambda: resolution_fallback_result
+                result_constants[signature_param.name] = resolution_fallback_result
 
     # Then look for weak matches for keyword parameters
     for signature_param in keyword_signature_params:
@@ -165,22 +187,25 @@ def prepare_action_params(action: callable, injectables: Tuple[InjectableParamet
             continue
         if not should_try_injection(signature_param):
             continue
-
-        for injectable_param_index in range(len(remaining_injectables)):
-            injectable_param = remaining_injectables[injectable_param_index]
-            comparison = injectable_param.compare_to(signature_param)
-
-            if comparison.is_weak_match:
-                result_kwargs[signature_param.name] = injectable_param.value_factory
-                remaining_injectables = tuple(i for i in remaining_injectables if i != injectable_param)
-                break
+        slot_index = find_slot_index(signature_param, is_weak_match)
+        if slot_index is not None:
+            result_kwargs[signature_param.name] = slot_index
 
         has_default_value = signature_param.default != inspect.Parameter.empty
         if not has_default_value:
             resolution_fallback_result = resolution_fallback(signature_param)
             if resolution_fallback_result is not None:
-                result_kwargs[signature_param.name] = lambda: resolution_fallback_result
+                result_constants[signature_param.name] = resolution_fallback_result
+
+    return InjectionPlan(
+        positional_slot_indices=tuple(result_args[i] for i in range(len(result_args))),
+        keyword_slot_indices=tuple((name, slot_index) for name, slot_index in result_kwargs.items() if name not in result_constants),
+        keyword_constants=tuple(result_constants.items()),
+    )
+
 
-    result_args_values = tuple(result_args[i]() for i in range(len(result_args)))
-    result_kwargs_values = {k: v() for k, v in result_kwargs.items()}
-    return result_args_values, result_kwargs_values
+def prepare_action_params(action: callable, injectables: Tuple[InjectableParameter, ...], should_try_injection: Callable[[inspect.Parameter], bool] = default_should_try_injection, resolution_fallback: Callable[[inspect.Parameter], Optional[Any]] = default_resolution_fallback) -> tuple[tuple, dict]:
+    """Returns a tuple of the parameters of the provided action."""
+    slots = tuple((injectable.possible_names, injectable.possible_types) for injectable in injectables)
+    plan = compile_injection_plan(action, slots, should_try_injection, resolution_fallback)
+    return plan.bind(tuple(injectables))
@@ -0,0 +1,185 @@
+import datetime
+import random
+import uuid
+
+from typing import List, Optional, Tuple
+from xml.etree import ElementTree
+
+from onenote.HierarchyScope import HierarchyScope
+from onenote.OneNoteApiRecording import OneNoteApiRecording
+from onenote.PageInfo import PageInfo
+from onenote.PublishFormat import PublishFormat
+from onenote.ReplayOneNoteAPI import \
+    create_get_hierarchy_request_key, \
+    create_publish_request_key, \
+    create_get_page_content_request_key, \
+    create_get_binary_page_content_request_key
+from onenote.XMLSchema import XMLSchema
+from .SyntheticNotebookSettings import SyntheticNotebookSettings
+from .SyntheticPage import SyntheticPage, SyntheticParagraph, SyntheticTable, SyntheticImage, SyntheticBlock
+from .synthetic_page_payloads import one, encode_png, render_page_mhtml, render_section_mhtml, render_page_pdf, \
+    render_page_content_xml
+
+
+_vocabulary = (
+    'butter', 'sugar', 'flour', 'lemon', 'zest', 'cream', 'cheese', 'whisk', 'fold', 'bake', 'oven', 'minutes', 'until',
+    'golden', 'pan', 'vanilla', 'eggs', 'milk', 'salt', 'pinch', 'cool', 'slice', 'serve', 'chilled', 'walnut', 'toffee',
+    'caramel', 'crust', 'filling', 'layer', 'frosting', 'spread', 'evenly', 'gently', 'medium', 'heat', 'stir', 'combine',
+)
+_base_date_time = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class SyntheticNotebookGenerator:
+    """
+    Generates notebooks of arbitrary size, recording everything the exporter asks OneNote for (hierarchy XML, published
+    MHTML and PDF, page content XML and images, and each section's MHTML) so that ReplayOneNoteAPI can serve them as if OneNote were present.
+    Generation is deterministic for a given seed.
+    """
+
+    def __init__(self, settings: SyntheticNotebookSettings = None):
+        if settings is None:
+            settings = SyntheticNotebookSettings()
+        if not isinstance(settings, SyntheticNotebookSettings):
+            raise TypeError(f"settings must be an instance of SyntheticNotebookSettings, not {type(settings)}")
+        self._settings = settings
+
+    @property
+    def settings(self) -> SyntheticNotebookSettings:
+        return self._settings
+
+    @staticmethod
+    def _create_id(rng: random.Random) -> str:
+        return f'{{{str(uuid.UUID(int=rng.getrandbits(128))).upper()}}}{{1}}{{B0}}'
+
+    @staticmethod
+    def _create_words(rng: random.Random, count: int) -> str:
+        return ' '.join(rng.choice(_vocabulary) for _ in range(count))
+
+    def _create_blocks(self, rng: random.Random) -> List[SyntheticBlock]:
+        settings = self._settings
+        blocks: List[SyntheticBlock] = [
+            SyntheticParagraph(self._create_words(rng, settings.words_per_paragraph).capitalize() + '.')
+            for _ in range(settings.paragraphs_per_page)
+        ]
+        insertions: List[SyntheticBlock] = []
+        for _ in range(settings.tables_per_page):
+            header = ('Ingredient', 'Amount', 'Notes')
+            rows = tuple((rng.choice(_vocabulary), str(rng.randint(1, 500)), self._create_words(rng, 3)) for _ in range(rng.randint(2, 6)))
+            insertions.append(SyntheticTable((header,) + rows))
+        for _ in range(settings.images_per_page):
+            rgb = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+            insertions.append(SyntheticImage(self._create_id(rng), encode_png(settings.image_size_px, settings.image_size_px, rgb), settings.image_size_px))
+
+        # Spread tables and images evenly through the text, rather than bunching them up at the end.
+        for i, insertion in enumerate(insertions):
+            blocks.insert(round((i + 1) * len(blocks) / (len(insertions) + 1)), insertion)
+        return blocks
+
+    def create_page(self, name: str, rng: Optional[random.Random] = None, page_ordinal: int = 0, is_subpage: bool = False) -> SyntheticPage:
+        """
+        Creates a single page's content per the settings, without recording anything.
+        :param name: The page's name.
+        :param rng: The source of the page's content. Defaults to one seeded from the settings.
+        :param page_ordinal: The page's position across the whole generation, which determines its timestamps.
+        :param is_subpage: Whether the page is a subpage.
+        """
+        if rng is None:
+            rng = random.Random(self._settings.seed)
+        date_time = (_base_date_time + datetime.timedelta(minutes=page_ordinal)).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        return SyntheticPage(self._create_id(rng), name, date_time, is_subpage, tuple(self._create_blocks(rng)))
+
+    def _generate_page(self, recording: OneNoteApiRecording, rng: random.Random, name: str, page_ordinal: int, is_subpage: bool) -> Tuple[SyntheticPage, ElementTree]:
+        settings = self._settings
+        page = self.create_page(name, rng, page_ordinal, is_subpage)
+
+        if settings.include_mhtml:
+            recording.write(create_publish_request_key(page.page_id, PublishFormat.pfMHTML), render_page_mhtml(page, f'tmp{page_ordinal:06d}'), '.mht')
+        if settings.include_pdf:
+            recording.write(create_publish_request_key(page.page_id, PublishFormat.pfPDF), render_page_pdf(page), '.pdf')
+        if settings.include_page_content:
+            page_content_xml = render_page_content_xml(page)
+            for page_info in (PageInfo.piBasic, PageInfo.piFileType):
+                recording.write(create_get_page_content_request_key(page.page_id, page_info, XMLSchema.xs2013), page_content_xml, '.xml')
+            for image in page.images:
+                recording.write(create_get_binary_page_content_request_key(page.page_id, image.callback_id), image.png_bytes, '.png')
+
+        page_attributes = {
+            'ID': page.page_id,
+            'name': page.name,
+            'dateTime': page.date_time,
+            'lastModifiedTime': page.date_time,
+            'pageLevel': '2' if is_subpage else '1',
+        }
+        if is_subpage:
+            page_attributes['isSubPage'] = 'true'
+        return page, ElementTree.Element(one('Page'), page_attributes)
+
+    @staticmethod
+    def _write_hierarchy(recording: OneNoteApiRecording, node_id: str, element: ElementTree, *hierarchy_scopes: HierarchyScope):
+        element_xml = ElementTree.tostring(element, encoding='utf-8')
+        for hierarchy_scope in hierarchy_scopes:
+            recording.write(create_get_hierarchy_request_key(node_id, hierarchy_scope, XMLSchema.xs2013), element_xml, '.xml')
+
+    def generate_into(self, recording: OneNoteApiRecording) -> int:
+        """
+        Generates the notebooks, recording every response into the recording.
+        :param recording: The recording to write into.
+        :return: The number of pages generated, subpages included.
+        """
+        if not isinstance(recording, OneNoteApiRecording):
+            raise TypeError(f"recording must be an instance of OneNoteApiRecording, not {type(recording)}")
+
+        settings = self._settings
+        rng = random.Random(settings.seed)
+        last_modified_time = _base_date_time.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        notebooks_element = ElementTree.Element(one('Notebooks'))
+        page_ordinal = 0
+
+        for notebook_index in range(settings.notebook_count):
+            notebook_name = f'Notebook {notebook_index + 1}'
+            notebook_attributes = {
+                'name': notebook_name,
+                'nickname': notebook_name,
+                'ID': self._create_id(rng),
+                'path': f'https://d.docs.live.net/0000000000000000/Documents/{notebook_name}',
+                'lastModifiedTime': last_modified_time,
+                'color': '#ADE792',
+            }
+            notebook_element = ElementTree.Element(one('Notebook'), notebook_attributes)
+
+            for section_index in range(settings.sections_per_notebook):
+                section_name = f'Section {section_index + 1}'
+                section_attributes = {
+                    'name': section_name,
+                    'ID': self._create_id(rng),
+                    'path': f"{notebook_attributes['path']}/{section_name}.one",
+                    'lastModifiedTime': last_modified_time,
+                    'color': '#8AA8E4',
+                    'readOnly': 'false',
+                }
+                section_element = ElementTree.Element(one('Section'), section_attributes)
+                section_pages: List[SyntheticPage] = []
+                for page_index in range(settings.pages_per_section):
+                    page_name = f'Page {notebook_index + 1}-{section_index + 1}-{page_index + 1}'
+                    page_ordinal += 1
+                    page, page_element = self._generate_page(recording, rng, page_name, page_ordinal, False)
+                    section_pages.append(page)
+                    section_element.append(page_element)
+                    for subpage_index in range(settings.subpages_per_page):
+                        page_ordinal += 1
+                        page, page_element = self._generate_page(recording, rng, f'{page_name}-{subpage_index + 1}', page_ordinal, True)
+                        section_pages.append(page)
+                        section_element.append(page_element)
+
+                if settings.include_section_mhtml and section_pages:
+                    section_mhtml = render_section_mhtml(section_name, section_pages, f'tmp{section_index:06d}')
+                    recording.write(create_publish_request_key(section_attributes['ID'], PublishFormat.pfMHTML), section_mhtml, '.mht')
+
+                self._write_hierarchy(recording, section_attributes['ID'], section_element, HierarchyScope.Children, HierarchyScope.Pages)
+                notebook_element.append(ElementTree.Element(one('Section'), section_attributes))
+
+            self._write_hierarchy(recording, notebook_attributes['ID'], notebook_element, HierarchyScope.Children, HierarchyScope.Sections)
+            notebooks_element.append(ElementTree.Element(one('Notebook'), notebook_attributes))
+
+        self._write_hierarchy(recording, '', notebooks_element, HierarchyScope.Children, HierarchyScope.Notebooks)
+        return page_ordinal
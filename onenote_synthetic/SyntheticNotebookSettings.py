@@ -0,0 +1,37 @@
+import dataclasses
+
+
+@dataclasses.dataclass
+class SyntheticNotebookSettings:
+    notebook_count: int = 1
+    sections_per_notebook: int = 10
+    pages_per_section: int = 100
+    subpages_per_page: int = 0
+    images_per_page: int = 1
+    tables_per_page: int = 0
+    paragraphs_per_page: int = 20
+    words_per_paragraph: int = 40
+    image_size_px: int = 48
+    include_mhtml: bool = True
+    include_section_mhtml: bool = True
+    include_pdf: bool = True
+    include_page_content: bool = True
+    seed: int = 0
+
+    def __post_init__(self):
+        for field in dataclasses.fields(self):
+            value = getattr(self, field.name)
+            if field.type == 'int' or field.type is int:
+                if not isinstance(value, int):
+                    raise TypeError(f"{field.name} must be an int, not {type(value)}")
+                if value < 0:
+                    raise ValueError(f"{field.name} must be >= 0, received {value}")
+        if self.image_size_px < 1:
+            raise ValueError(f"image_size_px must be >= 1, received {self.image_size_px}")
+
+    @property
+    def page_count(self) -> int:
+        """
+        The total number of pages to be generated, subpages included.
+        """
+        return self.notebook_count * self.sections_per_notebook * self.pages_per_section * (1 + self.subpages_per_page)
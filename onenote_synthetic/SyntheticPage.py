@@ -0,0 +1,40 @@
+import dataclasses
+
+from typing import Tuple, Union
+
+
+@dataclasses.dataclass(frozen=True)
+class SyntheticParagraph:
+    text: str
+
+
+@dataclasses.dataclass(frozen=True)
+class SyntheticTable:
+    rows: Tuple[Tuple[str, ...], ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class SyntheticImage:
+    callback_id: str
+    png_bytes: bytes
+    size_px: int
+
+
+SyntheticBlock = Union[SyntheticParagraph, SyntheticTable, SyntheticImage]
+
+
+@dataclasses.dataclass(frozen=True)
+class SyntheticPage:
+    """
+    The content of a generated page, from which each of its payloads (MHTML, PDF, page content XML) is rendered, so
+    that they all agree with one another.
+    """
+    page_id: str
+    name: str
+    date_time: str
+    is_subpage: bool
+    blocks: Tuple[SyntheticBlock, ...]
+
+    @property
+    def images(self) -> Tuple[SyntheticImage, ...]:
+        return tuple(block for block in self.blocks if isinstance(block, SyntheticImage))
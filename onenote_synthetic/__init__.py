@@ -0,0 +1,3 @@
+from .SyntheticNotebookSettings import SyntheticNotebookSettings
+from .SyntheticPage import SyntheticPage, SyntheticParagraph, SyntheticTable, SyntheticImage
+from .SyntheticNotebookGenerator import SyntheticNotebookGenerator
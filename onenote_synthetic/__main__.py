@@ -0,0 +1,56 @@
+import argparse
+import sys
+
+from onenote.OneNoteApiRecording import OneNoteApiRecording
+from onenote_synthetic.SyntheticNotebookGenerator import SyntheticNotebookGenerator
+from onenote_synthetic.SyntheticNotebookSettings import SyntheticNotebookSettings
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='python -m onenote_synthetic',
+        description='Generate synthetic notebooks into a OneNote API recording, for replay (and benchmarking) without OneNote.',
+    )
+    parser.add_argument('recording_dir', help='The directory to write the recording into (see ReplayOneNoteAPI).')
+    parser.add_argument('--notebooks', type=int, default=1, help='Number of notebooks.')
+    parser.add_argument('--sections', type=int, default=10, help='Number of sections per notebook.')
+    parser.add_argument('--pages', type=int, default=100, help='Number of pages per section.')
+    parser.add_argument('--subpages', type=int, default=0, help='Number of subpages per page.')
+    parser.add_argument('--images', type=int, default=1, help='Number of images per page.')
+    parser.add_argument('--tables', type=int, default=0, help='Number of tables per page.')
+    parser.add_argument('--paragraphs', type=int, default=20, help='Number of paragraphs per page.')
+    parser.add_argument('--words', type=int, default=40, help='Number of words per paragraph.')
+    parser.add_argument('--image-size', type=int, default=48, help='Width and height of each image, in pixels.')
+    parser.add_argument('--no-mhtml', action='store_true', help='Do not generate published MHTML.')
+    parser.add_argument('--no-section-mhtml', action='store_true', help='Do not generate published MHTML for whole sections.')
+    parser.add_argument('--no-pdf', action='store_true', help='Do not generate published PDFs.')
+    parser.add_argument('--no-page-content', action='store_true', help='Do not generate page content XML or images.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the (deterministic) content.')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    settings = SyntheticNotebookSettings(
+        notebook_count=args.notebooks,
+        sections_per_notebook=args.sections,
+        pages_per_section=args.pages,
+        subpages_per_page=args.subpages,
+        images_per_page=args.images,
+        tables_per_page=args.tables,
+        paragraphs_per_page=args.paragraphs,
+        words_per_paragraph=args.words,
+        image_size_px=args.image_size,
+        include_mhtml=not args.no_mhtml,
+        include_section_mhtml=not args.no_section_mhtml,
+        include_pdf=not args.no_pdf,
+        include_page_content=not args.no_page_content,
+        seed=args.seed,
+    )
+    page_count = SyntheticNotebookGenerator(settings).generate_into(OneNoteApiRecording(args.recording_dir))
+    print(f"{page_count} pages generated into: {args.recording_dir}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,259 @@
+import base64
+import html
+import quopri
+import struct
+import textwrap
+import zlib
+
+from typing import Sequence, Tuple
+from xml.etree import ElementTree
+
+import fitz
+
+from .SyntheticPage import SyntheticPage, SyntheticParagraph, SyntheticTable, SyntheticImage
+
+
+onenote_namespace = 'http://schemas.microsoft.com/office/onenote/2013/onenote'
+_mhtml_boundary = '----=_NextPart_01D96AF3.5A17E7C0'
+_mhtml_content_location_base = 'file:///C:/5A17E7C0'
+_pdf_page_width, _pdf_page_height, _pdf_margin = 612, 792, 54
+_pdf_font_size, _pdf_line_height, _pdf_wrap_width = 11, 14, 95
+
+
+def one(tag: str) -> str:
+    return f'{{{onenote_namespace}}}{tag}'
+
+
+def encode_png(width: int, height: int, rgb: tuple[int, int, int]) -> bytes:
+    """
+    Encodes a solid-colored RGB image, with a diagonal stripe so that it isn't trivially compressible to nothing.
+    """
+    def chunk(chunk_type: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+    pixel, stripe_pixel = bytes(rgb), bytes(255 - c for c in rgb)
+    rows = (b'\x00' + b''.join(stripe_pixel if x == y else pixel for x in range(width)) for y in range(height))
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) + chunk(b'IDAT', zlib.compress(b''.join(rows))) + chunk(b'IEND', b'')
+
+
+def _render_page_html(page: SyntheticPage, main_file_href: str, file_list_href: str, image_hrefs: Sequence[str]) -> str:
+    body_lines = [
+        f"<p style='margin:0in;font-family:\"Calibri Light\";font-size:20.0pt'>{html.escape(page.name)}</p>",
+        f"<p style='margin:0in;font-family:Calibri;font-size:10.0pt;color:#767676'>{html.escape(page.date_time)}</p>",
+    ]
+    image_hrefs = iter(image_hrefs)
+    for block in page.blocks:
+        if isinstance(block, SyntheticParagraph):
+            body_lines.append(f"<p style='margin:0in;font-family:Calibri;font-size:11.0pt'>{html.escape(block.text)}</p>")
+        elif isinstance(block, SyntheticTable):
+            body_lines.append("<table border=1 cellpadding=0 cellspacing=0 style='border-collapse:collapse'>")
+            for row in block.rows:
+                cells = ''.join(f"<td style='padding:2pt'><p style='margin:0in'>{html.escape(cell)}</p></td>" for cell in row)
+                body_lines.append(f'<tr>{cells}</tr>')
+            body_lines.append('</table>')
+        elif isinstance(block, SyntheticImage):
+            body_lines.append(f"<p style='margin:0in'><img src=\"{next(image_hrefs)}\" width={block.size_px} height={block.size_px}></p>")
+    body_lines.append("<p style='text-align:left;margin:0in;font-family:Arial;font-size:9pt;color:#969696;direction:ltr'>Created with OneNote.</p>")
+
+    return '\n'.join((
+        '<html xmlns:o="urn:schemas-microsoft-com:office:office" xmlns="http://www.w3.org/TR/REC-html40">',
+        '<head>',
+        '<meta http-equiv=Content-Type content="text/html; charset=utf-8">',
+        '<meta name=ProgId content=OneNote.File>',
+        '<meta name=Generator content="Microsoft OneNote 15">',
+        f'<link id=Main-File rel=Main-File href={main_file_href}>',
+        f'<link rel=File-List href="{file_list_href}">',
+        '</head>',
+        "<body lang=en-US style='font-family:Calibri;font-size:11.0pt'>",
+        "<div style='direction:ltr;border-width:100%'>",
+        *body_lines,
+        '</div>',
+        '</body>',
+        '</html>',
+    ))
+
+
+def _render_mhtml(html_parts: Sequence[Tuple[str, str]], image_parts: Sequence[Tuple[str, bytes]], files_dir: str, file_list: Sequence[str]) -> bytes:
+    parts = [
+        'MIME-Version: 1.0',
+        f'Content-Type: multipart/related; boundary="{_mhtml_boundary}"',
+        '',
+        'This document is a Single File Web Page, also known as a Web Archive file.',
+        '',
+    ]
+    for location, html_text in html_parts:
+        parts += [
+            f'--{_mhtml_boundary}',
+            f'Content-Location: {_mhtml_content_location_base}/{location}',
+            'Content-Transfer-Encoding: quoted-printable',
+            'Content-Type: text/html; charset="utf-8"',
+            '',
+            quopri.encodestring(html_text.encode('utf-8')).decode('ascii'),
+            '',
+        ]
+    for location, png_bytes in image_parts:
+        parts += [
+            f'--{_mhtml_boundary}',
+            f'Content-Location: {_mhtml_content_location_base}/{location}',
+            'Content-Transfer-Encoding: base64',
+            'Content-Type: image/png',
+            '',
+            *textwrap.wrap(base64.b64encode(png_bytes).decode('ascii'), 76),
+            '',
+        ]
+    parts += [
+        f'--{_mhtml_boundary}',
+        f'Content-Location: {_mhtml_content_location_base}/{files_dir}/filelist.xml',
+        'Content-Transfer-Encoding: quoted-printable',
+        'Content-Type: text/xml; charset="utf-8"',
+        '',
+        quopri.encodestring('\n'.join(('<xml xmlns:o="urn:schemas-microsoft-com:office:office">', *file_list, ' <o:File HRef="filelist.xml"/>', '</xml>')).encode('utf-8')).decode('ascii'),
+        f'--{_mhtml_boundary}--',
+        '',
+    ]
+    return '\n'.join(parts).encode('utf-8')
+
+
+def render_page_mhtml(page: SyntheticPage, file_base_name: str) -> bytes:
+    """
+    Renders a page the way OneNote publishes it to MHTML: a quoted-printable HTML part, followed by a base-64 part per
+    image and a file list.
+    """
+    files_dir = f'{file_base_name}_files'
+    image_file_names = [f'image{ordinal:03d}.png' for ordinal in range(1, len(page.images) + 1)]
+    page_html = _render_page_html(page, f'{file_base_name}.htm', f'{files_dir}/filelist.xml', [f'{files_dir}/{image_file_name}' for image_file_name in image_file_names])
+    return _render_mhtml(
+        html_parts=[(f'{file_base_name}.htm', page_html)],
+        image_parts=[(f'{files_dir}/{image_file_name}', image.png_bytes) for image_file_name, image in zip(image_file_names, page.images)],
+        files_dir=files_dir,
+        file_list=[f' <o:MainFile HRef="../{file_base_name}.htm"/>', *(f' <o:File HRef="{image_file_name}"/>' for image_file_name in image_file_names)],
+    )
+
+
+def render_section_mhtml(section_name: str, pages: Sequence[SyntheticPage], file_base_name: str) -> bytes:
+    """
+    Renders a section the way OneNote publishes it to MHTML: a main HTML part linking to each page, a quoted-printable
+    HTML part per page, then a base-64 part per image (numbered across the whole section) and a file list. The pages'
+    HTML parts and images all sit together in the section's files directory.
+    """
+    files_dir = f'{file_base_name}_files'
+    page_file_names = [f'page{ordinal:03d}.htm' for ordinal in range(1, len(pages) + 1)]
+    main_html = '\n'.join((
+        '<html xmlns:o="urn:schemas-microsoft-com:office:office" xmlns="http://www.w3.org/TR/REC-html40">',
+        '<head>',
+        '<meta http-equiv=Content-Type content="text/html; charset=utf-8">',
+        '<meta name=ProgId content=OneNote.File>',
+        f'<title>{html.escape(section_name)}</title>',
+        f'<link rel=File-List href="{files_dir}/filelist.xml">',
+        '</head>',
+        '<body>',
+        *(f'<p><a href="{files_dir}/{page_file_name}">{html.escape(page.name)}</a></p>' for page_file_name, page in zip(page_file_names, pages)),
+        '</body>',
+        '</html>',
+    ))
+
+    html_parts = [(f'{file_base_name}.htm', main_html)]
+    image_parts = []
+    for page_file_name, page in zip(page_file_names, pages):
+        image_file_names = [f'image{ordinal:03d}.png' for ordinal in range(len(image_parts) + 1, len(image_parts) + len(page.images) + 1)]
+        # Relative to the page's own HTML part, which is already in the files directory.
+        html_parts.append((f'{files_dir}/{page_file_name}', _render_page_html(page, f'../{file_base_name}.htm', 'filelist.xml', image_file_names)))
+        image_parts += [(f'{files_dir}/{image_file_name}', image.png_bytes) for image_file_name, image in zip(image_file_names, page.images)]
+
+    return _render_mhtml(
+        html_parts=html_parts,
+        image_parts=image_parts,
+        files_dir=files_dir,
+        file_list=[
+            f' <o:MainFile HRef="../{file_base_name}.htm"/>',
+            *(f' <o:File HRef="{page_file_name}"/>' for page_file_name in page_file_names),
+            *(f' <o:File HRef="{location.rsplit("/", 1)[1]}"/>' for location, _ in image_parts),
+        ],
+    )
+
+
+def render_page_pdf(page: SyntheticPage) -> bytes:
+    """
+    Renders a page the way OneNote publishes it to PDF: flowed text, with each image embedded where it appears.
+    """
+    document = fitz.open()
+    pdf_page = None
+    y = 0.0
+
+    def ensure_room(height: float):
+        nonlocal pdf_page, y
+        if pdf_page is None or y + height > _pdf_page_height - _pdf_margin:
+            pdf_page = document.new_page(width=_pdf_page_width, height=_pdf_page_height)
+            y = _pdf_margin
+
+    def write_line(text: str, x: float = _pdf_margin, font_size: float = _pdf_font_size):
+        nonlocal y
+        ensure_room(_pdf_line_height)
+        pdf_page.insert_text((x, y + font_size), text, fontsize=font_size)
+        y += _pdf_line_height
+
+    write_line(page.name, font_size=20)
+    y += _pdf_line_height
+    for block in page.blocks:
+        if isinstance(block, SyntheticParagraph):
+            for line in textwrap.wrap(block.text, _pdf_wrap_width):
+                write_line(line)
+        elif isinstance(block, SyntheticTable):
+            for row in block.rows:
+                ensure_room(_pdf_line_height)
+                for column_index, cell in enumerate(row):
+                    pdf_page.insert_text((_pdf_margin + column_index * 120, y + _pdf_font_size), cell, fontsize=_pdf_font_size)
+                y += _pdf_line_height
+        elif isinstance(block, SyntheticImage):
+            ensure_room(block.size_px)
+            pdf_page.insert_image(fitz.Rect(_pdf_margin, y, _pdf_margin + block.size_px, y + block.size_px), stream=block.png_bytes)
+            y += block.size_px
+    write_line('Created with OneNote.', font_size=9)
+
+    try:
+        return document.tobytes()
+    finally:
+        document.close()
+
+
+def render_page_content_xml(page: SyntheticPage) -> bytes:
+    """
+    Renders a page the way GetPageContent returns it with file types (but without binary data).
+    """
+    page_element = ElementTree.Element(one('Page'), {
+        'ID': page.page_id,
+        'name': page.name,
+        'dateTime': page.date_time,
+        'lastModifiedTime': page.date_time,
+        'pageLevel': '2' if page.is_subpage else '1',
+        'lang': 'en-US',
+    })
+    ElementTree.SubElement(page_element, one('QuickStyleDef'), {'index': '0', 'name': 'PageTitle'})
+    ElementTree.SubElement(page_element, one('QuickStyleDef'), {'index': '1', 'name': 'p'})
+    title = ElementTree.SubElement(page_element, one('Title'), {'lang': 'en-US'})
+    ElementTree.SubElement(ElementTree.SubElement(title, one('OE'), {'quickStyleIndex': '0'}), one('T')).text = page.name
+    outline = ElementTree.SubElement(page_element, one('Outline'))
+    oe_children = ElementTree.SubElement(outline, one('OEChildren'))
+
+    for block in page.blocks:
+        oe = ElementTree.SubElement(oe_children, one('OE'), {'quickStyleIndex': '1'})
+        if isinstance(block, SyntheticParagraph):
+            ElementTree.SubElement(oe, one('T')).text = html.escape(block.text)
+        elif isinstance(block, SyntheticTable):
+            table = ElementTree.SubElement(oe, one('Table'), {'bordersVisible': 'true', 'hasHeaderRow': 'true'})
+            columns = ElementTree.SubElement(table, one('Columns'))
+            for column_index in range(len(block.rows[0]) if block.rows else 0):
+                ElementTree.SubElement(columns, one('Column'), {'index': str(column_index), 'width': '100.0'})
+            for row in block.rows:
+                row_element = ElementTree.SubElement(table, one('Row'))
+                for cell in row:
+                    cell_oe_children = ElementTree.SubElement(ElementTree.SubElement(row_element, one('Cell')), one('OEChildren'))
+                    ElementTree.SubElement(ElementTree.SubElement(cell_oe_children, one('OE')), one('T')).text = html.escape(cell)
+        elif isinstance(block, SyntheticImage):
+            image = ElementTree.SubElement(oe, one('Image'), {'format': 'png'})
+            size_pt = f'{block.size_px * 72 / 96:.1f}'
+            ElementTree.SubElement(image, one('Size'), {'width': size_pt, 'height': size_pt})
+            ElementTree.SubElement(image, one('CallbackID'), {'callbackID': block.callback_id})
+
+    return ElementTree.tostring(page_element, encoding='utf-8')
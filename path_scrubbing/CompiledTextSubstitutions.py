@@ -0,0 +1,176 @@
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Tuple, Union
+
+from .LabeledRegexSubstitution import LabeledRegexSubstitution
+
+
+_leading_zero_width_or_group_opener_pattern = re.compile(r'\\b|\\B|\^|\((?:\?:|\?P<\w+>)?')
+_single_character_atom_pattern = re.compile(r'\\[dwsDWS]|\\[^A-Za-z0-9]|[^\\.^$*+?{}\[\]|()]')
+_optional_quantifier_pattern = re.compile(r'[?*]|\{0*[,}]|\{0+,')
+
+
+def _create_prefilter_atom(pattern: Pattern[str], atom: str) -> str:
+    # Case only matters to a literal letter.
+    ignore_case = pattern.flags & re.IGNORECASE and not atom.startswith('\\') and atom.lower() != atom.upper()
+    return f'(?i:{atom})' if ignore_case else atom
+
+
+def _find_required_leading_atom(pattern: Pattern[str]) -> Optional[str]:
+    """
+    :return: A single-character atom (e.g. '\\d' or ':') that every match of the pattern has to contain, because it
+             comes first once past any leading word boundaries and group openers; or None if there isn't one that's
+             plainly so.
+    """
+    pattern_text = pattern.pattern
+    if pattern.flags & re.VERBOSE:
+        return None
+
+    position, enclosing_group_count = 0, 0
+    while leading_match := _leading_zero_width_or_group_opener_pattern.match(pattern_text, position):
+        enclosing_group_count += leading_match.group().startswith('(')
+        position = leading_match.end()
+
+    atom_match = _single_character_atom_pattern.match(pattern_text, position)
+    if not atom_match or _optional_quantifier_pattern.match(pattern_text, atom_match.end()):
+        return None
+
+    # An alternation at the top level or within a group enclosing the atom, or an enclosing group being optional,
+    # would let a match do without the atom.
+    depth, index = 0, 0
+    while index < len(pattern_text):
+        character = pattern_text[index]
+        if character == '\\':
+            index += 1
+        elif character == '[':
+            index += 2 if pattern_text.startswith('[^', index) else 1
+            index += pattern_text.startswith(']', index)
+            while pattern_text[index] != ']':
+                index += 2 if pattern_text[index] == '\\' else 1
+        elif character == '(':
+            depth += 1
+        elif character == ')':
+            depth -= 1
+            if depth < enclosing_group_count:
+                if _optional_quantifier_pattern.match(pattern_text, index + 1):
+                    return None
+                enclosing_group_count = depth
+        elif character == '|' and depth <= enclosing_group_count:
+            return None
+        index += 1
+
+    return atom_match.group()
+
+
+class _TranslationStage:
+    """
+    Consecutive single-character literal substitutions, applied at once via str.translate.
+    """
+
+    def __init__(self):
+        self._table: Dict[int, str] = {}
+
+    def try_add(self, character: str, replacement: str) -> bool:
+        # Applying the substitutions at once only matches applying them in turn if none of them would have replaced
+        # what an earlier one put in.
+        if ord(character) in self._table or any(character in r for r in self._table.values()):
+            return False
+        self._table[ord(character)] = replacement
+        return True
+
+    def __call__(self, value: str) -> str:
+        return value.translate(self._table)
+
+
+class _GuardedStage:
+    """
+    Consecutive substitutions whose patterns all have to contain the same kind of character (e.g. a digit). Text
+    without any such character is passed over with one cheap search; otherwise each substitution is only applied if
+    its pattern is found.
+    """
+
+    def __init__(self, prefilter_atom: Optional[str]):
+        self._prefilter = re.compile(prefilter_atom) if prefilter_atom is not None else None
+        self._substitutions: List[Tuple[Callable[[str], str], Pattern[str]]] = []
+
+    def add(self, substitution: Callable[[str], str], pattern: Pattern[str]):
+        self._substitutions.append((substitution, pattern))
+
+    def __call__(self, value: str) -> str:
+        if self._prefilter is not None and not self._prefilter.search(value):
+            return value
+        for substitution, pattern in self._substitutions:
+            if pattern.search(value):
+                value = substitution(value)
+        return value
+
+
+class CompiledTextSubstitutions(Callable[[str], str]):
+    """
+    Applies a sequence of text substitutions, giving the same result as applying each in turn, but with fewer passes
+    over the text: runs of single-character literal substitutions are merged into one str.translate, and runs of
+    pattern-based substitutions are passed over with a single search when the text lacks a character all their
+    patterns need.
+    """
+
+    def __init__(self, substitutions: Iterable[Callable[[str], str]]):
+        """
+        :param substitutions: The substitutions, in the order they're to be applied. Those that expose a compiled
+                              'pattern' are taken to leave any text it doesn't match unchanged.
+        """
+        if substitutions is None:
+            raise TypeError("substitutions must not be None")
+        self._stages: Tuple[Callable[[str], str], ...] = tuple(self._compile_stages(substitutions))
+
+    @staticmethod
+    def _get_pattern(substitution: Callable[[str], str]) -> Optional[Pattern[str]]:
+        pattern = getattr(substitution, 'pattern', None)
+        if not isinstance(pattern, re.Pattern) or not isinstance(pattern.pattern, str):
+            return None
+        return pattern
+
+    @classmethod
+    def _compile_stages(cls, substitutions: Iterable[Callable[[str], str]]) -> Iterable[Callable[[str], str]]:
+        current_stage: Union[_TranslationStage, _GuardedStage, None] = None
+        current_prefilter_atom: Optional[str] = None
+
+        for substitution in substitutions:
+            if not callable(substitution):
+                raise TypeError(f"substitutions must be callable, not {type(substitution)}")
+
+            literal_translation = substitution.literal_translation if isinstance(substitution, LabeledRegexSubstitution) else None
+            if literal_translation is not None:
+                if isinstance(current_stage, _TranslationStage) and current_stage.try_add(*literal_translation):
+                    continue
+                if current_stage is not None:
+                    yield current_stage
+                current_stage = _TranslationStage()
+                current_stage.try_add(*literal_translation)
+                continue
+
+            pattern = cls._get_pattern(substitution)
+            if pattern is not None:
+                leading_atom = _find_required_leading_atom(pattern)
+                prefilter_atom = _create_prefilter_atom(pattern, leading_atom) if leading_atom is not None else None
+                if not isinstance(current_stage, _GuardedStage) or prefilter_atom != current_prefilter_atom:
+                    if current_stage is not None:
+                        yield current_stage
+                    current_stage, current_prefilter_atom = _GuardedStage(prefilter_atom), prefilter_atom
+                current_stage.add(substitution, pattern)
+                continue
+
+            if current_stage is not None:
+                yield current_stage
+            current_stage = None
+            yield substitution
+
+        if current_stage is not None:
+            yield current_stage
+
+    @property
+    def stage_count(self) -> int:
+        return len(self._stages)
+
+    def __call__(self, value: str) -> str:
+        for stage in self._stages:
+            value = stage(value)
+        return value
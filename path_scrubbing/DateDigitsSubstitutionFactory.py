@@ -13,7 +13,7 @@ class DateDigitsSubstitutionFactory:
                  date_component_order: YearMonthDayDigitsComponentOrder = YearMonthDayDigitsComponentOrder.MDY,
                  abbrev_year: bool = False
                  ):
-        self._pattern = self._create_regex_pattern(date_components_sep, date_component_order, abbrev_year)
+        self._pattern = re.compile(self._create_regex_pattern(date_components_sep, date_component_order, abbrev_year))
         self._date_components_sep = date_components_sep
         self._date_component_order = date_component_order
         self._abbrev_year = abbrev_year
@@ -30,7 +30,7 @@ class DateDigitsSubstitutionFactory:
         raise ValueError(f'Invalid date_component_order: {date_component_order}')
 
     def __str__(self):
-        return f'{self.__class__.__name__}({self._pattern})'
+        return f'{self.__class__.__name__}({self._pattern.pattern})'
 
     def _parse_from_pattern_match(self, match: Match[str], capture_groups: dict[str, int], abbrev_year_prefix: str = '20') -> date:
         year = int(match.group(capture_groups['year']))
@@ -98,5 +98,6 @@ class DateDigitsSubstitutionFactory:
         text_func = functools.partial(self._parse_and_reformat_all, new_date_components_sep=new_date_components_sep, new_date_component_order=new_date_component_order, abbrev_year_prefix=abbrev_year_prefix)
         return LabeledTextFunc(
             f'DateDigitsSubstitutionFactory._parse_and_reformat_all(date_components_sep: "{self._date_components_sep}"->"{new_date_components_sep}", date_component_order: "{self._date_component_order}"->"{new_date_component_order}", abbrev_year: {self._abbrev_year})',
-            text_func
+            text_func,
+            self._pattern,
         )
@@ -1,5 +1,6 @@
 import dataclasses
 import re
+from typing import Optional, Pattern, Tuple
 
 
 @dataclasses.dataclass
@@ -12,5 +13,24 @@ class LabeledRegexSubstitution:
     def __str__(self):
         return f'{self._label}: "{self._pattern}" -> "{self._replacement}"'
 
+    @property
+    def pattern(self) -> Pattern[str]:
+        return self._pattern
+
+    @property
+    def literal_translation(self) -> Optional[Tuple[str, str]]:
+        """
+        :return: The (character, replacement) this substitution amounts to, if it only replaces a single literal
+                 character with literal text; otherwise None.
+        """
+        if self._pattern.flags & ~re.UNICODE or '\\' in self._replacement:
+            return None
+        pattern_text = self._pattern.pattern
+        if len(pattern_text) == 2 and pattern_text[0] == '\\' and not pattern_text[1].isalnum():
+            return pattern_text[1], self._replacement
+        if len(pattern_text) == 1 and re.escape(pattern_text) == pattern_text:
+            return pattern_text, self._replacement
+        return None
+
     def __call__(self, value: str) -> str:
         return re.sub(self._pattern, self._replacement, value)
@@ -1,15 +1,25 @@
 import dataclasses
-from typing import Callable
+from typing import Callable, Optional, Pattern
 
 
 @dataclasses.dataclass
 class LabeledTextFunc:
-    def __init__(self, label: str, func: Callable[[str], str]):
+    def __init__(self, label: str, func: Callable[[str], str], pattern: Optional[Pattern[str]] = None):
+        """
+        :param label: Describes what the function does.
+        :param func: The function.
+        :param pattern: If given, the function leaves any text this pattern doesn't match unchanged.
+        """
         self._label = label
         self._func = func
+        self._pattern = pattern
 
     def __str__(self):
         return f'{self._label}: {self._func}'
 
+    @property
+    def pattern(self) -> Optional[Pattern[str]]:
+        return self._pattern
+
     def __call__(self, value: str) -> str:
         return self._func(value)
@@ -0,0 +1,50 @@
+import os
+
+
+windows_verboten_characters = ('"', '*', '/', ':', '<', '>', '?', '\\', '|')
+
+
+class OsPathsCharacterSupport:
+    """
+    Answers which characters the OS's paths support, from what's known about the OS up front rather than anything
+    worked out per character.
+    """
+
+    def __init__(self, is_windows: bool, supports_unicode_filenames: bool):
+        if not isinstance(is_windows, bool):
+            raise TypeError(f"is_windows must be a bool, not {type(is_windows)}")
+        if not isinstance(supports_unicode_filenames, bool):
+            raise TypeError(f"supports_unicode_filenames must be a bool, not {type(supports_unicode_filenames)}")
+        self._is_windows = is_windows
+        self._supports_unicode_filenames = supports_unicode_filenames
+        self._verboten_characters = frozenset(windows_verboten_characters if is_windows else ())
+
+    @classmethod
+    def probe(cls) -> 'OsPathsCharacterSupport':
+        """
+        Detects the support of the OS this process is running on.
+        """
+        return cls(is_windows=os.name == 'nt', supports_unicode_filenames=bool(os.path.supports_unicode_filenames))
+
+    @property
+    def is_windows(self) -> bool:
+        return self._is_windows
+
+    @property
+    def supports_unicode_filenames(self) -> bool:
+        return self._supports_unicode_filenames
+
+    def supports_character(self, character: str) -> bool:
+        """
+        :param character: The character, or characters, in question.
+        :return: Whether all of them are supported.
+        """
+        if not self._verboten_characters.isdisjoint(character):
+            return False
+        # Where filenames aren't unicode, any character at all counts as unsupported.
+        if not self._supports_unicode_filenames and isinstance(character, str) and len(character) > 0:
+            return False
+        return True
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(is_windows={self._is_windows}, supports_unicode_filenames={self._supports_unicode_filenames})'
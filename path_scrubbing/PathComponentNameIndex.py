@@ -0,0 +1,46 @@
+import pathlib
+from typing import Dict, Iterable, Set
+
+
+class PathComponentNameIndex:
+    """
+    Tracks the names taken within one directory, so that every name claimed from it is distinct. Names are compared
+    ignoring case, as they are on Windows' and macOS' file systems. A name that's already taken gets the lowest
+    numbered suffix, e.g. 'Name (2)', that's free; deterministically, given the same names in the same order.
+    """
+
+    def __init__(self, reserved_names: Iterable[pathlib.Path] = ()):
+        """
+        :param reserved_names: Names that will be claimed later, which suffixed names must not take. Typically every
+                               name in the directory, so that e.g. a later 'Name (2)' keeps its own name.
+        """
+        if reserved_names is None:
+            raise TypeError("reserved_names must not be None")
+        self._reserved_keys: Set[str] = {self._get_key(name) for name in reserved_names}
+        self._claimed_keys: Set[str] = set()
+        self._next_suffix_numbers: Dict[str, int] = {}
+
+    @staticmethod
+    def _get_key(name: pathlib.Path) -> str:
+        return str(name).casefold()
+
+    def claim(self, name: pathlib.Path) -> pathlib.Path:
+        """
+        :param name: The name wanted.
+        :return: The name, or if it's already been claimed, the name with a suffix that distinguishes it.
+        """
+        key = self._get_key(name)
+        if key not in self._claimed_keys:
+            self._claimed_keys.add(key)
+            return name
+
+        suffix_number = self._next_suffix_numbers.get(key, 2)
+        while True:
+            suffixed_name = pathlib.Path(f'{name} ({suffix_number})')
+            suffixed_key = self._get_key(suffixed_name)
+            suffix_number += 1
+            if suffixed_key not in self._claimed_keys and suffixed_key not in self._reserved_keys:
+                break
+        self._next_suffix_numbers[key] = suffix_number
+        self._claimed_keys.add(suffixed_key)
+        return suffixed_name
@@ -1,24 +1,47 @@
 import functools
 import pathlib
-from functools import reduce, cache
+from functools import reduce, cache, lru_cache
 from typing import Callable, Iterable, Optional, Tuple
 
 from .AbbrevYearPrefix import AbbrevYearPrefix
+from .CompiledTextSubstitutions import CompiledTextSubstitutions
 from .LabeledRegexSubstitution import LabeledRegexSubstitution
 from .DateDigitsSubstitutionFactory import DateDigitsSubstitutionFactory
 from .TimeDigitsSubstitutionFactory import TimeDigitsSubstitutionFactory
-from .os_paths_support import os_paths_support_character
+from .disambiguate_path_components import disambiguate_path_components
+from .OsPathsCharacterSupport import OsPathsCharacterSupport
+from .os_paths_support import default_os_paths_character_support
+
+
+default_path_cleanup_cache_size = 4096
 
 
 class PathComponentScrubber(Callable[[str], pathlib.Path]):
-    def __init__(self):
+    def __init__(self, cache_size: int = default_path_cleanup_cache_size, os_paths_character_support: Optional[OsPathsCharacterSupport] = None):
+        """
+        :param cache_size: How many recently cleaned up path components to remember the results for. Node names repeat
+                           heavily (e.g. section names), so most are cleaned up only once.
+        :param os_paths_character_support: Which characters paths support. Defaults to that of the OS this process is
+                                           running on.
+        """
+        if not isinstance(cache_size, int):
+            raise TypeError(f"cache_size must be an int, not {type(cache_size)}")
+        if cache_size < 0:
+            raise ValueError(f"cache_size must not be negative, not {cache_size}")
+        if os_paths_character_support is None:
+            os_paths_character_support = default_os_paths_character_support
+        if not isinstance(os_paths_character_support, OsPathsCharacterSupport):
+            raise TypeError(f"os_paths_character_support must be an instance of OsPathsCharacterSupport, not {type(os_paths_character_support)}")
+        self._os_paths_character_support = os_paths_character_support
         self._prefer_zettelkasten_style_timestamp_infixes: bool = True
         self._abbrev_year_prefix: Optional[AbbrevYearPrefix] = AbbrevYearPrefix.TWENTY
         self._reformat_datetimes_separated_by: Tuple[str, ...] = ('_',)
         self._reformat_times_fill_empty_seconds: bool = False
         self._reformat_all_times_coercing_to_24hr_iso8601: bool = True
+        self._cleanup_path_component_cached = lru_cache(maxsize=cache_size)(self._cleanup_path_component_uncached)
 
     def _yield_path_cleanup_substitutions(self) -> Iterable[Callable[[str], str]]:
+        os_paths_support_character = self._os_paths_character_support.supports_character
         os_paths_support_slashes = os_paths_support_character('/')
         os_paths_support_colons = os_paths_support_character(':')
         os_paths_support_lessthan = os_paths_support_character('<')
@@ -129,12 +152,31 @@ class PathComponentScrubber(Callable[[str], pathlib.Path]):
     def _path_cleanup_substitutions(self) -> Tuple[Callable[[str], str], ...]:
         return tuple(self._yield_path_cleanup_substitutions())
 
-    def __call__(self, *args, **kwargs):
-        return self.cleanup_path_component(*args, **kwargs)
+    @property
+    @cache
+    def _compiled_path_cleanup_substitutions(self) -> CompiledTextSubstitutions:
+        return CompiledTextSubstitutions(self._path_cleanup_substitutions)
 
-    def cleanup_path_component(self, path: str) -> pathlib.Path:
-        cleaned_path_text = reduce(
+    def _apply_path_cleanup_substitutions_in_turn(self, path: str) -> str:
+        return reduce(
             lambda updated_path_text, substitution: substitution(updated_path_text),
             self._path_cleanup_substitutions,
             path)
-        return pathlib.Path(cleaned_path_text)
+
+    def _cleanup_path_component_uncached(self, path: str) -> pathlib.Path:
+        return pathlib.Path(self._compiled_path_cleanup_substitutions(path))
+
+    def __call__(self, *args, **kwargs):
+        return self.cleanup_path_component(*args, **kwargs)
+
+    def cleanup_path_component(self, path: str) -> pathlib.Path:
+        return self._cleanup_path_component_cached(path)
+
+    def cleanup_path_components(self, paths: Iterable[str]) -> Tuple[pathlib.Path, ...]:
+        """
+        Cleans up the names of everything in one directory at once, so that names that would collide once cleaned up
+        are kept distinct.
+        :param paths: The names, in order.
+        :return: The cleaned up names, in the same order, suffixed where needed (see disambiguate_path_components).
+        """
+        return disambiguate_path_components(self.cleanup_path_component(path) for path in paths)
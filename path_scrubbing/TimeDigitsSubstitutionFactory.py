@@ -89,12 +89,14 @@ class TimeDigitsSubstitutionFactory:
         text_func = functools.partial(self._parse_and_reformat_all, new_time_components_sep=new_time_components_sep, include_missing_seconds=include_missing_seconds, capture_groups_start_at=capture_groups_start_at)
         return LabeledTextFunc(
             f'TimeDigitsSubstitutionFactory._parse_and_reformat_all(time_components_sep: "{self._time_components_sep}"->"{new_time_components_sep}", expect_seconds: {self._expect_seconds}, twelve_hour: {self._twelve_hour}, include_missing_seconds: {include_missing_seconds})',
-            text_func
+            text_func,
+            self._pattern,
         )
 
     def create_substitutor_coercing_to_24hr_iso8601(self, include_missing_seconds: bool = False, capture_groups_start_at: int = 1) -> LabeledTextFunc:
         text_func = functools.partial(self._coerce_to_24hr_iso8601, include_missing_seconds=include_missing_seconds, capture_groups_start_at=capture_groups_start_at)
         return LabeledTextFunc(
             f'TimeDigitsSubstitutionFactory._coerce_to_24hr_iso8601(expect_seconds: {self._expect_seconds}, twelve_hour: {self._twelve_hour}, include_missing_seconds: {include_missing_seconds})',
-            text_func
+            text_func,
+            self._pattern,
         )
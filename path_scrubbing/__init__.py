@@ -1,8 +1,12 @@
 from .AbbrevYearPrefix import AbbrevYearPrefix
+from .CompiledTextSubstitutions import CompiledTextSubstitutions
 from .DateDigitsSubstitutionFactory import DateDigitsSubstitutionFactory
 from .LabeledRegexSubstitution import LabeledRegexSubstitution
 from .LabeledTextFunc import LabeledTextFunc
 from .TimeDigitsSubstitutionFactory import TimeDigitsSubstitutionFactory
 from .YearMonthDayDigitsComponentOrder import YearMonthDayDigitsComponentOrder
-from .os_paths_support import os_paths_support_character
+from .OsPathsCharacterSupport import OsPathsCharacterSupport
+from .PathComponentNameIndex import PathComponentNameIndex
+from .disambiguate_path_components import disambiguate_path_components
+from .os_paths_support import os_paths_support_character, default_os_paths_character_support
 from .PathComponentScrubber import PathComponentScrubber
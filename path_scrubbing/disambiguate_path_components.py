@@ -0,0 +1,15 @@
+import pathlib
+from typing import Iterable, Tuple
+
+from .PathComponentNameIndex import PathComponentNameIndex
+
+
+def disambiguate_path_components(path_components: Iterable[pathlib.Path]) -> Tuple[pathlib.Path, ...]:
+    """
+    :param path_components: The names of everything in one directory, in order.
+    :return: The names in the same order, those that collide with an earlier one (ignoring case) suffixed to keep
+             them distinct, e.g. 'Name', 'Name (2)', 'Name (3)'.
+    """
+    path_components = tuple(path_components)
+    name_index = PathComponentNameIndex(reserved_names=path_components)
+    return tuple(name_index.claim(path_component) for path_component in path_components)
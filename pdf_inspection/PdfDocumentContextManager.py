@@ -3,6 +3,7 @@ import pathlib
 import fitz
 
 from onenote_export.Pathlike import Pathlike
+from tracing import ExportTracer
 
 
 class PdfDocumentContextManager:
@@ -27,7 +28,8 @@ class PdfDocumentContextManager:
             assert self._file_path.exists()
             file_path = str(self._file_path)
             # https://pymupdf.readthedocs.io/en/latest/document.html#Document.__init__
-            self._pymupdf_document = fitz.Document(file_path)
+            with ExportTracer.current().span('open_document', 'pymupdf', path=file_path):
+                self._pymupdf_document = fitz.Document(file_path)
 
         self._enters += 1
         assert self._pymupdf_document is not None
@@ -9,6 +9,7 @@ from fitz import fitz
 from onenote_export.Pathlike import Pathlike
 from onenote_export.temporary_file import TemporaryFilePath
 from pdf_inspection.type_variables import T, fitzImagesEntryResolved
+from tracing import ExportTracer
 
 
 class PdfDocumentPageImage:
@@ -60,7 +61,8 @@ class PdfDocumentPageImage:
                     os.remove(str(png_output_path))
                 shutil.move(tmp_png_output_path, png_output_path)
 
-        self._use_pymupdf_page_image(_try_save_pix_image)
+        with ExportTracer.current().span('export_png', 'pymupdf', path=str(png_output_path)):
+            self._use_pymupdf_page_image(_try_save_pix_image)
 
     def __str__(self):
         return f"{self.__class__.__name__}({self.parent_page}, {self._page_images_index})"
@@ -1,9 +1,13 @@
 import unittest
+from test_benchmarks import *
 from test_markdown_dom import *
+from test_markdown_re import *
 from test_mhtml_dom import *
 from test_onenote_export import *
+from test_onenote_synthetic import *
 from test_path_scrubbing import *
 from test_pdf_inspection import *
+from test_tracing import *
 
 
 if __name__ == '__main__':
@@ -0,0 +1,87 @@
+import pathlib
+import tempfile
+import unittest
+
+from benchmarks import Benchmark, BenchmarkResult, run_benchmark, run_benchmarks, write_benchmark_results, \
+    read_benchmark_results, compare_benchmark_results
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    def test_run_benchmark_prepares_each_round_in_a_fresh_work_dir(self):
+        # Arrange
+        prepared_work_dirs = []
+        operated_work_dirs = []
+
+        def prepare(work_dir: pathlib.Path):
+            self.assertEqual(list(work_dir.iterdir()), [])
+            prepared_work_dirs.append(work_dir)
+            (work_dir / 'input').write_text('input')
+            return lambda: operated_work_dirs.append((work_dir / 'input').read_text())
+
+        sut = Benchmark('sample', prepare, rounds=3)
+
+        # Act
+        actual = run_benchmark(sut, warmup_rounds=1)
+
+        # Assert
+        self.assertEqual(actual.name, 'sample')
+        self.assertEqual(len(actual.round_seconds), 3)
+        self.assertEqual(len(prepared_work_dirs), 4)
+        self.assertEqual(operated_work_dirs, ['input'] * 4)
+        for work_dir in prepared_work_dirs:
+            self.assertFalse(work_dir.exists())
+
+    def test_run_benchmarks_filters_by_name(self):
+        # Arrange
+        benchmarks = (Benchmark('alpha', lambda _: lambda: None), Benchmark('beta', lambda _: lambda: None))
+
+        # Act
+        actual = run_benchmarks(benchmarks, name_pattern='^b', rounds=1)
+
+        # Assert
+        self.assertEqual([result.name for result in actual], ['beta'])
+
+    def test_results_round_trip_through_json(self):
+        # Arrange
+        expected = (BenchmarkResult('alpha', (0.3, 0.1, 0.2)), BenchmarkResult('beta', (1.0,)))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            results_path = pathlib.Path(temp_dir) / 'baseline.json'
+
+            # Act
+            write_benchmark_results(results_path, expected)
+            actual = read_benchmark_results(results_path)
+
+        # Assert
+        self.assertEqual(actual, {result.name: result for result in expected})
+        self.assertEqual(actual['alpha'].median_seconds, 0.2)
+
+    def test_compare_flags_only_slowdowns_above_the_threshold(self):
+        # Arrange
+        baseline = {
+            'faster': BenchmarkResult('faster', (1.0,)),
+            'within_threshold': BenchmarkResult('within_threshold', (1.0,)),
+            'slower': BenchmarkResult('slower', (1.0,)),
+            'removed': BenchmarkResult('removed', (1.0,)),
+        }
+        current = (
+            BenchmarkResult('faster', (0.5,)),
+            BenchmarkResult('within_threshold', (1.09,)),
+            BenchmarkResult('slower', (1.5,)),
+            BenchmarkResult('added', (1.0,)),
+        )
+
+        # Act
+        actual = {comparison.name: comparison for comparison in compare_benchmark_results(baseline, current, threshold=0.1)}
+
+        # Assert
+        self.assertEqual(set(actual), {'faster', 'within_threshold', 'slower', 'added', 'removed'})
+        self.assertEqual({name for name, comparison in actual.items() if comparison.is_regression}, {'slower'})
+        self.assertAlmostEqual(actual['slower'].change_ratio, 0.5)
+        self.assertIsNone(actual['added'].change_ratio)
+        self.assertIsNone(actual['removed'].change_ratio)
+
+    def test_benchmark_rejects_invalid_rounds(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            Benchmark('sample', lambda _: lambda: None, rounds=0)
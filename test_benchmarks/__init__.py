@@ -0,0 +1 @@
+from .TestBenchmarkRunner import TestBenchmarkRunner
@@ -0,0 +1,126 @@
+import io
+import json
+import pathlib
+import unittest
+
+import panflute
+
+from markdown_dom.ChangeTrackingPanfluteDocumentContextManager import ChangeTrackingPanfluteDocumentContextManager
+from markdown_dom.LazyBlockPlaceholder import LazyBlockPlaceholder
+from markdown_dom.PandocAstJsonCodec import PandocAstJsonCodec
+from markdown_dom.PandocMarkdownDocumentImportSettings import PandocMarkdownDocumentImportSettings
+
+
+class TestChangeTrackingPanfluteDocumentContextManager(unittest.TestCase):
+    def test_codecs_round_trip_like_panflute(self):
+        document_ast_json = self._create_sample_document_ast_json()
+        expected = self._dump_with_panflute(json.loads(document_ast_json, object_hook=panflute.elements.from_json))
+
+        for codec in {PandocAstJsonCodec(), PandocAstJsonCodec.create_default()}:
+            with self.subTest(codec=codec.name):
+                # Arrange
+                subject = ChangeTrackingPanfluteDocumentContextManager.from_ast_json(document_ast_json, codec=codec)
+
+                # Act
+                with subject:
+                    pass
+                actual = subject.document_ast_json
+
+                # Assert
+                self.assertEqual(actual, expected)
+
+    def test_entered_lazily_only_materializes_blocks_containing_requested_types(self):
+        # Arrange
+        document_ast_json = self._create_sample_document_ast_json()
+        eager_subject = ChangeTrackingPanfluteDocumentContextManager.from_ast_json(document_ast_json)
+        lazy_subject = ChangeTrackingPanfluteDocumentContextManager.from_ast_json(document_ast_json)
+
+        def relink(element: panflute.Element, _):
+            if isinstance(element, panflute.Link):
+                element.url = 'relinked.md'
+
+        # Act
+        with eager_subject:
+            panflute.run_filter(relink, doc=eager_subject.panflute_document)
+        eager_subject.commit_changes()
+        with lazy_subject.entered_lazily((panflute.Link,)):
+            lazy_blocks = tuple(lazy_subject.panflute_document.content)
+            panflute.run_filter(relink, doc=lazy_subject.panflute_document)
+        lazy_subject.commit_changes()
+
+        # Assert
+        placeholder_count = sum(isinstance(b, LazyBlockPlaceholder) for b in lazy_blocks)
+        self.assertGreater(placeholder_count, 0)
+        self.assertLess(placeholder_count, len(lazy_blocks))
+        self.assertIn('relinked.md', lazy_subject.document_ast_json)
+        self.assertEqual(lazy_subject.document_ast_json, eager_subject.document_ast_json)
+
+    def test_entered_lazily_leaves_blocks_within_containers_raw_unless_they_contain_requested_types(self):
+        # Arrange
+        document = panflute.Doc(panflute.Div(
+            panflute.Para(panflute.Str('untouched')),
+            panflute.Para(panflute.Link(panflute.Str('link'), url='original.md')),
+            panflute.BulletList(
+                panflute.ListItem(panflute.Para(panflute.Str('untouched item'))),
+                panflute.ListItem(panflute.Para(panflute.Link(panflute.Str('link'), url='original.md'))),
+            ),
+        ))
+        document_ast_json = self._dump_with_panflute(document)
+        eager_subject = ChangeTrackingPanfluteDocumentContextManager.from_ast_json(document_ast_json)
+        lazy_subject = ChangeTrackingPanfluteDocumentContextManager.from_ast_json(document_ast_json)
+
+        def relink(element: panflute.Element, _):
+            if isinstance(element, panflute.Link):
+                element.url = 'relinked.md'
+
+        # Act
+        with eager_subject:
+            panflute.run_filter(relink, doc=eager_subject.panflute_document)
+        eager_subject.commit_changes()
+        with lazy_subject.entered_lazily((panflute.Link,)):
+            div, = lazy_subject.panflute_document.content
+            untouched, relinked, bullet_list = div.content
+            untouched_item, relinked_item = (item.content[0] for item in bullet_list.content)
+            panflute.run_filter(relink, doc=lazy_subject.panflute_document)
+        lazy_subject.commit_changes()
+
+        # Assert
+        self.assertIsInstance(div, panflute.Div)
+        self.assertIsInstance(untouched, LazyBlockPlaceholder)
+        self.assertIsInstance(relinked, panflute.Para)
+        self.assertIsInstance(untouched_item, LazyBlockPlaceholder)
+        self.assertIsInstance(relinked_item, panflute.Para)
+        self.assertEqual(lazy_subject.document_ast_json.count('relinked.md'), 2)
+        self.assertEqual(lazy_subject.document_ast_json, eager_subject.document_ast_json)
+
+    def test_entered_lazily_materializes_blocks_containing_subclasses_of_abstract_requested_types(self):
+        # Arrange
+        document = panflute.Doc(
+            panflute.Para(panflute.Emph(panflute.Str('inline'))),
+            panflute.HorizontalRule(),
+        )
+        subject = ChangeTrackingPanfluteDocumentContextManager.from_ast_json(self._dump_with_panflute(document))
+
+        # Act
+        with subject.entered_lazily((panflute.Inline,)):
+            para, horizontal_rule = subject.panflute_document.content
+
+        # Assert
+        self.assertIsInstance(para, panflute.Para)
+        self.assertIsInstance(horizontal_rule, LazyBlockPlaceholder)
+
+    @staticmethod
+    def _create_sample_document_ast_json() -> str:
+        sample_md_path = pathlib.Path(__file__).parent / 'sample_data' / 'hummingbird-cake.md'
+        return PandocMarkdownDocumentImportSettings.create_default_for_extant_obsidian_md()\
+            .execute_convert_markdown_file_to_pandoc_ast_json_str(sample_md_path)
+
+    @staticmethod
+    def _dump_with_panflute(doc: panflute.Doc) -> str:
+        with io.StringIO() as f:
+            panflute.dump(doc, f)
+            return f.getvalue()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import pathlib
+import tempfile
+import unittest
+
+from markdown_dom.MarkdownContentHashSidecar import MarkdownContentHashSidecar
+from markdown_dom.MarkdownDocument import MarkdownDocument
+from markdown_dom.PandocMarkdownDocumentImportSettings import PandocMarkdownDocumentImportSettings
+
+
+class TestMarkdownContentHashSidecar(unittest.TestCase):
+    def test_is_unchanged(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            subject = MarkdownContentHashSidecar()
+            md_path = pathlib.Path(temp_dir) / 'page.md'
+            md_path.write_bytes(b'content')
+
+            # Act & Assert
+            self.assertFalse(subject.is_unchanged(md_path, b'content'), 'no hash recorded yet')
+            subject.write_hash(md_path, subject.compute_hash(b'content'))
+            self.assertTrue(subject.is_unchanged(md_path, b'content'))
+            self.assertFalse(subject.is_unchanged(md_path, b'other content'))
+            md_path.write_bytes(b'edited content')
+            self.assertFalse(subject.is_unchanged(md_path, b'content'), 'file edited since hash was recorded')
+
+    def test_save_skips_write_when_rendered_markdown_is_unchanged(self):
+        sample_md_path = pathlib.Path(__file__).parent / 'sample_data' / 'hummingbird-cake.md'
+        sample_ast_json = PandocMarkdownDocumentImportSettings.create_default_for_extant_obsidian_md()\
+            .execute_convert_markdown_file_to_pandoc_ast_json_str(sample_md_path)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Arrange
+            sidecar = MarkdownContentHashSidecar()
+            md_path = pathlib.Path(temp_dir) / 'page.md'
+            open_document = lambda: MarkdownDocument.open_document_ast_json_str(sample_ast_json, md_path, content_hash_sidecar=sidecar)
+
+            # Act
+            first_document = open_document()
+            first_written = first_document.save()
+            second_document = open_document()
+            second_was_dirty = second_document.is_dirty
+            second_written = second_document.save()
+            md_path.write_text('Edited by hand.\n', encoding='utf-8')
+            third_written = open_document().save()
+
+            # Assert
+            self.assertTrue(first_written)
+            self.assertTrue(sidecar.sidecar_path_for(md_path).exists())
+            self.assertTrue(second_was_dirty)
+            self.assertFalse(second_written)
+            self.assertFalse(second_document.is_dirty)
+            self.assertTrue(third_written)
+            self.assertNotEqual(md_path.read_text(encoding='utf-8'), 'Edited by hand.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
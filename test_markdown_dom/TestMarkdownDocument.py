@@ -1,6 +1,7 @@
 import pathlib
 import shutil
 import unittest
+import unittest.mock
 from typing import Callable, Optional
 
 import panflute
@@ -86,6 +87,45 @@ class TestMarkdownDocument(unittest.TestCase):
 
         self._subtest_for_each_sample_document_ast_json(can_be_filtered)
 
+    def test_save_only_writes_when_rendered_markdown_differs(self):
+        def saves_only_changes(md_file: pathlib.Path):
+            # Arrange
+            document_ast_json = MarkdownDocument.import_md_file(md_file)._use_pandoc_ast_json(lambda j: j)
+            open_document = lambda: MarkdownDocument.open_document_ast_json_str(document_ast_json, md_file)
+            open_document().save()
+            rendered_content = md_file.read_bytes()
+            md_file_siblings = set(md_file.parent.iterdir())
+
+            # Act
+            written_when_unchanged = open_document().save()
+            md_file.write_bytes(rendered_content + b'Edited.\n')
+            written_when_changed = open_document().save()
+
+            # Assert
+            self.assertFalse(written_when_unchanged)
+            self.assertTrue(written_when_changed)
+            self.assertEqual(md_file.read_bytes(), rendered_content)
+            self.assertEqual(set(md_file.parent.iterdir()), md_file_siblings, 'no temporary files should be left behind')
+
+        self._subtest_for_each_sample_markdown_document(saves_only_changes)
+
+    def test_save_overwrites_in_place_when_replacement_is_denied(self):
+        def overwrites_in_place(md_file: pathlib.Path):
+            # Arrange
+            subject = MarkdownDocument.import_md_file(md_file)
+            subject.count_elements()
+            md_file.write_text('Stale content.\n', encoding='utf-8')
+
+            # Act
+            with unittest.mock.patch('os.replace', side_effect=PermissionError):
+                written = subject.save()
+
+            # Assert
+            self.assertTrue(written)
+            self.assertNotEqual(md_file.read_text(encoding='utf-8'), 'Stale content.\n')
+
+        self._subtest_for_each_sample_markdown_document(overwrites_in_place)
+
     def _subtest_for_each_sample_markdown_document(self, func: Callable[[pathlib.Path], None]):
         sample_data_dir = pathlib.Path(__file__).parent / pathlib.Path('sample_data')
         sample_document_paths = sample_data_dir.glob('*.md')
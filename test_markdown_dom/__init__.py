@@ -1,2 +1,4 @@
+from .TestChangeTrackingPanfluteDocumentContextManager import TestChangeTrackingPanfluteDocumentContextManager
+from .TestMarkdownContentHashSidecar import TestMarkdownContentHashSidecar
 from .TestMarkdownDocument import TestMarkdownDocument
 from .TestPandocExtensionsActivationMap import TestPandocExtensionsActivationMap
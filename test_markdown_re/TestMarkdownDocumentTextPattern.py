@@ -0,0 +1,102 @@
+import io
+import pathlib
+import re
+import unittest
+
+import panflute
+
+from markdown_dom.DocumentBlockScope import DocumentBlockScope
+from markdown_dom.MarkdownDocument import MarkdownDocument
+from markdown_re.MarkdownDocumentTextPattern import MarkdownDocumentTextPattern
+
+
+class TestMarkdownDocumentTextPattern(unittest.TestCase):
+    def test_rm_with_block_scope_only_affects_selected_blocks(self):
+        # Arrange
+        subject = MarkdownDocumentTextPattern(r'\s*Created with OneNote\.\s*', flags=re.MULTILINE)
+        doc = self._create_document(
+            'Created with OneNote.',
+            'Some body text.',
+            'Created with OneNote.',
+        )
+
+        # Act
+        subject.rm(doc, block_scope=DocumentBlockScope.last(1))
+
+        # Assert
+        actual = self._read_paragraph_texts(doc)
+        self.assertEqual(actual, ['Created with OneNote.', 'Some body text.'])
+
+    def test_search_with_block_scope_does_not_see_unselected_blocks(self):
+        # Arrange
+        subject = MarkdownDocumentTextPattern(r'needle')
+        doc = self._create_document('needle', 'hay', 'hay')
+
+        # Act
+        found_in_scope = subject.search(doc, action=lambda m: m is not None, block_scope=DocumentBlockScope.indices(1, -1))
+        found_in_document = subject.search(doc, action=lambda m: m is not None)
+
+        # Assert
+        self.assertFalse(found_in_scope)
+        self.assertTrue(found_in_document)
+
+    def test_findall_sees_table_head_and_foot_text(self):
+        # Arrange
+        subject = MarkdownDocumentTextPattern(r'(head|body|foot)er')
+
+        def create_row(text: str) -> panflute.TableRow:
+            return panflute.TableRow(panflute.TableCell(panflute.Plain(panflute.Str(text))))
+
+        table = panflute.Table(
+            panflute.TableBody(create_row('bodyer')),
+            head=panflute.TableHead(create_row('header')),
+            foot=panflute.TableFoot(create_row('footer')),
+        )
+        panflute_doc = panflute.Doc(table)
+        with io.StringIO() as f:
+            panflute.dump(panflute_doc, f)
+            doc = MarkdownDocument(f.getvalue(), pathlib.Path('nonexistent.md'))
+
+        # Act
+        actual = subject.findall(doc)
+
+        # Assert
+        self.assertCountEqual(actual, ['head', 'body', 'foot'])
+
+    def test_block_scope_resolves_indices_in_document_order(self):
+        cases = [
+            (DocumentBlockScope.last(2), 5, (3, 4)),
+            (DocumentBlockScope.last(10), 3, (0, 1, 2)),
+            (DocumentBlockScope.last(0), 3, ()),
+            (DocumentBlockScope.indices(-1, 0, 0, 7), 3, (0, 2)),
+        ]
+        for subject, block_count, expected in cases:
+            with self.subTest(subject=str(subject), block_count=block_count):
+                # Act
+                actual = subject.resolve_block_indices(block_count)
+
+                # Assert
+                self.assertEqual(actual, expected)
+
+    @staticmethod
+    def _create_document(*paragraph_texts: str) -> MarkdownDocument:
+        def create_paragraph(text: str) -> panflute.Para:
+            words = text.split(' ')
+            inlines = [panflute.Str(words[0])]
+            for word in words[1:]:
+                inlines += [panflute.Space(), panflute.Str(word)]
+            return panflute.Para(*inlines)
+
+        panflute_doc = panflute.Doc(*(create_paragraph(t) for t in paragraph_texts))
+        with io.StringIO() as f:
+            panflute.dump(panflute_doc, f)
+            document_ast_json = f.getvalue()
+        return MarkdownDocument(document_ast_json, pathlib.Path('nonexistent.md'))
+
+    @staticmethod
+    def _read_paragraph_texts(doc: MarkdownDocument) -> list[str]:
+        return doc._use_panflute_document(lambda d: [panflute.stringify(b).strip() for b in d.content])
+
+
+if __name__ == '__main__':
+    unittest.main()
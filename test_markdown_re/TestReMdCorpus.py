@@ -0,0 +1,76 @@
+import pathlib
+import re
+import tempfile
+import unittest
+
+from markdown_re.literal_prefilter import extract_required_literal_tokens, raw_text_could_match
+from markdown_re.re_md_corpus import search_corpus, rm_corpus
+
+
+class TestReMdCorpus(unittest.TestCase):
+    def test_extract_required_literal_tokens(self):
+        cases = [
+            (r'\s*Created with OneNote\.\s*', ('created', 'with', 'onenote')),
+            (r'(?:foo|bar)baz', ('baz',)),
+            (r'(?:optional)?required', ('required',)),
+            (r'x{2}yzzy', ('yzzy',)),
+            (r'[abc]+', ()),
+            (r'ab', ()),
+        ]
+        for pattern, expected in cases:
+            with self.subTest(pattern=pattern):
+                # Act
+                actual = extract_required_literal_tokens(re.compile(pattern))
+
+                # Assert
+                self.assertEqual(actual, expected)
+
+    def test_raw_text_could_match(self):
+        # Arrange
+        tokens = extract_required_literal_tokens(re.compile(r'Created with OneNote', flags=re.IGNORECASE))
+
+        # Act & Assert
+        self.assertTrue(raw_text_could_match(tokens, 'Body.\n\nCreated with *OneNote*.\n'))
+        self.assertFalse(raw_text_could_match(tokens, 'Body.\n\nCreated with Word.\n'))
+        self.assertTrue(raw_text_could_match((), 'anything'))
+
+    def test_search_corpus_reports_prefiltered_and_matched_files(self):
+        with tempfile.TemporaryDirectory() as corpus_dir:
+            # Arrange
+            corpus_dir = pathlib.Path(corpus_dir)
+            (corpus_dir / 'nested').mkdir()
+            (corpus_dir / 'a.md').write_text('Some *needle* text.\n', encoding='utf-8')
+            (corpus_dir / 'nested' / 'b.md').write_text('Just hay.\n', encoding='utf-8')
+
+            # Act
+            outcomes = search_corpus(r'needle', corpus_dir, max_workers=1)
+
+            # Assert
+            by_name = {o.md_path.name: o for o in outcomes}
+            self.assertEqual(set(by_name), {'a.md', 'b.md'})
+            self.assertTrue(by_name['a.md'].matched)
+            self.assertFalse(by_name['a.md'].rewritten)
+            self.assertTrue(by_name['b.md'].prefiltered_out)
+
+    def test_rm_corpus_rewrites_only_matching_files(self):
+        with tempfile.TemporaryDirectory() as corpus_dir:
+            # Arrange
+            corpus_dir = pathlib.Path(corpus_dir)
+            matching_md_path = corpus_dir / 'a.md'
+            matching_md_path.write_text('Body.\n\nCreated with OneNote.\n', encoding='utf-8')
+            other_md_path = corpus_dir / 'b.md'
+            other_md_text = 'Body,   with *odd*    spacing.\n'
+            other_md_path.write_text(other_md_text, encoding='utf-8')
+
+            # Act
+            dry_run_outcomes = rm_corpus(r'\s*Created with OneNote\.\s*', corpus_dir, max_workers=1, dry_run=True)
+            dry_run_text = matching_md_path.read_text(encoding='utf-8')
+            outcomes = rm_corpus(r'\s*Created with OneNote\.\s*', corpus_dir, max_workers=1)
+
+            # Assert
+            self.assertEqual([o.matched for o in dry_run_outcomes], [True, False])
+            self.assertEqual([o.rewritten for o in dry_run_outcomes], [False, False])
+            self.assertIn('Created with OneNote.', dry_run_text)
+            self.assertEqual([o.rewritten for o in outcomes], [True, False])
+            self.assertNotIn('Created with OneNote', matching_md_path.read_text(encoding='utf-8'))
+            self.assertEqual(other_md_path.read_text(encoding='utf-8'), other_md_text)
@@ -0,0 +1,2 @@
+from .TestMarkdownDocumentTextPattern import TestMarkdownDocumentTextPattern
+from .TestReMdCorpus import TestReMdCorpus
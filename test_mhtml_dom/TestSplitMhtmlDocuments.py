@@ -0,0 +1,102 @@
+import pathlib
+import tempfile
+import unittest
+
+from mhtml_dom.MhtmlContainer import MhtmlContainer
+from mhtml_dom.MhtmlContainerHeaders import MhtmlContainerHeaders
+from mhtml_dom.MhtmlContentItem import MhtmlContentItem
+from mhtml_dom.split_mhtml_documents import get_mhtml_document_titles, split_mhtml_documents
+
+
+sample_data_dir = pathlib.Path(__file__).parent / 'sample_data'
+# A section of two pages: "apple-cake.mht" (with its image) and "keto-recipe-ideas.mht" (without any), as OneNote lays
+# them out when publishing the whole section.
+sample_section_mhtml_path = sample_data_dir / 'keto-recipes-section.mht'
+
+
+class TestSplitMhtmlDocuments(unittest.TestCase):
+    def test_splits_recorded_section_into_its_pages(self):
+        # Arrange
+        section = MhtmlContainer.read_file(sample_section_mhtml_path)
+        expected_image = MhtmlContainer.read_file(sample_data_dir / 'apple-cake.mht').content_items[2].body
+
+        # Act
+        actual = split_mhtml_documents(section, 2)
+
+        # Assert
+        apple_cake, keto_recipe_ideas = actual
+        self.assertEqual([item.content_type.value for item in apple_cake.content_items], ['text/html', 'image/jpeg'])
+        self.assertIn('src="page_files/image001.jpg"', apple_cake.content_items[0].body)
+        self.assertIn('Apple Cake', apple_cake.content_items[0].body)
+        self.assertEqual(apple_cake.content_items[1].body, expected_image)
+        self.assertEqual([item.content_type.value for item in keto_recipe_ideas.content_items], ['text/html'])
+        self.assertIn('Keto', keto_recipe_ideas.content_items[0].body)
+
+    def test_split_pages_extract_like_a_single_published_page(self):
+        # Arrange
+        section = MhtmlContainer.read_file(sample_section_mhtml_path)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = pathlib.Path(temp_dir)
+
+            # Act
+            apple_cake, _ = split_mhtml_documents(section, 2)
+            actual_html_path = apple_cake.extractall(output_dir)
+
+            # Assert
+            actual_files = sorted(path.relative_to(output_dir).as_posix() for path in output_dir.rglob('*') if path.is_file())
+            self.assertEqual(actual_files, ['page.htm', 'page_files/image001.jpg'])
+            self.assertEqual(actual_html_path, output_dir / 'page.htm')
+
+    def test_asset_shared_by_documents_is_copied_into_each(self):
+        # Arrange
+        base = 'file:///C:/0000/section_files'
+        container = MhtmlContainer(MhtmlContainerHeaders({'MIME-Version': '1.0'}), (
+            MhtmlContentItem({'Content-Location': f'{base}/page001.htm', 'Content-Type': 'text/html'}, "<img src=image007.png><img src='image007.png'>"),
+            MhtmlContentItem({'Content-Location': f'{base}/page002.htm', 'Content-Type': 'text/html'}, '<a href="image007.png#x"><img src="image008.png"></a>'),
+            MhtmlContentItem({'Content-Location': f'{base}/image007.png', 'Content-Type': 'image/png'}, b'7'),
+            MhtmlContentItem({'Content-Location': f'{base}/image008.png', 'Content-Type': 'image/png'}, b'8'),
+        ))
+
+        # Act
+        actual = split_mhtml_documents(container, 2, file_base_name='p')
+
+        # Assert
+        first, second = actual
+        self.assertEqual(first.content_items[0].body, "<img src=p_files/image001.png><img src='p_files/image001.png'>")
+        self.assertEqual([item.body for item in first.content_items[1:]], [b'7'])
+        self.assertEqual(second.content_items[0].body, '<a href="p_files/image001.png"><img src="p_files/image002.png"></a>')
+        self.assertEqual([item.body for item in second.content_items[1:]], [b'7', b'8'])
+
+    def test_splits_out_only_the_documents_asked_for(self):
+        # Arrange
+        section = MhtmlContainer.read_file(sample_section_mhtml_path)
+
+        # Act
+        actual = split_mhtml_documents(section, 2, document_indices=(1,))
+
+        # Assert
+        keto_recipe_ideas, = actual
+        self.assertIn('Keto', keto_recipe_ideas.content_items[0].body)
+
+    def test_gets_page_titles_from_the_section_table_of_contents(self):
+        # Arrange
+        section = MhtmlContainer.read_file(sample_section_mhtml_path)
+
+        # Act
+        actual = get_mhtml_document_titles(section, 2)
+
+        # Assert
+        self.assertEqual(actual, ('Apple Cake', 'Keto Recipe Ideas'))
+
+    def test_rejects_unexpected_document_count(self):
+        # Arrange
+        section = MhtmlContainer.read_file(sample_section_mhtml_path)
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            split_mhtml_documents(section, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1 +1,2 @@
 from .TestMhtmlContainer import TestMhtmlContainer
+from .TestSplitMhtmlDocuments import TestSplitMhtmlDocuments
@@ -0,0 +1,21 @@
+from onenote.MonotonicClock import MonotonicClock
+
+
+class FakeMonotonicClock(MonotonicClock):
+    """
+    A clock that only advances when slept on (or when told to), recording each sleep.
+    """
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds: float):
+        self.now += seconds
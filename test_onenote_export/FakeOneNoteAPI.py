@@ -0,0 +1,49 @@
+from typing import Dict, Optional
+from unittest.mock import MagicMock
+from xml.etree import ElementTree
+
+from onenote.HierarchyScope import HierarchyScope
+from onenote.OneNoteAPI import OneNoteAPI
+from onenote.PageInfo import PageInfo
+from onenote.PublishFormat import PublishFormat
+from onenote.XMLSchema import XMLSchema
+from onenote_export.Pathlike import Pathlike
+
+
+class FakeOneNoteAPI(OneNoteAPI):
+    """
+    A OneNoteAPI that serves canned XML and binaries instead of talking to OneNote over COM.
+    """
+
+    def __init__(self,
+                 hierarchy_xml: Optional[Dict[str, str]] = None,
+                 page_content_xml: Optional[Dict[str, str]] = None,
+                 binary_page_content: Optional[Dict[str, bytes]] = None,
+                 ):
+        """
+        :param hierarchy_xml: Hierarchy XML, by node ID.
+        :param page_content_xml: Page content XML, by page ID.
+        :param binary_page_content: Binary page content, by callback ID.
+        """
+        super().__init__(app=MagicMock())
+        self._hierarchy_xml = dict(hierarchy_xml or {})
+        self._page_content_xml = dict(page_content_xml or {})
+        self._binary_page_content = dict(binary_page_content or {})
+        self.calls: list[tuple] = []
+
+    def get_hierarchy(self, node_id: str, hierarchy_scope: HierarchyScope, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        self.calls.append(('get_hierarchy', node_id, hierarchy_scope))
+        return ElementTree.fromstring(self._hierarchy_xml[node_id])
+
+    def publish(self, page_id: str, target_file_path: Pathlike, publish_format: PublishFormat, clsid_of_exporter: str = ""):
+        self.calls.append(('publish', page_id, publish_format))
+        # Nothing served by this fake is ever published, so a publish is a test failure rather than a missing feature.
+        raise AssertionError(f"publish must not be called when pages are read from GetPageContent and images from GetBinaryPageContent, but was for {page_id} as {publish_format.name}")
+
+    def get_page_content(self, page_id: str, page_info: PageInfo, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        self.calls.append(('get_page_content', page_id, page_info))
+        return ElementTree.fromstring(self._page_content_xml[page_id])
+
+    def get_binary_page_content(self, page_id: str, callback_id: str) -> bytes:
+        self.calls.append(('get_binary_page_content', page_id, callback_id))
+        return self._binary_page_content[callback_id]
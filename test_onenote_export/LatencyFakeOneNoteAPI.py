@@ -0,0 +1,63 @@
+import pathlib
+import threading
+import time
+from typing import Callable, Optional
+from xml.etree import ElementTree
+
+from onenote.HierarchyScope import HierarchyScope
+from onenote.PageInfo import PageInfo
+from onenote.PublishFormat import PublishFormat
+from onenote.XMLSchema import XMLSchema
+from onenote_export.Pathlike import Pathlike
+from test_onenote_export.FakeOneNoteAPI import FakeOneNoteAPI
+
+
+class LatencyFakeOneNoteAPI(FakeOneNoteAPI):
+    """
+    A FakeOneNoteAPI whose every call takes a while, as calls to OneNote over COM do, recording which thread made each
+    call and how many were ever in flight at once. It can also publish, writing a placeholder file.
+    """
+
+    def __init__(self, latency_seconds: float = 0.0, wait_in_call: Optional[Callable[[], None]] = None, **kwargs):
+        """
+        :param latency_seconds: How long each call takes.
+        :param wait_in_call: Called during each call, e.g. to hold the call until a test lets it finish.
+        :param kwargs: Passed on to FakeOneNoteAPI.
+        """
+        super().__init__(**kwargs)
+        self._latency_seconds = latency_seconds
+        self._wait_in_call = wait_in_call
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self.call_threads: list[threading.Thread] = []
+
+    def _take_a_while(self):
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            self.call_threads.append(threading.current_thread())
+        try:
+            if self._wait_in_call is not None:
+                self._wait_in_call()
+            time.sleep(self._latency_seconds)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def get_hierarchy(self, node_id: str, hierarchy_scope: HierarchyScope, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        self._take_a_while()
+        return super().get_hierarchy(node_id, hierarchy_scope, schema)
+
+    def publish(self, page_id: str, target_file_path: Pathlike, publish_format: PublishFormat, clsid_of_exporter: str = ""):
+        self._take_a_while()
+        self.calls.append(('publish', page_id, publish_format))
+        pathlib.Path(target_file_path).write_bytes(f'{page_id} as {publish_format.name}'.encode('utf-8'))
+
+    def get_page_content(self, page_id: str, page_info: PageInfo, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        self._take_a_while()
+        return super().get_page_content(page_id, page_info, schema)
+
+    def get_binary_page_content(self, page_id: str, callback_id: str) -> bytes:
+        self._take_a_while()
+        return super().get_binary_page_content(page_id, callback_id)
@@ -0,0 +1,109 @@
+import asyncio
+import pathlib
+import sys
+import tempfile
+import threading
+import unittest
+
+from onenote import AsyncOneNoteAPI
+from onenote.HierarchyScope import HierarchyScope
+from onenote.PublishFormat import PublishFormat
+from test_onenote_export.LatencyFakeOneNoteAPI import LatencyFakeOneNoteAPI
+from test_onenote_export.TestReplayOneNoteAPI import sample_notebooks_xml
+from tracing import ExportTracer, default_export_tracer
+
+
+class TestAsyncOneNoteAPI(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+        self.temp_dir = pathlib.Path(self._temp_dir.name)
+
+    def test_calls_are_traced_into_the_tracer_current_where_they_were_queued(self):
+        # Arrange
+        tracer = ExportTracer(enabled=True)
+
+        with AsyncOneNoteAPI(lambda: LatencyFakeOneNoteAPI()) as sut:
+            # Act
+            with tracer.activated():
+                while_activated = sut.submit(lambda _: ExportTracer.current()).result()
+            afterwards = sut.submit(lambda _: ExportTracer.current()).result()
+
+        # Assert
+        self.assertIs(while_activated, tracer)
+        self.assertIs(afterwards, default_export_tracer)
+
+    def test_calls_are_made_in_turn_on_the_thread_that_created_the_api(self):
+        # Arrange
+        onenote_api = LatencyFakeOneNoteAPI(latency_seconds=0.01, hierarchy_xml={'': sample_notebooks_xml})
+        creating_threads = []
+
+        def create_onenote_api():
+            creating_threads.append(threading.current_thread())
+            return onenote_api
+
+        async def make_calls(sut: AsyncOneNoteAPI):
+            return await asyncio.gather(
+                *(sut.get_hierarchy('', HierarchyScope.Children) for _ in range(4)),
+                *(sut.publish(f'{{P{i}}}', self.temp_dir / f'{i}.pdf', PublishFormat.pfPDF) for i in range(4)),
+            )
+
+        # Act
+        with AsyncOneNoteAPI(create_onenote_api) as sut:
+            actual = asyncio.run(make_calls(sut))
+
+        # Assert
+        self.assertEqual([element[0].attrib['ID'] for element in actual[:4]], ['{NB}'] * 4)
+        self.assertEqual(onenote_api.max_in_flight, 1)
+        self.assertEqual(len(creating_threads), 1)
+        self.assertEqual(set(onenote_api.call_threads), set(creating_threads))
+        self.assertIsNot(creating_threads[0], threading.current_thread())
+        self.assertEqual([call[1] for call in onenote_api.calls if call[0] == 'publish'], ['{P0}', '{P1}', '{P2}', '{P3}'])
+
+    def test_event_loop_runs_subprocesses_while_a_call_waits(self):
+        # Arrange
+        subprocess_finished = threading.Event()
+        call_saw_subprocess_finish = []
+        onenote_api = LatencyFakeOneNoteAPI(wait_in_call=lambda: call_saw_subprocess_finish.append(subprocess_finished.wait(timeout=30)))
+
+        async def run_subprocess():
+            process = await asyncio.create_subprocess_exec(sys.executable, '-c', 'pass')
+            await process.wait()
+            subprocess_finished.set()
+
+        async def publish_and_run_subprocess(sut: AsyncOneNoteAPI):
+            await asyncio.gather(sut.publish('{P}', self.temp_dir / 'page.pdf', PublishFormat.pfPDF), run_subprocess())
+
+        # Act
+        with AsyncOneNoteAPI(lambda: onenote_api) as sut:
+            asyncio.run(publish_and_run_subprocess(sut))
+
+        # Assert
+        self.assertEqual(call_saw_subprocess_finish, [True])
+
+    def test_call_errors_are_raised_to_the_awaiter(self):
+        # Arrange
+        onenote_api = LatencyFakeOneNoteAPI(hierarchy_xml={})
+
+        # Act & Assert
+        with AsyncOneNoteAPI(lambda: onenote_api) as sut:
+            with self.assertRaises(KeyError):
+                asyncio.run(sut.get_hierarchy('{missing}', HierarchyScope.Children))
+
+    def test_closing_finishes_queued_calls_and_then_rejects_more(self):
+        # Arrange
+        onenote_api = LatencyFakeOneNoteAPI(latency_seconds=0.01)
+        sut = AsyncOneNoteAPI(lambda: onenote_api)
+        queued = [sut.submit(lambda api, i=i: api.publish(f'{{P{i}}}', self.temp_dir / f'{i}.pdf', PublishFormat.pfPDF)) for i in range(3)]
+
+        # Act
+        sut.close()
+
+        # Assert
+        self.assertTrue(all(future.done() and future.exception() is None for future in queued))
+        with self.assertRaises(RuntimeError):
+            sut.submit(lambda api: None)
+
+
+if __name__ == '__main__':
+    unittest.main()
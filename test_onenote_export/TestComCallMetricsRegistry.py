@@ -0,0 +1,66 @@
+import unittest
+
+from onenote.ComCallMetricsRegistry import ComCallMetricsRegistry
+
+
+class TestComCallMetricsRegistry(unittest.TestCase):
+    def test_snapshot_summarizes_recorded_calls(self):
+        # Arrange
+        sut = ComCallMetricsRegistry()
+        for latency_ms in range(1, 101):
+            sut.record_attempt('GetPageContent', latency_ms / 1000)
+            sut.record_call('GetPageContent', succeeded=True)
+        sut.record_attempt('Publish', 2.0)
+        sut.record_backoff('Publish', 0.5)
+        sut.record_attempt('Publish', 1.0)
+        sut.record_call('Publish', succeeded=False)
+
+        # Act
+        actual = sut.snapshot()
+
+        # Assert
+        self.assertEqual(tuple(actual.keys()), ('GetPageContent', 'Publish'))
+        get_page_content = actual['GetPageContent']
+        self.assertEqual(get_page_content.call_count, 100)
+        self.assertEqual(get_page_content.attempt_count, 100)
+        self.assertEqual(get_page_content.retry_count, 0)
+        self.assertGreaterEqual(get_page_content.p50_latency_seconds, 0.050)
+        self.assertLess(get_page_content.p50_latency_seconds, 0.050 * 1.13)
+        self.assertGreaterEqual(get_page_content.p95_latency_seconds, 0.095)
+        self.assertLess(get_page_content.p95_latency_seconds, 0.095 * 1.13)
+        self.assertGreaterEqual(get_page_content.p99_latency_seconds, 0.099)
+        self.assertLessEqual(get_page_content.p99_latency_seconds, 0.100)
+        self.assertAlmostEqual(get_page_content.max_latency_seconds, 0.100)
+        self.assertAlmostEqual(get_page_content.total_latency_seconds, 5.05)
+        publish = actual['Publish']
+        self.assertEqual((publish.call_count, publish.failure_count, publish.attempt_count, publish.retry_count), (1, 1, 2, 1))
+        self.assertAlmostEqual(publish.total_backoff_seconds, 0.5)
+
+    def test_percentiles_stay_within_a_bucket_of_the_recorded_latencies(self):
+        # Arrange
+        sut = ComCallMetricsRegistry()
+        for latency_ms in range(1, 10001):
+            sut.record_attempt('GetHierarchy', (latency_ms % 100 + 1) / 1000)
+        sut.record_attempt('GetHierarchy', 5000.0)
+
+        # Act
+        actual = sut.snapshot()['GetHierarchy']
+
+        # Assert
+        self.assertEqual(actual.attempt_count, 10001)
+        self.assertGreaterEqual(actual.p50_latency_seconds, 0.050)
+        self.assertLess(actual.p50_latency_seconds, 0.050 * 1.13)
+        self.assertLessEqual(actual.p99_latency_seconds, 0.100 * 1.13)
+        self.assertEqual(actual.max_latency_seconds, 5000.0)
+
+    def test_reset_clears_recorded_calls(self):
+        # Arrange
+        sut = ComCallMetricsRegistry()
+        sut.record_attempt('Publish', 1.0)
+        sut.record_call('Publish', succeeded=True)
+
+        # Act
+        sut.reset()
+
+        # Assert
+        self.assertEqual(sut.snapshot(), {})
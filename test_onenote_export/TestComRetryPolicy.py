@@ -0,0 +1,121 @@
+import random
+import unittest
+
+from onenote.ComCallMetricsRegistry import ComCallMetricsRegistry
+from onenote.ComCircuitBreaker import ComCircuitBreaker
+from onenote.ComRetryPolicy import ComRetryPolicy
+from test_onenote_export.FakeMonotonicClock import FakeMonotonicClock
+
+
+rpc_server_too_busy = -2147023175
+access_denied = -2147024891
+
+
+class FakeComError(Exception):
+    def __init__(self, hresult: int):
+        super().__init__(hresult, 'COM error', None, None)
+        self.hresult = hresult
+
+
+def create_com_error(hresult: int) -> FakeComError:
+    return FakeComError(hresult)
+
+
+def create_failing_invocation(clock: FakeMonotonicClock, failures: list[Exception], result: str = 'result', latency_seconds: float = 0.01):
+    calls = []
+
+    def invoke():
+        calls.append(clock.now)
+        clock.advance(latency_seconds)
+        if failures:
+            raise failures.pop(0)
+        return result
+
+    return invoke, calls
+
+
+class TestComRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeMonotonicClock()
+        self.metrics = ComCallMetricsRegistry()
+
+    def _create_sut(self, **kwargs) -> ComRetryPolicy:
+        kwargs.setdefault('jitter_ratio', 0.0)
+        return ComRetryPolicy(clock=self.clock, metrics=self.metrics, com_error_types=(FakeComError,), **kwargs)
+
+    def test_execute_retries_transient_errors_with_exponential_backoff(self):
+        # Arrange
+        sut = self._create_sut(initial_backoff_seconds=0.05, backoff_multiplier=2.0)
+        invoke, calls = create_failing_invocation(self.clock, [create_com_error(rpc_server_too_busy)] * 3)
+
+        # Act
+        with self.assertLogs('onenote', level='WARNING'):
+            actual = sut.execute('GetPageContent', invoke)
+
+        # Assert
+        self.assertEqual(actual, 'result')
+        self.assertEqual(len(calls), 4)
+        for actual_sleep, expected_sleep in zip(self.clock.sleeps, [0.05, 0.1, 0.2]):
+            self.assertAlmostEqual(actual_sleep, expected_sleep)
+        metrics = self.metrics.snapshot()['GetPageContent']
+        self.assertEqual((metrics.call_count, metrics.failure_count, metrics.attempt_count, metrics.retry_count), (1, 0, 4, 3))
+
+    def test_execute_raises_non_retryable_errors_immediately(self):
+        # Arrange
+        sut = self._create_sut()
+        error = create_com_error(access_denied)
+        invoke, calls = create_failing_invocation(self.clock, [error])
+
+        # Act & Assert
+        with self.assertRaises(FakeComError) as raised:
+            sut.execute('Publish', invoke)
+        self.assertIs(raised.exception, error)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_execute_gives_up_when_attempts_or_budget_run_out(self):
+        cases = [
+            ('max_attempts', {'max_attempts': 3, 'max_total_seconds': 1000.0}, 3),
+            ('max_total_seconds', {'max_attempts': 100, 'max_backoff_seconds': 1.0, 'max_total_seconds': 2.5}, 4),
+        ]
+        for name, policy_kwargs, expected_attempts in cases:
+            with self.subTest(name=name):
+                # Arrange
+                self.clock = FakeMonotonicClock()
+                sut = self._create_sut(initial_backoff_seconds=0.25, **policy_kwargs)
+                invoke, calls = create_failing_invocation(self.clock, [create_com_error(rpc_server_too_busy)] * 1000)
+
+                # Act & Assert
+                with self.assertRaises(RuntimeError), self.assertLogs('onenote', level='WARNING'):
+                    sut.execute('GetHierarchy', invoke)
+                self.assertEqual(len(calls), expected_attempts)
+                self.assertLessEqual(self.clock.now, policy_kwargs['max_total_seconds'])
+
+    def test_calculate_backoff_applies_jitter_within_ratio(self):
+        # Arrange
+        sut = self._create_sut(initial_backoff_seconds=1.0, jitter_ratio=0.5, rng=random.Random(42))
+
+        # Act
+        actual = [sut.calculate_backoff(1) for _ in range(100)]
+
+        # Assert
+        self.assertTrue(all(0.5 <= backoff <= 1.0 for backoff in actual))
+        self.assertGreater(len(set(actual)), 1)
+
+    def test_circuit_breaker_pauses_calls_once_tripped(self):
+        # Arrange
+        circuit_breaker = ComCircuitBreaker(failure_threshold=2, open_seconds=10.0)
+        sut = self._create_sut(initial_backoff_seconds=0.05, circuit_breaker=circuit_breaker)
+        invoke, calls = create_failing_invocation(self.clock, [create_com_error(rpc_server_too_busy)] * 2, latency_seconds=0.0)
+
+        # Act
+        with self.assertLogs('onenote', level='WARNING') as logs:
+            actual = sut.execute('GetHierarchy', invoke)
+
+        # Assert
+        self.assertEqual(actual, 'result')
+        self.assertEqual(len(calls), 3)
+        # The second failure trips the breaker, so the third attempt waits out the pause rather than just the backoff.
+        self.assertGreaterEqual(calls[2] - calls[1], 10.0)
+        self.assertFalse(circuit_breaker.is_open(self.clock))
+        self.assertTrue(any('pausing all COM calls' in line for line in logs.output))
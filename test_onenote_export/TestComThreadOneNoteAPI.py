@@ -0,0 +1,40 @@
+import concurrent.futures
+import threading
+import unittest
+
+from onenote import AsyncOneNoteAPI, ComThreadOneNoteAPI
+from onenote.HierarchyScope import HierarchyScope
+from test_onenote_export.LatencyFakeOneNoteAPI import LatencyFakeOneNoteAPI
+from test_onenote_export.TestReplayOneNoteAPI import sample_notebooks_xml
+
+
+class TestComThreadOneNoteAPI(unittest.TestCase):
+    def test_calls_from_any_thread_are_made_on_the_com_thread(self):
+        # Arrange
+        onenote_api = LatencyFakeOneNoteAPI(latency_seconds=0.01, hierarchy_xml={'': sample_notebooks_xml})
+
+        with AsyncOneNoteAPI(lambda: onenote_api) as async_onenote_api:
+            sut = ComThreadOneNoteAPI(async_onenote_api)
+
+            # Act
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+                actual = list(pool.map(lambda _: sut.get_hierarchy('', HierarchyScope.Children), range(8)))
+
+        # Assert
+        self.assertEqual([element[0].attrib['ID'] for element in actual], ['{NB}'] * 8)
+        self.assertEqual(onenote_api.max_in_flight, 1)
+        com_thread, = set(onenote_api.call_threads)
+        self.assertIsNot(com_thread, threading.current_thread())
+
+    def test_call_errors_are_raised_to_the_caller(self):
+        # Arrange
+        with AsyncOneNoteAPI(lambda: LatencyFakeOneNoteAPI(hierarchy_xml={})) as async_onenote_api:
+            sut = ComThreadOneNoteAPI(async_onenote_api)
+
+            # Act & Assert
+            with self.assertRaises(KeyError):
+                sut.get_hierarchy('{missing}', HierarchyScope.Children)
+
+
+if __name__ == '__main__':
+    unittest.main()
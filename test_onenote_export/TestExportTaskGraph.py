@@ -0,0 +1,136 @@
+import threading
+import time
+import unittest
+
+from onenote_export.ExportTaskGraph import ExportTaskGraph
+from onenote_export.OneNoteExportTaskLiteral import OneNoteExportTaskLiteral
+from tracing import ExportTracer
+
+
+class TestExportTaskGraph(unittest.TestCase):
+    def setUp(self):
+        self.ran = []
+        self.threads = {}
+
+    def _task(self, description: str, seconds: float = 0.0, wait_for: threading.Barrier = None, prerequisites=()) -> OneNoteExportTaskLiteral:
+        def execute():
+            if wait_for is not None:
+                wait_for.wait(timeout=10)
+            time.sleep(seconds)
+            self.ran.append(description)
+            self.threads[description] = threading.current_thread()
+        return OneNoteExportTaskLiteral(execute, description, prerequisites)
+
+    def test_tasks_run_after_their_prerequisites(self):
+        # Arrange
+        sut = ExportTaskGraph()
+        a, b, c, d = (self._task(name) for name in 'abcd')
+        sut.add(d, (b, c))
+        sut.add(b, (a,))
+        sut.add(c, (a,))
+
+        # Act
+        sut.execute()
+
+        # Assert
+        self.assertEqual(self.ran, ['a', 'b', 'c', 'd'])
+        self.assertEqual(set(self.threads.values()), {threading.current_thread()})
+
+    def test_from_tasks_follows_the_prerequisites_tasks_were_created_with(self):
+        # Arrange
+        a = self._task('a')
+        b = self._task('b', prerequisites=(a,))
+        c = self._task('c', prerequisites=(a, b))
+
+        # Act
+        sut = ExportTaskGraph.from_tasks((c,))
+
+        # Assert
+        self.assertEqual(sut.topological_order(), (a, b, c))
+        self.assertEqual(sut.prerequisites_of(c), (a, b))
+
+    def test_cycles_are_reported_without_running_any_task(self):
+        # Arrange
+        tracer = ExportTracer(enabled=True)
+        sut = ExportTaskGraph()
+        a, b, c = (self._task(name) for name in 'abc')
+        sut.add(b, (a,))
+        sut.add(c, (b,))
+        sut.add_edge(c, a)
+
+        # Act
+        with self.assertRaises(ValueError) as raised:
+            sut.execute(tracer=tracer, trace_args={'node_id': '{P}'})
+
+        # Assert
+        self.assertEqual(self.ran, [])
+        self.assertEqual(len(sut.find_cycle()), 4)
+        self.assertIn('→', str(raised.exception))
+        mark, = tracer.spans
+        self.assertEqual((mark.name, mark.args['node_id']), ('task_graph_cycle', '{P}'))
+        self.assertEqual(mark.duration_us, 0)
+
+    def test_ready_tasks_run_in_parallel(self):
+        # Arrange
+        both_running = threading.Barrier(2)
+        sut = ExportTaskGraph()
+        a, b = self._task('a', wait_for=both_running), self._task('b', wait_for=both_running)
+        sut.add(self._task('c'), (a, b))
+
+        # Act
+        sut.execute(max_workers=2)
+
+        # Assert
+        self.assertFalse(both_running.broken)
+        self.assertEqual(self.ran[-1], 'c')
+
+    def test_tasks_on_the_calling_thread_run_there_alongside_the_others(self):
+        # Arrange
+        both_running = threading.Barrier(2)
+        sut = ExportTaskGraph()
+        sut.add(self._task('com', wait_for=both_running), on_calling_thread=True)
+        sut.add(self._task('pandoc', wait_for=both_running))
+
+        # Act
+        sut.execute(max_workers=2)
+
+        # Assert
+        self.assertFalse(both_running.broken)
+        self.assertIs(self.threads['com'], threading.current_thread())
+        self.assertIsNot(self.threads['pandoc'], threading.current_thread())
+
+    def test_run_reports_the_critical_path(self):
+        # Arrange
+        tracer = ExportTracer(enabled=True)
+        sut = ExportTaskGraph()
+        a, slow, fast = self._task('a'), self._task('slow', seconds=0.2), self._task('fast')
+        last = sut.add(self._task('last'), (sut.add(slow, (a,)), sut.add(fast, (a,))))
+
+        # Act
+        actual = sut.execute(max_workers=2, tracer=tracer)
+
+        # Assert
+        self.assertEqual(actual.critical_path, (a, slow, last))
+        self.assertGreaterEqual(actual.critical_path_seconds, 0.2)
+        self.assertIn('a (', str(actual))
+        mark, = [span for span in tracer.spans if span.name == 'critical_path']
+        self.assertEqual(mark.args['tasks'], 'a → slow → last')
+
+    def test_failures_stop_later_tasks_and_are_raised(self):
+        # Arrange
+        def fail():
+            raise KeyError('page')
+        sut = ExportTaskGraph()
+        failing = sut.add(OneNoteExportTaskLiteral(fail, 'failing'))
+        sut.add(self._task('after'), (failing,))
+
+        for max_workers in (1, 2):
+            with self.subTest(max_workers=max_workers):
+                # Act & Assert
+                with self.assertRaises(KeyError):
+                    sut.execute(max_workers=max_workers)
+                self.assertEqual(self.ran, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from onenote import OneNoteApplication, OneNoteHierarchySnapshot, HierarchySnapshotOneNoteAPI, AsyncOneNoteAPI, ComThreadOneNoteAPI
+from onenote.OneNoteAPI import OneNoteAPI
+from onenote.HierarchyScope import HierarchyScope
+from test_onenote_export.FakeOneNoteAPI import FakeOneNoteAPI
+
+
+namespace = 'xmlns:one="http://schemas.microsoft.com/office/onenote/2013/onenote"'
+notebook_id = '{NB}'
+
+
+def create_hierarchy_xml(notebook_modified: str, section_a_modified: str, section_b_modified: str, section_a_page_name: str = 'Page A1') -> dict[str, str]:
+    return {
+        '': f'''<one:Notebooks {namespace}>
+            <one:Notebook name="Notebook" nickname="Notebook" ID="{notebook_id}" path="x" lastModifiedTime="{notebook_modified}" color="#000000"/>
+        </one:Notebooks>''',
+        notebook_id: f'''<one:Notebook {namespace} name="Notebook" nickname="Notebook" ID="{notebook_id}" path="x" lastModifiedTime="{notebook_modified}" color="#000000">
+            <one:Section name="Section A" ID="{{SA}}" path="x" lastModifiedTime="{section_a_modified}" color="#000000"/>
+            <one:SectionGroup name="Group" ID="{{SG}}" path="x" lastModifiedTime="{section_b_modified}">
+                <one:Section name="Section B" ID="{{SB}}" path="x" lastModifiedTime="{section_b_modified}" color="#000000"/>
+            </one:SectionGroup>
+        </one:Notebook>''',
+        '{SA}': f'''<one:Section {namespace} name="Section A" ID="{{SA}}" path="x" lastModifiedTime="{section_a_modified}" color="#000000">
+            <one:Page ID="{{PA1}}" name="{section_a_page_name}" dateTime="2023-01-01T00:00:00.000Z" lastModifiedTime="{section_a_modified}" pageLevel="1"/>
+        </one:Section>''',
+        '{SB}': f'''<one:Section {namespace} name="Section B" ID="{{SB}}" path="x" lastModifiedTime="{section_b_modified}" color="#000000">
+            <one:Page ID="{{PB1}}" name="Page B1" dateTime="2023-01-01T00:00:00.000Z" lastModifiedTime="{section_b_modified}" pageLevel="1"/>
+            <one:Page ID="{{PB2}}" name="Page B2" dateTime="2023-01-01T00:00:00.000Z" lastModifiedTime="{section_b_modified}" pageLevel="1"/>
+        </one:Section>''',
+    }
+
+
+def walk_page_routes(onenote_api: HierarchySnapshotOneNoteAPI) -> list[tuple[str, ...]]:
+    def walk(node):
+        if not node.children:
+            yield node.route
+        for child in node.children:
+            yield from walk(child)
+
+    return [route for notebook in OneNoteApplication(onenote_api).children for route in walk(notebook)]
+
+
+class TestHierarchySnapshotOneNoteAPI(unittest.TestCase):
+    def setUp(self):
+        self._snapshot_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._snapshot_dir.cleanup)
+
+    def _walk(self, hierarchy_xml: dict[str, str]) -> tuple[list[tuple[str, ...]], list[tuple]]:
+        onenote_api = FakeOneNoteAPI(hierarchy_xml=hierarchy_xml)
+        sut = HierarchySnapshotOneNoteAPI(onenote_api, OneNoteHierarchySnapshot(self._snapshot_dir.name))
+        return walk_page_routes(sut), onenote_api.calls
+
+    def test_wrapping_the_com_thread_api_dispatches_to_onenote_once(self):
+        # Arrange
+        with patch.object(OneNoteAPI, '_create_onenote_com_object') as create_onenote_com_object:
+            # Act
+            with AsyncOneNoteAPI() as async_onenote_api:
+                HierarchySnapshotOneNoteAPI(ComThreadOneNoteAPI(async_onenote_api), OneNoteHierarchySnapshot(self._snapshot_dir.name))
+
+        # Assert
+        self.assertEqual(create_onenote_com_object.call_count, 1)
+
+    def test_first_walk_fetches_each_section_once(self):
+        # Arrange
+        hierarchy_xml = create_hierarchy_xml('2023-01-02T00:00:00.000Z', '2023-01-01T00:00:00.000Z', '2023-01-02T00:00:00.000Z')
+
+        # Act
+        actual_routes, actual_calls = self._walk(hierarchy_xml)
+
+        # Assert
+        self.assertEqual(actual_routes, [
+            ('Notebook', 'Section A', 'Page A1'),
+            ('Notebook', 'Group', 'Section B', 'Page B1'),
+            ('Notebook', 'Group', 'Section B', 'Page B2'),
+        ])
+        self.assertEqual(actual_calls, [
+            ('get_hierarchy', '', HierarchyScope.Children),
+            ('get_hierarchy', notebook_id, HierarchyScope.Sections),
+            ('get_hierarchy', '{SA}', HierarchyScope.Pages),
+            ('get_hierarchy', '{SB}', HierarchyScope.Pages),
+        ])
+
+    def test_walk_of_unchanged_notebook_only_fetches_notebooks(self):
+        # Arrange
+        hierarchy_xml = create_hierarchy_xml('2023-01-02T00:00:00.000Z', '2023-01-01T00:00:00.000Z', '2023-01-02T00:00:00.000Z')
+        expected_routes, _ = self._walk(hierarchy_xml)
+
+        # Act
+        actual_routes, actual_calls = self._walk(hierarchy_xml)
+
+        # Assert
+        self.assertEqual(actual_routes, expected_routes)
+        self.assertEqual(actual_calls, [('get_hierarchy', '', HierarchyScope.Children)])
+
+    def test_walk_of_changed_notebook_only_fetches_changed_sections(self):
+        # Arrange
+        self._walk(create_hierarchy_xml('2023-01-02T00:00:00.000Z', '2023-01-01T00:00:00.000Z', '2023-01-02T00:00:00.000Z'))
+        changed_hierarchy_xml = create_hierarchy_xml('2023-01-03T00:00:00.000Z', '2023-01-03T00:00:00.000Z', '2023-01-02T00:00:00.000Z', section_a_page_name='Page A1 Renamed')
+
+        # Act
+        actual_routes, actual_calls = self._walk(changed_hierarchy_xml)
+
+        # Assert
+        self.assertEqual(actual_routes, [
+            ('Notebook', 'Section A', 'Page A1 Renamed'),
+            ('Notebook', 'Group', 'Section B', 'Page B1'),
+            ('Notebook', 'Group', 'Section B', 'Page B2'),
+        ])
+        self.assertEqual(actual_calls, [
+            ('get_hierarchy', '', HierarchyScope.Children),
+            ('get_hierarchy', notebook_id, HierarchyScope.Sections),
+            ('get_hierarchy', '{SA}', HierarchyScope.Pages),
+        ])
@@ -0,0 +1,81 @@
+import io
+import logging
+import pathlib
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from onenote import OneNotePage, OneNoteSection
+from onenote_export.logging_helper import get_logger, export_logging
+
+
+class TestLoggingHelper(unittest.TestCase):
+    def test_get_logger_attaches_node_context_without_adding_handlers(self):
+        # Arrange
+        page = self._create_page(section_index=2, page_index=5)
+
+        # Act
+        with self.assertLogs('test_logging_helper.module', level=logging.INFO) as captured:
+            subject = get_logger(module_name='test_logging_helper.module', onenote_node=page)
+            subject.info('Exported.')
+
+        # Assert
+        self.assertEqual(captured.records[0].onenote_node, 'Section[2].Page[5]')
+        self.assertEqual(subject.logger.name, 'test_logging_helper.module')
+        self.assertEqual(subject.logger.handlers, [])
+
+    def test_get_logger_shares_one_logger_across_nodes(self):
+        # Arrange
+        pages = [self._create_page(section_index=0, page_index=i) for i in range(500)]
+
+        # Act
+        actual = {get_logger(module_name='test_logging_helper.module', onenote_node=page).logger for page in pages}
+
+        # Assert
+        self.assertEqual(len(actual), 1)
+
+    def test_export_logging_formats_and_writes_on_a_background_thread(self):
+        # Arrange
+        page = self._create_page(section_index=1, page_index=3)
+        console_stream = io.StringIO()
+        formatting_thread_names = []
+
+        class ThreadRecordingFilter(logging.Filter):
+            def filter(self, record):
+                formatting_thread_names.append(threading.current_thread().name)
+                return True
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = pathlib.Path(temp_dir) / 'export.log'
+
+            # Act
+            with export_logging(level=logging.INFO, log_file=str(log_file), log_file_level=logging.WARNING, console_stream=console_stream) as listener:
+                for handler in listener.handlers:
+                    handler.addFilter(ThreadRecordingFilter())
+                subject = get_logger(module_name='test_logging_helper.module', onenote_node=page)
+                subject.info('Exported page.')
+                subject.warning('Still has broken images.')
+            log_file_lines = log_file.read_text(encoding='utf-8').splitlines()
+
+        # Assert
+        console_lines = console_stream.getvalue().splitlines()
+        self.assertEqual(len(console_lines), 2)
+        self.assertIn('ℹ️INFO     test_logging_helper.module Section[1].Page[3] Exported page.', console_lines[0])
+        self.assertEqual(len(log_file_lines), 1)
+        self.assertIn('⚠️WARNING  test_logging_helper.module Section[1].Page[3] Still has broken images.', log_file_lines[0])
+        self.assertNotIn(threading.current_thread().name, formatting_thread_names)
+
+    @staticmethod
+    def _create_page(section_index: int, page_index: int) -> OneNotePage:
+        section = MagicMock(spec=OneNoteSection)
+        section.index = section_index
+        section.parent = None
+        page = MagicMock(spec=OneNotePage)
+        page.index = page_index
+        page.parent = section
+        return page
+
+
+if __name__ == '__main__':
+    unittest.main()
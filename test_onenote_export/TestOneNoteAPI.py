@@ -0,0 +1,93 @@
+import base64
+import pathlib
+import tempfile
+import unittest
+from typing import Any
+from unittest.mock import MagicMock
+from xml.etree import ElementTree
+
+from onenote import OneNoteApplication, OneNoteApiRecording, OneNotePage, OneNoteSection
+from onenote.HierarchyScope import HierarchyScope
+from onenote.OneNoteAPI import OneNoteAPI
+from onenote.PageInfo import PageInfo
+from onenote.PublishFormat import PublishFormat
+from onenote.ReplayOneNoteAPI import \
+    create_get_hierarchy_request_key, \
+    create_publish_request_key, \
+    create_get_page_content_request_key, \
+    create_get_binary_page_content_request_key
+from onenote.XMLSchema import XMLSchema
+from onenote_export.OneNoteExporter import create_default_onenote_exporter
+from onenote_synthetic import SyntheticNotebookGenerator, SyntheticNotebookSettings
+from path_scrubbing import PathComponentScrubber
+
+
+class RecordedOneNoteComApplication:
+    """
+    Stands in for OneNote's COM application object, serving the calls OneNoteAPI makes from a recording.
+    """
+
+    def __init__(self, recording: OneNoteApiRecording):
+        self._recording = recording
+
+    def GetHierarchy(self, node_id: str, hierarchy_scope: int, schema: int) -> str:
+        return self._recording.read(create_get_hierarchy_request_key(node_id, HierarchyScope(hierarchy_scope), XMLSchema(schema))).decode('utf-8')
+
+    def Publish(self, hierarchy_id: str, target_file_path: str, publish_format: int, clsid_of_exporter: str):
+        pathlib.Path(target_file_path).write_bytes(self._recording.read(create_publish_request_key(hierarchy_id, PublishFormat(publish_format))))
+
+    def GetPageContent(self, page_id: str, page_info: int, schema: int) -> str:
+        return self._recording.read(create_get_page_content_request_key(page_id, PageInfo(page_info), XMLSchema(schema))).decode('utf-8')
+
+    def GetBinaryPageContent(self, page_id: str, callback_id: str) -> str:
+        return base64.b64encode(self._recording.read(create_get_binary_page_content_request_key(page_id, callback_id))).decode('ascii')
+
+
+class DispatchCountingOneNoteAPI(OneNoteAPI):
+    dispatch_count = 0
+
+    def __init__(self, recording: OneNoteApiRecording):
+        self._recording = recording
+        super().__init__()
+
+    def _create_onenote_com_object(self) -> Any:
+        DispatchCountingOneNoteAPI.dispatch_count += 1
+        return RecordedOneNoteComApplication(self._recording)
+
+
+class TestOneNoteAPI(unittest.TestCase):
+    def setUp(self):
+        DispatchCountingOneNoteAPI.dispatch_count = 0
+
+    def test_export_binds_to_onenote_once(self):
+        # Arrange
+        settings = SyntheticNotebookSettings(sections_per_notebook=2, pages_per_section=2, subpages_per_page=1, paragraphs_per_page=2)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = pathlib.Path(temp_dir)
+            recording = OneNoteApiRecording(temp_dir / 'recording')
+            SyntheticNotebookGenerator(settings).generate_into(recording)
+            exporter = create_default_onenote_exporter(temp_dir / 'output', 'assets', PathComponentScrubber())
+
+            # Act
+            exporter.execute_export(OneNoteApplication(DispatchCountingOneNoteAPI(recording)))
+
+            # Assert
+            self.assertEqual(DispatchCountingOneNoteAPI.dispatch_count, 1)
+            self.assertGreater(len(list((temp_dir / 'output').rglob('*.md'))), 0)
+
+    def test_nodes_cannot_be_created_without_an_onenote_api(self):
+        # Arrange
+        page_element = ElementTree.fromstring('<Page ID="{P}" name="Page"/>')
+
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            OneNoteApplication()
+        with self.assertRaises(TypeError):
+            OneNoteApplication(None)
+        with self.assertRaises(TypeError):
+            OneNotePage(page_element, MagicMock(spec=OneNoteSection), 0, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
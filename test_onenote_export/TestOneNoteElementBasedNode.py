@@ -0,0 +1,94 @@
+import datetime
+import gc
+import unittest
+import weakref
+
+from onenote import OneNoteApplication, OneNotePage, OneNoteSection
+from test_onenote_export.FakeOneNoteAPI import FakeOneNoteAPI
+
+
+sample_hierarchy_xml = {
+    '': '<one:Notebooks xmlns:one="http://schemas.microsoft.com/office/onenote/2013/onenote">'
+        '<one:Notebook name="Recipes" nickname="Recipes" ID="{NB}" path="https://example.com/Recipes" lastModifiedTime="2023-04-01T12:00:00.000Z" color="#ADE792"/>'
+        '</one:Notebooks>',
+    '{NB}': '<one:Notebook xmlns:one="http://schemas.microsoft.com/office/onenote/2013/onenote">'
+            '<one:Section name="Cakes" ID="{S}" path="https://example.com/Recipes/Cakes.one" lastModifiedTime="2023-04-01T12:00:00.000Z" readOnly="true"/>'
+            '</one:Notebook>',
+    '{S}': '<one:Section xmlns:one="http://schemas.microsoft.com/office/onenote/2013/onenote">'
+           '<one:Page ID="{P1}" name="Apple Cake" dateTime="2023-03-01T08:00:00.000Z" lastModifiedTime="2023-04-01T12:00:00.000Z" pageLevel="1"/>'
+           '<one:Page ID="{P2}" name="Icing" dateTime="2023-03-02T08:00:00.000Z" lastModifiedTime="2023-04-01T12:00:00.000Z" pageLevel="2" isSubPage="true"/>'
+           '</one:Section>',
+}
+
+
+class TestOneNoteElementBasedNode(unittest.TestCase):
+    def test_nodes_copy_their_attributes_from_the_hierarchy_xml(self):
+        # Arrange
+        sut = OneNoteApplication(FakeOneNoteAPI(hierarchy_xml=sample_hierarchy_xml))
+
+        # Act
+        notebook, = sut.children
+        section, = notebook.children
+        page, = section.children
+        subpage = section.all_pages[1]
+
+        # Assert
+        self.assertEqual((notebook.node_id, notebook.name, notebook.color), ('{NB}', 'Recipes', '#ADE792'))
+        self.assertIsInstance(section, OneNoteSection)
+        self.assertTrue(section.is_readonly)
+        self.assertFalse(section.is_locked)
+        self.assertIsInstance(page, OneNotePage)
+        self.assertEqual(page.route, ('Recipes', 'Cakes', 'Apple Cake'))
+        self.assertEqual(page.created_at, datetime.datetime(2023, 3, 1, 8, tzinfo=datetime.timezone.utc))
+        self.assertFalse(page.is_subpage)
+        self.assertTrue(subpage.is_subpage)
+        self.assertFalse(hasattr(page, '__dict__'))
+
+    def test_children_are_read_once(self):
+        # Arrange
+        onenote_api = FakeOneNoteAPI(hierarchy_xml=sample_hierarchy_xml)
+        sut = OneNoteApplication(onenote_api)
+
+        # Act
+        first = sut.children
+        second = sut.children
+
+        # Assert
+        self.assertIs(second, first)
+        self.assertEqual(len([call for call in onenote_api.calls if call[0] == 'get_hierarchy']), 1)
+
+    def test_section_pages_are_read_once_and_shared_with_its_children(self):
+        # Arrange
+        onenote_api = FakeOneNoteAPI(hierarchy_xml=sample_hierarchy_xml)
+        notebook, = OneNoteApplication(onenote_api).children
+        section, = notebook.children
+
+        # Act
+        first = section.all_pages
+        second = section.all_pages
+        page, = section.children
+
+        # Assert
+        self.assertIs(second, first)
+        self.assertIs(page, first[0])
+        self.assertEqual([call[1] for call in onenote_api.calls if call[0] == 'get_hierarchy'], ['', '{NB}', '{S}'])
+
+    def test_dropped_nodes_are_not_kept_alive(self):
+        # Arrange
+        sut = OneNoteApplication(FakeOneNoteAPI(hierarchy_xml=sample_hierarchy_xml))
+        notebook, = sut.children
+        section, = notebook.children
+        page, = section.children
+        page.name, page.route, page.modified_at, section.children
+        page_ref = weakref.ref(page)
+
+        # Act
+        del sut, notebook, section, page
+        gc.collect()
+
+        # Assert
+        self.assertIsNone(page_ref())
+
+
+if __name__ == '__main__':
+    unittest.main()
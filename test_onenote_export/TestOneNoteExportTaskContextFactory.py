@@ -3,10 +3,10 @@ import pathlib
 import unittest
 from unittest.mock import MagicMock
 
-from onenote import OneNotePage
+from onenote import OneNotePage, OneNoteSection
 from onenote_export.OneNoteExportTaskContext import OneNoteExportTaskContext
 from onenote_export.OneNoteExportTaskContextFactory import OneNoteExportTaskContextFactory
-from path_scrubbing import PathComponentScrubber
+from path_scrubbing import PathComponentScrubber, OsPathsCharacterSupport
 
 
 class TestOneNoteExportTaskContextFactory(unittest.TestCase):
@@ -36,6 +36,30 @@ class TestOneNoteExportTaskContextFactory(unittest.TestCase):
         # Assert
         self.assertIsInstance(actual, OneNoteExportTaskContext)
 
+    def test_create_context_for_traversal_transition_to_child_keeps_sibling_page_outputs_distinct(self):
+        # Arrange
+        section = MagicMock(spec=OneNoteSection)
+        pages = []
+        for index, name in enumerate(('Plan 1/2', 'Plan 1∕2', 'plan 1∕2')):
+            page = MagicMock(spec=OneNotePage)
+            page.name, page.index, page.parent, page.children = name, index, section, ()
+            pages.append(page)
+        section.children = tuple(pages)
+        path_component_scrubber = PathComponentScrubber(os_paths_character_support=OsPathsCharacterSupport(is_windows=True, supports_unicode_filenames=True))
+        subject_instance = OneNoteExportTaskContextFactory(pathlib.Path('out'), pathlib.Path('assets'), path_component_scrubber, use_legacy_docx_export=False)
+        section_context = OneNoteExportTaskContext(section, pathlib.Path('out') / 'Section', pathlib.Path('assets'), pathlib.Path('Section'))
+
+        # Act
+        with self.assertLogs('onenote_export.OneNoteExportTaskContextFactory', level='WARNING'):
+            actual = [subject_instance.create_context_for_traversal_transition_to_child(section_context, page).output_md_path for page in pages]
+
+        # Assert
+        self.assertEqual(actual, [
+            pathlib.Path('out') / 'Section' / 'Plan 1∕2.md',
+            pathlib.Path('out') / 'Section' / 'Plan 1∕2 (2).md',
+            pathlib.Path('out') / 'Section' / 'plan 1∕2 (3).md',
+        ])
+
     def _create_traversal_antecedent_context_instance(self):
         return OneNoteExportTaskContext(
             None,  # node
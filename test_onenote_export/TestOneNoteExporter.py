@@ -1,6 +1,53 @@
+import pathlib
+import tempfile
+import threading
 import unittest
+from typing import Dict, Set
+from unittest.mock import MagicMock
 
+from onenote import OneNoteApplication, OneNoteApiRecording, ReplayOneNoteAPI
+from onenote.ComCallMetricsRegistry import ComCallMetricsRegistry
+from onenote.PageInfo import PageInfo
+from onenote.PublishFormat import PublishFormat
+from onenote.XMLSchema import XMLSchema
+from onenote_export.OneNoteExportTaskFactory import OneNoteExportTaskFactory
+from onenote_export.OneNoteExportTaskLiteral import OneNoteExportTaskLiteral
 from onenote_export.OneNoteExporter import OneNoteExporter, create_default_onenote_exporter
+from onenote_export.PageImageSource import PageImageSource
+from onenote_export.Pathlike import Pathlike
+from onenote_synthetic import SyntheticNotebookGenerator, SyntheticNotebookSettings
+from path_scrubbing import PathComponentScrubber
+from tracing import ExportTracer
+
+
+class PublishCountingReplayOneNoteAPI(ReplayOneNoteAPI):
+    def __init__(self, recording: OneNoteApiRecording):
+        super().__init__(recording)
+        self.publish_counts: Dict[PublishFormat, int] = {}
+        self.publish_threads: Set[threading.Thread] = set()
+
+    def publish(self, page_id: str, target_file_path: Pathlike, publish_format: PublishFormat, clsid_of_exporter: str = ""):
+        self.publish_counts[publish_format] = self.publish_counts.get(publish_format, 0) + 1
+        self.publish_threads.add(threading.current_thread())
+        super().publish(page_id, target_file_path, publish_format, clsid_of_exporter)
+
+
+class PageContentThreadAssertingReplayOneNoteAPI(ReplayOneNoteAPI):
+    def __init__(self, recording: OneNoteApiRecording, com_thread: threading.Thread):
+        super().__init__(recording)
+        self._com_thread = com_thread
+
+    def _assert_on_com_thread(self, method_name: str):
+        if threading.current_thread() is not self._com_thread:
+            raise AssertionError(f"{method_name} was called on {threading.current_thread().name}, not the COM thread")
+
+    def get_page_content(self, page_id: str, page_info: PageInfo, schema: XMLSchema = XMLSchema.xs2013):
+        self._assert_on_com_thread('get_page_content')
+        return super().get_page_content(page_id, page_info, schema)
+
+    def get_binary_page_content(self, page_id: str, callback_id: str) -> bytes:
+        self._assert_on_com_thread('get_binary_page_content')
+        return super().get_binary_page_content(page_id, callback_id)
 
 
 class TestOneNoteExporter(unittest.TestCase):
@@ -33,6 +80,181 @@ class TestOneNoteExporter(unittest.TestCase):
         # Assert
         self.assertIsInstance(actual, OneNoteExporter)
 
+    def test_com_call_metrics_are_logged_when_the_export_fails(self):
+        # Arrange
+        def fail_export():
+            raise RuntimeError("export failed")
+
+        task_factory = MagicMock(spec=OneNoteExportTaskFactory)
+        task_factory.create_default_for_node_type.side_effect = lambda node, prerequisites: OneNoteExportTaskLiteral(fail_export, prerequisites=prerequisites)
+        com_call_metrics = ComCallMetricsRegistry()
+        com_call_metrics.record_attempt('Publish', 1.0)
+        com_call_metrics.record_call('Publish', succeeded=False)
+        application = MagicMock(spec=OneNoteApplication)
+        application.children = ()
+        sut = OneNoteExporter(task_factory, com_call_metrics=com_call_metrics)
+
+        # Act
+        with self.assertLogs('onenote_export.OneNoteExporter', level='INFO') as logs, self.assertRaises(RuntimeError):
+            sut.execute_export(application)
+
+        # Assert
+        self.assertTrue(any('Publish: 1 calls (1 failed)' in message for message in logs.output))
+
+    def test_export_records_its_stages_and_pandoc_calls_into_its_tracer(self):
+        # Arrange
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = pathlib.Path(temp_dir)
+            recording = OneNoteApiRecording(temp_dir / 'recording')
+            SyntheticNotebookGenerator(SyntheticNotebookSettings(sections_per_notebook=1, pages_per_section=2, paragraphs_per_page=2)).generate_into(recording)
+            tracer = ExportTracer(enabled=True)
+            sut = create_default_onenote_exporter(temp_dir / 'output', 'assets', PathComponentScrubber(), tracer=tracer)
+
+            # Act
+            sut.execute_export(OneNoteApplication(ReplayOneNoteAPI(recording)))
+
+        # Assert
+        spans = tracer.spans
+        page_export_spans = [span for span in spans if span.name == 'page_export']
+        self.assertEqual([span.args['node_name'] for span in page_export_spans], ['Page 1-1-1', 'Page 1-1-2'])
+        for page_export_span in page_export_spans:
+            with self.subTest(page=page_export_span.args['node_name']):
+                stage_names = [span.name for span in spans if span.args.get('node_id') == page_export_span.args['node_id'] and span is not page_export_span]
+                self.assertIn('page_reparse_embedded_html', stage_names)
+                self.assertIn('page_export_pandoc_ast_to_markdown_file', stage_names)
+        self.assertEqual({span.name for span in spans if span.category == 'export' and not span.args}, {'scan', 'export'})
+        self.assertIn('pandoc', {span.category for span in spans})
+
+    def test_publishing_whole_sections_exports_the_same_files_with_one_publish_per_section(self):
+        # Arrange
+        settings = SyntheticNotebookSettings(sections_per_notebook=2, pages_per_section=3, images_per_page=2, tables_per_page=1, paragraphs_per_page=3)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = pathlib.Path(temp_dir)
+            recording = OneNoteApiRecording(temp_dir / 'recording')
+            SyntheticNotebookGenerator(settings).generate_into(recording)
+            expected_output_dir, actual_output_dir = temp_dir / 'per_page', temp_dir / 'per_section'
+            expected_onenote_api, actual_onenote_api = PublishCountingReplayOneNoteAPI(recording), PublishCountingReplayOneNoteAPI(recording)
+
+            # Act
+            create_default_onenote_exporter(expected_output_dir, 'assets', PathComponentScrubber())\
+                .execute_export(OneNoteApplication(expected_onenote_api))
+            create_default_onenote_exporter(actual_output_dir, 'assets', PathComponentScrubber(), publish_whole_sections=True)\
+                .execute_export(OneNoteApplication(actual_onenote_api))
+
+            # Assert
+            self.assertEqual(expected_onenote_api.publish_counts[PublishFormat.pfMHTML], settings.page_count)
+            self.assertEqual(actual_onenote_api.publish_counts[PublishFormat.pfMHTML], settings.sections_per_notebook)
+            expected_files = {p.relative_to(expected_output_dir): p.read_bytes() for p in expected_output_dir.rglob('*') if p.is_file()}
+            actual_files = {p.relative_to(actual_output_dir): p.read_bytes() for p in actual_output_dir.rglob('*') if p.is_file()}
+            self.assertEqual(len([p for p in expected_files if p.suffix == '.md']), settings.page_count)
+            self.assertEqual(actual_files.keys(), expected_files.keys())
+            for path, expected_bytes in expected_files.items():
+                with self.subTest(path=path):
+                    self.assertEqual(actual_files[path], expected_bytes)
+
+    def test_running_page_subtasks_in_parallel_exports_the_same_files_and_calls_onenote_from_one_thread(self):
+        # Arrange
+        settings = SyntheticNotebookSettings(sections_per_notebook=2, pages_per_section=3, images_per_page=2, tables_per_page=1, paragraphs_per_page=3)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = pathlib.Path(temp_dir)
+            recording = OneNoteApiRecording(temp_dir / 'recording')
+            SyntheticNotebookGenerator(settings).generate_into(recording)
+            expected_output_dir, actual_output_dir = temp_dir / 'sequential', temp_dir / 'parallel'
+            actual_onenote_api = PublishCountingReplayOneNoteAPI(recording)
+
+            # Act
+            create_default_onenote_exporter(expected_output_dir, 'assets', PathComponentScrubber())\
+                .execute_export(OneNoteApplication(ReplayOneNoteAPI(recording)))
+            create_default_onenote_exporter(actual_output_dir, 'assets', PathComponentScrubber(), page_subtask_max_workers=3)\
+                .execute_export(OneNoteApplication(actual_onenote_api))
+
+            # Assert
+            self.assertEqual(actual_onenote_api.publish_threads, {threading.current_thread()})
+            expected_files = {p.relative_to(expected_output_dir): p.read_bytes() for p in expected_output_dir.rglob('*') if p.is_file()}
+            actual_files = {p.relative_to(actual_output_dir): p.read_bytes() for p in actual_output_dir.rglob('*') if p.is_file()}
+            self.assertEqual(len([p for p in expected_files if p.suffix == '.md']), settings.page_count)
+            self.assertEqual(actual_files, expected_files)
+
+    def test_running_native_xml_page_subtasks_in_parallel_exports_the_same_files_and_reads_page_content_from_one_thread(self):
+        # Arrange
+        settings = SyntheticNotebookSettings(sections_per_notebook=2, pages_per_section=3, images_per_page=2, tables_per_page=1, paragraphs_per_page=3)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = pathlib.Path(temp_dir)
+            recording = OneNoteApiRecording(temp_dir / 'recording')
+            SyntheticNotebookGenerator(settings).generate_into(recording)
+            expected_output_dir, actual_output_dir = temp_dir / 'sequential', temp_dir / 'parallel'
+            exporter_kwargs = {'use_native_xml_export': True, 'page_image_source': PageImageSource.BINARY_PAGE_CONTENT}
+
+            # Act
+            create_default_onenote_exporter(expected_output_dir, 'assets', PathComponentScrubber(), **exporter_kwargs)\
+                .execute_export(OneNoteApplication(ReplayOneNoteAPI(recording)))
+            create_default_onenote_exporter(actual_output_dir, 'assets', PathComponentScrubber(), page_subtask_max_workers=3, **exporter_kwargs)\
+                .execute_export(OneNoteApplication(PageContentThreadAssertingReplayOneNoteAPI(recording, threading.current_thread())))
+
+            # Assert
+            expected_files = {p.relative_to(expected_output_dir): p.read_bytes() for p in expected_output_dir.rglob('*') if p.is_file()}
+            actual_files = {p.relative_to(actual_output_dir): p.read_bytes() for p in actual_output_dir.rglob('*') if p.is_file()}
+            self.assertEqual(len([p for p in expected_files if p.suffix == '.md']), settings.page_count)
+            self.assertEqual(actual_files, expected_files)
+
+    def test_native_xml_export_takes_images_from_page_content_without_publishing_pdfs(self):
+        # Arrange
+        settings = SyntheticNotebookSettings(sections_per_notebook=1, pages_per_section=2, images_per_page=2, tables_per_page=1, paragraphs_per_page=3)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = pathlib.Path(temp_dir)
+            recording = OneNoteApiRecording(temp_dir / 'recording')
+            SyntheticNotebookGenerator(settings).generate_into(recording)
+            expected_output_dir, actual_output_dir = temp_dir / 'binary_page_content', temp_dir / 'pdf'
+            actual_onenote_api = PublishCountingReplayOneNoteAPI(recording)
+
+            # Act
+            create_default_onenote_exporter(expected_output_dir, 'assets', PathComponentScrubber(), use_native_xml_export=True, page_image_source=PageImageSource.BINARY_PAGE_CONTENT)\
+                .execute_export(OneNoteApplication(ReplayOneNoteAPI(recording)))
+            with self.assertLogs('onenote_export.OneNoteExporter', level='WARNING'):
+                sut = create_default_onenote_exporter(actual_output_dir, 'assets', PathComponentScrubber(), use_native_xml_export=True, page_image_source=PageImageSource.PDF)
+            sut.execute_export(OneNoteApplication(actual_onenote_api))
+
+            # Assert
+            self.assertEqual(actual_onenote_api.publish_counts, {})
+            expected_files = {p.relative_to(expected_output_dir): p.read_bytes() for p in expected_output_dir.rglob('*') if p.is_file()}
+            actual_files = {p.relative_to(actual_output_dir): p.read_bytes() for p in actual_output_dir.rglob('*') if p.is_file()}
+            self.assertEqual(len([p for p in expected_files if p.suffix == '.md']), settings.page_count)
+            self.assertEqual(len([p for p in expected_files if p.parent.name == 'assets']), settings.page_count * settings.images_per_page)
+            self.assertEqual(actual_files, expected_files)
+
+    def test_exporting_pages_concurrently_within_a_memory_budget_exports_the_same_files(self):
+        # Arrange
+        settings = SyntheticNotebookSettings(sections_per_notebook=2, pages_per_section=3, images_per_page=2, tables_per_page=1, paragraphs_per_page=3)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = pathlib.Path(temp_dir)
+            recording = OneNoteApiRecording(temp_dir / 'recording')
+            SyntheticNotebookGenerator(settings).generate_into(recording)
+            create_default_onenote_exporter(temp_dir / 'sequential', 'assets', PathComponentScrubber())\
+                .execute_export(OneNoteApplication(ReplayOneNoteAPI(recording)))
+            expected_files = {p.relative_to(temp_dir / 'sequential'): p.read_bytes() for p in (temp_dir / 'sequential').rglob('*') if p.is_file()}
+
+            for budget_bytes, expected_run_alone_count in ((2 ** 40, 0), (1, settings.page_count)):
+                with self.subTest(budget_bytes=budget_bytes):
+                    actual_output_dir = temp_dir / f'concurrent-{budget_bytes}'
+                    sut = create_default_onenote_exporter(actual_output_dir, 'assets', PathComponentScrubber(), page_max_workers=3, page_memory_budget_bytes=budget_bytes)
+
+                    # Act
+                    sut.execute_export(OneNoteApplication(ReplayOneNoteAPI(recording)))
+
+                    # Assert
+                    admission = sut.admission_controller.snapshot()
+                    self.assertEqual(admission.admitted_count, settings.page_count)
+                    self.assertEqual(admission.run_alone_count, expected_run_alone_count)
+                    if expected_run_alone_count:
+                        self.assertEqual(admission.peak_admitted_count, 1)
+                    actual_files = {p.relative_to(actual_output_dir): p.read_bytes() for p in actual_output_dir.rglob('*') if p.is_file()}
+                    self.assertEqual(actual_files, expected_files)
+
 
 if __name__ == '__main__':
     unittest.main()
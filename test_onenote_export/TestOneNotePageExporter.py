@@ -7,6 +7,7 @@ from markdown_dom.MarkdownDocument import MarkdownDocument
 from onenote import OneNotePage, OneNoteSection, OneNoteSectionGroup, OneNoteNotebook, OneNoteApplication
 from onenote_export.OneNoteExportTaskContext import OneNoteExportTaskContext
 from onenote_export.OneNoteExportTaskFactory import OneNoteExportTaskFactory
+from onenote_export.OneNoteExportTaskLiteral import OneNoteExportTaskLiteral
 from onenote_export.OneNotePageExportTaskContext import OneNotePageExportTaskContext
 from onenote_export.OneNotePageExporter import OneNotePageExporter
 from onenote_export.OneNotePageExporterSettings import OneNotePageExporterSettings
@@ -19,7 +20,7 @@ from path_scrubbing import PathComponentScrubber
 class TestOneNotePageExporter(unittest.TestCase):
     def test_can_instantiate(self):
         # Arrange
-        subject_ctor_args = (self._mock_context(), (), MagicMock(spec=OneNoteExportTaskFactory), OneNotePageExporterSettings())
+        subject_ctor_args = (self._mock_context(), (), self._mock_subtask_factory(), OneNotePageExporterSettings())
         subject_ctor_kwargs = {}
 
         # Act
@@ -47,6 +48,33 @@ class TestOneNotePageExporter(unittest.TestCase):
         # Assert
         self.assertEqual(actual, None)
 
+    def test_subtask_graph_lets_reparsing_overlap_extracting_files(self):
+        # Arrange
+        subject_ctor_args = (self._mock_context(), (), self._mock_subtask_factory(), OneNotePageExporterSettings())
+
+        # Act
+        actual = OneNotePageExporter(*subject_ctor_args).subtask_graph
+
+        # Assert
+        prerequisites = {str(task): tuple(str(p) for p in actual.prerequisites_of(task)) for task in actual.tasks}
+        self.assertEqual(prerequisites, {
+            'page_ensure_output_dir_exists': (),
+            'page_ensure_assets_dir_exists': ('page_ensure_output_dir_exists',),
+            'page_reparse_embedded_html': (),
+            'page_extract_ordinated_assets': ('page_ensure_assets_dir_exists',),
+            'page_extract_images': ('page_extract_ordinated_assets',),
+            'page_relink_ordinated_assets': ('page_reparse_embedded_html', 'page_extract_ordinated_assets'),
+            'page_patch_images_into_md': ('page_relink_ordinated_assets', 'page_extract_images'),
+            'page_remove_onenote_footer': ('page_patch_images_into_md',),
+            'page_export_pandoc_ast_to_markdown_file': ('page_remove_onenote_footer',),
+        })
+
+    def _mock_subtask_factory(self) -> OneNoteExportTaskFactory:
+        subtask_factory = MagicMock(spec=OneNoteExportTaskFactory)
+        subtask_factory.create_from_spec.side_effect = \
+            lambda node, task_spec, prerequisites: OneNoteExportTaskLiteral(lambda: None, task_spec.__name__, prerequisites)
+        return subtask_factory
+
     def _mock_context(self) -> OneNotePageExportTaskContext:
         page_node = self._mock_onenote_page()
         mock_output_dir = MagicMock(spec=pathlib.Path)
@@ -95,7 +123,7 @@ class TestOneNotePageExporter(unittest.TestCase):
         subject_ctor_kwargs = {
             'context': self._mock_context(),
             'prerequisites': (),
-            'subtask_factory': MagicMock(spec=OneNoteExportTaskFactory),
+            'subtask_factory': self._mock_subtask_factory(),
             'settings': OneNotePageExporterSettings(),
         }
 
@@ -0,0 +1,92 @@
+import json
+import pathlib
+import unittest
+from xml.etree import ElementTree
+
+import pypandoc
+
+from onenote_export.onenote_page_xml_to_pandoc_ast import convert_onenote_page_xml_to_pandoc_ast, convert_onenote_text_html_to_inlines
+
+
+sample_page_content_xml_path = pathlib.Path(__file__).parent / 'sample_data' / 'page-with-formatting.xml'
+
+
+def render_markdown(pandoc_ast: dict) -> str:
+    return pypandoc.convert_text(json.dumps(pandoc_ast), to='markdown', format='json')
+
+
+class TestOneNotePageXmlToPandocAst(unittest.TestCase):
+    def test_convert_onenote_page_xml_to_pandoc_ast_renders_page_structure(self):
+        # Arrange
+        page_content = ElementTree.parse(sample_page_content_xml_path).getroot()
+
+        # Act
+        pandoc_ast = convert_onenote_page_xml_to_pandoc_ast(page_content, resolve_image_url=lambda _: 'page_files/image001.png')
+        actual = render_markdown(pandoc_ast)
+
+        # Assert
+        expected_fragments = [
+            'Page With Formatting\n',
+            '# Ingredients\n',
+            '## Method\n',
+            'Use **fresh** lemons from [the market](https://example.com/market) &\n*never* bottled juice.',
+            '-   Lemons\n    -   Meyer, if available\n-   Sugar\n',
+            '1.  Zest the lemons.\n2.  Juice the lemons.\n',
+            '☒ Buy lemons',
+            '☐ Buy sugar',
+            'Ingredient   Amount',
+            'Lemons       3',
+            '![Lemon cake](page_files/image001.png){width="200" height="100"}',
+        ]
+        for expected_fragment in expected_fragments:
+            with self.subTest(expected_fragment=expected_fragment):
+                self.assertIn(expected_fragment, actual)
+
+    def test_convert_onenote_page_xml_to_pandoc_ast_drops_unresolved_images(self):
+        # Arrange
+        page_content = ElementTree.parse(sample_page_content_xml_path).getroot()
+
+        # Act
+        actual = render_markdown(convert_onenote_page_xml_to_pandoc_ast(page_content))
+
+        # Assert
+        self.assertNotIn('![', actual)
+        self.assertIn('☐ Buy sugar', actual)
+
+    def test_convert_onenote_page_xml_to_pandoc_ast_joins_text_runs_split_by_a_selection(self):
+        # Arrange
+        page_content = ElementTree.fromstring('''<one:Page xmlns:one="http://schemas.microsoft.com/office/onenote/2013/onenote" name="Selected">
+            <one:Outline>
+                <one:OEChildren>
+                    <one:OE>
+                        <one:T><![CDATA[Zest the ]]></one:T>
+                        <one:T selected="all"><![CDATA[<span style='font-weight:bold'>lem</span>]]></one:T>
+                        <one:T selected="partial"><![CDATA[<span style='font-weight:bold'>ons</span> before juicing them.]]></one:T>
+                    </one:OE>
+                </one:OEChildren>
+            </one:Outline>
+        </one:Page>''')
+
+        # Act
+        actual = render_markdown(convert_onenote_page_xml_to_pandoc_ast(page_content))
+
+        # Assert
+        self.assertIn('Zest the **lemons** before juicing them.', actual)
+
+    def test_convert_onenote_text_html_to_inlines(self):
+        cases = [
+            ('plain  text', [{'t': 'Str', 'c': 'plain'}, {'t': 'Space'}, {'t': 'Str', 'c': 'text'}]),
+            ("<span style='font-weight:bold;font-style:italic'>both</span>", [{'t': 'Strong', 'c': [{'t': 'Emph', 'c': [{'t': 'Str', 'c': 'both'}]}]}]),
+            ("a<span style='text-decoration:line-through'> gone</span>", [{'t': 'Str', 'c': 'a'}, {'t': 'Space'}, {'t': 'Strikeout', 'c': [{'t': 'Str', 'c': 'gone'}]}]),
+            ('x<sup>2</sup>', [{'t': 'Str', 'c': 'x'}, {'t': 'Superscript', 'c': [{'t': 'Str', 'c': '2'}]}]),
+            ('one<br>two', [{'t': 'Str', 'c': 'one'}, {'t': 'LineBreak'}, {'t': 'Str', 'c': 'two'}]),
+            ('<b>unclosed', [{'t': 'Strong', 'c': [{'t': 'Str', 'c': 'unclosed'}]}]),
+            ('<span style="font-weight:bold"> </span>', []),
+        ]
+        for text_html, expected in cases:
+            with self.subTest(text_html=text_html):
+                # Act
+                actual = convert_onenote_text_html_to_inlines(text_html)
+
+                # Assert
+                self.assertEqual(actual, expected)
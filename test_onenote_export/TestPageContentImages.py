@@ -0,0 +1,85 @@
+import pathlib
+import unittest
+from unittest.mock import MagicMock
+from xml.etree import ElementTree
+
+from onenote import OneNotePage, OneNoteSection
+from onenote.PageInfo import PageInfo
+from onenote_export.onenote_page_xml import determine_image_file_suffix
+from onenote_export.page_content_images import read_page_content_images
+from test_onenote_export.FakeOneNoteAPI import FakeOneNoteAPI
+
+
+sample_page_content_xml_path = pathlib.Path(__file__).parent / 'sample_data' / 'page-with-images.xml'
+sample_page_id = '{8C2B7E4A-0D9F-4E7B-9A53-1F0E6D2C4B11}{1}{E19551234567890123456789012345678901234561}'
+sample_png_bytes = b'\x89PNG\r\n\x1a\n' + b'png image data'
+sample_jpg_bytes = b'\xff\xd8\xff\xe0' + b'jpg image data'
+
+
+def create_page_with_images(onenote_api: FakeOneNoteAPI) -> OneNotePage:
+    page_element = ElementTree.fromstring(sample_page_content_xml_path.read_text(encoding='utf-8'))
+    return OneNotePage(page_element, MagicMock(spec=OneNoteSection), 0, onenote_api)
+
+
+class TestPageContentImages(unittest.TestCase):
+    def test_read_page_content_images_fetches_original_bytes_in_document_order(self):
+        # Arrange
+        onenote_api = FakeOneNoteAPI(
+            page_content_xml={sample_page_id: sample_page_content_xml_path.read_text(encoding='utf-8')},
+            binary_page_content={
+                '{11111111-2222-3333-4444-555555555555}{1}{B0}': sample_png_bytes,
+                '{11111111-2222-3333-4444-555555555555}{2}{B0}': sample_jpg_bytes,
+            },
+        )
+        page = create_page_with_images(onenote_api)
+
+        # Act
+        actual = list(read_page_content_images(page))
+
+        # Assert
+        self.assertEqual(actual, [(sample_png_bytes, '.png'), (sample_jpg_bytes, '.jpg')])
+        self.assertEqual(onenote_api.calls[0][2], PageInfo.piFileType)
+        self.assertNotIn('publish', [call[0] for call in onenote_api.calls])
+
+    def test_read_page_content_images_includes_title_and_page_level_images_in_xml_order(self):
+        # Arrange
+        def image_xml(callback_ordinal: int, position: str = '') -> str:
+            return f'''<one:Image format="png">{position}<one:CallbackID callbackID="{{11111111-2222-3333-4444-555555555555}}{{{callback_ordinal}}}{{B0}}"/></one:Image>'''
+
+        page_content_xml = f'''<one:Page xmlns:one="http://schemas.microsoft.com/office/onenote/2013/onenote" ID="{sample_page_id}" name="Page">
+            <one:Title><one:OE>{image_xml(1)}</one:OE></one:Title>
+            {image_xml(2, '<one:Position x="360.0" y="300.0" z="1"/>')}
+            <one:Outline><one:Position x="36.0" y="86.4" z="0"/><one:OEChildren><one:OE>{image_xml(3)}</one:OE></one:OEChildren></one:Outline>
+        </one:Page>'''
+        image_bytes = [sample_png_bytes + bytes([ordinal]) for ordinal in range(1, 4)]
+        onenote_api = FakeOneNoteAPI(
+            page_content_xml={sample_page_id: page_content_xml},
+            binary_page_content={f'{{11111111-2222-3333-4444-555555555555}}{{{ordinal}}}{{B0}}': b for ordinal, b in enumerate(image_bytes, 1)},
+        )
+        page = OneNotePage(ElementTree.fromstring(page_content_xml), MagicMock(spec=OneNoteSection), 0, onenote_api)
+
+        # Act
+        actual = [image_bytes for image_bytes, _ in read_page_content_images(page)]
+
+        # Assert
+        self.assertEqual(actual, image_bytes)
+
+    def test_determine_image_file_suffix(self):
+        cases = [
+            ('png', b'', '.png'),
+            ('JPEG', b'', '.jpg'),
+            (None, sample_png_bytes, '.png'),
+            (None, sample_jpg_bytes, '.jpg'),
+            (None, b'unknown', '.bin'),
+        ]
+        for image_format, image_bytes, expected in cases:
+            with self.subTest(image_format=image_format, image_bytes=image_bytes):
+                # Act
+                actual = determine_image_file_suffix(image_format, image_bytes)
+
+                # Assert
+                self.assertEqual(actual, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import threading
+import time
+import unittest
+
+from onenote_export.PageMemoryAdmissionController import PageMemoryAdmissionController
+
+
+class TestPageMemoryAdmissionController(unittest.TestCase):
+    def setUp(self):
+        self.threads = []
+
+    def tearDown(self):
+        for thread in self.threads:
+            thread.join(timeout=10)
+
+    def _admit_in_background(self, sut: PageMemoryAdmissionController, footprint_bytes: int) -> (threading.Event, threading.Event):
+        admitted, release = threading.Event(), threading.Event()
+
+        def run():
+            with sut.admit(footprint_bytes):
+                admitted.set()
+                release.wait(timeout=10)
+
+        waiting_count = sut.snapshot().waiting_count
+        thread = threading.Thread(target=run, daemon=True)
+        self.threads.append(thread)
+        thread.start()
+        self._wait_until(lambda: admitted.is_set() or sut.snapshot().waiting_count > waiting_count)
+        return admitted, release
+
+    @staticmethod
+    def _wait_until(predicate):
+        deadline = time.monotonic() + 10
+        while not predicate() and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def test_footprint_is_estimated_from_what_was_published(self):
+        # Arrange
+        sut = PageMemoryAdmissionController(budget_bytes=2 ** 30, bytes_per_published_byte=10, baseline_bytes=1000)
+
+        # Act
+        actual = sut.estimate_footprint_bytes(500)
+
+        # Assert
+        self.assertEqual(actual, 6000)
+
+    def test_pages_are_admitted_while_their_footprints_fit_the_budget(self):
+        # Arrange
+        sut = PageMemoryAdmissionController(budget_bytes=100)
+        first_admitted, first_release = self._admit_in_background(sut, 60)
+        second_admitted, second_release = self._admit_in_background(sut, 40)
+
+        # Act
+        third_admitted, third_release = self._admit_in_background(sut, 30)
+        third_waited = not third_admitted.is_set()
+        second_release.set()
+        third_admitted.wait(timeout=10)
+
+        # Assert
+        self.assertTrue(first_admitted.is_set() and second_admitted.is_set())
+        self.assertTrue(third_waited)
+        self.assertTrue(third_admitted.is_set())
+        first_release.set()
+        third_release.set()
+        for thread in self.threads:
+            thread.join(timeout=10)
+        actual = sut.snapshot()
+        self.assertEqual((actual.admitted_count, actual.peak_admitted_count, actual.peak_admitted_bytes), (3, 2, 100))
+
+    def test_pages_too_big_for_the_budget_run_alone_and_are_not_overtaken(self):
+        # Arrange
+        sut = PageMemoryAdmissionController(budget_bytes=100)
+        small_admitted, small_release = self._admit_in_background(sut, 10)
+
+        # Act
+        huge_admitted, huge_release = self._admit_in_background(sut, 500)
+        later_small_admitted, later_small_release = self._admit_in_background(sut, 10)
+        waited_for_the_running_page = not huge_admitted.is_set()
+        small_release.set()
+        huge_admitted.wait(timeout=10)
+        later_small_waited_for_the_huge_page = not later_small_admitted.is_set()
+        huge_release.set()
+        later_small_admitted.wait(timeout=10)
+        later_small_release.set()
+
+        # Assert
+        self.assertTrue(waited_for_the_running_page)
+        self.assertTrue(later_small_waited_for_the_huge_page)
+        self.assertTrue(later_small_admitted.is_set())
+        for thread in self.threads:
+            thread.join(timeout=10)
+        actual = sut.snapshot()
+        self.assertEqual((actual.run_alone_count, actual.peak_admitted_count, actual.waiting_count), (1, 1, 0))
+
+    def test_budget_must_be_positive(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            PageMemoryAdmissionController(budget_bytes=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import patch
+from xml.etree import ElementTree
+
+from onenote import OneNoteApiRecording, RecordingOneNoteAPI, ReplayOneNoteAPI, AsyncOneNoteAPI, ComThreadOneNoteAPI, \
+    HierarchySnapshotOneNoteAPI, OneNoteHierarchySnapshot
+from onenote.OneNoteAPI import OneNoteAPI
+from onenote.HierarchyScope import HierarchyScope
+from onenote.PageInfo import PageInfo
+from onenote.PublishFormat import PublishFormat
+from onenote_export.Pathlike import Pathlike
+from test_onenote_export.FakeOneNoteAPI import FakeOneNoteAPI
+from test_onenote_export.TestPageContentImages import sample_page_content_xml_path, sample_page_id, sample_png_bytes
+
+
+sample_notebooks_xml = '<one:Notebooks xmlns:one="http://schemas.microsoft.com/office/onenote/2013/onenote"><one:Notebook name="Notebook" ID="{NB}"/></one:Notebooks>'
+sample_callback_id = '{11111111-2222-3333-4444-555555555555}{1}{B0}'
+sample_pdf_bytes = b'%PDF-1.4 sample'
+
+
+class PublishingFakeOneNoteAPI(FakeOneNoteAPI):
+    def publish(self, page_id: str, target_file_path: Pathlike, publish_format: PublishFormat, clsid_of_exporter: str = ""):
+        self.calls.append(('publish', page_id, publish_format))
+        pathlib.Path(target_file_path).write_bytes(sample_pdf_bytes)
+
+
+class TestReplayOneNoteAPI(unittest.TestCase):
+    def setUp(self):
+        self._recording_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._recording_dir.cleanup)
+        self.recording_dir = pathlib.Path(self._recording_dir.name)
+
+    def _record_session(self):
+        live_api = PublishingFakeOneNoteAPI(
+            hierarchy_xml={'': sample_notebooks_xml},
+            page_content_xml={sample_page_id: sample_page_content_xml_path.read_text(encoding='utf-8')},
+            binary_page_content={sample_callback_id: sample_png_bytes},
+        )
+        sut = RecordingOneNoteAPI(live_api, OneNoteApiRecording(self.recording_dir))
+        sut.get_hierarchy('', HierarchyScope.Children)
+        sut.get_page_content(sample_page_id, PageInfo.piFileType)
+        sut.get_binary_page_content(sample_page_id, sample_callback_id)
+        sut.publish(sample_page_id, self.recording_dir / 'published.pdf', PublishFormat.pfPDF)
+
+    def test_replay_serves_recorded_responses(self):
+        # Arrange
+        self._record_session()
+        sut = ReplayOneNoteAPI(OneNoteApiRecording(self.recording_dir))
+
+        # Act
+        actual_hierarchy = sut.get_hierarchy('', HierarchyScope.Children)
+        actual_page_content = sut.get_page_content(sample_page_id, PageInfo.piFileType)
+        actual_binary_page_content = sut.get_binary_page_content(sample_page_id, sample_callback_id)
+        actual_published_path = self.recording_dir / 'replayed.pdf'
+        sut.publish(sample_page_id, actual_published_path, PublishFormat.pfPDF)
+
+        # Assert
+        self.assertEqual(actual_hierarchy[0].attrib['ID'], '{NB}')
+        expected_page_content = ElementTree.parse(sample_page_content_xml_path).getroot()
+        self.assertEqual(ElementTree.tostring(actual_page_content), ElementTree.tostring(expected_page_content))
+        self.assertEqual(actual_binary_page_content, sample_png_bytes)
+        self.assertEqual(actual_published_path.read_bytes(), sample_pdf_bytes)
+
+    def test_replay_raises_for_unrecorded_requests(self):
+        # Arrange
+        self._record_session()
+        sut = ReplayOneNoteAPI(OneNoteApiRecording(self.recording_dir))
+
+        # Act & Assert
+        with self.assertRaises(KeyError):
+            sut.get_page_content(sample_page_id, PageInfo.piBasic)
+
+    def test_recording_the_com_thread_api_dispatches_to_onenote_once(self):
+        # Arrange
+        with patch.object(OneNoteAPI, '_create_onenote_com_object') as create_onenote_com_object:
+            # Act
+            with AsyncOneNoteAPI() as async_onenote_api:
+                onenote_api = ComThreadOneNoteAPI(async_onenote_api)
+                onenote_api = RecordingOneNoteAPI(onenote_api, OneNoteApiRecording(self.recording_dir / 'recording'))
+                HierarchySnapshotOneNoteAPI(onenote_api, OneNoteHierarchySnapshot(self.recording_dir / 'snapshot'))
+
+        # Assert
+        self.assertEqual(create_onenote_com_object.call_count, 1)
@@ -0,0 +1,111 @@
+import pathlib
+import tempfile
+import threading
+import unittest
+from xml.etree import ElementTree
+
+from onenote import OneNoteApplication, OneNoteApiRecording, ReplayOneNoteAPI
+from onenote.HierarchyScope import HierarchyScope
+from onenote.PublishFormat import PublishFormat
+from onenote.XMLSchema import XMLSchema
+from onenote_export.Pathlike import Pathlike
+from onenote_export.SectionMhtmlPublisher import SectionMhtmlPublisher
+from onenote_synthetic import SyntheticNotebookGenerator, SyntheticNotebookSettings
+
+
+class BarrierReplayOneNoteAPI(ReplayOneNoteAPI):
+    def __init__(self, recording: OneNoteApiRecording, barrier: threading.Barrier):
+        super().__init__(recording)
+        self._barrier = barrier
+
+    def publish(self, page_id: str, target_file_path: Pathlike, publish_format: PublishFormat, clsid_of_exporter: str = ""):
+        self._barrier.wait()
+        super().publish(page_id, target_file_path, publish_format, clsid_of_exporter)
+
+
+class PageReorderingReplayOneNoteAPI(ReplayOneNoteAPI):
+    def get_hierarchy(self, node_id: str, hierarchy_scope: HierarchyScope, schema: XMLSchema = XMLSchema.xs2013) -> ElementTree:
+        result = super().get_hierarchy(node_id, hierarchy_scope, schema)
+        if result.tag.endswith('Section'):
+            result[:] = reversed(list(result))
+        return result
+
+
+class TestSectionMhtmlPublisher(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.recording = OneNoteApiRecording(pathlib.Path(self._temp_dir.name) / 'recording')
+        SyntheticNotebookGenerator(SyntheticNotebookSettings(sections_per_notebook=2, pages_per_section=3)).generate_into(self.recording)
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    @staticmethod
+    def _get_sections(application: OneNoteApplication):
+        notebook, = application.children
+        return notebook.children
+
+    def test_keeps_only_the_containers_of_expected_pages(self):
+        # Arrange
+        sut = SectionMhtmlPublisher()
+        section, _ = self._get_sections(OneNoteApplication(ReplayOneNoteAPI(self.recording)))
+        first_page, second_page, third_page = section.all_pages
+        sut.expect_page(first_page)
+        sut.expect_page(third_page)
+
+        # Act
+        first_container = sut.pop_page_mhtml_container(first_page)
+        pending_page_count = sut.pending_page_count
+        third_container = sut.pop_page_mhtml_container(third_page)
+
+        # Assert
+        self.assertIsNotNone(first_container)
+        self.assertIsNotNone(third_container)
+        self.assertEqual(pending_page_count, 1)
+        self.assertEqual(sut.pending_page_count, 0)
+        self.assertIsNone(sut.pop_page_mhtml_container(second_page))
+
+    def test_leaves_pages_to_be_published_one_at_a_time_when_the_section_orders_them_differently(self):
+        # Arrange
+        sut = SectionMhtmlPublisher()
+        section, _ = self._get_sections(OneNoteApplication(PageReorderingReplayOneNoteAPI(self.recording)))
+        page = section.all_pages[0]
+        sut.expect_page(page)
+
+        # Act
+        with self.assertLogs('onenote_export.SectionMhtmlPublisher', level='WARNING') as logs:
+            actual = sut.pop_page_mhtml_container(page)
+
+        # Assert
+        self.assertIsNone(actual)
+        self.assertIn('not titled after their pages', logs.output[0])
+
+    def test_publishes_different_sections_at_the_same_time(self):
+        # Arrange
+        sut = SectionMhtmlPublisher()
+        # Each section's publish waits for the other's, so publishing them one at a time would time out.
+        onenote_api = BarrierReplayOneNoteAPI(self.recording, threading.Barrier(2, timeout=10))
+        sections = self._get_sections(OneNoteApplication(onenote_api))
+        pages = [section.all_pages[0] for section in sections]
+        for page in pages:
+            sut.expect_page(page)
+        actual = {}
+
+        def pop(page):
+            actual[page.node_id] = sut.pop_page_mhtml_container(page)
+
+        # Act
+        threads = [threading.Thread(target=pop, args=(page,)) for page in pages]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=20)
+
+        # Assert
+        self.assertEqual(actual.keys(), {page.node_id for page in pages})
+        self.assertTrue(all(container is not None for container in actual.values()))
+        self.assertEqual(sut.pending_page_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import inspect
+import logging
+import unittest
+
+from onenote_export.simple_injector import InjectableParameter, compile_injection_plan, prepare_action_params
+
+
+class SampleContext:
+    pass
+
+
+def sample_action(context: SampleContext, logger: logging.Logger, prerequisites=()):
+    return context, logger, prerequisites
+
+
+def skip_prerequisites(param: inspect.Parameter) -> bool:
+    return param.name != 'prerequisites'
+
+
+class TestSimpleInjector(unittest.TestCase):
+    @staticmethod
+    def _create_injectables(context: SampleContext, logger: logging.Logger):
+        return (
+            InjectableParameter(('logger', 'log'), (logging.Logger,), lambda: logger),
+            InjectableParameter(('context', 'ctx'), (SampleContext,), lambda: context),
+        )
+
+    def test_prepare_action_params_injects_by_name_and_type(self):
+        # Arrange
+        context, logger = SampleContext(), logging.getLogger(__name__)
+
+        # Act
+        actual_args, actual_kwargs = prepare_action_params(sample_action, self._create_injectables(context, logger), should_try_injection=skip_prerequisites)
+
+        # Assert
+        self.assertEqual(actual_args, ())
+        self.assertEqual(actual_kwargs, {'context': context, 'logger': logger})
+
+    def test_plan_is_compiled_once_and_bound_to_fresh_values(self):
+        # Arrange
+        compile_injection_plan.cache_clear()
+        contexts = [SampleContext() for _ in range(3)]
+
+        # Act
+        actual = [
+            prepare_action_params(sample_action, self._create_injectables(context, logging.getLogger(__name__)), should_try_injection=skip_prerequisites)
+            for context in contexts
+        ]
+
+        # Assert
+        self.assertEqual([kwargs['context'] for _, kwargs in actual], contexts)
+        cache_info = compile_injection_plan.cache_info()
+        self.assertEqual((cache_info.misses, cache_info.hits), (1, 2))
+
+    def test_prepare_action_params_raises_for_unresolvable_required_parameter(self):
+        # Arrange
+        def action_needing_unknown(unknown: int):
+            pass
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            prepare_action_params(action_needing_unknown, self._create_injectables(SampleContext(), logging.getLogger(__name__)))
@@ -0,0 +1,69 @@
+import json
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from xml.etree import ElementTree
+
+from onenote import OneNotePage, OneNoteSection
+from onenote_export.TemporaryOneNotePageXmlExport import TemporaryOneNotePageXmlExport
+from test_onenote_export.FakeOneNoteAPI import FakeOneNoteAPI
+from test_onenote_export.TestPageContentImages import sample_page_content_xml_path, sample_page_id, sample_png_bytes, sample_jpg_bytes
+
+
+class TestTemporaryOneNotePageXmlExport(unittest.TestCase):
+    def setUp(self):
+        self.onenote_api = FakeOneNoteAPI(
+            page_content_xml={sample_page_id: sample_page_content_xml_path.read_text(encoding='utf-8')},
+            binary_page_content={
+                '{11111111-2222-3333-4444-555555555555}{1}{B0}': sample_png_bytes,
+                '{11111111-2222-3333-4444-555555555555}{2}{B0}': sample_jpg_bytes,
+            },
+        )
+        page_element = ElementTree.fromstring(sample_page_content_xml_path.read_text(encoding='utf-8'))
+        self.page = OneNotePage(page_element, MagicMock(spec=OneNoteSection), 0, self.onenote_api)
+
+    def _find_image_urls(self, pandoc_ast_json: str) -> list[str]:
+        urls = []
+
+        def visit(node):
+            if isinstance(node, dict):
+                if node.get('t') == 'Image':
+                    urls.append(node['c'][2][0])
+                for value in node.values():
+                    visit(value)
+            elif isinstance(node, list):
+                for value in node:
+                    visit(value)
+
+        visit(json.loads(pandoc_ast_json))
+        return urls
+
+    def test_create_pandoc_ast_json_links_ordinated_images_without_publishing(self):
+        # Arrange
+        sut = TemporaryOneNotePageXmlExport(self.page)
+
+        # Act
+        with sut:
+            actual = sut.create_pandoc_ast_json()
+
+        # Assert
+        self.assertEqual(self._find_image_urls(actual), ['page_files/image001.png', 'page_files/image002.jpg'])
+        called_methods = [call[0] for call in self.onenote_api.calls]
+        self.assertNotIn('publish', called_methods)
+        self.assertNotIn('get_binary_page_content', called_methods)
+
+    def test_extract_assets_to_writes_image_bytes_to_mapped_paths(self):
+        # Arrange
+        sut = TemporaryOneNotePageXmlExport(self.page)
+
+        with tempfile.TemporaryDirectory() as target_dir, sut:
+            target_dir = pathlib.Path(target_dir)
+
+            # Act
+            actual = sut.extract_assets_to(target_dir, lambda p: pathlib.Path('assets') / f'page_{p.name}')
+
+            # Assert
+            self.assertEqual(actual, (pathlib.Path('assets/page_image001.png'), pathlib.Path('assets/page_image002.jpg')))
+            self.assertEqual((target_dir / actual[0]).read_bytes(), sample_png_bytes)
+            self.assertEqual((target_dir / actual[1]).read_bytes(), sample_jpg_bytes)
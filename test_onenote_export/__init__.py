@@ -1,5 +1,21 @@
 from .test_page_export_tasks import *
 from .TestOneNoteExporter import TestOneNoteExporter
+from .TestOneNoteAPI import TestOneNoteAPI
+from .TestAsyncOneNoteAPI import TestAsyncOneNoteAPI
+from .TestComThreadOneNoteAPI import TestComThreadOneNoteAPI
 from .TestOneNotePageExporter import TestOneNotePageExporter
 from .TestOneNoteExportTaskContext import TestOneNoteExportTaskContext
 from .TestOneNoteExportTaskContextFactory import TestOneNoteExportTaskContextFactory
+from .TestPageContentImages import TestPageContentImages
+from .TestOneNotePageXmlToPandocAst import TestOneNotePageXmlToPandocAst
+from .TestTemporaryOneNotePageXmlExport import TestTemporaryOneNotePageXmlExport
+from .TestHierarchySnapshotOneNoteAPI import TestHierarchySnapshotOneNoteAPI
+from .TestOneNoteElementBasedNode import TestOneNoteElementBasedNode
+from .TestComCallMetricsRegistry import TestComCallMetricsRegistry
+from .TestComRetryPolicy import TestComRetryPolicy
+from .TestReplayOneNoteAPI import TestReplayOneNoteAPI
+from .TestExportTaskGraph import TestExportTaskGraph
+from .TestPageMemoryAdmissionController import TestPageMemoryAdmissionController
+from .TestSectionMhtmlPublisher import TestSectionMhtmlPublisher
+from .TestSimpleInjector import TestSimpleInjector
+from .TestLoggingHelper import TestLoggingHelper
@@ -3,7 +3,12 @@ import pathlib
 import unittest
 from unittest.mock import MagicMock
 
+from onenote_export.OneNotePageExporterSettings import OneNotePageExporterSettings
+from onenote_export.PageImageSource import PageImageSource
 from onenote_export.page_export_tasks.page_pdf_patch_images_into_md import page_pdf_patch_images_into_md
+from test_onenote_export.FakeOneNoteAPI import FakeOneNoteAPI
+from test_onenote_export.TestPageContentImages import create_page_with_images, sample_page_id, \
+    sample_page_content_xml_path, sample_png_bytes, sample_jpg_bytes
 from test_onenote_export.test_page_export_tasks.seeded_fake_onenote_page_export_task_context import create_seeded_fake_onenote_page_export_task_context
 
 
@@ -22,6 +27,32 @@ class TestPagePdfPatchImagesIntoMd(unittest.TestCase):
                     page_pdf_patch_images_into_md(context, MagicMock(logging.Logger))
                     self.assertTrue(True)
 
+    def test_binary_page_content_source_writes_original_image_bytes(self):
+        # Arrange
+        sample_data_dir = pathlib.Path(__file__).parent / pathlib.Path('sample_data')
+        settings = OneNotePageExporterSettings(page_image_source=PageImageSource.BINARY_PAGE_CONTENT)
+        onenote_api = FakeOneNoteAPI(
+            page_content_xml={sample_page_id: sample_page_content_xml_path.read_text(encoding='utf-8')},
+            binary_page_content={
+                '{11111111-2222-3333-4444-555555555555}{1}{B0}': sample_png_bytes,
+                '{11111111-2222-3333-4444-555555555555}{2}{B0}': sample_jpg_bytes,
+            },
+        )
+
+        with create_seeded_fake_onenote_page_export_task_context(
+            sample_md_path=sample_data_dir / pathlib.Path('hummingbird-cake.md'),
+        ) as context:
+            context.node = create_page_with_images(onenote_api)
+
+            # Act
+            page_pdf_patch_images_into_md(context, MagicMock(logging.Logger), settings)
+
+            # Assert
+            written_images = sorted(context.output_assets_dir_path.iterdir())
+            self.assertEqual([p.read_bytes() for p in written_images], [sample_png_bytes, sample_jpg_bytes])
+            self.assertEqual([p.suffix for p in written_images], ['.png', '.jpg'])
+            self.assertNotIn('publish', [call[0] for call in onenote_api.calls])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,16 +1,17 @@
 import logging
 import pathlib
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from onenote_export.page_export_tasks.page_remove_onenote_footer import page_remove_onenote_footer
+from markdown_dom.CompoundDocumentElementContentTextMap import CompoundDocumentElementContentTextMap
+from onenote_export.page_export_tasks.page_remove_onenote_footer import page_remove_onenote_footer, footer_text_pattern
 from test_onenote_export.test_page_export_tasks.seeded_fake_onenote_page_export_task_context import \
     SeededMockOneNotePageExportTaskContext
 
 
 class TestPageRemoveOneNoteFooter(unittest.TestCase):
 
-    def test_can_run_against_samples_without_error(self):
+    def test_removes_footer_without_text_mapping_the_page_body(self):
         sample_data_dir = pathlib.Path(__file__).parent / pathlib.Path('sample_data')
         sample_document_names = {f.with_suffix('').name for f in sample_data_dir.glob('*.mht')}
 
@@ -18,11 +19,26 @@ class TestPageRemoveOneNoteFooter(unittest.TestCase):
             with self.subTest(sample_document_name=sample_document_name):
                 with SeededMockOneNotePageExportTaskContext(
                     sample_mhtml_path=sample_data_dir / pathlib.Path(f'{sample_document_name}.mht'),
-
                 ) as context:
-                    page_remove_onenote_footer(context, MagicMock(logging.Logger))
-                    self.assertTrue(True)
-
+                    # Arrange
+                    doc = context.output_md_document
+                    found_footer_before = footer_text_pattern.search(doc, action=lambda m: m is not None)
+                    text_mapped_block_positions = []
+                    original_from_element_walk = CompoundDocumentElementContentTextMap.from_element_walk
+
+                    def spy_from_element_walk(elements):
+                        text_mapped_block_positions.extend((block.index, len(block.doc.content)) for block in elements)
+                        return original_from_element_walk(elements)
+
+                    # Act
+                    with patch.object(CompoundDocumentElementContentTextMap, 'from_element_walk', side_effect=spy_from_element_walk):
+                        page_remove_onenote_footer(context, MagicMock(logging.Logger))
+
+                    # Assert
+                    self.assertTrue(found_footer_before)
+                    self.assertFalse(footer_text_pattern.search(doc, action=lambda m: m is not None))
+                    self.assertTrue(text_mapped_block_positions)
+                    self.assertTrue(all(index == block_count - 1 for index, block_count in text_mapped_block_positions))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,110 @@
+import pathlib
+import tempfile
+import unittest
+from typing import Iterable
+
+from mhtml_dom.MhtmlContainer import MhtmlContainer
+from onenote import OneNoteApplication, OneNoteApiRecording, OneNoteNode, OneNotePage, ReplayOneNoteAPI
+from onenote.PageInfo import PageInfo
+from onenote.PublishFormat import PublishFormat
+from onenote_export.OneNoteExporter import create_default_onenote_exporter
+from onenote_synthetic import SyntheticNotebookGenerator, SyntheticNotebookSettings
+from path_scrubbing import PathComponentScrubber
+from pdf_inspection.PdfDocument import PdfDocument
+
+
+class TestSyntheticNotebookGenerator(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+        self.temp_dir = pathlib.Path(self._temp_dir.name)
+        self.recording = OneNoteApiRecording(self.temp_dir / 'recording')
+
+    @staticmethod
+    def _walk_pages(node: OneNoteNode) -> Iterable[OneNotePage]:
+        for child in node.children:
+            if isinstance(child, OneNotePage):
+                yield child
+            yield from TestSyntheticNotebookGenerator._walk_pages(child)
+
+    def test_generated_hierarchy_can_be_walked_via_replay(self):
+        # Arrange
+        settings = SyntheticNotebookSettings(notebook_count=2, sections_per_notebook=3, pages_per_section=4, paragraphs_per_page=1)
+        sut = SyntheticNotebookGenerator(settings)
+
+        # Act
+        actual_page_count = sut.generate_into(self.recording)
+
+        # Assert
+        self.assertEqual(actual_page_count, settings.page_count)
+        onenote = OneNoteApplication(ReplayOneNoteAPI(self.recording))
+        self.assertEqual(len(onenote.children), 2)
+        for notebook in onenote.children:
+            with self.subTest(notebook=notebook):
+                self.assertEqual(len(notebook.children), 3)
+        self.assertEqual(len(list(self._walk_pages(onenote))), settings.page_count)
+
+    def test_generated_payloads_agree_with_one_another(self):
+        # Arrange
+        settings = SyntheticNotebookSettings(sections_per_notebook=1, pages_per_section=2, images_per_page=3, tables_per_page=1, paragraphs_per_page=2)
+        SyntheticNotebookGenerator(settings).generate_into(self.recording)
+        onenote_api = ReplayOneNoteAPI(self.recording)
+        pages = list(self._walk_pages(OneNoteApplication(onenote_api)))
+
+        for page_index, page in enumerate(pages):
+            with self.subTest(page=page):
+                mhtml_path = self.temp_dir / f'{page_index}.mht'
+                pdf_path = self.temp_dir / f'{page_index}.pdf'
+
+                # Act
+                onenote_api.publish(page.node_id, mhtml_path, PublishFormat.pfMHTML)
+                onenote_api.publish(page.node_id, pdf_path, PublishFormat.pfPDF)
+                page_content = page.get_content(PageInfo.piFileType)
+
+                # Assert
+                mhtml = MhtmlContainer.read_file(mhtml_path)
+                mhtml_images = [item for item in mhtml.content_items if item.content_type.value == 'image/png']
+                self.assertEqual(len(mhtml_images), 3)
+                pdf_images = [image for pdf_page in PdfDocument(pdf_path).pages for image in pdf_page.images]
+                self.assertEqual(len(pdf_images), 3)
+                callback_ids = [element.attrib['callbackID'] for element in page_content.findall('.//{*}CallbackID')]
+                self.assertEqual(len(callback_ids), 3)
+                for callback_id, mhtml_image in zip(callback_ids, mhtml_images):
+                    self.assertEqual(page.get_binary_content(callback_id), mhtml_image.body)
+
+    def test_generation_is_deterministic_for_a_seed(self):
+        # Arrange
+        settings = SyntheticNotebookSettings(sections_per_notebook=1, pages_per_section=2, include_mhtml=False, include_pdf=False, seed=42)
+        other_recording = OneNoteApiRecording(self.temp_dir / 'other_recording')
+
+        # Act
+        SyntheticNotebookGenerator(settings).generate_into(self.recording)
+        SyntheticNotebookGenerator(settings).generate_into(other_recording)
+
+        # Assert
+        expected_files = sorted((self.temp_dir / 'recording' / 'responses').iterdir())
+        actual_files = sorted((self.temp_dir / 'other_recording' / 'responses').iterdir())
+        self.assertEqual([f.name for f in actual_files], [f.name for f in expected_files])
+        for expected_file, actual_file in zip(expected_files, actual_files):
+            self.assertEqual(actual_file.read_bytes(), expected_file.read_bytes())
+
+    def test_generated_notebook_can_be_exported(self):
+        # Arrange
+        settings = SyntheticNotebookSettings(sections_per_notebook=1, pages_per_section=2, paragraphs_per_page=3)
+        SyntheticNotebookGenerator(settings).generate_into(self.recording)
+        output_dir = self.temp_dir / 'output'
+        sut = create_default_onenote_exporter(output_dir, 'assets', PathComponentScrubber())
+
+        # Act
+        sut.execute_export(OneNoteApplication(ReplayOneNoteAPI(self.recording)))
+
+        # Assert
+        self.assertEqual(len(list(output_dir.rglob('*.md'))), 2)
+        self.assertEqual(len(list(output_dir.rglob('*.png'))), 2)
+
+    def test_settings_reject_negative_counts(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            SyntheticNotebookSettings(pages_per_section=-1)
+        with self.assertRaises(TypeError):
+            SyntheticNotebookSettings(pages_per_section=1.5)
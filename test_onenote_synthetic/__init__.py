@@ -0,0 +1 @@
+from .TestSyntheticNotebookGenerator import TestSyntheticNotebookGenerator
@@ -0,0 +1,89 @@
+import itertools
+import pathlib
+import unittest
+from typing import Callable, Tuple
+
+from path_scrubbing.CompiledTextSubstitutions import CompiledTextSubstitutions
+from path_scrubbing.LabeledRegexSubstitution import LabeledRegexSubstitution
+from path_scrubbing.OsPathsCharacterSupport import OsPathsCharacterSupport
+from path_scrubbing.PathComponentScrubber import PathComponentScrubber
+
+
+sample_page_titles_path = pathlib.Path(__file__).parent / 'sample_data' / 'page_titles.txt'
+
+
+class TestCompiledTextSubstitutions(unittest.TestCase):
+    os_paths_character_supports = [
+        OsPathsCharacterSupport(is_windows=True, supports_unicode_filenames=True),
+        OsPathsCharacterSupport(is_windows=False, supports_unicode_filenames=False),
+        OsPathsCharacterSupport(is_windows=False, supports_unicode_filenames=True),
+    ]
+
+    def test_path_cleanup_matches_applying_substitutions_in_turn(self):
+        # Arrange
+        corpus = self._create_page_title_corpus()
+
+        for os_paths_character_support in self.os_paths_character_supports:
+            with self.subTest(os_paths_character_support=os_paths_character_support):
+                scrubber = PathComponentScrubber(cache_size=0, os_paths_character_support=os_paths_character_support)
+                subject = scrubber._compiled_path_cleanup_substitutions
+
+                # Act
+                mismatches = []
+                for title in corpus:
+                    expected = self._get_cleanup_outcome(scrubber._apply_path_cleanup_substitutions_in_turn, title)
+                    actual = self._get_cleanup_outcome(subject, title)
+                    if actual != expected:
+                        mismatches.append((title, expected, actual))
+
+                # Assert
+                self.assertLess(subject.stage_count, len(scrubber._path_cleanup_substitutions))
+                self.assertEqual(mismatches, [])
+
+    def test_literal_substitutions_that_feed_one_another_stay_in_order(self):
+        # Arrange
+        substitutions = (
+            LabeledRegexSubstitution('a to b', 'a', 'b'),
+            LabeledRegexSubstitution('b to c', 'b', 'c'),
+            LabeledRegexSubstitution('Star to Dash', r'\*', '-'),
+        )
+        subject = CompiledTextSubstitutions(substitutions)
+
+        # Act
+        actual = subject('a*b')
+
+        # Assert
+        self.assertEqual(actual, 'c-c')
+        self.assertEqual(subject.stage_count, 2)
+
+    def test_cleanup_path_component_remembers_results(self):
+        # Arrange
+        subject = PathComponentScrubber(cache_size=2)
+
+        # Act
+        first = subject.cleanup_path_component('Section 1')
+        second = subject.cleanup_path_component('Section 1')
+
+        # Assert
+        self.assertIs(first, second)
+        self.assertEqual(subject._cleanup_path_component_cached.cache_info().hits, 1)
+
+    @staticmethod
+    def _create_page_title_corpus() -> Tuple[str, ...]:
+        sample_titles = tuple(sample_page_titles_path.read_text(encoding='utf-8').splitlines())
+        dates = ('6/2/2014', '12/31/21', '2019_08_19', '2019/8/9', '8_19_2019', '8_19_19', '03/2024', '7_2023', '2023-04-05', '13/13/2013', '')
+        times = ('8:04 AM', '4_01 PM', '16_01_33', '11:59:59 pm', '9:15', 'T09:30:00', '12_30_45 PM', '')
+        decorations = ('Office Lens', 'Notes: "draft"', '3/4" *x* <y> |z| ?', '— done – ok', '')
+        generated_titles = tuple(' '.join(filter(None, parts)) for parts in itertools.product(dates, times, decorations))
+        return sample_titles + generated_titles
+
+    @staticmethod
+    def _get_cleanup_outcome(cleanup: Callable[[str], str], title: str) -> Tuple[str, object]:
+        try:
+            return 'value', cleanup(title)
+        except ValueError as e:
+            return 'error', type(e)
+
+
+if __name__ == '__main__':
+    unittest.main()
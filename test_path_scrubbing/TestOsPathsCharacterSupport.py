@@ -0,0 +1,44 @@
+import os
+import unittest
+
+from path_scrubbing.OsPathsCharacterSupport import OsPathsCharacterSupport, windows_verboten_characters
+
+
+class TestOsPathsCharacterSupport(unittest.TestCase):
+    def test_windows_does_not_support_verboten_characters(self):
+        # Arrange
+        subject = OsPathsCharacterSupport(is_windows=True, supports_unicode_filenames=True)
+
+        for character in windows_verboten_characters:
+            with self.subTest(character=character):
+                # Act
+                actual = subject.supports_character(character)
+
+                # Assert
+                self.assertFalse(actual)
+
+        self.assertTrue(subject.supports_character('—'))
+        self.assertTrue(subject.supports_character('＊'))
+
+    def test_without_unicode_filenames_supports_no_characters(self):
+        # Arrange
+        subject = OsPathsCharacterSupport(is_windows=False, supports_unicode_filenames=False)
+
+        # Act
+        actual = [subject.supports_character(c) for c in ('a', '/', ':', '—', '“”')]
+
+        # Assert
+        self.assertEqual(actual, [False] * 5)
+        self.assertTrue(subject.supports_character(''))
+
+    def test_probe_reflects_the_running_os(self):
+        # Act
+        actual = OsPathsCharacterSupport.probe()
+
+        # Assert
+        self.assertEqual(actual.is_windows, os.name == 'nt')
+        self.assertEqual(actual.supports_unicode_filenames, bool(os.path.supports_unicode_filenames))
+
+
+if __name__ == '__main__':
+    unittest.main()
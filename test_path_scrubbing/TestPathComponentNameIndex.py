@@ -0,0 +1,43 @@
+import pathlib
+import unittest
+
+from path_scrubbing.PathComponentNameIndex import PathComponentNameIndex
+from path_scrubbing.disambiguate_path_components import disambiguate_path_components
+
+
+class TestPathComponentNameIndex(unittest.TestCase):
+    def test_claim_suffixes_names_already_claimed_ignoring_case(self):
+        # Arrange
+        subject = PathComponentNameIndex()
+
+        # Act
+        actual = [subject.claim(pathlib.Path(name)) for name in ('To Do', 'to do', 'To Do', 'Groceries')]
+
+        # Assert
+        self.assertEqual(actual, [pathlib.Path('To Do'), pathlib.Path('to do (2)'), pathlib.Path('To Do (3)'), pathlib.Path('Groceries')])
+
+    def test_disambiguate_path_components_does_not_take_names_still_to_come(self):
+        # Arrange
+        path_components = [pathlib.Path(name) for name in ('Notes', 'Notes', 'Notes (2)', 'Notes')]
+
+        # Act
+        actual = disambiguate_path_components(path_components)
+
+        # Assert
+        self.assertEqual(actual, tuple(pathlib.Path(name) for name in ('Notes', 'Notes (3)', 'Notes (2)', 'Notes (4)')))
+
+    def test_disambiguate_path_components_is_deterministic(self):
+        # Arrange
+        path_components = [pathlib.Path(f'Page {i % 7}') for i in range(1000)]
+
+        # Act
+        first = disambiguate_path_components(path_components)
+        second = disambiguate_path_components(path_components)
+
+        # Assert
+        self.assertEqual(first, second)
+        self.assertEqual(len({str(p).casefold() for p in first}), len(path_components))
+
+
+if __name__ == '__main__':
+    unittest.main()
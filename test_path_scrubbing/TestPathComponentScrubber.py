@@ -1,9 +1,13 @@
 import unittest
 
+from path_scrubbing.OsPathsCharacterSupport import OsPathsCharacterSupport
 from path_scrubbing.PathComponentScrubber import PathComponentScrubber
 
 
 class TestPathComponentScrubber(unittest.TestCase):
+    # The expectations are for Windows' paths, whatever OS the tests run on.
+    windows_os_paths_character_support = OsPathsCharacterSupport(is_windows=True, supports_unicode_filenames=True)
+
     param_list = [
         ('6/2/2014 8:04 AM Office Lens', '201406020804 Office Lens'),
         ('+Checklist', '+Checklist'),
@@ -21,7 +25,7 @@ class TestPathComponentScrubber(unittest.TestCase):
         for input_path_component, expected in self.param_list:
             with self.subTest(input_path_component=input_path_component, expected=expected):
                 # Arrange
-                subject = PathComponentScrubber()
+                subject = PathComponentScrubber(os_paths_character_support=self.windows_os_paths_character_support)
 
                 # Act
                 actual = subject.cleanup_path_component(input_path_component).name
@@ -1,3 +1,6 @@
+from .TestCompiledTextSubstitutions import TestCompiledTextSubstitutions
 from .TestDateDigitsSubstitutionFactory import TestDateDigitsSubstitutionFactory
+from .TestOsPathsCharacterSupport import TestOsPathsCharacterSupport
+from .TestPathComponentNameIndex import TestPathComponentNameIndex
 from .TestPathComponentScrubber import TestPathComponentScrubber
 from .TestTimeDigitsSubstitutionFactory import TestTimeDigitsSubstitutionFactory
@@ -0,0 +1,110 @@
+import concurrent.futures
+import contextvars
+import json
+import pathlib
+import tempfile
+import threading
+import unittest
+
+from tracing import ExportTracer, default_export_tracer
+
+
+class TestExportTracer(unittest.TestCase):
+    def test_disabled_tracer_records_nothing(self):
+        # Arrange
+        sut = ExportTracer()
+
+        # Act
+        with sut.span('stage', 'export', node_id='{A}'):
+            pass
+
+        # Assert
+        self.assertEqual(sut.spans, ())
+
+    def test_enabled_tracer_records_nested_spans(self):
+        # Arrange
+        sut = ExportTracer(enabled=True)
+
+        # Act
+        with sut.span('outer', 'export', node_id='{A}'):
+            with sut.span('inner', 'com', node_id='{A}'):
+                pass
+
+        # Assert
+        inner, outer = sut.spans
+        self.assertEqual((inner.name, inner.category, inner.args), ('inner', 'com', {'node_id': '{A}'}))
+        self.assertEqual((outer.name, outer.category), ('outer', 'export'))
+        self.assertLessEqual(outer.start_us, inner.start_us)
+        self.assertGreaterEqual(outer.start_us + outer.duration_us, inner.start_us + inner.duration_us)
+        self.assertEqual(inner.thread_id, threading.get_ident())
+
+    def test_span_is_recorded_when_work_raises(self):
+        # Arrange
+        sut = ExportTracer(enabled=True)
+
+        # Act
+        with self.assertRaises(RuntimeError):
+            with sut.span('failing', 'export'):
+                raise RuntimeError()
+
+        # Assert
+        self.assertEqual([span.name for span in sut.spans], ['failing'])
+
+    def test_write_chrome_trace_writes_complete_events_in_start_order(self):
+        # Arrange
+        sut = ExportTracer(enabled=True)
+        with sut.span('outer', 'export'):
+            with sut.span('inner', 'pandoc'):
+                pass
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_path = pathlib.Path(temp_dir) / 'trace.json'
+
+            # Act
+            sut.write_chrome_trace(trace_path)
+
+            # Assert
+            actual = json.loads(trace_path.read_text(encoding='utf-8'))
+        metadata_events = [e for e in actual['traceEvents'] if e['ph'] == 'M']
+        complete_events = [e for e in actual['traceEvents'] if e['ph'] == 'X']
+        self.assertEqual([e['args']['name'] for e in metadata_events], [threading.current_thread().name])
+        self.assertEqual([e['name'] for e in complete_events], ['outer', 'inner'])
+        self.assertEqual([e['cat'] for e in complete_events], ['export', 'pandoc'])
+
+    def test_current_tracer_is_the_default_unless_one_is_activated(self):
+        # Arrange
+        sut = ExportTracer(enabled=True)
+
+        # Act
+        before = ExportTracer.current()
+        with sut.activated():
+            during = ExportTracer.current()
+            with ExportTracer().activated():
+                nested = ExportTracer.current()
+            after_nested = ExportTracer.current()
+        after = ExportTracer.current()
+
+        # Assert
+        self.assertIs(before, default_export_tracer)
+        self.assertIs(during, sut)
+        self.assertIsNot(nested, sut)
+        self.assertIs(after_nested, sut)
+        self.assertIs(after, default_export_tracer)
+
+    def test_activated_tracer_is_current_in_work_handed_to_other_threads_with_the_context(self):
+        # Arrange
+        sut = ExportTracer(enabled=True)
+
+        # Act
+        with sut.activated():
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+                with_context = pool.submit(contextvars.copy_context().run, ExportTracer.current).result()
+                without_context = pool.submit(ExportTracer.current).result()
+
+        # Assert
+        self.assertIs(with_context, sut)
+        self.assertIs(without_context, default_export_tracer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1 @@
+from .TestExportTracer import TestExportTracer
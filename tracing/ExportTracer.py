@@ -0,0 +1,136 @@
+import contextlib
+import contextvars
+import json
+import os
+import pathlib
+import threading
+import time
+
+from typing import ContextManager, Iterator, List, Optional, Tuple, Union
+
+from .TraceSpan import TraceSpan
+
+
+class ExportTracer:
+    """
+    Records spans of work (export stages, and calls across the COM, pandoc and PyMuPDF boundaries), to be written out
+    as a Chrome trace (viewable in chrome://tracing or https://ui.perfetto.dev). Disabled tracers record nothing, and
+    their spans cost next to nothing. Safe to record into from multiple threads.
+    Code at those boundaries records into the current tracer, which is whichever tracer was last activated in the
+    calling context (see `activated`), or default_export_tracer if none was.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self._enabled = enabled
+        self._lock = threading.Lock()
+        self._spans: List[TraceSpan] = []
+        self._origin_ns = time.perf_counter_ns()
+
+    @staticmethod
+    def current() -> 'ExportTracer':
+        """
+        :return: The tracer activated in the calling context, or default_export_tracer if none is.
+        """
+        return _current_export_tracer.get(default_export_tracer)
+
+    @contextlib.contextmanager
+    def activated(self) -> Iterator['ExportTracer']:
+        """
+        Makes this the current tracer within the context manager, including for work the calling context hands to other
+        threads along with a copy of itself (see contextvars.copy_context).
+        """
+        token = _current_export_tracer.set(self)
+        try:
+            yield self
+        finally:
+            _current_export_tracer.reset(token)
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._enabled = value
+
+    def span(self, name: str, category: str, **args: Optional[str]) -> ContextManager[None]:
+        """
+        :param name: What is being done, e.g. the export stage or the method being called.
+        :param category: The boundary or layer the work belongs to, e.g. 'export', 'com', 'pandoc' or 'pymupdf'.
+        :param args: Identifies what the work is being done for, e.g. page_id.
+        :return: A context manager that times the work done inside it.
+        """
+        if not self._enabled:
+            return contextlib.nullcontext()
+        return self._record_span(name, category, args)
+
+    def mark(self, name: str, category: str, **args: Optional[str]):
+        """
+        Records something that happened at a point in time, rather than over a span of it, as a span with no duration.
+        :param name: What happened, e.g. 'critical_path'.
+        :param category: The boundary or layer it happened in.
+        :param args: What happened, and what for.
+        """
+        if not self._enabled:
+            return
+        now_ns = time.perf_counter_ns()
+        self._append_span(name, category, now_ns, now_ns, args)
+
+    @contextlib.contextmanager
+    def _record_span(self, name: str, category: str, args: dict):
+        started_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._append_span(name, category, started_ns, time.perf_counter_ns(), args)
+
+    def _append_span(self, name: str, category: str, started_ns: int, ended_ns: int, args: dict):
+        thread = threading.current_thread()
+        span = TraceSpan(
+            name=name,
+            category=category,
+            start_us=(started_ns - self._origin_ns) / 1000,
+            duration_us=(ended_ns - started_ns) / 1000,
+            thread_id=thread.ident,
+            thread_name=thread.name,
+            args=args,
+        )
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> Tuple[TraceSpan, ...]:
+        """
+        The spans recorded so far, in order of completion (so nested spans precede the spans containing them).
+        """
+        with self._lock:
+            return tuple(self._spans)
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+
+    def write_chrome_trace(self, path: Union[str, os.PathLike]):
+        """
+        Writes the spans recorded so far as Chrome trace event JSON.
+        :param path: The file to write.
+        """
+        process_id = os.getpid()
+        spans = self.spans
+        thread_names = {span.thread_id: span.thread_name for span in spans}
+        trace_events = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': process_id, 'tid': thread_id, 'args': {'name': thread_name}}
+            for thread_id, thread_name in thread_names.items()
+        ]
+        trace_events += [span.to_chrome_trace_event(process_id) for span in sorted(spans, key=lambda s: s.start_us)]
+
+        path = pathlib.Path(path)
+        temp_path = path.with_name(path.name + '.tmp')
+        with temp_path.open('w', encoding='utf-8') as trace_file:
+            json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, trace_file)
+        os.replace(temp_path, path)
+
+
+_current_export_tracer: contextvars.ContextVar[ExportTracer] = contextvars.ContextVar('current_export_tracer')
+
+default_export_tracer = ExportTracer()
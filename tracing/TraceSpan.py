@@ -0,0 +1,29 @@
+import dataclasses
+
+from typing import Dict, Optional
+
+
+@dataclasses.dataclass(frozen=True)
+class TraceSpan:
+    """
+    A completed span of work, as recorded by ExportTracer. Times are in microseconds since the tracer was created.
+    """
+    name: str
+    category: str
+    start_us: float
+    duration_us: float
+    thread_id: int
+    thread_name: str
+    args: Dict[str, Optional[str]]
+
+    def to_chrome_trace_event(self, process_id: int) -> dict:
+        return {
+            'name': self.name,
+            'cat': self.category,
+            'ph': 'X',
+            'ts': self.start_us,
+            'dur': self.duration_us,
+            'pid': process_id,
+            'tid': self.thread_id,
+            'args': self.args,
+        }
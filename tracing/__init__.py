@@ -0,0 +1,2 @@
+from .TraceSpan import TraceSpan
+from .ExportTracer import ExportTracer, default_export_tracer